@@ -0,0 +1,11 @@
+"""
+Offline synthetic-load benchmarks for the marketplace scripts and the
+validator rounds.
+
+    python -m benchmarks                         # default sizes, all suites
+    python -m benchmarks --suite news --news-sizes 50 5000
+    python -m benchmarks --compare baseline.json
+
+See generators.py for the synthetic marketplaces and news corpora and
+harness.py for what is timed.
+"""
@@ -0,0 +1,150 @@
+"""
+Run the synthetic-load benchmarks and store the results as JSON.
+
+Usage:
+    python -m benchmarks
+    python -m benchmarks --suite marketplace --marketplace-sizes 10 1000 100000
+    python -m benchmarks --suite news --news-sizes 50 5000 50000 --output news.json
+    python -m benchmarks --compare benchmark_results.json --threshold 0.2
+"""
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime
+from typing import List
+
+from . import harness
+
+
+def compare(results: List[dict], baseline: List[dict], threshold: float) -> List[str]:
+    """Entries whose median got slower than the baseline by more than threshold."""
+    previous = {(r["suite"], r["name"], r["size"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get((result["suite"], result["name"], result["size"]))
+        if before is None or before["median_seconds"] <= 0:
+            continue
+        ratio = result["median_seconds"] / before["median_seconds"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{result['suite']}/{result['name']} @ {result['size']}: "
+                f"{before['median_seconds'] * 1000:.1f} ms → {result['median_seconds'] * 1000:.1f} ms "
+                f"({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Synthetic-load benchmarks for marketplace scripts and validator rounds"
+    )
+    parser.add_argument(
+        "--suite",
+        choices=["all", "marketplace", "news"],
+        default="all",
+        help="Which benchmarks to run (default: all)"
+    )
+    parser.add_argument(
+        "--marketplace-sizes",
+        type=int,
+        nargs="+",
+        default=[10, 1000, 10000],
+        help="Plugin counts for the synthetic marketplaces (default: 10 1000 10000)"
+    )
+    parser.add_argument(
+        "--news-sizes",
+        type=int,
+        nargs="+",
+        default=[50, 1000, 5000],
+        help="Item counts for the synthetic news corpora (default: 50 1000 5000)"
+    )
+    parser.add_argument(
+        "--duplicate-rate",
+        type=float,
+        default=0.1,
+        help="Share of near-duplicate news items (default: 0.1)"
+    )
+    parser.add_argument(
+        "--non-ai-rate",
+        type=float,
+        default=0.05,
+        help="Share of non-AI news items (default: 0.05)"
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="Timed runs per benchmark; the median is reported (default: 3)"
+    )
+    parser.add_argument(
+        "--output",
+        default="benchmark_results.json",
+        help="Results JSON path (default: benchmark_results.json)"
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        help="Previous results JSON to check for regressions"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Slowdown ratio above which --compare reports a regression (default: 0.25)"
+    )
+
+    args = parser.parse_args()
+
+    results = []
+    if args.suite in ("all", "marketplace"):
+        print(f"🏪 Marketplace benchmarks: {args.marketplace_sizes} plugins")
+        results += harness.marketplace_suite(args.marketplace_sizes, runs=args.runs)
+    if args.suite in ("all", "news"):
+        print(f"📰 News round benchmarks: {args.news_sizes} items")
+        results += harness.news_suite(args.news_sizes, runs=args.runs,
+                                      duplicate_rate=args.duplicate_rate, non_ai_rate=args.non_ai_rate)
+
+    print()
+    for r in results:
+        print(f"  {r['suite']:<12} {r['name']:<30} {r['size']:>7,}  "
+              f"{r['median_seconds'] * 1000:10.1f} ms  {r['per_item_us']:10.1f} µs/item")
+
+    document = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": args.runs,
+            "duplicate_rate": args.duplicate_rate,
+            "non_ai_rate": args.non_ai_rate,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    print()
+    print(f"📄 Results written to {args.output}")
+
+    if args.compare:
+        try:
+            with open(args.compare, "r", encoding="utf-8") as f:
+                baseline = json.load(f)["results"]
+        except (OSError, json.JSONDecodeError, KeyError) as e:
+            print(f"❌ Error: Could not read baseline {args.compare}: {e}")
+            sys.exit(1)
+
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print()
+            print(f"❌ {len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"✅ No regressions over {args.threshold:.0%} against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Synthetic inputs for the benchmarks. Everything is generated locally from
+a seed, so runs are reproducible and need no network access.
+"""
+
+import json
+import random
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, NamedTuple
+
+VALID_SKILL_MD = """---
+name: {name}
+description: Synthetic skill {name} used for marketplace benchmarks
+---
+
+# {title}
+
+## When to Use This Skill
+
+Benchmark fixture generated by benchmarks/generators.py.
+"""
+
+# Frontmatter without the required description field
+BROKEN_SKILL_MD = """---
+name: {name}
+---
+
+# {title}
+"""
+
+
+class MarketplaceStats(NamedTuple):
+    root: Path
+    plugins: int
+    valid_skills: int
+    broken_skills: int
+    missing_skills: int
+
+
+def make_marketplace(
+    root: Path,
+    plugins: int,
+    skills_per_plugin: int = 1,
+    broken_rate: float = 0.05,
+    missing_rate: float = 0.05,
+    seed: int = 0,
+) -> MarketplaceStats:
+    """Write a marketplace with `plugins` plugins under root.
+
+    A broken_rate share of skills get a SKILL.md without a description and
+    a missing_rate share get no SKILL.md at all; the rest are valid.
+    """
+    rng = random.Random(seed)
+    plugin_dir = root / ".claude-plugin"
+    plugin_dir.mkdir(parents=True, exist_ok=True)
+    skills_dir = root / "skills"
+    skills_dir.mkdir(exist_ok=True)
+
+    entries = []
+    valid = broken = missing = 0
+    for p in range(plugins):
+        skill_paths = []
+        for s in range(skills_per_plugin):
+            name = f"skill-{p:06d}-{s}"
+            skill_dir = skills_dir / name
+            skill_dir.mkdir(exist_ok=True)
+            skill_paths.append(f"./skills/{name}")
+
+            roll = rng.random()
+            if roll < missing_rate:
+                missing += 1
+                continue
+            template = BROKEN_SKILL_MD if roll < missing_rate + broken_rate else VALID_SKILL_MD
+            (skill_dir / "SKILL.md").write_text(template.format(name=name, title=name.replace("-", " ").title()))
+            if template is BROKEN_SKILL_MD:
+                broken += 1
+            else:
+                valid += 1
+
+        entries.append({
+            "name": f"plugin-{p:06d}",
+            "description": f"Synthetic plugin {p} bundling {skills_per_plugin} benchmark skill(s)",
+            "source": "./",
+            "strict": False,
+            "skills": skill_paths,
+        })
+
+    marketplace = {
+        "name": "benchmark-marketplace",
+        "owner": {"name": "Benchmark", "email": "bench@example.com"},
+        "metadata": {
+            "description": "Synthetic marketplace for benchmarks",
+            "version": "1.0.0",
+            "license": "MIT",
+            "repository": "https://github.com/example/benchmark-marketplace",
+            "keywords": ["benchmark"],
+        },
+        "plugins": entries,
+    }
+    with open(plugin_dir / "marketplace.json", "w") as f:
+        json.dump(marketplace, f, indent=2)
+        f.write("\n")
+
+    return MarketplaceStats(root, plugins, valid, broken, missing)
+
+
+AI_COMPANIES = ["OpenAI", "Anthropic", "Google", "Meta", "NVIDIA", "Microsoft", "Mistral AI", "xAI", "百度", "阿里巴巴"]
+AI_VERBS = ["announces", "launches", "unveils", "releases", "open-sources", "ships"]
+AI_PRODUCTS = ["GPT-5", "Claude", "Gemini", "Llama", "AI agent", "large language model", "AI chip", "multimodal model"]
+NON_AI_TITLES = [
+    "TSMC expands 3nm production capacity",
+    "Samsung reports record foundry capacity utilization",
+    "Bitcoin rallies as cryptocurrency exchanges add listings",
+    "New gaming GPU lineup targets esports players",
+    "Operators begin 6G network field trials",
+]
+SOURCES = [
+    ("TechCrunch", "techcrunch.com", 9.5, 1),
+    ("Reuters", "reuters.com", 9.5, 1),
+    ("The Verge", "theverge.com", 9.5, 1),
+    ("36氪", "36kr.com", 7.5, 2),
+    ("VentureBeat", "venturebeat.com", 7.5, 2),
+]
+CATEGORIES = ["AI Models", "AI Products", "AI Infrastructure", "Funding", "Research"]
+SUMMARY_WORDS = ("inference training reasoning developers enterprise pricing latency tokens context window "
+                 "open source safety evaluation partnership deployment cloud benchmark agents").split()
+
+
+def make_news_corpus(
+    count: int,
+    duplicate_rate: float = 0.1,
+    non_ai_rate: float = 0.05,
+    now: datetime = datetime(2025, 11, 20, 7, 30, tzinfo=timezone.utc),
+    seed: int = 0,
+) -> List[dict]:
+    """Items in the validated_items schema of validated.json.
+
+    A duplicate_rate share are near-duplicates of an earlier item (same
+    story, lightly edited title, different source) and a non_ai_rate share
+    are off-topic semiconductor/crypto/telecom stories.
+    """
+    rng = random.Random(seed)
+    vocabulary = SUMMARY_WORDS + [f"{rng.choice(SUMMARY_WORDS)}{n}" for n in range(max(200, count // 2))]
+    items: List[dict] = []
+
+    for idx in range(count):
+        roll = rng.random()
+        if items and roll < duplicate_rate:
+            base = rng.choice(items)
+            title = base["title"] + (" (update)" if rng.random() < 0.5 else "!")
+            summary = base["summary"]
+            company, product, category = (base["key_data"]["company"], base["key_data"]["product"],
+                                          base["category"])
+        elif roll < duplicate_rate + non_ai_rate:
+            title = f"{rng.choice(NON_AI_TITLES)} ({idx})"
+            summary = " ".join(rng.choice(vocabulary) for _ in range(40))
+            company, product, category = "", "", "Semiconductors"
+        else:
+            company = rng.choice(AI_COMPANIES)
+            product = rng.choice(AI_PRODUCTS)
+            topic = " ".join(rng.choice(vocabulary) for _ in range(3))
+            title = f"{company} {rng.choice(AI_VERBS)} {product} for {topic}"
+            summary = f"{company} {product} " + " ".join(rng.choice(vocabulary) for _ in range(40))
+            category = rng.choice(CATEGORIES)
+
+        name, host, credibility, tier = rng.choice(SOURCES)
+        age_hours = rng.uniform(0, 47.5)
+        published = now - timedelta(hours=age_hours)
+        slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")[:80]
+        items.append({
+            "id": f"item_{idx:05d}",
+            "title": title,
+            "source": {
+                "name": name,
+                "url": f"https://{host}/{published:%Y/%m/%d}/{slug}",
+                "credibility": credibility,
+                "tier": tier,
+            },
+            "timestamp": {
+                "published": published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "parsed_method": "ISO8601",
+                "age_hours": round(age_hours, 1),
+                "layer": 0 if age_hours < 24 else 1,
+            },
+            "completeness": {
+                "score": round(rng.uniform(6.0, 10.0), 1),
+                "has_essential_fields": True,
+                "has_key_data": bool(product),
+                "summary_length": len(summary),
+            },
+            "summary": summary,
+            "key_data": {"company": company, "product": product},
+            "category": category,
+        })
+    return items
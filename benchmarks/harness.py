@@ -0,0 +1,145 @@
+"""
+Timing harnesses for the marketplace scripts and the validator rounds.
+
+Each harness returns a list of result dicts:
+    {"suite", "name", "size", "runs", "min_seconds", "median_seconds", "per_item_us"}
+which __main__.py collects into a results JSON file.
+"""
+
+import contextlib
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from .generators import VALID_SKILL_MD, make_marketplace, make_news_corpus
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MARKETPLACE_SCRIPTS = REPO_ROOT / "skills" / "marketplace-creator" / "scripts"
+VALIDATOR_SCRIPTS = REPO_ROOT / "daily-tech-news-validator" / "scripts"
+
+for _path in (MARKETPLACE_SCRIPTS, VALIDATOR_SCRIPTS):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+import add_plugin  # noqa: E402
+import ai_relevance  # noqa: E402
+import dedup_engine  # noqa: E402
+import domain_index  # noqa: E402
+import init_marketplace  # noqa: E402
+import timestamp_engine  # noqa: E402
+import validate_marketplace  # noqa: E402
+import validation_executor  # noqa: E402
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Silence the scripts' progress output while timing."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def measure(
+    suite: str,
+    name: str,
+    size: int,
+    fn: Callable[[int], object],
+    runs: int = 3,
+    setup: Optional[Callable[[int], None]] = None,
+) -> dict:
+    """Call fn(run) `runs` times and summarize the wall times.
+
+    setup(run), if given, runs before each timed call and is not timed.
+    """
+    times = []
+    for run in range(runs):
+        if setup is not None:
+            setup(run)
+        with _quiet():
+            start = time.perf_counter()
+            fn(run)
+            times.append(time.perf_counter() - start)
+
+    median = statistics.median(times)
+    return {
+        "suite": suite,
+        "name": name,
+        "size": size,
+        "runs": runs,
+        "min_seconds": round(min(times), 6),
+        "median_seconds": round(median, 6),
+        "per_item_us": round(median / max(size, 1) * 1e6, 3),
+    }
+
+
+def marketplace_suite(sizes: List[int], runs: int = 3, jobs: int = 4) -> List[dict]:
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench-marketplace-") as tmp:
+        tmp_root = Path(tmp)
+
+        for size in sizes:
+            root = tmp_root / f"marketplace-{size}"
+            make_marketplace(root, size, seed=size)
+
+            def validate(_run, root=root, jobs=1):
+                validate_marketplace.MarketplaceValidator(root, jobs=jobs).validate()
+
+            results.append(measure("marketplace", "validate", size, validate, runs))
+            results.append(measure("marketplace", f"validate (jobs={jobs})", size,
+                                   lambda run, root=root: validate(run, root, jobs), runs))
+
+            # A dedicated valid skill keeps add_plugin off its interactive prompt
+            added_skill = root / "skills" / "bench-added"
+            added_skill.mkdir(exist_ok=True)
+            (added_skill / "SKILL.md").write_text(VALID_SKILL_MD.format(name="bench-added", title="Bench Added"))
+
+            def add(run, root=root):
+                add_plugin.add_plugin(root, f"bench-added-{run}", "Plugin added by the benchmark",
+                                      ["./skills/bench-added"])
+
+            results.append(measure("marketplace", "add_plugin", size, add, runs))
+
+        def create(run):
+            init_marketplace.create_marketplace_structure(f"bench-init-{run}", tmp_root / "init")
+
+        results.append(measure("marketplace", "create_marketplace_structure", 1, create, runs))
+    return results
+
+
+def _round2(items: List[dict]):
+    epochs = []
+    for item in items:
+        value = dedup_engine._get(item, "timestamp", "published")
+        parsed = timestamp_engine.parse_timestamp(value) if value else None
+        if parsed is not None:
+            epochs.append(parsed.published.timestamp())
+    return timestamp_engine.compute_ages(epochs)
+
+
+def _round5(items: List[dict]):
+    return validation_executor.round5_metrics([validation_executor.score_completeness(item) for item in items])
+
+
+def news_suite(sizes: List[int], runs: int = 3, duplicate_rate: float = 0.1,
+               non_ai_rate: float = 0.05) -> List[dict]:
+    results = []
+    index = domain_index.default_index()
+    matcher = ai_relevance.default_matcher()
+
+    for size in sizes:
+        items = make_news_corpus(size, duplicate_rate=duplicate_rate, non_ai_rate=non_ai_rate, seed=size)
+        urls = [dedup_engine.item_url(item) for item in items]
+
+        rounds = [
+            ("Round 1: Credibility", lambda run: index.classify_batch(urls)),
+            ("Round 2: Time Accuracy", lambda run: _round2(items)),
+            ("Round 3: AI Relevance", lambda run: matcher.classify_batch(items)),
+            ("Round 4: Deduplication", lambda run: dedup_engine.deduplicate(items)),
+            ("Round 5: Completeness", lambda run: _round5(items)),
+        ]
+        for name, fn in rounds:
+            results.append(measure("news", name, size, fn, runs))
+    return results
@@ -0,0 +1,671 @@
+#!/usr/bin/env python3
+"""
+Paragraph-level incremental runner for the formatter's five mandatory rounds.
+
+The article is split into blocks (a paragraph plus its trailing blank
+lines; fenced code blocks stay whole). Every round is line-local, so each
+block can go through Rounds 1-5 on its own:
+
+    Round 1  compliance    keyword_scanner.KeywordScanner rewrite
+    Round 2  punctuation   punctuation_normalizer.PunctuationNormalizer
+    Round 3  grammar       duplicate full-width marks, stray spaces between Han characters
+    Round 4  titles        repeated !/? in headings; length and clickbait findings
+    Round 5  qa            excess blank lines; per-block facts for the document checks
+
+Each block's round outputs, change logs and facts are cached by the
+block's content hash, so re-running after an edit only re-processes the
+changed paragraphs. The cross-paragraph checks of Round 5 (heading
+hierarchy, required sections, 5 focus items, word count, remaining
+high-risk terms) are recomputed every run from the cached per-block facts,
+and change logs are re-based to document lines and offsets, so the report
+is identical to a full run over the whole article (--verify checks this).
+
+Usage:
+    python format_pipeline.py tech_news_[DATE]_wechat_draft.md --output tech_news_[DATE]_wechat_final.md
+    python format_pipeline.py draft.md --report format_changes_[DATE].json [--cache PATH | --no-cache]
+    python format_pipeline.py draft.md --verify
+    python format_pipeline.py --benchmark
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+from keyword_scanner import DEFAULT_TABLE, RISK_HIGH, KeywordScanner  # noqa: E402
+from punctuation_normalizer import MARK_NAMES, PunctuationNormalizer, normalize_stream  # noqa: E402
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_NAME = ".format_cache.json"
+
+ROUNDS = ("compliance", "punctuation", "grammar", "titles", "qa")
+ROUND_FOCUS = {
+    "compliance": "Compliance",
+    "punctuation": "Punctuation",
+    "grammar": "Grammar",
+    "titles": "Titles",
+    "qa": "QA",
+}
+# (line key, offset key) of each round's change-log entries
+LOG_KEYS = {
+    "compliance": ("location", "offset"),
+    "punctuation": ("line", "position"),
+    "grammar": ("line", "offset"),
+    "titles": ("line", "offset"),
+    "qa": ("line", "offset"),
+}
+
+REQUIRED_SECTIONS = ("48小时焦点", "免责声明")
+FOCUS_SECTION = "48小时焦点"
+FOCUS_ITEMS = 5
+WORD_RANGE = (6000, 8000)
+TITLE_LENGTH = {1: (15, 30), 2: (5, 12)}
+CLICKBAIT_WORDS = ("震惊",)
+
+_FENCE_LINE_RE = re.compile(r"[ \t]*(?:```|~~~)")
+_HEADING_RE = re.compile(r"(#{1,6})[ \t]+(.*?)[ \t]*$")
+_INLINE_CODE_RE = re.compile(r"`[^`\n]+`")
+_GRAMMAR_RE = re.compile(
+    r"(?P<duplicate>([，。；：、！？])\2+)"
+    r"|(?P<space>(?<=[\u3400-\u9fff])[ \t]+(?=[\u3400-\u9fff]))"
+)
+_REPEATED_MARK_RE = re.compile(r"([!?！？])\1+")
+_BLANK_RUN_RE = re.compile(r"\n(?:[ \t]*\n){2,}")
+_FOCUS_ITEM_RE = re.compile(r"\d+\.[ \t]")
+_WORD_RE = re.compile(r"[\u3400-\u9fff]|[A-Za-z0-9]+")
+
+
+class RoundResult(NamedTuple):
+    """One round's outcome for one block (or the whole text, in a full run)."""
+    text: str
+    log: List[dict]
+    counts: Dict[str, int]
+    issues: List[dict]
+    facts: Optional[dict] = None
+
+
+class BlockResult(NamedTuple):
+    """What the cache stores per block; intermediate round texts are not kept."""
+    text: str
+    rounds: List[list]    # per round: [log, counts, issues, input lines, input chars]
+    facts: dict
+
+
+def split_blocks(text: str) -> List[str]:
+    """Split into paragraphs with their trailing blank lines; ''.join() restores text.
+
+    Blank lines inside fenced code do not split, and leading blank lines
+    belong to the first block.
+    """
+    blocks: List[str] = []
+    current: List[str] = []
+    has_content = False
+    prev_blank = False
+    in_fence = False
+    for line in text.splitlines(keepends=True):
+        blank = not in_fence and not line.strip()
+        if not blank and prev_blank and has_content:
+            blocks.append("".join(current))
+            current = []
+        current.append(line)
+        if not blank:
+            has_content = True
+        if _FENCE_LINE_RE.match(line):
+            in_fence = not in_fence
+        prev_blank = blank
+    if current:
+        blocks.append("".join(current))
+    return blocks
+
+
+def iter_lines(text: str):
+    """Yield (line number, offset, line without newline, in_fence) for each line."""
+    offset = 0
+    in_fence = False
+    for number, line in enumerate(text.split("\n"), 1):
+        fence_line = bool(_FENCE_LINE_RE.match(line))
+        yield number, offset, line, in_fence or fence_line
+        if fence_line:
+            in_fence = not in_fence
+        offset += len(line) + 1
+
+
+def prose_segments(text: str) -> List[Tuple[bool, str]]:
+    """(in_fence, text) runs of whole lines; fence lines belong to the fenced run."""
+    segments: List[Tuple[bool, str]] = []
+    lines = text.split("\n")
+    for idx, (_, _, line, fenced) in enumerate(iter_lines(text)):
+        piece = line + ("\n" if idx < len(lines) - 1 else "")
+        if segments and segments[-1][0] == fenced:
+            segments[-1] = (fenced, segments[-1][1] + piece)
+        else:
+            segments.append((fenced, piece))
+    return segments
+
+
+# -- rounds -----------------------------------------------------------------
+
+def round_compliance(text: str, scanner: KeywordScanner) -> RoundResult:
+    result = scanner.rewrite(text)
+    counts = Counter(match.keyword.risk for match in result.changes)
+    return RoundResult(result.text, [m.to_change() for m in result.changes], dict(counts), [])
+
+
+def round_punctuation(text: str) -> RoundResult:
+    changes: List[dict] = []
+    normalizer = PunctuationNormalizer(on_change=changes.append)
+    out = "".join(normalize_stream([text], normalizer))
+    counts = {f"mark:{mark}": n for mark, n in normalizer.counts.items()}
+    counts.update({f"preserved:{kind}": n for kind, n in normalizer.preserved.items()})
+    return RoundResult(out, changes, counts, [])
+
+
+def round_grammar(text: str) -> RoundResult:
+    """Collapse repeated full-width marks and drop spaces between Han characters (prose only)."""
+    pieces: List[str] = []
+    log: List[dict] = []
+    counts: Counter = Counter()
+    for number, offset, line, fenced in iter_lines(text):
+        if pieces:
+            pieces.append("\n")
+        if fenced or _HEADING_RE.match(line):
+            pieces.append(line)
+            continue
+        pos = 0
+        for code in list(_INLINE_CODE_RE.finditer(line)) + [None]:
+            stop = code.start() if code else len(line)
+            last = pos
+            for match in _GRAMMAR_RE.finditer(line, pos, stop):
+                after = match.group(2) if match.group("duplicate") else ""
+                rule = "duplicate_punctuation" if match.group("duplicate") else "space_between_han"
+                pieces.append(line[last:match.start()])
+                pieces.append(after)
+                last = match.end()
+                counts[rule] += 1
+                log.append({"rule": rule, "line": number, "offset": offset + match.start(),
+                            "before": match.group(0), "after": after})
+            pieces.append(line[last:stop])
+            if code:
+                pieces.append(code.group(0))
+                pos = code.end()
+    return RoundResult("".join(pieces), log, dict(counts), [])
+
+
+def _title_length(title: str) -> int:
+    return len(re.sub(r"[*`_\s]", "", title))
+
+
+def round_titles(text: str) -> RoundResult:
+    """Fix repeated !/? in headings; report length and clickbait findings."""
+    pieces: List[str] = []
+    log: List[dict] = []
+    issues: List[dict] = []
+    counts: Counter = Counter()
+    for number, offset, line, fenced in iter_lines(text):
+        if pieces:
+            pieces.append("\n")
+        heading = None if fenced else _HEADING_RE.match(line)
+        if not heading:
+            pieces.append(line)
+            continue
+        level = len(heading.group(1))
+        fixed = _REPEATED_MARK_RE.sub(r"\1", line)
+        if fixed != line:
+            counts["repeated_marks"] += 1
+            log.append({"rule": "repeated_marks", "line": number, "offset": offset,
+                        "before": line, "after": fixed})
+        pieces.append(fixed)
+
+        title = _HEADING_RE.match(fixed).group(2)
+        limits = TITLE_LENGTH.get(level)
+        length = _title_length(title)
+        if limits and not limits[0] <= length <= limits[1]:
+            issues.append({"check": "title_length", "severity": "minor", "line": number,
+                           "message": f"H{level} '{title}' is {length} characters "
+                                      f"(recommended {limits[0]}-{limits[1]})"})
+        for word in CLICKBAIT_WORDS:
+            if word in title:
+                issues.append({"check": "clickbait", "severity": "major", "line": number,
+                               "message": f"Heading '{title}' uses clickbait wording '{word}'"})
+    return RoundResult("".join(pieces), log, dict(counts), issues)
+
+
+def round_qa(text: str, scanner: KeywordScanner) -> RoundResult:
+    """Collapse runs of blank lines, then collect the facts the document checks need."""
+    pieces: List[str] = []
+    log: List[dict] = []
+    offset = 0
+    line = 1
+    for fenced, segment in prose_segments(text):
+        if fenced:
+            pieces.append(segment)
+        else:
+            last = 0
+            for match in _BLANK_RUN_RE.finditer(segment):
+                pieces.append(segment[last:match.start()])
+                pieces.append("\n\n")
+                last = match.end()
+                log.append({"rule": "blank_lines", "line": line + segment.count("\n", 0, match.start()),
+                            "offset": offset + match.start(), "before": match.group(0), "after": "\n\n"})
+            pieces.append(segment[last:])
+        offset += len(segment)
+        line += segment.count("\n")
+    out = "".join(pieces)
+
+    headings = []
+    items = []
+    words = 0
+    for number, _, line_text, fenced in iter_lines(out):
+        if fenced:
+            continue
+        heading = _HEADING_RE.match(line_text)
+        if heading:
+            headings.append([number, len(heading.group(1)), heading.group(2)])
+        elif _FOCUS_ITEM_RE.match(line_text):
+            items.append(number)
+        words += len(_WORD_RE.findall(line_text))
+    high_risk = [[out.count("\n", 0, m.start) + 1, m.keyword.term] for m in scanner.scan(out)
+                 if m.keyword.risk == RISK_HIGH and m.keyword.replacement != m.keyword.term]
+    facts = {"headings": headings, "items": items, "words": words, "high_risk": high_risk}
+    return RoundResult(out, log, {"blank_lines": len(log)} if log else {}, [], facts)
+
+
+def document_checks(facts: dict) -> List[dict]:
+    """Round 5 cross-paragraph checks over the merged facts of every block."""
+    issues: List[dict] = []
+    headings = facts["headings"]
+
+    previous = 0
+    for number, level, title in headings:
+        if previous and level > previous + 1:
+            issues.append({"check": "heading_hierarchy", "severity": "minor", "line": number,
+                           "message": f"H{level} '{title}' skips a level after H{previous}"})
+        previous = level
+
+    for section in REQUIRED_SECTIONS:
+        if not any(section in title for _, _, title in headings):
+            issues.append({"check": "required_section", "severity": "major", "line": None,
+                           "message": f"Required section '{section}' is missing"})
+
+    for idx, (number, level, title) in enumerate(headings):
+        if FOCUS_SECTION not in title:
+            continue
+        end = next((h[0] for h in headings[idx + 1:] if h[1] <= level), float("inf"))
+        count = sum(1 for item in facts["items"] if number < item < end)
+        if count != FOCUS_ITEMS:
+            issues.append({"check": "focus_items", "severity": "major", "line": number,
+                           "message": f"'{title}' has {count} items (expected exactly {FOCUS_ITEMS})"})
+
+    low, high = WORD_RANGE
+    if not low <= facts["words"] <= high:
+        issues.append({"check": "word_count", "severity": "minor", "line": None,
+                       "message": f"Word count {facts['words']} is outside {low}-{high}"})
+
+    for number, term in facts["high_risk"]:
+        issues.append({"check": "high_risk_keyword", "severity": "critical", "line": number,
+                       "message": f"High-risk keyword '{term}' remains"})
+    return issues
+
+
+# -- pipeline ---------------------------------------------------------------
+
+def _fingerprint(table: Path) -> str:
+    """Changes whenever the rules or the code of any round change."""
+    digest = hashlib.sha256(str(CACHE_VERSION).encode())
+    here = Path(__file__).resolve().parent
+    for path in (table, here / "keyword_scanner.py", here / "punctuation_normalizer.py", Path(__file__).resolve()):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class FormatPipeline:
+    """Runs Rounds 1-5 per block, reusing cached results for unchanged blocks."""
+
+    def __init__(self, table: Path = DEFAULT_TABLE, cache_path: Optional[Path] = None):
+        self.scanner = KeywordScanner.from_table(table)
+        self.fingerprint = _fingerprint(table)
+        self.cache_path = cache_path
+        self.hits = 0
+        self.misses = 0
+        self.rounds_time = 0.0    # seconds spent inside the five rounds
+        self._cache: Dict[str, list] = {}
+        self._dirty = False
+        if cache_path:
+            self.load_cache()
+
+    def load_cache(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CACHE_VERSION and data.get("fingerprint") == self.fingerprint:
+            self._cache = data.get("blocks", {})
+
+    def save_cache(self):
+        if not self.cache_path or not self._dirty:
+            return
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        data = json.dumps({"version": CACHE_VERSION, "fingerprint": self.fingerprint, "blocks": self._cache},
+                          ensure_ascii=False, separators=(",", ":"))
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
+
+    def process_block(self, text: str) -> BlockResult:
+        """Run all five rounds over one block (or a whole article)."""
+        start = time.perf_counter()
+        rounds = []
+        result = None
+        for name in ROUNDS:
+            source = text
+            if name == "compliance":
+                result = round_compliance(text, self.scanner)
+            elif name == "punctuation":
+                result = round_punctuation(text)
+            elif name == "grammar":
+                result = round_grammar(text)
+            elif name == "titles":
+                result = round_titles(text)
+            else:
+                result = round_qa(text, self.scanner)
+            rounds.append([result.log, result.counts, result.issues, source.count("\n"), len(source)])
+            text = result.text
+        self.rounds_time += time.perf_counter() - start
+        return BlockResult(text, rounds, result.facts)
+
+    def run(self, text: str, incremental: bool = True) -> Tuple[str, dict]:
+        """Format an article; returns (final text, report).
+
+        incremental=False runs every round over the whole article in one
+        piece, which is the reference the block-wise run must match.
+        """
+        if not incremental:
+            return self._assemble([self.process_block(text)])
+
+        per_block = []
+        used: Dict[str, list] = {}
+        for block in split_blocks(text):
+            key = hashlib.sha1(block.encode("utf-8")).hexdigest()
+            cached = self._cache.get(key)
+            if cached is not None:
+                self.hits += 1
+                result = BlockResult(*cached)
+            else:
+                self.misses += 1
+                result = self.process_block(block)
+                self._dirty = True
+            used[key] = list(result)
+            per_block.append(result)
+        # Only the current article's blocks are kept
+        if used.keys() != self._cache.keys():
+            self._dirty = True
+        self._cache = used
+        return self._assemble(per_block)
+
+    def _assemble(self, per_block: List[BlockResult]) -> Tuple[str, dict]:
+        """Re-base per-block logs to document lines/offsets and merge counts and facts."""
+        rounds = {}
+        for k, name in enumerate(ROUNDS):
+            line_key, offset_key = LOG_KEYS[name]
+            log: List[dict] = []
+            issues: List[dict] = []
+            counts: Counter = Counter()
+            line_base = offset_base = 0
+            for block in per_block:
+                block_log, block_counts, block_issues, lines, chars = block.rounds[k]
+                for entry in block_log:
+                    entry = dict(entry)
+                    entry[line_key] += line_base
+                    entry[offset_key] += offset_base
+                    log.append(entry)
+                for issue in block_issues:
+                    issues.append(dict(issue, line=issue["line"] + line_base))
+                counts.update(block_counts)
+                line_base += lines
+                offset_base += chars
+            rounds[name] = {"changes": len(log), "counts": dict(sorted(counts.items())),
+                            "issues": issues, "log": log}
+
+        facts = {"headings": [], "items": [], "words": 0, "high_risk": []}
+        line_base = 0
+        for block in per_block:
+            facts["headings"].extend([h[0] + line_base, h[1], h[2]] for h in block.facts["headings"])
+            facts["items"].extend(item + line_base for item in block.facts["items"])
+            facts["words"] += block.facts["words"]
+            facts["high_risk"].extend([h[0] + line_base, h[1]] for h in block.facts["high_risk"])
+            line_base += block.text.count("\n")
+
+        rounds["qa"]["issues"] = document_checks(facts)
+        rounds["qa"]["word_count"] = facts["words"]
+        severities = {issue["severity"] for r in rounds.values() for issue in r["issues"]}
+        status = "FAIL" if "critical" in severities else "WARNING" if "major" in severities else "PASS"
+
+        report = {
+            "status": status,
+            "total_changes": sum(r["changes"] for r in rounds.values()),
+            "rounds": rounds,
+        }
+        return "".join(block.text for block in per_block), report
+
+
+def print_summary(report: dict, out=sys.stdout):
+    """Round-by-round table in the format report's layout."""
+    print("## Round-by-Round Summary", file=out)
+    print(file=out)
+    print("| Round | Focus | Changes | Issues |", file=out)
+    print("|-------|-------|---------|--------|", file=out)
+    for idx, name in enumerate(ROUNDS, 1):
+        data = report["rounds"][name]
+        print(f"| {idx} | {ROUND_FOCUS[name]} | {data['changes']} | {len(data['issues'])} |", file=out)
+    print(file=out)
+    punctuation = report["rounds"]["punctuation"]["counts"]
+    by_type = Counter()
+    for key, count in punctuation.items():
+        if key.startswith("mark:"):
+            by_type[MARK_NAMES[key[5:]]] += count
+    if by_type:
+        print("Punctuation by type: " + ", ".join(f"{k} {v}" for k, v in by_type.most_common()), file=out)
+    for issue in report["rounds"]["titles"]["issues"] + report["rounds"]["qa"]["issues"]:
+        where = f"Line {issue['line']}: " if issue["line"] else ""
+        print(f"⚠️  [{issue['severity']}] {where}{issue['message']}", file=out)
+    status_emoji = {"PASS": "✅", "WARNING": "⚠️", "FAIL": "❌"}[report["status"]]
+    print(f"{status_emoji} Overall Status: {report['status']} ({report['total_changes']} changes, "
+          f"{report['rounds']['qa']['word_count']} words)", file=out)
+
+
+def _synthetic_article(pipeline: FormatPipeline, words: int = 7000, seed: int = 0) -> str:
+    """A writer-shaped draft: title, focus section, news sections, disclaimer."""
+    rng = random.Random(seed)
+    terms = [k.term for k in pipeline.scanner.keywords]
+    filler = ("人工智能公司今日发布新一代大模型产品并宣布开放接口服务开发者社区反响积极"
+              "多家云厂商表示将在未来数月内接入该模型以提升推理效率和降低部署成本")
+
+    def sentence() -> str:
+        offset = rng.randrange(len(filler) - 24)
+        text = filler[offset:offset + rng.randint(10, 24)]
+        if rng.random() < 0.15:
+            text += rng.choice(terms)
+        if rng.random() < 0.2:
+            text += " OpenAI发布GPT-4.5"
+        return text + rng.choice(",,.;!?") + ("  " if rng.random() < 0.05 else "")
+
+    lines = ["# 48小时科技新闻汇总 | 2025年11月20日 AI焦点", "", "## 引导语", "",
+             "".join(sentence() for _ in range(6)), "", "## 🌟 48小时焦点", ""]
+    for idx in range(1, 6):
+        lines += [f"{idx}. **🇺🇸 OpenAI发布新模型{idx}**", "   " + sentence(), ""]
+    count = 0
+    section = 0
+    while count < words:
+        section += 1
+        lines += [f"## 🤖 AI动态{section}", ""]
+        for item in range(4):
+            lines += [f"### 公司新闻{section}-{item}!!", ""]
+            para = "".join(sentence() for _ in range(rng.randint(4, 9)))
+            lines += [para, ""]
+            count += len(para)
+            if rng.random() < 0.1:
+                lines += ["```python", "print('hello, world.')", "", "x = 1", "```", ""]
+            if rng.random() < 0.1:
+                lines += ["", ""]
+    lines += ["## 📋 免责声明", "", "本文内容仅供参考,不构成投资建议.", ""]
+    return "\n".join(lines)
+
+
+def run_benchmark(table: Path):
+    """Full run vs. incremental re-run after editing one paragraph."""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / DEFAULT_CACHE_NAME
+        pipeline = FormatPipeline(table, cache_path)
+        text = _synthetic_article(pipeline)
+        blocks = split_blocks(text)
+        print(f"📄 Synthetic article: {len(text)} characters, {len(blocks)} blocks")
+
+        start = time.perf_counter()
+        full_text, full_report = pipeline.run(text, incremental=False)
+        full_time = time.perf_counter() - start
+        full_rounds = pipeline.rounds_time
+
+        start = time.perf_counter()
+        pipeline.run(text)
+        pipeline.save_cache()
+        cold_time = time.perf_counter() - start
+
+        rng = random.Random(1)
+        prose = [i for i, block in enumerate(blocks) if not block.startswith(("#", "```", "\n"))]
+        edit_times = []
+        edit_rounds = []
+        for _ in range(10):
+            idx = rng.choice(prose)
+            blocks[idx] = "新增内容,今日OpenAI宣布军事合同相关调整. " + blocks[idx]
+            text = "".join(blocks)
+            pipeline = FormatPipeline(table, cache_path)
+            start = time.perf_counter()
+            inc_text, inc_report = pipeline.run(text)
+            pipeline.save_cache()
+            edit_times.append(time.perf_counter() - start)
+            edit_rounds.append(pipeline.rounds_time)
+            full_text, full_report = FormatPipeline(table).run(text, incremental=False)
+            if (inc_text, inc_report) != (full_text, full_report):
+                print("❌ Error: incremental result differs from the full run")
+                sys.exit(1)
+
+        median = len(edit_times) // 2
+        print(f"⏱️  Full run:                  {full_time * 1000:8.2f} ms "
+              f"(rounds {full_rounds * 1000:.2f} ms)")
+        print(f"⏱️  Incremental, cold cache:   {cold_time * 1000:8.2f} ms")
+        print(f"⏱️  Incremental, 1 edited:     {sorted(edit_times)[median] * 1000:8.2f} ms "
+              f"(rounds {sorted(edit_rounds)[median] * 1000:.2f} ms; median of {len(edit_times)}, "
+              f"includes cache load/save and report assembly)")
+        print(f"✅ Reports identical to the full run ({full_report['total_changes']} changes)")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run formatter Rounds 1-5 with per-paragraph caching"
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        help="Draft article (tech_news_[DATE]_wechat_draft.md)"
+    )
+    parser.add_argument(
+        "--output",
+        help="Write the formatted article to this path"
+    )
+    parser.add_argument(
+        "--report",
+        help="Write the full change report (logs, counts, issues) as JSON"
+    )
+    parser.add_argument(
+        "--table",
+        default=str(DEFAULT_TABLE),
+        help="Path to sensitive_keywords.md"
+    )
+    parser.add_argument(
+        "--cache",
+        help=f"Cache file (default: {DEFAULT_CACHE_NAME} next to the input)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Process every paragraph without reading or writing the cache"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Run every round over the whole article in one piece (no splitting, no cache)"
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Also do a full run and fail if text or report differ"
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Time a full run against an incremental re-run after one-paragraph edits"
+    )
+
+    args = parser.parse_args()
+    table = Path(args.table)
+
+    if args.benchmark:
+        run_benchmark(table)
+        return
+
+    if not args.input:
+        parser.error("input file is required unless --benchmark is given")
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"❌ Error: Input file does not exist: {input_path}")
+        sys.exit(1)
+
+    cache_path = None
+    if not (args.no_cache or args.full):
+        cache_path = Path(args.cache) if args.cache else input_path.parent / DEFAULT_CACHE_NAME
+
+    with open(input_path, "r", encoding="utf-8", newline="") as f:
+        text = f.read()
+
+    start = time.perf_counter()
+    pipeline = FormatPipeline(table, cache_path)
+    final_text, report = pipeline.run(text, incremental=not args.full)
+    pipeline.save_cache()
+    elapsed = time.perf_counter() - start
+
+    if args.verify and not args.full:
+        full_text, full_report = FormatPipeline(table).run(text, incremental=False)
+        if (full_text, full_report) != (final_text, report):
+            print("❌ Error: incremental result differs from the full run")
+            sys.exit(1)
+        print("✅ Verified: identical to a full run")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            f.write(final_text)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+    print_summary(report)
+    if not args.full:
+        print(f"⏱️  {elapsed * 1000:.1f} ms ({pipeline.hits} paragraph(s) reused, {pipeline.misses} processed)")
+    sys.exit(1 if report["status"] == "FAIL" else 0)
+
+
+if __name__ == "__main__":
+    main()
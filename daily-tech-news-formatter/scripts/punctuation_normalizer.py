@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+"""
+Streaming punctuation normalizer for formatter Round 2 (Punctuation Normalization).
+
+Implements references/punctuation_guide.md as a single-pass state machine:
+text is consumed chunk by chunk, protected spans (fenced and inline code,
+URLs, emails, Markdown link targets, HTML tags, list markers) are copied
+verbatim, and each ASCII mark is converted only when the CJK/Latin run on
+either side of it calls for Chinese punctuation. Quote and parenthesis
+pairing is tracked per line so closing marks always match their opener.
+
+Memory is bounded by the longest line (capped at MAX_PENDING characters),
+so gigabyte-sized archives can be re-normalized without loading them. The
+change log is streamed to a callback (--changes writes it as JSON Lines);
+the normalizer itself keeps only counts and the first SAMPLE_CHANGES records.
+
+Usage:
+    python punctuation_normalizer.py <article.md> [--output <final.md>] [--json] [--changes <log.jsonl>]
+    python punctuation_normalizer.py --benchmark 50
+"""
+
+import argparse
+import io
+import json
+import random
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+FULL_WIDTH = {
+    ",": "，",
+    ".": "。",
+    ":": "：",
+    ";": "；",
+    "!": "！",
+    "?": "？",
+    "(": "（",
+    ")": "）",
+}
+DOUBLE_QUOTES = ("“", "”")
+SINGLE_QUOTES = ("‘", "’")
+
+MARK_NAMES = {
+    ",": "Comma",
+    ".": "Period",
+    ":": "Colon",
+    ";": "Semicolon",
+    "!": "Exclamation",
+    "?": "Question",
+    "(": "Parentheses",
+    ")": "Parentheses",
+    '"': "Quotes",
+    "'": "Quotes",
+}
+
+# Decision tree: text that is more than 70% Latin letters keeps English punctuation
+ENGLISH_RATIO = 0.7
+CONTEXT_CHARS = 40
+
+# Longest line held in memory before it is cut at a space
+MAX_PENDING = 1 << 20
+LOOKAHEAD = 256
+CHUNK_SIZE = 1 << 16
+# Change records kept in memory for the report; the rest go to on_change only
+SAMPLE_CHANGES = 50
+
+_CJK = "CJK"
+_LATIN = "LATIN"
+_DIGIT = "DIGIT"
+_OTHER = "OTHER"
+_NONE = "NONE"
+
+# Skipped when looking for the run on either side of a mark
+_SKIP = frozenset(" \t*_~\"'()[]“”‘’（）「」《》<>.,;:!?，。；：！？、")
+
+# The leading lookahead lists every character a token can start with, which
+# lets the regex engine skip runs of Han characters without trying each branch
+_TOKEN_RE = re.compile(
+    r"(?=[,.:;!?()\"'\n`\]<A-Za-z0-9._%+\-#> \t~])"
+    r"(?:(?P<fence>^[ \t]*(?:```|~~~)[^\n]*)"
+    r"|(?P<code>`[^`\n]+`)"
+    r"|(?P<link>\]\([^)\s]*\))"
+    r"|(?P<url>(?:https?|ftp)://[^\s<>\"'()\u3000-\u303f\u3400-\u9fff\uff00-\uffef]+"
+    r"|www\.[A-Za-z0-9\-]+(?:\.[A-Za-z0-9\-]+)+)"
+    r"|(?P<email>(?<![A-Za-z0-9._%+\-])[A-Za-z0-9._%+\-]+@[A-Za-z0-9\-]+(?:\.[A-Za-z0-9\-]+)+)"
+    r"|(?P<tag><[A-Za-z!/][^>\n]*>)"
+    r"|(?P<list>^[ \t>#]*\d+\.(?=[ \t]))"
+    r"|(?P<mark>[,.:;!?()\"'])"
+    r"|(?P<newline>\n))",
+    re.MULTILINE,
+)
+_FENCE_RE = re.compile(r"^[ \t]*(?:```|~~~)[^\n]*", re.MULTILINE)
+
+
+def _char_class(ch: str) -> str:
+    if ch < "\x80":
+        if ch.isalpha():
+            return _LATIN
+        return _DIGIT if ch.isdigit() else _OTHER
+    if "\u2e80" <= ch <= "\u9fff" or "\uf900" <= ch <= "\ufaff" or "\uff00" <= ch <= "\uffef":
+        return _CJK
+    return _OTHER
+
+
+def _is_ascii_alnum(ch: str) -> bool:
+    return ch < "\x80" and ch.isalnum()
+
+
+class PunctuationNormalizer:
+    """Incremental normalizer; feed() chunks in order, then call flush().
+
+    Every change record is passed to on_change; `changes` holds only the
+    first sample_size of them, so memory does not grow with the input.
+    """
+
+    def __init__(self, record_changes: bool = True,
+                 on_change: Optional[Callable[[dict], None]] = None,
+                 sample_size: int = SAMPLE_CHANGES):
+        self.record_changes = record_changes
+        self.on_change = on_change
+        self.sample_size = sample_size
+        self.changes: List[dict] = []
+        self.counts: Counter = Counter()
+        self.preserved: Counter = Counter()
+        self._carry = ""
+        self._offset = 0          # characters consumed before the current buffer
+        self._line = 1
+        self._at_line_start = True
+        self._in_fence = False
+        self._reset_line_state()
+
+    def _reset_line_state(self):
+        self._parens: List[bool] = []
+        self._double: Optional[bool] = None   # None = closed, else whether the opener was converted
+        self._single: Optional[bool] = None
+
+    def feed(self, chunk: str) -> str:
+        """Normalize as much of the stream as can be decided; return the output."""
+        buf = self._carry + chunk
+        end = buf.rfind("\n") + 1
+        if end == 0:
+            if len(buf) < MAX_PENDING:
+                self._carry = buf
+                return ""
+            # Overlong line: cut at a space, keeping LOOKAHEAD characters of context
+            end = buf.rfind(" ", 0, len(buf) - LOOKAHEAD) + 1 or len(buf) - LOOKAHEAD
+        return self._process(buf, end)
+
+    def flush(self) -> str:
+        """Normalize whatever is left at the end of the stream."""
+        buf, self._carry = self._carry, ""
+        return self._process(buf, len(buf)) if buf else ""
+
+    def _process(self, buf: str, end: int) -> str:
+        out: List[str] = []
+        pos = 0
+        line_start = 0 if self._at_line_start else -1
+
+        while pos < end:
+            if self._in_fence:
+                m = _FENCE_RE.search(buf, pos, end)
+                stop = m.end() if m else end
+                self._line += buf.count("\n", pos, stop)
+                out.append(buf[pos:stop])
+                pos = stop
+                if m:
+                    self._in_fence = False
+                continue
+
+            m = _TOKEN_RE.search(buf, pos)
+            if m is None or m.start() >= end:
+                out.append(buf[pos:end])
+                pos = end
+                break
+
+            kind = m.lastgroup
+            start = m.start()
+            if kind == "mark":
+                pos = self._mark(buf, start, pos, max(line_start, 0), out)
+                continue
+
+            out.append(buf[pos:m.end()])
+            pos = m.end()
+            if kind == "newline":
+                self._line += 1
+                line_start = pos
+                self._reset_line_state()
+            elif kind == "fence":
+                if start == 0 and line_start < 0:
+                    continue
+                self._in_fence = True
+                self.preserved["code"] += 1
+            elif kind == "link":
+                self.preserved["url"] += 1
+            elif kind != "list":
+                self.preserved[kind] += 1
+
+        self._carry = buf[pos:]
+        self._offset += pos
+        self._at_line_start = pos == 0 and self._at_line_start or (pos > 0 and buf[pos - 1] == "\n")
+        return "".join(out)
+
+    def _mark(self, buf: str, i: int, pos: int, line_start: int, out: List[str]) -> int:
+        """Handle one ASCII mark at buf[i]; return the next scan position."""
+        mark = buf[i]
+        a = buf[i - 1] if i > line_start else ""
+        b = buf[i + 1] if i + 1 < len(buf) else ""
+        replacement = None
+
+        if mark in ".,:" and _is_ascii_alnum(a) and _is_ascii_alnum(b):
+            # 3.14, 1,000, 14:30, GPT-4.5, openai.com
+            self.preserved["number" if a.isdigit() and b.isdigit() else "identifier"] += 1
+        elif mark == "." and (a == "." or b == "."):
+            self.preserved["identifier"] += 1
+        elif mark == "." and a.isascii() and a.isalpha() and i - 2 >= line_start and buf[i - 2] == ".":
+            self.preserved["abbreviation"] += 1          # U.S., Ph.D.
+        elif mark == "(":
+            if _is_ascii_alnum(a) and _is_ascii_alnum(b):
+                self.preserved["identifier"] += 1
+                self._parens.append(False)
+            else:
+                converted = self._chinese_context(buf, i, line_start)
+                self._parens.append(converted)
+                replacement = FULL_WIDTH[mark] if converted else None
+        elif mark == ")":
+            converted = self._parens.pop() if self._parens else self._chinese_context(buf, i, line_start)
+            replacement = FULL_WIDTH[mark] if converted else None
+        elif mark == '"':
+            if self._double is None:
+                self._double = self._chinese_context(buf, i, line_start)
+                replacement = DOUBLE_QUOTES[0] if self._double else None
+            else:
+                replacement = DOUBLE_QUOTES[1] if self._double else None
+                self._double = None
+        elif mark == "'":
+            if _is_ascii_alnum(a) and (_is_ascii_alnum(b) or self._single is None):
+                self.preserved["english"] += 1           # don't, OpenAI's, users'
+            elif self._single is None:
+                self._single = self._chinese_context(buf, i, line_start)
+                replacement = SINGLE_QUOTES[0] if self._single else None
+            else:
+                replacement = SINGLE_QUOTES[1] if self._single else None
+                self._single = None
+        elif self._chinese_context(buf, i, line_start):
+            replacement = FULL_WIDTH[mark]
+        else:
+            self.preserved["english"] += 1
+
+        if replacement is None:
+            out.append(buf[pos:i + 1])
+            return i + 1
+
+        # Full-width marks carry their own spacing
+        j = i
+        while j > max(pos, line_start) and buf[j - 1] in " \t":
+            j -= 1
+        if j == line_start:
+            j = i
+        out.append(buf[pos:j])
+        out.append(replacement)
+        self.counts[mark] += 1
+        if self.record_changes:
+            # Context stays on the mark's own line, so it doesn't depend on
+            # what follows the line (or on where the stream was chunked)
+            context_end = buf.find("\n", i, i + 10)
+            change = {
+                "position": self._offset + i,
+                "line": self._line,
+                "before": mark,
+                "after": replacement,
+                "context": buf[max(line_start, i - 10):context_end if context_end >= 0 else i + 10],
+            }
+            if len(self.changes) < self.sample_size:
+                self.changes.append(change)
+            if self.on_change is not None:
+                self.on_change(change)
+
+        nxt = i + 1
+        while nxt < len(buf) and buf[nxt] in " \t":
+            nxt += 1
+        return nxt
+
+    def _chinese_context(self, buf: str, i: int, line_start: int) -> bool:
+        """Decide whether the mark at buf[i] sits in Chinese text."""
+        # Fast path: a mark directly after a Han character ("宣布,")
+        if i > line_start and "\u3400" <= buf[i - 1] <= "\u9fff":
+            return True
+
+        prev_class = _NONE
+        j = i - 1
+        stop = i - 32 if i - 32 > line_start else line_start
+        while j >= stop:
+            if buf[j] not in _SKIP:
+                prev_class = _char_class(buf[j])
+                break
+            j -= 1
+
+        next_class = _NONE
+        j = i + 1
+        stop = min(len(buf), i + 32)
+        while j < stop:
+            ch = buf[j]
+            if ch == "\n":
+                break
+            if ch not in _SKIP:
+                next_class = _char_class(ch)
+                break
+            j += 1
+
+        if prev_class == _CJK or next_class == _CJK:
+            return True
+        if prev_class == _LATIN and next_class == _LATIN:
+            return False
+
+        # Ambiguous boundary (digits, symbols, line end): use the decision
+        # tree's ratio over the surrounding window
+        line_end = buf.find("\n", i, i + CONTEXT_CHARS)
+        window = buf[max(line_start, i - CONTEXT_CHARS):line_end if line_end >= 0 else i + CONTEXT_CHARS]
+        cjk = sum(1 for ch in window if "\u3400" <= ch <= "\u9fff")
+        latin = sum(1 for ch in window if ch < "\x80" and ch.isalpha())
+        if cjk + latin == 0:
+            return False
+        return latin <= ENGLISH_RATIO * (cjk + latin)
+
+    def summary(self) -> dict:
+        """Counts for the Round 2 section of the format report."""
+        by_type: Dict[str, int] = {}
+        for mark, count in self.counts.items():
+            by_type[MARK_NAMES[mark]] = by_type.get(MARK_NAMES[mark], 0) + count
+        return {
+            "total": sum(self.counts.values()),
+            "by_type": by_type,
+            "preserved": dict(self.preserved),
+        }
+
+
+def normalize_stream(chunks: Iterable[str], normalizer: Optional[PunctuationNormalizer] = None) -> Iterator[str]:
+    """Yield normalized output for a stream of text chunks."""
+    normalizer = normalizer or PunctuationNormalizer()
+    for chunk in chunks:
+        out = normalizer.feed(chunk)
+        if out:
+            yield out
+    out = normalizer.flush()
+    if out:
+        yield out
+
+
+def normalize_text(text: str) -> Tuple[str, List[dict]]:
+    """Normalize a whole string; returns (normalized_text, changes_log)."""
+    changes: List[dict] = []
+    normalizer = PunctuationNormalizer(on_change=changes.append)
+    return "".join(normalize_stream([text], normalizer)), changes
+
+
+def iter_text_chunks(f: io.TextIOBase, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _synthetic_corpus(size_mb: int, seed: int = 0) -> List[str]:
+    """Mixed Chinese/English Markdown lines, split into CHUNK_SIZE chunks."""
+    rng = random.Random(seed)
+    filler = ("人工智能公司今日发布新一代大模型产品并宣布开放接口服务开发者社区反响积极"
+              "多家云厂商表示将在未来数月内接入该模型以提升推理效率和降低部署成本")
+    lines = [
+        "OpenAI宣布, GPT-5将在2025年Q2发布. CEO Sam Altman表示:\"这是AI历史上的重大突破.\"",
+        "该模型参数达到10.5T,支持多模态能力(文本、图像、视频).",
+        "访问https://openai.com或发送邮件至support@openai.com了解GPT-4.5 Turbo的详情.",
+        "According to TechCrunch, OpenAI raised $10B at a $150B valuation.",
+        "美国(U.S.)政府宣布新政策, 价格为$99.99美元, 2025年11月20日14:30发布.",
+        "他说:\"她问'你确定吗?',然后我回答'是的'.\"",
+        "1. 使用`model.generate()`接口, 性能提升了2.5倍!",
+        "",
+    ]
+
+    def paragraph() -> str:
+        parts = []
+        for _ in range(rng.randint(3, 8)):
+            offset = rng.randrange(len(filler) - 30)
+            parts.append(filler[offset:offset + rng.randint(12, 30)] + rng.choice(",,,.;!?"))
+        return "".join(parts)
+
+    # Realistic density: roughly one mark every 15-20 characters
+    text = "\n".join(rng.choice(lines) if rng.random() < 0.3 else paragraph()
+                     for _ in range(size_mb * 1024 * 1024 // 250))
+    return [text[i:i + CHUNK_SIZE] for i in range(0, len(text), CHUNK_SIZE)]
+
+
+def run_benchmark(size_mb: int):
+    chunks = _synthetic_corpus(size_mb)
+    total_bytes = sum(len(chunk.encode("utf-8")) for chunk in chunks)
+    normalizer = PunctuationNormalizer(record_changes=False)
+
+    start = time.perf_counter()
+    for _ in normalize_stream(chunks, normalizer):
+        pass
+    elapsed = time.perf_counter() - start
+
+    mb = total_bytes / (1024 * 1024)
+    print(f"⏱️  Normalized {mb:.1f} MB in {elapsed:.3f}s ({mb / elapsed:.2f} MB/s)")
+    print(json.dumps(normalizer.summary(), ensure_ascii=False, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Normalize Chinese/English punctuation in one streaming pass (formatter Round 2)"
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        help="Markdown article to normalize"
+    )
+    parser.add_argument(
+        "--output",
+        help="Write the normalized article to this path"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help=f"Print the summary and the first {SAMPLE_CHANGES} changes as JSON"
+    )
+    parser.add_argument(
+        "--changes",
+        metavar="PATH",
+        help="Write every change record to PATH as JSON Lines while normalizing"
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="MB",
+        help="Normalize MB megabytes of synthetic text and report throughput"
+    )
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        return
+
+    if not args.input:
+        parser.error("input file is required unless --benchmark is given")
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"❌ Error: Input file does not exist: {input_path}")
+        sys.exit(1)
+
+    log = open(args.changes, "w", encoding="utf-8") if args.changes else None
+    on_change = (lambda change: log.write(json.dumps(change, ensure_ascii=False) + "\n")) if log else None
+    normalizer = PunctuationNormalizer(on_change=on_change)
+    try:
+        with open(input_path, "r", encoding="utf-8", newline="") as src:
+            if args.output:
+                with open(args.output, "w", encoding="utf-8", newline="") as dst:
+                    for out in normalize_stream(iter_text_chunks(src), normalizer):
+                        dst.write(out)
+            else:
+                for _ in normalize_stream(iter_text_chunks(src), normalizer):
+                    pass
+    finally:
+        if log:
+            log.close()
+
+    summary = normalizer.summary()
+    if args.json:
+        print(json.dumps({"summary": summary, "changes": normalizer.changes,
+                          "changes_truncated": summary["total"] > len(normalizer.changes)},
+                         ensure_ascii=False, indent=2))
+        return
+
+    print("### Round 2: Punctuation Normalization")
+    print()
+    print(f"**Changes Applied**: {summary['total']} punctuation marks normalized")
+    if summary["by_type"]:
+        print()
+        print("#### By Punctuation Type")
+        print("| Type | Count |")
+        print("|------|-------|")
+        for name, count in sorted(summary["by_type"].items(), key=lambda kv: -kv[1]):
+            print(f"| {name} | {count} |")
+    if summary["preserved"]:
+        print()
+        print("#### Preserved Contexts")
+        for name, count in sorted(summary["preserved"].items(), key=lambda kv: -kv[1]):
+            print(f"- {name}: {count} instances")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Concurrent page fetcher for collection and source cross-verification.
+
+AsyncFetcher fetches many URLs at once on asyncio while staying polite to
+each site:
+
+- Keep-alive HTTP/1.1 connections are pooled per host and reused
+- Each domain has its own concurrency limit and token bucket; Tier 1 hosts
+  from the validator's whitelist (reuters.com, techcrunch.com, ...) get the
+  conservative TIER1_POLICY so they are never hammered
+- A global cap bounds the number of requests in flight
+- Connection errors, timeouts, 429 and 5xx responses are retried with
+  exponential backoff (Retry-After is honored)
+- fetch_all(urls, stop_after=N) cancels the remaining requests as soon as
+  N accepted pages have arrived
+- With a PageCache, fresh pages are served from disk and stale ones are
+  revalidated with conditional requests
+
+Usage:
+    python fetch_engine.py https://techcrunch.com/... https://www.reuters.com/... [--stop-after 45]
+    python fetch_engine.py --benchmark 100 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import gzip
+import random
+import ssl
+import sys
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from page_cache import USER_AGENT, PageCache
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_REDIRECTS = 5
+MAX_RETRY_AFTER = 30.0
+
+
+class DomainPolicy(NamedTuple):
+    concurrency: int
+    rate: float   # requests per second
+    burst: int
+
+
+TIER1_POLICY = DomainPolicy(concurrency=2, rate=1.0, burst=2)
+DEFAULT_POLICY = DomainPolicy(concurrency=4, rate=4.0, burst=4)
+
+
+class FetchResult(NamedTuple):
+    url: str
+    status: Optional[int]
+    headers: Dict[str, str]
+    body: bytes
+    elapsed: float
+    attempts: int
+    from_cache: bool
+    error: Optional[str]
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and 200 <= self.status < 300
+
+
+class FetchError(Exception):
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Refills `rate` tokens per second up to `capacity`; acquire() waits for one."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class _Domain:
+    __slots__ = ("semaphore", "bucket")
+
+    def __init__(self, policy: DomainPolicy):
+        self.semaphore = asyncio.Semaphore(policy.concurrency)
+        self.bucket = TokenBucket(policy.rate, policy.burst)
+
+
+def tier_policy(domain: str) -> DomainPolicy:
+    """TIER1_POLICY for hosts on the validator's Tier 1 whitelist, else DEFAULT_POLICY."""
+    validator_scripts = Path(__file__).resolve().parents[2] / "daily-tech-news-validator" / "scripts"
+    if str(validator_scripts) not in sys.path:
+        sys.path.insert(0, str(validator_scripts))
+    import domain_index
+
+    return TIER1_POLICY if domain_index.default_index().classify(domain).tier == 1 else DEFAULT_POLICY
+
+
+def url_domain(url: str) -> str:
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class ConnectionPool:
+    """Idle keep-alive connections keyed by (scheme, host, port)."""
+
+    def __init__(self, max_idle_per_host: int = 8):
+        self.max_idle_per_host = max_idle_per_host
+        self.idle: Dict[Tuple[str, str, int], List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+        self.stats = Counter()
+        self._ssl: Optional[ssl.SSLContext] = None
+
+    async def acquire(self, key: Tuple[str, str, int]):
+        """Return (reader, writer, reused)."""
+        idle = self.idle.get(key)
+        while idle:
+            reader, writer = idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                self.stats["reused"] += 1
+                return reader, writer, True
+            writer.close()
+
+        scheme, host, port = key
+        context = None
+        if scheme == "https":
+            if self._ssl is None:
+                self._ssl = ssl.create_default_context()
+            context = self._ssl
+        reader, writer = await asyncio.open_connection(host, port, ssl=context)
+        self.stats["opened"] += 1
+        return reader, writer, False
+
+    def release(self, key, reader, writer, reusable: bool):
+        idle = self.idle.setdefault(key, [])
+        if reusable and len(idle) < self.max_idle_per_host:
+            idle.append((reader, writer))
+        else:
+            writer.close()
+
+    def close(self):
+        for connections in self.idle.values():
+            for _, writer in connections:
+                writer.close()
+        self.idle.clear()
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: Dict[str, str], status: int) -> Tuple[bytes, bool]:
+    """Read a response body; returns (body, connection reusable)."""
+    if status in (204, 304) or 100 <= status < 200:
+        return b"", True
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        parts = []
+        while True:
+            size = int((await reader.readline()).split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(parts), True
+            parts.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+    if "content-length" in headers:
+        return await reader.readexactly(int(headers["content-length"])), True
+    return await reader.read(), False
+
+
+def _decode(body: bytes, headers: Dict[str, str]) -> bytes:
+    encoding = headers.get("content-encoding", "").lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        return zlib.decompress(body)
+    return body
+
+
+class AsyncFetcher:
+    """Rate-limited concurrent fetcher; see the module docstring.
+
+    policy_for(domain) picks a DomainPolicy (default: tier_policy) and
+    domain_key(url) names the rate-limit domain of a URL (default: its
+    host without "www.").
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 16,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 15.0,
+        cache: Optional[PageCache] = None,
+        policy_for: Callable[[str], DomainPolicy] = tier_policy,
+        domain_key: Callable[[str], str] = url_domain,
+    ):
+        self.max_in_flight = max_in_flight
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = cache
+        self.policy_for = policy_for
+        self.domain_key = domain_key
+        self.pool = ConnectionPool()
+        self.stats = Counter()
+        self._global: Optional[asyncio.Semaphore] = None
+        self._domains: Dict[str, _Domain] = {}
+
+    def _domain(self, url: str) -> _Domain:
+        key = self.domain_key(url)
+        domain = self._domains.get(key)
+        if domain is None:
+            domain = self._domains[key] = _Domain(self.policy_for(key))
+        return domain
+
+    async def _request_once(self, url: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        lines = [f"GET {target} HTTP/1.1", f"Host: {parts.netloc}", f"User-Agent: {USER_AGENT}",
+                 "Accept-Encoding: gzip, deflate", "Connection: keep-alive"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        # Until the connection goes back to the pool, any exit (errors, a
+        # timeout or cancellation from wait_for) must close it
+        writer = None
+        try:
+            for _ in range(2):
+                reader, writer, reused = await self.pool.acquire(key)
+                try:
+                    writer.write(request)
+                    await writer.drain()
+                    status_line = await reader.readline()
+                    if not status_line:
+                        raise ConnectionResetError("connection closed before response")
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    writer = None
+                    if reused:
+                        continue  # the server dropped an idle keep-alive connection
+                    raise
+                break
+
+            version, status, _ = status_line.decode("latin-1").split(" ", 2)
+            response_headers: Dict[str, str] = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                response_headers[name.strip().lower()] = value.strip()
+            body, reusable = await _read_body(reader, response_headers, int(status))
+
+            reusable = reusable and version == "HTTP/1.1" and response_headers.get("connection", "").lower() != "close"
+            self.pool.release(key, reader, writer, reusable)
+            writer = None
+        finally:
+            if writer is not None:
+                writer.close()
+        self.stats["requests"] += 1
+        return int(status), response_headers, _decode(body, response_headers)
+
+    async def _request(self, url: str, headers: Dict[str, str]) -> Tuple[str, int, Dict[str, str], bytes]:
+        for _ in range(MAX_REDIRECTS + 1):
+            status, response_headers, body = await asyncio.wait_for(self._request_once(url, headers), self.timeout)
+            if status in REDIRECT_STATUSES and "location" in response_headers:
+                url = urljoin(url, response_headers["location"])
+                continue
+            return url, status, response_headers, body
+        raise FetchError(f"too many redirects for {url}")
+
+    async def fetch(self, url: str) -> FetchResult:
+        """Fetch one URL under its domain's limits, with retries."""
+        start = time.perf_counter()
+        if self.cache is not None:
+            page = self.cache.get(url)
+            if page is not None:
+                self.stats["cache_hits"] += 1
+                return FetchResult(url, page.status, page.headers, page.body, 0.0, 0, True, None)
+
+        if self._global is None:
+            self._global = asyncio.Semaphore(self.max_in_flight)
+        domain = self._domain(url)
+        error = None
+        for attempt in range(1, self.retries + 2):
+            try:
+                async with domain.semaphore:
+                    await domain.bucket.acquire()
+                    async with self._global:
+                        headers = self.cache.conditional_headers(url) if self.cache is not None else {}
+                        final_url, status, response_headers, body = await self._request(url, headers)
+
+                if status in RETRY_STATUSES:
+                    retry_after = response_headers.get("retry-after", "")
+                    raise FetchError(f"HTTP {status}", float(retry_after) if retry_after.isdigit() else None)
+
+                if self.cache is not None and status == 304:
+                    page = self.cache.touch(url)
+                    if page is not None:
+                        self.stats["revalidated"] += 1
+                        return FetchResult(url, page.status, page.headers, page.body,
+                                           time.perf_counter() - start, attempt, True, None)
+                if self.cache is not None and 200 <= status < 300:
+                    self.cache.put(url, body, status, response_headers)
+                return FetchResult(final_url, status, response_headers, body,
+                                   time.perf_counter() - start, attempt, False, None)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, FetchError, ValueError) as e:
+                error = f"{type(e).__name__}: {e}"
+                if attempt > self.retries:
+                    break
+                self.stats["retries"] += 1
+                delay = getattr(e, "retry_after", None)
+                if delay is None:
+                    delay = self.backoff * 2 ** (attempt - 1) * (1 + random.random() * 0.25)
+                await asyncio.sleep(min(delay, MAX_RETRY_AFTER))
+
+        self.stats["failed"] += 1
+        return FetchResult(url, None, {}, b"", time.perf_counter() - start, self.retries + 1, False, error)
+
+    async def fetch_all(
+        self,
+        urls: List[str],
+        stop_after: Optional[int] = None,
+        accept: Callable[[FetchResult], bool] = lambda result: result.ok,
+    ) -> List[FetchResult]:
+        """Fetch urls concurrently; results are in completion order.
+
+        With stop_after, pending requests are cancelled once that many
+        results satisfy accept().
+        """
+        tasks = [asyncio.ensure_future(self.fetch(url)) for url in urls]
+        results: List[FetchResult] = []
+        accepted = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                results.append(result)
+                if accept(result):
+                    accepted += 1
+                    if stop_after is not None and accepted >= stop_after:
+                        break
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                self.stats["cancelled"] += len(pending)
+                await asyncio.gather(*pending, return_exceptions=True)
+        return results
+
+    def close(self):
+        self.pool.close()
+
+
+def fetch_urls(urls: List[str], stop_after: Optional[int] = None, **options) -> Tuple[List[FetchResult], Counter]:
+    """Synchronous wrapper: run fetch_all on a fresh event loop; returns (results, stats)."""
+
+    async def run():
+        fetcher = AsyncFetcher(**options)
+        try:
+            return await fetcher.fetch_all(urls, stop_after=stop_after), fetcher.stats + fetcher.pool.stats
+        finally:
+            fetcher.close()
+
+    return asyncio.run(run())
+
+
+def run_benchmark(count: int, latency: float):
+    """Sequential urllib vs. AsyncFetcher against the local stand-in server."""
+    import urllib.request
+    from local_server import HOSTS, LocalNewsServer, synthetic_pages
+
+    with LocalNewsServer(synthetic_pages(count), latency=latency) as server:
+        urls = [server.url(path) for path in server.pages]
+
+        start = time.perf_counter()
+        for url in urls:
+            with urllib.request.urlopen(url, timeout=15) as response:
+                response.read()
+        sequential = time.perf_counter() - start
+        print(f"⏱️  Sequential urllib:  {count} pages in {sequential:.2f}s")
+
+        # Pages are served under /<host>/..., so rate-limit by that first segment
+        def host_of(url: str) -> str:
+            return urlsplit(url).path.split("/")[1]
+
+        policy = DomainPolicy(concurrency=8, rate=200.0, burst=8)
+        start = time.perf_counter()
+        results, stats = fetch_urls(urls, max_in_flight=32, policy_for=lambda domain: policy, domain_key=host_of)
+        concurrent = time.perf_counter() - start
+        ok = sum(1 for r in results if r.ok)
+        print(f"⏱️  AsyncFetcher:       {ok}/{count} pages in {concurrent:.2f}s "
+              f"({sequential / concurrent:.1f}x, {stats['opened']} connections, {stats['reused']} reused)")
+
+        stop_after = max(1, int(count * 0.45))
+        start = time.perf_counter()
+        results, stats = fetch_urls(urls, stop_after=stop_after, max_in_flight=32,
+                                    policy_for=lambda domain: policy, domain_key=host_of)
+        print(f"⏱️  stop_after={stop_after}:    {len(results)} pages in {time.perf_counter() - start:.2f}s "
+              f"({stats['cancelled']} requests cancelled)")
+
+        start = time.perf_counter()
+        fetch_urls(urls[:len(HOSTS) * 4], policy_for=tier_policy, domain_key=host_of)
+        print(f"⏱️  Tier policies:      {len(HOSTS) * 4} pages in {time.perf_counter() - start:.2f}s "
+              f"(Tier 1 hosts limited to {TIER1_POLICY.rate:g} req/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Concurrent, per-domain rate-limited page fetcher"
+    )
+    parser.add_argument(
+        "urls",
+        nargs="*",
+        help="URLs to fetch"
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=16,
+        help="Global cap on concurrent requests (default: 16)"
+    )
+    parser.add_argument(
+        "--stop-after",
+        type=int,
+        help="Cancel remaining requests after this many successful fetches"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Serve and store pages through a PageCache in this directory"
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="N",
+        help="Compare sequential and concurrent fetching of N local pages"
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.05,
+        help="With --benchmark: simulated server latency in seconds (default: 0.05)"
+    )
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark, args.latency)
+        return
+
+    if not args.urls:
+        parser.error("at least one URL is required unless --benchmark is given")
+
+    cache = PageCache(args.cache_dir) if args.cache_dir else None
+    try:
+        results, stats = fetch_urls(args.urls, stop_after=args.stop_after,
+                                    max_in_flight=args.max_in_flight, cache=cache)
+    finally:
+        if cache is not None:
+            cache.save()
+
+    for result in results:
+        if result.ok:
+            source = "cache" if result.from_cache else f"{result.elapsed:.2f}s, {result.attempts} attempt(s)"
+            print(f"  ✓ {result.url}: HTTP {result.status}, {len(result.body)} bytes ({source})")
+        else:
+            print(f"  ❌ {result.url}: {result.error or f'HTTP {result.status}'}")
+    print(f"✅ {sum(1 for r in results if r.ok)}/{len(args.urls)} fetched "
+          f"({stats['requests']} requests, {stats['retries']} retries, {stats['cancelled']} cancelled)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Local HTTP stand-in for news sites, so the page cache and fetch engine can
+be exercised with no network access.
+
+LocalNewsServer serves synthetic article pages (with <meta> publish times,
+ETag and Last-Modified headers) on 127.0.0.1 from a background thread and
+counts the requests it receives per path. Every page lives under
+/<host>/<slug>, so one server can stand in for many sites.
+
+    with LocalNewsServer(synthetic_pages(100)) as server:
+        url = server.url("techcrunch.com/2025/11/20/story-1")
+
+Usage:
+    python local_server.py --pages 200 --port 8765
+"""
+
+import argparse
+import hashlib
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+ARTICLE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<meta property="article:published_time" content="{published}">
+</head>
+<body>
+<article>
+<h1>{title}</h1>
+<p>{body}</p>
+</article>
+</body>
+</html>
+"""
+
+HOSTS = ["techcrunch.com", "reuters.com", "theverge.com", "36kr.com", "venturebeat.com"]
+
+
+def synthetic_pages(count: int, now: Optional[datetime] = None, body_words: int = 600) -> Dict[str, bytes]:
+    """count article pages keyed by "<host>/<yyyy/mm/dd>/story-N"."""
+    now = now or datetime.now(timezone.utc)
+    filler = ("OpenAI Anthropic model inference agents developers pricing latency tokens "
+              "benchmark open source release enterprise").split()
+    pages = {}
+    for idx in range(count):
+        host = HOSTS[idx % len(HOSTS)]
+        published = now - timedelta(minutes=17 * idx % (48 * 60))
+        title = f"Story {idx}: {filler[idx % len(filler)]} update"
+        body = " ".join(filler[(idx + n) % len(filler)] for n in range(body_words))
+        html = ARTICLE_TEMPLATE.format(title=title, published=published.strftime("%Y-%m-%dT%H:%M:%SZ"), body=body)
+        pages[f"{host}/{published:%Y/%m/%d}/story-{idx}"] = html.encode("utf-8")
+    return pages
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like real news sites
+    # Headers and body go out in separate writes; without TCP_NODELAY every
+    # keep-alive response would stall on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server: "LocalNewsServer" = self.server.owner
+        path = self.path.split("?", 1)[0].lstrip("/")
+        with server.lock:
+            server.requests[path] += 1
+        if server.latency:
+            time.sleep(server.latency)
+
+        if server.requests[path] <= server.fail_first:
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = server.pages.get(path)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            with server.lock:
+                server.not_modified += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", formatdate(server.started, usegmt=True))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # the default of 5 drops bursts of concurrent connects
+
+    def handle_error(self, request, client_address):
+        # Clients cancelling in-flight requests is expected, not an error
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class LocalNewsServer:
+    """Threaded HTTP server on 127.0.0.1 serving `pages` from memory.
+
+    latency adds a fixed delay (seconds) to every response, to make
+    sequential vs. concurrent fetching measurable; fail_first answers the
+    first N requests for each path with 503 to exercise retries.
+    """
+
+    def __init__(self, pages: Dict[str, bytes], port: int = 0, latency: float = 0.0, fail_first: int = 0):
+        self.pages = pages
+        self.latency = latency
+        self.fail_first = fail_first
+        self.requests: Counter = Counter()
+        self.not_modified = 0
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self._httpd = _Server(("127.0.0.1", port), _Handler)
+        self._httpd.owner = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.port}/{path.lstrip('/')}"
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    def start(self) -> "LocalNewsServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "LocalNewsServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve synthetic news pages locally for offline cache/fetch testing"
+    )
+    parser.add_argument(
+        "--pages",
+        type=int,
+        default=100,
+        help="Number of synthetic article pages (default: 100)"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="Port on 127.0.0.1 (default: 8765)"
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Artificial delay per response in seconds (default: 0)"
+    )
+
+    args = parser.parse_args()
+
+    server = LocalNewsServer(synthetic_pages(args.pages), port=args.port, latency=args.latency)
+    print(f"🌐 Serving {args.pages} pages at http://127.0.0.1:{server.port}/")
+    for path in list(server.pages)[:3]:
+        print(f"   {server.url(path)}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        print()
+        print(f"✅ Served {server.total_requests} request(s)")
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+On-disk page cache for collection and verification.
+
+Pages fetched while collecting (Phase 1) and re-checked in the
+verification rounds (source cross-checks, Round 2 timestamp extraction)
+are stored once and reused across rounds and retries:
+
+- Keys are normalized URLs (lower-case host, default port, fragment and
+  tracking parameters removed, query sorted), so trivially different links
+  to one article share an entry
+- Bodies are zlib-compressed and content-addressed by SHA-256 under
+  objects/ab/<hash>.z; identical bodies from different URLs are stored once
+- Entries expire after a configurable TTL; expired entries with an ETag
+  or Last-Modified are revalidated with a conditional request
+- Total compressed bytes are capped; the least recently used entries are
+  evicted first
+- index.json is one compact JSON document, loaded in a single read and
+  rewritten atomically on save()
+- Several processes may share one cache directory: save() holds an
+  exclusive lock on index.lock, merges the index other processes saved
+  in the meantime, and only then deletes the object files of evicted
+  entries that no merged entry still refers to (a process holding an
+  older index sees a deleted object as a miss)
+- Derived values (e.g. the published time extracted from the HTML) are
+  memoized per content hash, so an unchanged page is never re-parsed;
+  a relative published time ("3 hours ago") is kept as text and resolved
+  against each page's fetch time
+
+Usage:
+    python page_cache.py https://techcrunch.com/2025/11/20/story [--published]
+    python page_cache.py --stats
+    python page_cache.py --benchmark 200
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves still merge, without the cross-process lock
+    fcntl = None
+
+DEFAULT_CACHE_DIR = ".page_cache"
+DEFAULT_TTL = 6 * 3600
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+INDEX_VERSION = 1
+
+TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "ref", "ref_src", "spm", "from"}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+USER_AGENT = "daily-tech-news-search/4.1 (+page_cache)"
+
+
+def normalize_url(url: str) -> str:
+    """Canonical cache key for a URL."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "https"
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/")
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+class CachedPage(NamedTuple):
+    url: str
+    content_hash: str
+    fetched_at: float
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    from_cache: bool
+
+    def text(self, encoding: str = "utf-8") -> str:
+        return self.body.decode(encoding, errors="replace")
+
+
+class PageCache:
+    """Content-addressed page store with TTL, byte-bounded LRU and memoization.
+
+        with PageCache(".page_cache", ttl=3600) as cache:
+            page = cache.fetch(url)
+            published = cache.memoize(page, "published", lambda p: extract(p.body))
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl: float = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_BYTES, compress_level: int = 6):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.index_path = self.cache_dir / "index.json"
+        self.lock = threading.RLock()
+        # url key -> [content_hash, fetched_at, last_access, status, headers]
+        self.entries: Dict[str, list] = {}
+        # content hash -> [compressed size, raw size, {memo name: value}]
+        self.objects: Dict[str, list] = {}
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "evictions": 0, "memo_hits": 0}
+        self._dirty = False
+        # url key -> content hash of entries removed here since the last save
+        self._dropped: Dict[str, str] = {}
+        # url key -> fetched_at of each entry as of the last load or save
+        self._synced: Dict[str, float] = {}
+        self._load_index()
+
+    # -- index -----------------------------------------------------------
+
+    def _read_index(self) -> Tuple[Dict[str, list], Dict[str, list]]:
+        try:
+            with open(self.index_path, "rb") as f:
+                index = json.loads(f.read())
+        except (OSError, ValueError):
+            return {}, {}
+        if index.get("version") != INDEX_VERSION:
+            return {}, {}
+        return index.get("entries", {}), index.get("objects", {})
+
+    def _load_index(self):
+        self.entries, self.objects = self._read_index()
+        self._synced = {key: entry[1] for key, entry in self.entries.items()}
+
+    @contextmanager
+    def _index_lock(self):
+        """Exclusive lock on the cache directory, across processes."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_dir / "index.lock", "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _merge(self, entries: Dict[str, list], objects: Dict[str, list]):
+        """Fold an index saved by another process into this one."""
+        for key in [k for k, mine in self.entries.items() if k not in entries and self._synced.get(k) == mine[1]]:
+            del self.entries[key]  # unchanged here, removed by another process
+        for key, theirs in entries.items():
+            if self._dropped.get(key) == theirs[0]:
+                continue  # removed here; don't bring it back
+            mine = self.entries.get(key)
+            if mine is None:
+                self.entries[key] = theirs
+            elif theirs[1] > mine[1]:
+                theirs[2] = max(theirs[2], mine[2])
+                self.entries[key] = theirs
+            else:
+                mine[2] = max(mine[2], theirs[2])
+        for content_hash, theirs in objects.items():
+            mine = self.objects.get(content_hash)
+            if mine is None:
+                self.objects[content_hash] = theirs
+            else:
+                mine[2] = {**theirs[2], **mine[2]}
+
+    def save(self):
+        """Merge with the index on disk and write index.json atomically if anything changed."""
+        with self.lock:
+            if not self._dirty:
+                return
+            with self._index_lock():
+                self._merge(*self._read_index())
+                self.evict()
+                # Objects are deleted only here, under the lock and against the merged index
+                referenced = {entry[0] for entry in self.entries.values()}
+                for content_hash in [h for h in self.objects if h not in referenced]:
+                    del self.objects[content_hash]
+                    self._unlink_object(content_hash)
+                index = {"version": INDEX_VERSION, "entries": self.entries, "objects": self.objects}
+                tmp_path = self.index_path.with_name(f"index.json.{os.getpid()}.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(tmp_path, self.index_path)
+            self._dropped.clear()
+            self._synced = {key: entry[1] for key, entry in self.entries.items()}
+            self._dirty = False
+
+    def __enter__(self) -> "PageCache":
+        return self
+
+    def __exit__(self, *exc):
+        self.save()
+        return False
+
+    @property
+    def total_bytes(self) -> int:
+        """Compressed bytes of the objects entries refer to."""
+        referenced = {entry[0] for entry in self.entries.values()}
+        return sum(obj[0] for h, obj in self.objects.items() if h in referenced)
+
+    # -- objects ---------------------------------------------------------
+
+    def _object_path(self, content_hash: str) -> Path:
+        return self.cache_dir / "objects" / content_hash[:2] / f"{content_hash[2:]}.z"
+
+    def _read_object(self, content_hash: str) -> Optional[bytes]:
+        try:
+            return zlib.decompress(self._object_path(content_hash).read_bytes())
+        except (OSError, zlib.error):
+            return None
+
+    def _unlink_object(self, content_hash: str):
+        try:
+            self._object_path(content_hash).unlink()
+        except OSError:
+            pass
+
+    def _write_object(self, body: bytes) -> str:
+        content_hash = hashlib.sha256(body).hexdigest()
+        path = self._object_path(content_hash)
+        # Another process sharing the directory may have deleted the file
+        if content_hash not in self.objects or not path.exists():
+            data = zlib.compress(body, self.compress_level)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            self.objects[content_hash] = [len(data), len(body), {}]
+        return content_hash
+
+    def _drop(self, key: str):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self._dropped[key] = entry[0]
+            self._dirty = True
+
+    def evict(self):
+        """Drop least recently used entries until the store fits max_bytes.
+
+        Unreferenced objects stop counting at once; their files are
+        deleted by the next save().
+        """
+        with self.lock:
+            refs = Counter(entry[0] for entry in self.entries.values())
+            total = sum(self.objects[h][0] for h in refs if h in self.objects)
+            if total <= self.max_bytes:
+                return
+            for key in sorted(self.entries, key=lambda k: self.entries[k][2]):
+                if total <= self.max_bytes:
+                    break
+                content_hash = self.entries[key][0]
+                self._drop(key)
+                self.stats["evictions"] += 1
+                refs[content_hash] -= 1
+                if refs[content_hash] == 0 and content_hash in self.objects:
+                    total -= self.objects[content_hash][0]
+
+    # -- public API ------------------------------------------------------
+
+    def get(self, url: str, allow_stale: bool = False) -> Optional[CachedPage]:
+        """Cached page for url, or None if missing (or expired, unless allow_stale)."""
+        key = normalize_url(url)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if not allow_stale and time.time() - entry[1] > self.ttl:
+                return None
+            body = self._read_object(entry[0])
+            if body is None:
+                self._drop(key)
+                return None
+            entry[2] = time.time()
+            self._dirty = True
+            return CachedPage(url, entry[0], entry[1], entry[3], entry[4], body, True)
+
+    def put(self, url: str, body: bytes, status: int = 200, headers: Optional[Dict[str, str]] = None) -> CachedPage:
+        """Store a fetched body under url's normalized key."""
+        keep = {k.lower(): v for k, v in (headers or {}).items()
+                if k.lower() in ("etag", "last-modified", "content-type")}
+        now = time.time()
+        with self.lock:
+            content_hash = self._write_object(body)
+            key = normalize_url(url)
+            previous = self.entries.get(key)
+            self.entries[key] = [content_hash, now, now, status, keep]
+            self._dirty = True
+            if previous is not None and previous[0] != content_hash:
+                self._dropped[key] = previous[0]
+            self.evict()
+        return CachedPage(url, content_hash, now, status, keep, body, False)
+
+    def touch(self, url: str) -> Optional[CachedPage]:
+        """Mark a stale entry fresh again (after a 304 Not Modified)."""
+        with self.lock:
+            entry = self.entries.get(normalize_url(url))
+            if entry is None:
+                return None
+            entry[1] = entry[2] = time.time()
+            self._dirty = True
+        return self.get(url, allow_stale=True)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for revalidating url."""
+        entry = self.entries.get(normalize_url(url))
+        if entry is None:
+            return {}
+        headers = {}
+        if "etag" in entry[4]:
+            headers["If-None-Match"] = entry[4]["etag"]
+        if "last-modified" in entry[4]:
+            headers["If-Modified-Since"] = entry[4]["last-modified"]
+        return headers
+
+    def fetch(self, url: str, timeout: float = 15.0) -> CachedPage:
+        """Return the page from cache, revalidating or downloading as needed."""
+        page = self.get(url)
+        if page is not None:
+            self.stats["hits"] += 1
+            return page
+
+        request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT, **self.conditional_headers(url)})
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                body = response.read()
+                status = response.status
+                headers = dict(response.headers.items())
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                self.stats["revalidated"] += 1
+                page = self.touch(url)
+                if page is not None:
+                    return page
+            raise
+        self.stats["misses"] += 1
+        return self.put(url, body, status, headers)
+
+    def memoize(self, page: CachedPage, name: str, compute: Callable[[CachedPage], object]):
+        """compute(page) once per content hash; the result must be JSON-serializable."""
+        with self.lock:
+            memo = self.objects.get(page.content_hash, [0, 0, {}])[2]
+            if name in memo:
+                self.stats["memo_hits"] += 1
+                return memo[name]
+        value = compute(page)
+        with self.lock:
+            if page.content_hash in self.objects:
+                self.objects[page.content_hash][2][name] = value
+                self._dirty = True
+        return value
+
+
+def published_time(cache: PageCache, url: str, timeout: float = 15.0) -> Optional[dict]:
+    """Fetch url through the cache and return its memoized Round 2 extraction.
+
+    Uses timestamp_engine.extract_from_html from the validator skill;
+    returns {"published", "method", "priority"} or None. A relative time
+    ("3 hours ago") is memoized as the raw text and resolved against the
+    fetch time of the page in hand, so a later fetch of the same body does
+    not inherit the first extraction's clock.
+    """
+    validator_scripts = Path(__file__).resolve().parents[2] / "daily-tech-news-validator" / "scripts"
+    if str(validator_scripts) not in sys.path:
+        sys.path.insert(0, str(validator_scripts))
+    import timestamp_engine
+
+    def extract(page: CachedPage) -> Optional[dict]:
+        found = timestamp_engine.extract_from_html([page.text()])
+        if found is None:
+            return None
+        relative = timestamp_engine.is_relative(found.raw)
+        return {"published": None if relative else found.published.isoformat(), "raw": found.raw,
+                "method": found.method, "priority": found.priority}
+
+    page = cache.fetch(url, timeout)
+    found = cache.memoize(page, "published_raw", extract)
+    if found is None:
+        return None
+    published = found["published"]
+    if published is None:
+        fetched = datetime.fromtimestamp(page.fetched_at, timezone.utc)
+        parsed = timestamp_engine.parse_timestamp(found["raw"], fetched)
+        if parsed is None:
+            return None
+        published = parsed.published.isoformat()
+    return {"published": published, "method": found["method"], "priority": found["priority"]}
+
+
+def run_benchmark(count: int):
+    """Fetch count pages from a local stand-in server twice: cold, then warm."""
+    import tempfile
+    from local_server import LocalNewsServer, synthetic_pages
+
+    with LocalNewsServer(synthetic_pages(count)) as server, tempfile.TemporaryDirectory() as tmp:
+        urls = [server.url(path) for path in server.pages]
+        for label in ("cold", "warm"):
+            with PageCache(tmp) as cache:
+                start = time.perf_counter()
+                for url in urls:
+                    published_time(cache, url)
+                elapsed = time.perf_counter() - start
+            print(f"⏱️  {label}: {count} pages in {elapsed:.3f}s "
+                  f"(server requests so far: {server.total_requests}, stats: {cache.stats})")
+
+        raw = sum(len(body) for body in server.pages.values())
+        stored = PageCache(tmp).total_bytes
+        print(f"📦 {raw / 1024:.0f} KB of HTML stored as {stored / 1024:.0f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="On-disk page cache for news collection and verification"
+    )
+    parser.add_argument(
+        "urls",
+        nargs="*",
+        help="URLs to fetch through the cache"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help=f"Cache directory (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=DEFAULT_TTL,
+        help=f"Seconds before a cached page is revalidated (default: {DEFAULT_TTL})"
+    )
+    parser.add_argument(
+        "--max-mb",
+        type=float,
+        default=DEFAULT_MAX_BYTES / 1024 / 1024,
+        help="Cache size limit in MB of compressed data (default: 256)"
+    )
+    parser.add_argument(
+        "--published",
+        action="store_true",
+        help="Print the memoized published time of each URL"
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print cache size and entry counts"
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="N",
+        help="Fetch N pages from a local stand-in server, cold and warm"
+    )
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        return
+
+    with PageCache(args.cache_dir, ttl=args.ttl, max_bytes=int(args.max_mb * 1024 * 1024)) as cache:
+        for url in args.urls:
+            try:
+                if args.published:
+                    print(f"  {url}: {published_time(cache, url)}")
+                else:
+                    page = cache.fetch(url)
+                    source = "cache" if page.from_cache else "network"
+                    print(f"  {url}: {len(page.body)} bytes from {source}")
+            except (urllib.error.URLError, OSError) as e:
+                print(f"❌ Error: Could not fetch {url}: {e}")
+
+        if args.stats or not args.urls:
+            print(f"📦 {len(cache.entries)} entries, {len(cache.objects)} objects, "
+                  f"{cache.total_bytes / 1024:.0f} KB compressed (limit {args.max_mb:.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+AI-relevance matcher for validator Round 3 (AI Relevance Validation).
+
+Every keyword list from the AI Relevance Keywords section of
+references/validation_rules.md (primary terms, model names, secondary
+terms, company context rules and exclusion patterns) is compiled into a
+single case-insensitive regex. Each item's title and summary are scanned
+once; secondary keywords such as "computer vision" only count when an AI
+context term occurs within CONTEXT_WINDOW characters, which is checked by
+sliding over the recorded match offsets instead of re-scanning the text.
+
+Decision order follows validate_ai_relevance():
+primary keyword → company + required context → exclusion pattern →
+secondary keyword → no AI keywords.
+
+Usage:
+    python ai_relevance.py <validated.json> [--output relevant.json]
+    python ai_relevance.py --benchmark 100000
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from domain_index import ACCEPT, LLM_EVAL, REJECT
+
+PRIMARY_KEYWORDS = [
+    # Core AI terms
+    "artificial intelligence", "AI", "AI model", "AI chip", "AI accelerator",
+    "AI data center", "data center AI", "AI training", "AI inference",
+    "machine learning", "deep learning", "neural network", "large language model",
+    "LLM", "LLMs", "generative AI", "GenAI", "foundation model", "training data",
+    "AGI", "AI safety", "AI alignment", "responsible AI", "AI governance", "AI regulation",
+    "人工智能", "大模型", "大语言模型", "机器学习", "深度学习", "神经网络", "生成式AI",
+    # Model names
+    "GPT-3", "GPT-3.5", "GPT-4", "GPT-4o", "GPT-4.5", "GPT-5", "ChatGPT", "Claude",
+    "Gemini", "Bard", "LLaMA", "PaLM", "DALL-E", "Midjourney", "Stable Diffusion",
+    "Copilot", "DeepSeek", "Qwen", "Grok",
+    # Technical terms
+    "transformer", "attention mechanism", "RLHF", "fine-tuning", "fine tuning",
+    "prompt engineering", "few-shot learning", "zero-shot learning", "multimodal",
+    "diffusion model",
+]
+
+# Count only with an AI context term nearby ("require AI context")
+SECONDARY_KEYWORDS = [
+    "computer vision", "natural language processing", "NLP", "speech recognition",
+    "autonomous driving", "recommendation system", "reinforcement learning",
+    "inference", "alignment", "tensor processing unit", "TPU", "H100", "A100",
+    "MI300", "inference engine", "training cluster",
+]
+
+# Words that make a nearby secondary keyword AI-related on top of the primary terms
+CONTEXT_TERMS = ["model", "models", "ML", "algorithm", "perception", "智能"]
+
+# Companies whose whole business is AI; their name is context for secondary terms
+AI_COMPANIES = [
+    "OpenAI", "Anthropic", "DeepMind", "xAI", "Mistral AI", "Cohere",
+    "Stability AI", "Hugging Face", "Perplexity",
+]
+
+# Company name alone is insufficient (Requires_AI_Context / Company_AI_Context)
+COMPANY_RULES: Dict[str, Tuple[List[str], List[str]]] = {
+    "NVIDIA": (["AI chip", "H100", "A100", "Blackwell", "AI data center", "AI training", "inference"],
+               ["gaming GPU", "crypto mining", "automotive"]),
+    "AMD": (["MI300", "Instinct", "AI accelerator", "ROCm"],
+            ["Ryzen", "EPYC", "Radeon"]),
+    "Apple": (["Apple Intelligence", "on-device AI", "neural engine", "Core ML"],
+              ["iOS update", "hardware specs"]),
+    "Intel": (["Gaudi", "Habana Labs", "AI PC"],
+              ["desktop CPU", "server CPU"]),
+    "Google": (["AI", "DeepMind", "Gemini"], []),
+    "Microsoft": (["Azure AI", "Copilot"], []),
+    "Meta": (["AI", "LLaMA", "PyTorch"], []),
+    "Amazon": (["AWS AI", "Bedrock"], []),
+}
+
+# "<trigger> WITHOUT <unless>" auto-reject patterns
+EXCLUSION_PATTERNS: List[Tuple[str, List[str], List[str]]] = [
+    ("semiconductor manufacturing", ["semiconductor manufacturing", "foundry capacity"], ["AI chip"]),
+    ("process node", ["3nm", "5nm"], ["AI", "GPU", "accelerator"]),
+    ("lithography", ["lithography", "EUV"], ["AI chip production"]),
+    ("rare earth", ["rare earth", "silicon wafer"], ["AI hardware"]),
+    ("5G/6G network", ["5G", "6G"], ["AI network optimization", "AI network"]),
+    ("cloud computing", ["cloud computing"], ["AI", "ML service"]),
+    ("blockchain", ["blockchain", "cryptocurrency", "crypto mining"], ["AI application", "AI"]),
+    ("quantum computing", ["quantum computing"], ["AI acceleration", "algorithm", "AI application"]),
+    ("metaverse", ["metaverse"], ["AI avatar", "generation", "AI"]),
+    ("gaming", ["gaming GPU", "graphics card"], ["AI training"]),
+    ("game engine", ["game engine"], ["AI NPC", "procedural generation"]),
+    ("esports", ["esports"], ["AI analysis"]),
+]
+
+# Characters between a secondary keyword and the nearest AI context term
+CONTEXT_WINDOW = 120
+RELEVANCE_THRESHOLD = 0.95
+EXCLUSION_RATE_LIMIT = 0.05
+
+# Action codes attached to each compiled term
+_PRIMARY = 0
+_SECONDARY = 1
+_CONTEXT = 2
+_COMPANY = 3
+_REQUIRED = 4
+_EXCLUDED = 5
+_TRIGGER = 6
+_UNLESS = 7
+
+_SPACE_RE = re.compile(r"\s+")
+
+
+class Relevance(NamedTuple):
+    """Round 3 verdict for one item."""
+    status: str
+    confidence: float
+    primary_keywords: List[str]
+    company: Optional[str]
+    reason: str
+
+    @property
+    def relevance_score(self) -> int:
+        return round(self.confidence * 10)
+
+    def ai_validation(self) -> dict:
+        """Return the ai_validation block of validated.json."""
+        return {
+            "primary_keywords": self.primary_keywords,
+            "company": self.company,
+            "relevance_score": self.relevance_score,
+        }
+
+
+def _normalize(term: str) -> str:
+    return _SPACE_RE.sub(" ", term.lower())
+
+
+class RelevanceMatcher:
+    """One combined regex over every Round 3 keyword table."""
+
+    def __init__(self):
+        actions: Dict[str, List[tuple]] = defaultdict(list)
+        canonical: Dict[str, str] = {}
+
+        def add(term: str, action: tuple):
+            key = _normalize(term)
+            canonical.setdefault(key, term)
+            if action not in actions[key]:
+                actions[key].append(action)
+
+        for term in PRIMARY_KEYWORDS:
+            add(term, (_PRIMARY,))
+        for term in SECONDARY_KEYWORDS:
+            add(term, (_SECONDARY,))
+        for term in CONTEXT_TERMS + AI_COMPANIES:
+            add(term, (_CONTEXT,))
+        for term in AI_COMPANIES:
+            add(term, (_COMPANY, term))
+        for company, (required, excluded) in COMPANY_RULES.items():
+            add(company, (_COMPANY, company))
+            for term in required:
+                add(term, (_REQUIRED, company))
+            for term in excluded:
+                add(term, (_EXCLUDED, company))
+        for idx, (_, triggers, unless) in enumerate(EXCLUSION_PATTERNS):
+            for term in triggers:
+                add(term, (_TRIGGER, idx))
+            for term in unless:
+                add(term, (_UNLESS, idx))
+
+        self._actions = {key: tuple(value) for key, value in actions.items()}
+        self._canonical = canonical
+        # Longest alternatives first so "AI chip" wins over "AI"; ASCII
+        # boundaries keep "AI" out of "said" but still match inside Chinese
+        alternatives = sorted(canonical.values(), key=len, reverse=True)
+        body = "|".join(re.escape(term).replace(r"\ ", r"\s+") for term in alternatives)
+        self._pattern = re.compile(rf"(?<![A-Za-z0-9])(?:{body})(?![A-Za-z0-9])", re.IGNORECASE)
+
+    def scan(self, text: str) -> Relevance:
+        """Classify one piece of text (title and summary joined)."""
+        actions = self._actions
+        primary: List[str] = []
+        secondary: List[Tuple[int, str]] = []
+        context: List[int] = []
+        companies: List[str] = []
+        required = set()
+        excluded = set()
+        triggers = set()
+        unless = set()
+
+        for match in self._pattern.finditer(text):
+            key = match.group().lower()
+            if " " in key or "\t" in key or "\n" in key:
+                key = _normalize(key)
+            for action in actions[key]:
+                code = action[0]
+                if code == _PRIMARY:
+                    term = self._canonical[key]
+                    if term not in primary:
+                        primary.append(term)
+                    context.append(match.start())
+                elif code == _SECONDARY:
+                    secondary.append((match.start(), self._canonical[key]))
+                elif code == _CONTEXT:
+                    context.append(match.start())
+                elif code == _COMPANY:
+                    if action[1] not in companies:
+                        companies.append(action[1])
+                elif code == _REQUIRED:
+                    required.add(action[1])
+                elif code == _EXCLUDED:
+                    excluded.add(action[1])
+                elif code == _TRIGGER:
+                    triggers.add(action[1])
+                else:
+                    unless.add(action[1])
+
+        company = companies[0] if companies else None
+
+        if primary:
+            return Relevance(ACCEPT, 1.0, primary, company, "primary-keyword")
+
+        for name in companies:
+            if name in COMPANY_RULES:
+                if name in excluded:
+                    return Relevance(REJECT, 0.0, [], name, "excluded-pattern")
+                if name in required:
+                    return Relevance(ACCEPT, 0.8, [name], name, "company-context")
+
+        for idx in sorted(triggers - unless):
+            return Relevance(REJECT, 0.0, [], company, EXCLUSION_PATTERNS[idx][0])
+
+        if secondary:
+            in_context = _with_context(secondary, context, CONTEXT_WINDOW)
+            if in_context:
+                return Relevance(ACCEPT, 0.7, in_context, company, "secondary-in-context")
+            return Relevance(LLM_EVAL, 0.5, [], company, "needs-manual-review")
+
+        return Relevance(REJECT, 0.0, [], company, "no-ai-keywords")
+
+    def classify(self, item: dict) -> Relevance:
+        return self.scan(f"{item.get('title') or ''}\n{item.get('summary') or ''}")
+
+    def classify_batch(self, items: Iterable[dict]) -> List[Relevance]:
+        classify = self.classify
+        return [classify(item) for item in items]
+
+
+def _with_context(secondary: Sequence[Tuple[int, str]], context: Sequence[int], window: int) -> List[str]:
+    """Secondary terms with a context offset within ±window.
+
+    Both lists are already in text order, so a single pointer slides over
+    the context offsets as the secondary offsets advance.
+    """
+    found: List[str] = []
+    j = 0
+    for offset, term in secondary:
+        while j < len(context) and context[j] < offset - window:
+            j += 1
+        if j < len(context) and context[j] <= offset + window and term not in found:
+            found.append(term)
+    return found
+
+
+_default_matcher: Optional[RelevanceMatcher] = None
+
+
+def default_matcher() -> RelevanceMatcher:
+    """Return the process-wide matcher compiled from validation_rules.md."""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = RelevanceMatcher()
+    return _default_matcher
+
+
+def round3_metrics(results: Sequence[Relevance]) -> dict:
+    """Build the quality_metrics.ai_relevance block for a batch.
+
+    relevance_rate is measured after rejection: accepted items over the
+    items that remain (accepted plus those pending manual review).
+    """
+    accepted = sum(1 for r in results if r.status == ACCEPT)
+    pending = sum(1 for r in results if r.status == LLM_EVAL)
+    rejected = sum(1 for r in results if r.status == REJECT)
+    excluded = sum(1 for r in results if r.status == REJECT and r.reason != "no-ai-keywords")
+    remaining = accepted + pending
+    rate = round(accepted / remaining, 3) if remaining else 0.0
+    exclusion_rate = excluded / len(results) if results else 0.0
+
+    return {
+        "ai_focused_count": accepted,
+        "non_ai_rejected": rejected,
+        "manual_review_count": pending,
+        "relevance_rate": rate,
+        "status": "PASS" if rate >= RELEVANCE_THRESHOLD and exclusion_rate <= EXCLUSION_RATE_LIMIT else "FAIL",
+    }
+
+
+def _synthetic_items(count: int, seed: int = 0) -> List[dict]:
+    rng = random.Random(seed)
+    subjects = ["OpenAI", "NVIDIA", "TSMC", "Apple", "Startup", "Meta", "Researchers", "Samsung"]
+    phrases = [
+        "unveils GPT-5 with multimodal reasoning", "ships H100 clusters for AI training",
+        "expands 3nm production capacity", "improves computer vision models",
+        "launches new gaming GPU lineup", "reports quarterly revenue growth",
+        "open-sources a large language model", "adds speech recognition to devices",
+    ]
+    filler = ("The company said the update would roll out to customers over the coming weeks, "
+              "with pricing and availability details to follow in a later announcement.")
+    return [
+        {
+            "title": f"{rng.choice(subjects)} {rng.choice(phrases)}",
+            "summary": f"{rng.choice(subjects)} {rng.choice(phrases)}. {filler}",
+        }
+        for _ in range(count)
+    ]
+
+
+def run_benchmark(count: int):
+    items = _synthetic_items(count)
+    matcher = default_matcher()
+    start = time.perf_counter()
+    results = matcher.classify_batch(items)
+    elapsed = time.perf_counter() - start
+    print(f"⏱️  Classified {count} items in {elapsed:.3f}s ({count / elapsed * 60:,.0f} items/min)")
+    print(json.dumps(round3_metrics(results), indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Score AI relevance of news items in one scan (validator Round 3)"
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        help="validated.json (or a JSON list of items)"
+    )
+    parser.add_argument(
+        "--output",
+        help="Write items with ai_validation attached, non-AI items removed"
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="N",
+        help="Classify N synthetic items and report throughput"
+    )
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        return
+
+    if not args.input:
+        parser.error("input file is required unless --benchmark is given")
+
+    try:
+        with open(args.input, "r", encoding="utf-8") as f:
+            document = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Error: Could not read {args.input}: {e}")
+        sys.exit(1)
+
+    items = document if isinstance(document, list) else document.get("validated_items", [])
+    results = default_matcher().classify_batch(items)
+
+    for item, result in zip(items, results):
+        if result.status == REJECT:
+            print(f"  ❌ \"{item.get('title')}\" - {result.reason}")
+        elif result.status == LLM_EVAL:
+            print(f"  ⚠️  \"{item.get('title')}\" - {result.reason}")
+    metrics = round3_metrics(results)
+    print(json.dumps(metrics, indent=2))
+
+    if args.output:
+        kept = []
+        for item, result in zip(items, results):
+            if result.status == REJECT:
+                continue
+            item = dict(item)
+            item["ai_validation"] = result.ai_validation()
+            kept.append(item)
+        if isinstance(document, dict):
+            document = dict(document)
+            document["validated_items"] = kept
+            document.setdefault("quality_metrics", {})["ai_relevance"] = metrics
+        else:
+            document = kept
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate detection for validator Round 4 (Deduplication).
+
+Instead of comparing every pair of items, candidates are generated from
+MinHash/LSH banding over title, summary and URL shingles plus exact
+indexes on normalized URL and content fingerprint
+("OpenAI|GPT-5|AI Models|2025-11-20"). Only candidate pairs get the exact
+checks from references/validation_rules.md:
+
+- Title: exact match, Levenshtein distance <3, or combined similarity
+  (0.3 × Levenshtein similarity + 0.7 × word overlap) ≥ 0.8
+- Fingerprint: identical company|product|event|date
+- URL: identical after normalization, or same domain with path
+  similarity ≥ 0.9
+
+Duplicate clusters are merged keeping the item with the best
+Merge_Strategy priority: Tier, then recency, then completeness (the longer
+summary), then credibility.
+
+Usage:
+    python dedup_engine.py <validated.json> [--output deduped.json]
+    python dedup_engine.py tech_news_20251120_validated.json --archive .story_archive [--days 7]
+    python dedup_engine.py --benchmark 5000
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from collections import defaultdict
+from hashlib import blake2b
+from itertools import combinations
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from domain_index import normalize_host, split_url
+
+# One 64-byte BLAKE2b digest per shingle gives 32 independent 16-bit hash
+# values, so a signature is an element-wise min computed entirely in C
+NUM_PERM = 32
+# 8 bands × 4 rows puts the LSH threshold near Jaccard 0.6 for titles and
+# summaries; URL paths must reach 0.9 similarity, so they use 4 × 8 (≈0.84)
+BANDS = 8
+URL_BANDS = 4
+
+TITLE_SIMILARITY_THRESHOLD = 0.8
+PATH_SIMILARITY_THRESHOLD = 0.9
+MAX_TITLE_EDIT_DISTANCE = 2  # "Levenshtein distance <3"
+
+# Buckets larger than this are boilerplate shingles, not stories
+MAX_BUCKET_SIZE = 200
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[.\-'][a-z0-9]+)*|[\u3400-\u9fff]")
+_PATH_TOKEN_RE = re.compile(r"[a-z0-9]+|[\u3400-\u9fff]")
+
+
+class _Entry(NamedTuple):
+    """Per-item features computed once and reused by every check."""
+    title: str
+    title_tokens: frozenset
+    title_chars: frozenset
+    url_key: str
+    domain: str
+    path: str
+    path_tokens: frozenset
+    fingerprint: Optional[str]
+
+
+class DedupResult(NamedTuple):
+    items: List[dict]
+    clusters: List[List[int]]
+    pair_reasons: Dict[Tuple[int, int], str]
+    metrics: dict
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Edit distance using Myers' bit-parallel algorithm (O(len(b)) int ops)."""
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+
+    m = len(b)
+    peq: Dict[str, int] = {}
+    for idx, ch in enumerate(b):
+        peq[ch] = peq.get(ch, 0) | (1 << idx)
+
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv, score = mask, 0, m
+    for ch in a:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+    return score
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def title_similarity(title1: str, title2: str, tokens1: frozenset, tokens2: frozenset) -> float:
+    """Combined score from validation_rules.md: 0.3 × Levenshtein + 0.7 × Jaccard."""
+    if title1 == title2:
+        return 1.0
+    word_overlap = jaccard(tokens1, tokens2)
+    # Even a perfect Levenshtein score cannot lift this pair over the threshold
+    if 0.3 + 0.7 * word_overlap < TITLE_SIMILARITY_THRESHOLD:
+        return 0.7 * word_overlap
+    longest = max(len(title1), len(title2))
+    lev_similarity = 1 - levenshtein(title1, title2) / longest
+    return 0.3 * lev_similarity + 0.7 * word_overlap
+
+
+def _get(item: dict, *path, default=None):
+    for key in path:
+        if not isinstance(item, dict) or key not in item:
+            return default
+        item = item[key]
+    return item if item is not None else default
+
+
+def item_url(item: dict) -> str:
+    return _get(item, "source", "url") or item.get("source_url") or ""
+
+
+def generate_fingerprint(item: dict) -> Optional[str]:
+    """company|product|event|date, or None when the entities are too sparse to be unique."""
+    company = _get(item, "ai_validation", "company") or item.get("company_name") or ""
+    product = _get(item, "key_data", "product") or _get(item, "key_data", "product_name") or ""
+    if not company or not product:
+        return None
+    event = item.get("category") or ""
+    published = _get(item, "timestamp", "published") or item.get("published_date") or ""
+    return f"{company}|{product}|{event}|{str(published)[:10]}".lower()
+
+
+def _features(item: dict) -> _Entry:
+    title = (item.get("title") or "").strip().lower()
+    raw_host, path = split_url(item_url(item))
+    domain = normalize_host(raw_host)
+    path = path.rstrip("/").lower()
+    return _Entry(
+        title=title,
+        title_tokens=frozenset(_TOKEN_RE.findall(title)),
+        title_chars=frozenset(title),
+        url_key=f"{domain}{path}" if domain else "",
+        domain=domain,
+        path=path,
+        path_tokens=frozenset(_PATH_TOKEN_RE.findall(path)),
+        fingerprint=generate_fingerprint(item),
+    )
+
+
+def _shingles(text: str, size: int) -> Set[str]:
+    tokens = _TOKEN_RE.findall(text.lower())
+    if len(tokens) < size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def minhash(shingles: Set[str]) -> Tuple[int, ...]:
+    """MinHash signature of NUM_PERM 16-bit values."""
+    if not shingles:
+        return ()
+    rows = [memoryview(blake2b(s.encode("utf-8"), digest_size=NUM_PERM * 2).digest()).cast("H")
+            for s in shingles]
+    return tuple(map(min, *rows)) if len(rows) > 1 else tuple(rows[0])
+
+
+def _band_keys(signature: Tuple[int, ...], family: str, bands: int = BANDS) -> Iterable[Tuple]:
+    rows = len(signature) // bands
+    for band in range(bands):
+        yield (family, band) + signature[band * rows:(band + 1) * rows]
+
+
+def duplicate_reason(a: _Entry, b: _Entry) -> Optional[str]:
+    """Exact Round 4 checks for one candidate pair; returns the matching rule."""
+    if a.url_key and a.url_key == b.url_key:
+        return "same_url"
+    if a.title and a.title == b.title:
+        return "exact_title"
+    if a.fingerprint and a.fingerprint == b.fingerprint:
+        return "fingerprint"
+    if a.title and b.title:
+        overlap = jaccard(a.title_tokens, b.title_tokens)
+        # Each edit adds or removes at most two distinct characters
+        close_enough = (abs(len(a.title) - len(b.title)) <= MAX_TITLE_EDIT_DISTANCE
+                        and len(a.title_chars ^ b.title_chars) <= 2 * MAX_TITLE_EDIT_DISTANCE)
+        if close_enough or 0.3 + 0.7 * overlap >= TITLE_SIMILARITY_THRESHOLD:
+            # One edit-distance computation serves both title rules
+            distance = levenshtein(a.title, b.title)
+            if distance <= MAX_TITLE_EDIT_DISTANCE:
+                return "title_edit_distance"
+            lev_similarity = 1 - distance / max(len(a.title), len(b.title))
+            if 0.3 * lev_similarity + 0.7 * overlap >= TITLE_SIMILARITY_THRESHOLD:
+                return "title_similarity"
+    if a.domain and a.domain == b.domain and a.path and b.path:
+        if title_similarity(a.path, b.path, a.path_tokens, b.path_tokens) >= PATH_SIMILARITY_THRESHOLD:
+            return "similar_url_path"
+    return None
+
+
+def candidate_pairs(items: List[dict], entries: List[_Entry]) -> Set[Tuple[int, int]]:
+    """Pairs sharing an LSH band, a normalized URL or a fingerprint."""
+    buckets: Dict[Tuple, List[int]] = defaultdict(list)
+
+    for idx, (item, entry) in enumerate(zip(items, entries)):
+        if entry.url_key:
+            buckets[("url", entry.url_key)].append(idx)
+        if entry.fingerprint:
+            buckets[("fp", entry.fingerprint)].append(idx)
+        if entry.title:
+            buckets[("title", entry.title)].append(idx)
+
+        # Date segments in paths are shared by every story of the day
+        path_shingles = {f"{entry.domain}/{tok}" for tok in entry.path_tokens if not tok.isdigit()}
+        families = (
+            ("t", _shingles(entry.title, 1) | _shingles(entry.title, 2), BANDS),
+            ("s", _shingles(item.get("summary") or "", 3), BANDS),
+            ("u", path_shingles, URL_BANDS),
+        )
+        for family, shingles, bands in families:
+            signature = minhash(shingles)
+            if signature:
+                for key in _band_keys(signature, family, bands):
+                    buckets[key].append(idx)
+
+    pairs: Set[Tuple[int, int]] = set()
+    for members in buckets.values():
+        if 1 < len(members) <= MAX_BUCKET_SIZE:
+            pairs.update(combinations(members, 2))
+    return pairs
+
+
+def priority_key(item: dict) -> Tuple:
+    """Merge_Strategy order: Tier 1 > Tier 2, newer, more complete (longer summary), more credible."""
+    tier = _get(item, "source", "tier", default=0)
+    tier_rank = tier if tier in (1, 2) else 3
+    age = _get(item, "timestamp", "age_hours", default=float("inf"))
+    summary_length = _get(item, "completeness", "summary_length") or len(item.get("summary") or "")
+    credibility = _get(item, "source", "credibility", default=0.0) or 0.0
+    return (tier_rank, age, -summary_length, -credibility)
+
+
+def _clusters(count: int, edges: Iterable[Tuple[int, int]]) -> List[List[int]]:
+    parent = list(range(count))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in edges:
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[max(ra, rb)] = min(ra, rb)
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for idx in range(count):
+        groups[find(idx)].append(idx)
+    return sorted(groups.values(), key=lambda group: group[0])
+
+
+def merge_cluster(items: List[dict]) -> dict:
+    """Keep the highest-priority item and note every merged source."""
+    ordered = sorted(items, key=priority_key)
+    primary = dict(ordered[0])
+    if len(ordered) > 1:
+        primary["sources_merged"] = [item.get("source", {"url": item_url(item)}) for item in ordered]
+        primary["duplicate_count"] = len(ordered)
+    return primary
+
+
+def find_duplicate_pairs(items: List[dict]) -> Dict[Tuple[int, int], str]:
+    """Run candidate generation plus exact checks; returns confirmed pairs."""
+    entries = [_features(item) for item in items]
+    confirmed: Dict[Tuple[int, int], str] = {}
+    for a, b in sorted(candidate_pairs(items, entries)):
+        reason = duplicate_reason(entries[a], entries[b])
+        if reason:
+            confirmed[(a, b)] = reason
+    return confirmed
+
+
+def deduplicate(items: List[dict], min_items: int = 40) -> DedupResult:
+    """Cluster duplicates, merge each cluster and compute Round 4 metrics."""
+    pairs = find_duplicate_pairs(items)
+    clusters = _clusters(len(items), pairs)
+    merged = [merge_cluster([items[idx] for idx in cluster]) for cluster in clusters]
+
+    exact = set()
+    for (a, b), reason in pairs.items():
+        if reason in ("same_url", "exact_title"):
+            exact.add(b)
+
+    # Self-check: anything still detected as a duplicate after merging
+    residual = len({b for _, b in find_duplicate_pairs(merged)}) if merged else 0
+    removed = len(items) - len(merged)
+    initial = len(items)
+    final = len(merged)
+    dedup_rate = 1 - residual / final if final else 1.0
+
+    status = "PASS" if dedup_rate >= 0.95 else "FAIL"
+    if status == "PASS" and final < min_items:
+        status = "WARNING"
+
+    metrics = {
+        "initial_count": initial,
+        "final_count": final,
+        "exact_duplicates": len(exact),
+        "similar_merged": sum(1 for c in clusters if len(c) > 1),
+        "duplicate_rate": round(removed / initial, 3) if initial else 0.0,
+        "dedup_rate": round(dedup_rate, 3),
+        "status": status,
+    }
+    return DedupResult(merged, clusters, pairs, metrics)
+
+
+def _synthetic_items(count: int, duplicate_rate: float = 0.1, seed: int = 0) -> List[dict]:
+    """Items in validated_items shape with a controlled share of near-duplicates."""
+    rng = random.Random(seed)
+    companies = ["OpenAI", "Anthropic", "Google", "Meta", "NVIDIA", "Microsoft", "Mistral AI", "xAI"]
+    verbs = ["announces", "launches", "unveils", "releases", "details", "ships"]
+    nouns = ["model", "agent", "API", "chip", "assistant", "platform", "SDK", "benchmark"]
+    hosts = ["techcrunch.com", "reuters.com", "theverge.com", "36kr.com", "venturebeat.com"]
+    base_words = ("inference training multimodal reasoning developers enterprise pricing latency tokens "
+                  "context window open source safety evaluation partnership deployment cloud").split()
+    words = base_words + [f"{rng.choice(base_words)}{n}" for n in range(2000)]
+
+    items: List[dict] = []
+    for idx in range(count):
+        if items and rng.random() < duplicate_rate:
+            base = rng.choice(items)
+            title = base["title"].replace(" new ", " latest ") if rng.random() < 0.5 else base["title"] + "!"
+            summary = base["summary"]
+        else:
+            company = rng.choice(companies)
+            topic = " ".join(rng.choice(words) for _ in range(4))
+            title = f"{company} {rng.choice(verbs)} new {rng.choice(nouns)} for {topic}"
+            summary = " ".join(rng.choice(words) for _ in range(40))
+        host = rng.choice(hosts)
+        slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+        items.append({
+            "id": f"item_{idx:05d}",
+            "title": title,
+            "source": {"name": host, "url": f"https://{host}/2025/11/20/{slug}",
+                       "credibility": 9.5 if host != "36kr.com" else 7.5,
+                       "tier": 1 if host != "36kr.com" else 2},
+            "timestamp": {"published": "2025-11-20T08:00:00Z", "age_hours": rng.uniform(0, 48)},
+            "completeness": {"score": rng.uniform(6, 10), "summary_length": len(summary)},
+            "summary": summary,
+            "category": "AI Models",
+        })
+    return items
+
+
+def run_benchmark(count: int):
+    items = _synthetic_items(count)
+    start = time.perf_counter()
+    result = deduplicate(items)
+    elapsed = time.perf_counter() - start
+    print(f"⏱️  Deduplicated {count} items in {elapsed:.3f}s")
+    print(json.dumps(result.metrics, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Sub-quadratic near-duplicate detection (validator Round 4)"
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        help="validated.json (or a JSON list of items)"
+    )
+    parser.add_argument(
+        "--output",
+        help="Write the deduplicated document to this path"
+    )
+    parser.add_argument(
+        "--archive",
+        help="Story archive directory; items published in the last --days days are dropped first"
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=7,
+        help="Lookback window for --archive (default: 7)"
+    )
+    parser.add_argument(
+        "--date",
+        help="Run date for --archive as YYYYMMDD (default: taken from the input file name)"
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="N",
+        help="Deduplicate N synthetic items and report timing"
+    )
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        return
+
+    if not args.input:
+        parser.error("input file is required unless --benchmark is given")
+
+    try:
+        with open(args.input, "r", encoding="utf-8") as f:
+            document = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Error: Could not read {args.input}: {e}")
+        sys.exit(1)
+
+    items = document if isinstance(document, list) else document.get("validated_items", [])
+
+    previously_published = None
+    if args.archive:
+        from story_archive import StoryArchive, date_from_path
+
+        day = int(args.date) if args.date and args.date.isdigit() else date_from_path(args.input)
+        if day is None:
+            print("❌ Error: --archive needs the run date; pass --date YYYYMMDD")
+            sys.exit(1)
+        items, dropped = StoryArchive(args.archive).filter_published(items, day, args.days)
+        for item, match in dropped:
+            print(f"  📰 already published {match.date} ({match.reason}): \"{item.get('title')}\"")
+        previously_published = len(dropped)
+
+    result = deduplicate(items)
+    if previously_published is not None:
+        result.metrics["previously_published"] = previously_published
+
+    for (a, b), reason in sorted(result.pair_reasons.items()):
+        print(f"  🔁 {reason}: \"{items[a].get('title')}\" ↔ \"{items[b].get('title')}\"")
+    print(json.dumps(result.metrics, indent=2))
+
+    if args.output:
+        if isinstance(document, dict):
+            document = dict(document)
+            document["validated_items"] = result.items
+            document.setdefault("quality_metrics", {})["deduplication"] = result.metrics
+        else:
+            document = result.items
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Compiled domain-credibility index for validator Round 1 (Source Credibility).
+
+The whitelist, special-case and blacklist tables from
+references/validation_rules.md are compiled once into a reversed-label host
+trie with per-host path-prefix exceptions, so a URL is classified with one
+regex match and a few dict lookups instead of scanning every list.
+
+Validation order (CRITICAL, from validation_rules.md):
+    1. Tier 1 whitelist      → ACCEPT
+    2. Tier 2 whitelist      → ACCEPT (including community sources)
+    3. Special Cases         → ACCEPT (verified accounts)
+    4. Blacklist             → REJECT
+    5. Unknown domain        → LLM_EVAL (5-8/10, manual review flag)
+
+Usage:
+    python domain_index.py <url> [<url> ...]
+    python domain_index.py --input urls.txt [--summary]
+    python domain_index.py --benchmark 200000
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+ACCEPT = "ACCEPT"
+REJECT = "REJECT"
+LLM_EVAL = "LLM_EVAL"
+
+# Ranks follow the validation order; a lower rank always wins
+RANK_TIER1 = 0
+RANK_TIER2 = 1
+RANK_SPECIAL = 2
+RANK_BLACKLIST = 3
+
+# Tier 1 Sources (Credibility 9-10/10)
+TIER1_SOURCES: Dict[str, float] = {
+    # International_Tech_Media
+    "techcrunch.com": 9.5,
+    "theverge.com": 9.5,
+    "arstechnica.com": 9.5,
+    "venturebeat.com": 9.5,
+    "wired.com": 9.5,
+    "cnet.com": 9.5,
+    "zdnet.com": 9.5,
+    # Business_Financial
+    "bloomberg.com": 9.5,
+    "reuters.com": 9.5,
+    "cnbc.com": 9.5,
+    "wsj.com": 9.5,
+    "ft.com": 9.5,
+    "economist.com": 9.5,
+    "forbes.com/tech": 9.5,
+    # Company_Official
+    "openai.com/blog": 9.5,
+    "anthropic.com/news": 9.5,
+    "blog.google": 9.5,
+    "blogs.microsoft.com": 9.5,
+    "ai.meta.com/blog": 9.5,
+    "aws.amazon.com/blogs": 9.5,
+    "nvidia.com/blog": 9.5,
+}
+
+# Tier 2 Sources (Credibility 7-8/10)
+TIER2_SOURCES: Dict[str, float] = {
+    # Tech_Publications
+    "siliconangle.com": 7.5,
+    "techtarget.com": 7.5,
+    "infoworld.com": 7.5,
+    "computerworld.com": 7.5,
+    "itworld.com": 7.5,
+    # Chinese_Tech_Media
+    "36kr.com": 7.5,
+    "tmtpost.com": 7.5,
+    "caixin.com": 7.5,
+    "yicai.com": 7.5,
+    "jiemian.com": 7.5,
+    "geekpark.net": 7.5,
+    # Academic_Research
+    "arxiv.org": 8.0,
+    "papers.nips.cc": 8.0,
+    "openreview.net": 8.0,
+    "research.google": 8.0,
+    "research.fb.com": 8.0,
+    # Community_Product_Discovery
+    "producthunt.com": 8.0,
+    "news.ycombinator.com": 8.0,
+    "github.com/trending": 8.0,
+    "reddit.com/r/artificial": 7.0,
+    "reddit.com/r/machinelearning": 7.0,
+}
+
+# Community sources that are only accepted above an engagement threshold
+# (Validation_Requirements: >100 upvotes); unknown engagement is not a reject
+MIN_UPVOTES: Dict[str, int] = {
+    "reddit.com/r/artificial": 100,
+    "reddit.com/r/machinelearning": 100,
+}
+BELOW_ENGAGEMENT_CREDIBILITY = 4.0
+
+# Special Cases: official social accounts and verified blogs
+SPECIAL_ACCOUNTS: List[str] = [
+    "OpenAI", "AnthropicAI", "Google", "Microsoft", "MetaAI",
+    "sama", "ylecun", "karpathy",
+]
+SPECIAL_CASES: Dict[str, Optional[float]] = {
+    **{f"twitter.com/{account}": 8.0 for account in SPECIAL_ACCOUNTS},
+    **{f"x.com/{account}": 8.0 for account in SPECIAL_ACCOUNTS},
+    "medium.com/@karpathy": 8.0,
+    # Company pages are not blacklisted, but still need LLM scoring
+    "linkedin.com/company": None,
+}
+
+# Blacklist (Auto-Reject)
+BLACKLIST: List[str] = [
+    # Social_Media
+    "reddit.com",
+    "twitter.com",
+    "x.com",
+    "facebook.com",
+    "linkedin.com",
+    "instagram.com",
+    "tiktok.com",
+    # User_Generated
+    "medium.com",
+    "substack.com",
+    "zhihu.com",
+    "xiaohongshu.com",
+    "douyin.com",
+    "bilibili.com",
+]
+
+# Tier 0 marks sources outside the Tier 1/2 whitelists
+UNTIERED = 0
+
+_URL_RE = re.compile(r"^(?:[A-Za-z][A-Za-z0-9+.\-]*:)?//([^/?#]*)([^?#]*)")
+
+
+class Classification(NamedTuple):
+    """Round 1 verdict for a single URL."""
+    url: str
+    domain: str
+    tier: int
+    credibility: Optional[float]
+    status: str
+    reason: str
+
+    def to_dict(self) -> dict:
+        return self._asdict()
+
+
+class _Rule(NamedTuple):
+    rank: int
+    tier: int
+    credibility: Optional[float]
+    status: str
+    reason: str
+    min_upvotes: int
+
+
+class _Node:
+    __slots__ = ("children", "host_rule", "path_rules")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.host_rule: Optional[_Rule] = None
+        self.path_rules: List[Tuple[str, _Rule]] = []
+
+
+class DomainIndex:
+    """Reversed-label host trie with per-host path-prefix exceptions."""
+
+    def __init__(self):
+        self._root = _Node()
+        # raw netloc → (host, best host-level rule, path rules in priority order)
+        self._host_cache: Dict[str, Tuple[str, Optional[_Rule], List[Tuple[str, _Rule]]]] = {}
+
+    @classmethod
+    def from_rules(cls) -> "DomainIndex":
+        """Compile the tables from validation_rules.md."""
+        index = cls()
+        for entry, score in TIER1_SOURCES.items():
+            index.add(entry, _Rule(RANK_TIER1, 1, score, ACCEPT, "Tier 1 whitelist", 0))
+        for entry, score in TIER2_SOURCES.items():
+            index.add(entry, _Rule(RANK_TIER2, 2, score, ACCEPT, "Tier 2 whitelist",
+                                   MIN_UPVOTES.get(entry, 0)))
+        for entry, score in SPECIAL_CASES.items():
+            if score is None:
+                rule = _Rule(RANK_SPECIAL, UNTIERED, None, LLM_EVAL, "Special case, requires LLM evaluation", 0)
+            else:
+                rule = _Rule(RANK_SPECIAL, UNTIERED, score, ACCEPT, "Verified official account", 0)
+            index.add(entry, rule)
+        for entry in BLACKLIST:
+            index.add(entry, _Rule(RANK_BLACKLIST, UNTIERED, 0.0, REJECT, "Blacklisted domain", 0))
+        return index
+
+    def add(self, entry: str, rule: _Rule):
+        """Register a 'host' or 'host/path-prefix' entry."""
+        host, _, path = entry.lower().partition("/")
+        node = self._root
+        for label in reversed(host.split(".")):
+            node = node.children.setdefault(label, _Node())
+
+        if path:
+            node.path_rules.append(("/" + path.rstrip("/"), rule))
+        elif node.host_rule is None or rule.rank < node.host_rule.rank:
+            node.host_rule = rule
+        self._host_cache.clear()
+
+    def _resolve_host(self, raw_host: str) -> Tuple[str, Optional[_Rule], List[Tuple[str, _Rule]]]:
+        """Collect the rules of every trie node matching a suffix of the host.
+
+        Results are memoized on the raw netloc, so host normalization and the
+        trie walk are paid once per distinct host rather than once per URL.
+        """
+        resolved = self._host_cache.get(raw_host)
+        if resolved is not None:
+            return resolved
+
+        host = normalize_host(raw_host)
+        best: Optional[_Rule] = None
+        path_rules: List[Tuple[str, _Rule]] = []
+        node = self._root
+        for label in reversed(host.split(".")):
+            node = node.children.get(label)
+            if node is None:
+                break
+            # Deeper (more specific) nodes win ties within the same rank
+            if node.host_rule is not None and (best is None or node.host_rule.rank <= best.rank):
+                best = node.host_rule
+            path_rules.extend(node.path_rules)
+
+        # Highest-priority category first, then longest prefix
+        path_rules.sort(key=lambda pr: (pr[1].rank, -len(pr[0])))
+        if best is not None:
+            path_rules = [pr for pr in path_rules if pr[1].rank < best.rank]
+
+        resolved = (host, best, path_rules)
+        self._host_cache[raw_host] = resolved
+        return resolved
+
+    def classify(self, url: str, upvotes: Optional[int] = None) -> Classification:
+        """Classify one URL following the whitelist → special → blacklist order."""
+        raw_host, path = split_url(url)
+        host, best, path_rules = self._resolve_host(raw_host)
+        domain = host
+
+        if path_rules:
+            lowered = path.lower()
+            for prefix, rule in path_rules:
+                if lowered.startswith(prefix) and (len(lowered) == len(prefix) or lowered[len(prefix)] == "/"):
+                    best = rule
+                    domain = host + prefix
+                    break
+
+        if best is None:
+            return Classification(url, host, UNTIERED, None, LLM_EVAL,
+                                  "Unknown domain, requires LLM evaluation")
+
+        if best.min_upvotes and upvotes is not None and upvotes <= best.min_upvotes:
+            return Classification(url, domain, UNTIERED, BELOW_ENGAGEMENT_CREDIBILITY, REJECT,
+                                  f"{best.reason}: below engagement threshold (>{best.min_upvotes} upvotes)")
+
+        return Classification(url, domain, best.tier, best.credibility, best.status, best.reason)
+
+    def classify_batch(
+        self,
+        urls: Iterable[str],
+        upvotes: Optional[Sequence[Optional[int]]] = None
+    ) -> List[Classification]:
+        """Classify a batch of URLs in a single pass."""
+        classify = self.classify
+        if upvotes is None:
+            return [classify(url) for url in urls]
+        return [classify(url, votes) for url, votes in zip(urls, upvotes)]
+
+
+def split_url(url: str) -> Tuple[str, str]:
+    """Return (raw netloc, path) without the cost of urllib.parse."""
+    match = _URL_RE.match(url)
+    if match is not None:
+        return match.group(1), match.group(2)
+
+    # Bare "domain.com/path" strings are common in search output
+    host, slash, path = url.strip().partition("/")
+    return host, slash + path.split("?", 1)[0].split("#", 1)[0]
+
+
+def normalize_host(raw_host: str) -> str:
+    """Lowercase a netloc and drop userinfo, port, trailing dot and 'www.'."""
+    host = raw_host.rpartition("@")[2].partition(":")[0].lower().rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+_default_index: Optional[DomainIndex] = None
+
+
+def default_index() -> DomainIndex:
+    """Return the process-wide index compiled from validation_rules.md."""
+    global _default_index
+    if _default_index is None:
+        _default_index = DomainIndex.from_rules()
+    return _default_index
+
+
+def round1_metrics(results: Sequence[Classification], threshold: float = 7.0) -> dict:
+    """Build the quality_metrics.source_credibility block for a batch."""
+    scored = [r.credibility for r in results if r.status == ACCEPT]
+    blacklisted = sum(1 for r in results if r.status == REJECT)
+    average = round(sum(scored) / len(scored), 2) if scored else 0.0
+    blacklist_rate = blacklisted / len(results) if results else 0.0
+
+    return {
+        "average": average,
+        "tier1_count": sum(1 for r in results if r.status == ACCEPT and r.tier == 1),
+        "tier2_count": sum(1 for r in results if r.status == ACCEPT and r.tier == 2),
+        "unverified_count": sum(1 for r in results if r.status == LLM_EVAL),
+        "blacklisted_count": blacklisted,
+        "threshold": threshold,
+        "status": "PASS" if average >= threshold and blacklist_rate <= 0.05 else "FAIL",
+    }
+
+
+def _synthetic_urls(count: int, seed: int = 0) -> List[str]:
+    """Generate a realistic mix of whitelisted, blacklisted and unknown URLs."""
+    rng = random.Random(seed)
+    hosts = (
+        ["techcrunch.com", "www.reuters.com", "news.ycombinator.com", "36kr.com", "arxiv.org"]
+        + ["reddit.com/r/artificial", "reddit.com/r/pics", "twitter.com/OpenAI", "x.com/randomuser"]
+        + ["medium.com/@someone", "example.net", "blog.google", "openai.com/blog", "openai.com/careers"]
+    )
+    unknown = ["site%d.example.com" % i for i in range(500)]
+    urls = []
+    for i in range(count):
+        host = rng.choice(hosts) if rng.random() < 0.8 else rng.choice(unknown)
+        urls.append(f"https://{host}/2025/11/20/story-{i}?utm_source=feed")
+    return urls
+
+
+def run_benchmark(count: int):
+    """Time batch classification of synthetic URLs."""
+    urls = _synthetic_urls(count)
+    index = DomainIndex.from_rules()
+
+    start = time.perf_counter()
+    results = index.classify_batch(urls)
+    elapsed = time.perf_counter() - start
+
+    print(f"⏱️  Classified {len(results)} URLs in {elapsed:.3f}s "
+          f"({len(results) / elapsed:,.0f} URLs/s)")
+    print(json.dumps(round1_metrics(results), indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Classify source URLs into tier, credibility and accept/reject"
+    )
+    parser.add_argument(
+        "urls",
+        nargs="*",
+        help="URLs to classify"
+    )
+    parser.add_argument(
+        "--input",
+        help="File with one URL per line ('-' for stdin)"
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Print Round 1 quality metrics instead of per-URL results"
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="N",
+        help="Classify N synthetic URLs and report throughput"
+    )
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        return
+
+    urls = list(args.urls)
+    if args.input:
+        stream = sys.stdin if args.input == "-" else open(args.input, "r")
+        with stream:
+            urls.extend(line.strip() for line in stream if line.strip())
+
+    if not urls:
+        parser.error("no URLs given")
+
+    results = default_index().classify_batch(urls)
+    if args.summary:
+        print(json.dumps(round1_metrics(results), indent=2))
+        return
+
+    for result in results:
+        print(json.dumps(result.to_dict(), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
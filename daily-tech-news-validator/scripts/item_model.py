@@ -0,0 +1,699 @@
+#!/usr/bin/env python3
+"""
+Compact item model for the validator rounds, with a fast parser for
+tech_news_[DATE]_raw.md.
+
+Items are __slots__ records (NewsItem) owned by an ItemStore. Text fields
+live on the record; key_data is kept as compact JSON text and decoded on
+access, and a canonical "published" string is rebuilt from the epoch
+column rather than stored; source names, domains, categories, companies and
+keywords are interned, so a corpus holds one copy of each. Numeric fields
+(credibility, tier, age_hours, layer, completeness and relevance scores)
+live in typed columns on the store (array 'd' / 'b'), so a round can scan
+one column without touching the records:
+
+    store = parse_raw_markdown(path, now=now)
+    fresh = store.take(i for i, age in enumerate(store.age_hours) if age <= 48)
+
+Unset values are NaN / -1 and are left out when an item is serialized.
+Whole numbers in the float columns are flagged per row so they come back
+as ints, and values a column cannot hold unchanged (e.g. "credibility":
+"high") are kept as unknown fields. Records are turned back into the
+validated_items schema of validated.json only on demand
+(NewsItem.to_dict(), ItemStore.iter_dicts(), write_json()), so the nested
+dicts are never all in memory at once. Fields the model does not know are
+kept and written back unchanged.
+
+Usage:
+    python item_model.py tech_news_20251120_raw.md --output items.json [--now 2025-11-20T15:30:00+08:00]
+    python item_model.py tech_news_20251120_validated.json --summary
+    python item_model.py --benchmark 50000
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from domain_index import normalize_host, split_url
+from timestamp_engine import SHANGHAI, UTC, compute_ages, parse_timestamp
+
+NAN = float("nan")
+ISO_Z = "%Y-%m-%dT%H:%M:%SZ"
+
+# Known fields per section of a validated_items entry, in schema order
+SECTION_FIELDS = {
+    "source": ("name", "url", "credibility", "tier"),
+    "timestamp": ("published", "parsed_method", "age_hours", "layer"),
+    "ai_validation": ("primary_keywords", "company", "relevance_score"),
+    "completeness": ("score", "has_essential_fields", "has_key_data", "summary_length"),
+}
+TOP_LEVEL_FIELDS = ("id", "title", "source", "timestamp", "ai_validation", "completeness",
+                    "summary", "key_data", "category")
+
+# Raw markdown field labels (English and Chinese) → NewsItem attribute
+RAW_FIELDS = {
+    "source": "source", "来源": "source",
+    "url": "url", "link": "url", "链接": "url",
+    "date": "date", "time": "date", "日期": "date", "时间": "date",
+    "summary": "summary", "摘要": "summary",
+    "key data": "key_data", "关键数据": "key_data",
+}
+
+
+# Bits of ItemStore.int_mask: float columns whose value was given as an int
+INT_BITS = {"credibility": 1, "age_hours": 2, "completeness": 4, "relevance": 8}
+# Largest int a double holds exactly
+MAX_EXACT_INT = 1 << 53
+
+# Column kind of each known numeric field, per section
+NUMERIC_FIELDS = {
+    "source": {"credibility": "d", "tier": "b"},
+    "timestamp": {"age_hours": "d", "layer": "b"},
+    "ai_validation": {"relevance_score": "d"},
+    "completeness": {"score": "d", "has_essential_fields": "?", "has_key_data": "?", "summary_length": "l"},
+}
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+def _float(value) -> float:
+    return NAN if value is None else float(value)
+
+
+def _flag(value) -> int:
+    return -1 if value is None else int(value)
+
+
+def _int_bits(**values) -> int:
+    return sum(bit for name, bit in INT_BITS.items()
+               if type(values[name]) is int and abs(values[name]) < MAX_EXACT_INT)
+
+
+def _fits(value, kind: str) -> bool:
+    """Whether a column of `kind` gives `value` back unchanged."""
+    if value is None or kind == "?":
+        return value is None or type(value) is bool
+    if type(value) is int:
+        if kind == "d":
+            return abs(value) < MAX_EXACT_INT
+        return 0 <= value <= (127 if kind == "b" else 2 ** 31 - 1)
+    return kind == "d" and type(value) is float and math.isfinite(value)
+
+
+def _stored_published(value: Optional[str], epoch: float) -> Optional[str]:
+    """None when `value` is exactly what the epoch column formats back to."""
+    if value is None or math.isnan(epoch):
+        return value
+    return None if value == datetime.fromtimestamp(epoch, UTC).strftime(ISO_Z) else value
+
+
+def _column(name: str, kind: str):
+    """Property reading/writing row self.row of the store's column `name`."""
+    if kind == "d":
+        bit = INT_BITS[name]
+
+        def fget(self):
+            value = getattr(self.store, name)[self.row]
+            if math.isnan(value):
+                return None
+            return int(value) if self.store.int_mask[self.row] & bit else value
+
+        def fset(self, value):
+            getattr(self.store, name)[self.row] = _float(value)
+            mask = self.store.int_mask[self.row] & ~bit
+            if type(value) is int and abs(value) < MAX_EXACT_INT:
+                mask |= bit
+            self.store.int_mask[self.row] = mask
+    else:
+        def fget(self):
+            value = getattr(self.store, name)[self.row]
+            return None if value < 0 else value
+
+        def fset(self, value):
+            getattr(self.store, name)[self.row] = _flag(value)
+    return property(fget, fset)
+
+
+class NewsItem:
+    """One news item; numeric fields are views into the owning store's columns."""
+
+    __slots__ = ("store", "row", "id", "title", "summary", "url", "source_name", "domain",
+                 "_published", "parsed_method", "category", "company", "keywords", "_key_data", "extra")
+
+    credibility = _column("credibility", "d")
+    tier = _column("tier", "b")
+    age_hours = _column("age_hours", "d")
+    layer = _column("layer", "b")
+    completeness = _column("completeness", "d")
+    relevance_score = _column("relevance", "d")
+    has_essential_fields = _column("has_essential", "b")
+    has_key_data = _column("has_key_data", "b")
+
+    @property
+    def published(self) -> Optional[str]:
+        if self._published is not None:
+            return self._published
+        epoch = self.store.epoch[self.row]
+        return None if math.isnan(epoch) else datetime.fromtimestamp(epoch, UTC).strftime(ISO_Z)
+
+    @published.setter
+    def published(self, value: Optional[str]):
+        parsed = parse_timestamp(value) if isinstance(value, str) else None
+        epoch = parsed.published.timestamp() if parsed else NAN
+        self.store.epoch[self.row] = epoch
+        self._published = _stored_published(value, epoch)
+
+    @property
+    def key_data(self):
+        """Decoded on each access; assign a new value to change it."""
+        return None if self._key_data is None else json.loads(self._key_data)
+
+    @key_data.setter
+    def key_data(self, value):
+        self._key_data = None if value is None else json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+    def __repr__(self) -> str:
+        return f"NewsItem({self.id!r}, {self.title!r})"
+
+    def to_dict(self) -> dict:
+        """The validated_items entry for this item; sections with no data are omitted."""
+        store, row = self.store, self.row
+        extra = self.extra or {}
+        int_mask = store.int_mask[row]
+
+        def section(name: str, values: dict) -> Optional[dict]:
+            values = {k: v for k, v in values.items() if v is not None}
+            for key, value in extra.get(name, {}).items():
+                values.setdefault(key, value)  # a value set since loading wins
+            return values or None
+
+        def number(column: array, value_type=float, bit: int = 0):
+            value = column[row]
+            if value_type is float:
+                if math.isnan(value):
+                    return None
+                return int(value) if int_mask & bit else value
+            return None if value < 0 else value_type(value)
+
+        length = store.summary_length[row]
+        fields = {
+            "id": self.id,
+            "title": self.title,
+            "source": section("source", {
+                "name": self.source_name or None, "url": self.url or None,
+                "credibility": number(store.credibility, bit=INT_BITS["credibility"]), "tier": number(store.tier, int),
+            }),
+            "timestamp": section("timestamp", {
+                "published": self.published, "parsed_method": self.parsed_method,
+                "age_hours": number(store.age_hours, bit=INT_BITS["age_hours"]), "layer": number(store.layer, int),
+            }),
+            "ai_validation": section("ai_validation", {
+                "primary_keywords": list(self.keywords) if self.keywords is not None else None,
+                "company": self.company, "relevance_score": number(store.relevance, bit=INT_BITS["relevance"]),
+            }),
+            "completeness": section("completeness", {
+                "score": number(store.completeness, bit=INT_BITS["completeness"]),
+                "has_essential_fields": number(store.has_essential, bool),
+                "has_key_data": number(store.has_key_data, bool),
+                "summary_length": length if length >= 0 else None,
+            }),
+            "summary": self.summary,
+            "key_data": self.key_data,
+            "category": self.category,
+        }
+        out = {key: value for key, value in fields.items() if value is not None}
+        for key, value in extra.get("", {}).items():
+            out.setdefault(key, value)
+        return out
+
+
+class ItemStore:
+    """Items plus their numeric columns; rows line up with self.items."""
+
+    def __init__(self):
+        self.items: List[NewsItem] = []
+        self.credibility = array("d")
+        self.tier = array("b")
+        self.age_hours = array("d")
+        self.layer = array("b")
+        self.completeness = array("d")
+        self.relevance = array("d")
+        self.has_essential = array("b")
+        self.has_key_data = array("b")
+        self.summary_length = array("l")
+        # INT_BITS of the float columns whose value is a whole number given as an int
+        self.int_mask = array("B")
+        # Publication time as UTC epoch seconds (NaN when unknown), for compute_ages()
+        self.epoch = array("d")
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[NewsItem]:
+        return iter(self.items)
+
+    def __getitem__(self, row: int) -> NewsItem:
+        return self.items[row]
+
+    def append(self, *, id: str, title: str, summary: str = "", url: str = "", source_name: str = "",
+               published: Optional[str] = None, parsed_method: Optional[str] = None,
+               category: Optional[str] = None, company: Optional[str] = None,
+               keywords: Optional[Iterable[str]] = None, key_data: Optional[dict] = None,
+               credibility=None, tier=None, age_hours=None, layer=None, completeness=None,
+               relevance_score=None, has_essential_fields=None, has_key_data=None,
+               summary_length=None, epoch=None, extra: Optional[dict] = None) -> NewsItem:
+        item = NewsItem()
+        item.store = self
+        item.row = len(self.items)
+        item.id = id
+        item.title = title
+        item.summary = summary
+        item.url = url
+        item.source_name = _intern(source_name)
+        item.domain = _intern(normalize_host(split_url(url)[0])) if url else ""
+        item._published = _stored_published(published, _float(epoch))
+        item.parsed_method = _intern(parsed_method)
+        item.category = _intern(category)
+        item.company = _intern(company)
+        item.keywords = tuple(sys.intern(k) for k in keywords) if keywords is not None else None
+        item._key_data = None
+        if key_data is not None:
+            item.key_data = key_data
+        item.extra = extra or None
+        self.items.append(item)
+
+        self.credibility.append(_float(credibility))
+        self.tier.append(_flag(tier))
+        self.age_hours.append(_float(age_hours))
+        self.layer.append(_flag(layer))
+        self.completeness.append(_float(completeness))
+        self.relevance.append(_float(relevance_score))
+        self.has_essential.append(_flag(has_essential_fields))
+        self.has_key_data.append(_flag(has_key_data))
+        self.summary_length.append(-1 if summary_length is None else summary_length)
+        self.int_mask.append(_int_bits(credibility=credibility, age_hours=age_hours,
+                                       completeness=completeness, relevance=relevance_score))
+        self.epoch.append(_float(epoch))
+        return item
+
+    def take(self, rows: Iterable[int]) -> "ItemStore":
+        """A new store with the given rows, in the given order (records are shallow-copied)."""
+        out = ItemStore()
+        columns = ("credibility", "tier", "age_hours", "layer", "completeness", "relevance",
+                   "has_essential", "has_key_data", "summary_length", "int_mask", "epoch")
+        sources = [getattr(self, name) for name in columns]
+        targets = [getattr(out, name) for name in columns]
+        for row in rows:
+            old = self.items[row]
+            item = NewsItem()
+            for slot in NewsItem.__slots__:
+                setattr(item, slot, getattr(old, slot))
+            item.store = out
+            item.row = len(out.items)
+            out.items.append(item)
+            for source, target in zip(sources, targets):
+                target.append(source[row])
+        return out
+
+    def update_ages(self, now: Optional[datetime] = None):
+        """Recompute age_hours and layer from the publication times (Round 2)."""
+        known = [row for row, epoch in enumerate(self.epoch) if not math.isnan(epoch)]
+        ages, layers = compute_ages([self.epoch[row] for row in known], now)
+        bit = INT_BITS["age_hours"]
+        for row, age, layer in zip(known, ages, layers):
+            self.age_hours[row] = round(age, 1)
+            self.int_mask[row] &= ~bit
+            self.layer[row] = layer
+
+    # -- serialization ---------------------------------------------------
+
+    def iter_dicts(self) -> Iterator[dict]:
+        for item in self.items:
+            yield item.to_dict()
+
+    def write_json(self, path: Path, key: str = "validated_items", document: Optional[dict] = None):
+        """Write {**document, key: [items]} one item at a time, atomically."""
+        document = dict(document or {})
+        document.pop(key, None)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            head = json.dumps(document, ensure_ascii=False, indent=2)
+            f.write(head[:-1].rstrip() + ("," if document else "") + f'\n  "{key}": [')
+            for idx, item in enumerate(self.items):
+                body = json.dumps(item.to_dict(), ensure_ascii=False, indent=2)
+                f.write(("," if idx else "") + "\n    " + body.replace("\n", "\n    "))
+            f.write("\n  ]\n}\n" if self.items else "]\n}\n")
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict]) -> "ItemStore":
+        """Build a store from validated_items entries, keeping unknown fields."""
+        store = cls()
+        for raw in items:
+            extra = {}
+            sections = {}
+            for name, fields in SECTION_FIELDS.items():
+                value = raw.get(name)
+                if isinstance(value, dict):
+                    # Explicit nulls, and numbers a column can't hold unchanged,
+                    # travel with the unknown fields
+                    numeric = NUMERIC_FIELDS[name]
+                    odd = {k for k, v in value.items()
+                           if k in fields and (v is None or (k in numeric and not _fits(v, numeric[k])))}
+                    sections[name] = {k: v for k, v in value.items() if k not in odd} if odd else value
+                    leftover = {k: v for k, v in value.items() if k not in fields or k in odd}
+                    if leftover:
+                        extra[name] = leftover
+                elif name in raw:
+                    extra.setdefault("", {})[name] = value
+            top = {k: v for k, v in raw.items()
+                   if k not in TOP_LEVEL_FIELDS or (v is None and k not in SECTION_FIELDS)}
+            if top:
+                extra.setdefault("", {}).update(top)
+
+            source = sections.get("source", {})
+            stamp = sections.get("timestamp", {})
+            ai = sections.get("ai_validation", {})
+            complete = sections.get("completeness", {})
+            published = stamp.get("published")
+            parsed = parse_timestamp(published) if isinstance(published, str) else None
+            store.append(
+                id=raw.get("id", ""), title=raw.get("title", ""), summary=raw.get("summary"),
+                url=source.get("url") or "", source_name=source.get("name"),
+                published=published, parsed_method=stamp.get("parsed_method"),
+                category=raw.get("category"), company=ai.get("company"),
+                keywords=ai.get("primary_keywords"), key_data=raw.get("key_data"),
+                credibility=source.get("credibility"), tier=source.get("tier"),
+                age_hours=stamp.get("age_hours"), layer=stamp.get("layer"),
+                completeness=complete.get("score"), relevance_score=ai.get("relevance_score"),
+                has_essential_fields=complete.get("has_essential_fields"),
+                has_key_data=complete.get("has_key_data"), summary_length=complete.get("summary_length"),
+                epoch=parsed.published.timestamp() if parsed else None, extra=extra,
+            )
+        return store
+
+
+def parse_raw_markdown(lines: Iterable[str], now: Optional[datetime] = None) -> ItemStore:
+    """Parse daily-tech-news-search output into an ItemStore.
+
+    Items are the "**N. Headline**" blocks; "## Category" and
+    "### Company" headings apply to the items below them. With `now`,
+    age_hours / layer are computed from the Date line; otherwise the
+    "Layer N (Xh ago)" annotation is used.
+    """
+    store = ItemStore()
+    category = company = None
+    current: Optional[dict] = None
+    last_field = None
+
+    def flush():
+        if current is None:
+            return
+        date_text, _, annotation = current.get("date", "").partition("|")
+        parsed = parse_timestamp(date_text) if date_text.strip() else None
+        age = layer = None
+        if annotation:
+            layer_at = annotation.find("Layer ")
+            if layer_at >= 0 and annotation[layer_at + 6:layer_at + 7].isdigit():
+                layer = int(annotation[layer_at + 6])
+            ago = annotation.find("h ago")
+            if ago > 0:
+                start = annotation.rfind("(", 0, ago) + 1
+                try:
+                    age = float(annotation[start:ago])
+                except ValueError:
+                    pass
+        key_data = {"details": current["key_data"]} if current.get("key_data") else None
+        summary = current.get("summary", "")
+        store.append(
+            id=f"item_{current['number']:03d}", title=current["title"], summary=summary,
+            url=current.get("url", ""), source_name=current.get("source", ""),
+            published=parsed.published.strftime(ISO_Z) if parsed else None,
+            parsed_method=parsed.method if parsed else None,
+            category=category, company=company, key_data=key_data,
+            age_hours=age, layer=layer, summary_length=len(summary),
+            epoch=parsed.published.timestamp() if parsed else None,
+        )
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        stripped = line.strip()
+        if not stripped:
+            last_field = None
+            continue
+        first = stripped[0]
+
+        if first == "#":
+            flush()
+            current = None
+            if stripped.startswith("### "):
+                company = stripped[4:].strip() or None
+            elif stripped.startswith("## "):
+                category = stripped[3:].strip() or None
+                company = None
+            continue
+
+        if first == "*" and stripped.startswith("**") and stripped.endswith("**") and len(stripped) > 4:
+            number, dot, title = stripped[2:-2].partition(". ")
+            if dot and number.isdigit():
+                flush()
+                current = {"number": int(number), "title": title.strip()}
+                last_field = None
+                continue
+
+        if current is None:
+            continue
+        if first in "-*" and stripped[1:2] == " ":
+            body = stripped[2:]
+            cut = min((at for at in (body.find(":"), body.find("：")) if at >= 0), default=-1)
+            field = RAW_FIELDS.get(body[:cut].strip().lower()) if cut > 0 else None
+            value = body[cut + 1:]
+            if field:
+                value = value.strip()
+                if field == "url" and value.startswith("[") and "](" in value:
+                    value = value[value.index("](") + 2:].rstrip(")")
+                current[field] = value
+                last_field = field
+                continue
+        if last_field in ("summary", "key_data"):
+            # Wrapped continuation of a multi-line field
+            current[last_field] += " " + stripped
+    flush()
+
+    if now is not None:
+        store.update_ages(now)
+    return store
+
+
+def load_items(path: Path, now: Optional[datetime] = None) -> ItemStore:
+    """raw.md, validated.json (or a bare list of items) → ItemStore."""
+    if path.suffix == ".md":
+        with open(path, "r", encoding="utf-8") as f:
+            return parse_raw_markdown(f, now)
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    items = data.get("validated_items", data.get("items", [])) if isinstance(data, dict) else data
+    store = ItemStore.from_dicts(items)
+    if now is not None:
+        store.update_ages(now)
+    return store
+
+
+def summarize(store: ItemStore) -> dict:
+    """Counts straight from the columns."""
+    ages = [age for age in store.age_hours if not math.isnan(age)]
+    layers = [0, 0, 0]
+    for layer in store.layer:
+        if layer >= 0:
+            layers[min(layer, 2)] += 1
+    domains = {item.domain for item in store}
+    return {
+        "items": len(store),
+        "sources": len({item.source_name for item in store}),
+        "domains": len(domains),
+        "layer0_count": layers[0],
+        "layer1_count": layers[1],
+        "layer2_count": layers[2],
+        "average_age_hours": round(sum(ages) / len(ages), 1) if ages else None,
+    }
+
+
+# -- benchmark --------------------------------------------------------------
+
+_SOURCES = [("TechCrunch", "techcrunch.com"), ("Reuters", "reuters.com"), ("The Verge", "theverge.com"),
+            ("36氪", "36kr.com"), ("VentureBeat", "venturebeat.com"), ("机器之心", "jiqizhixin.com")]
+_COMPANIES = ["OpenAI", "Anthropic", "Google", "Meta", "NVIDIA", "百度", "阿里巴巴", "智谱AI"]
+_WORDS = ("model inference training agents reasoning pricing tokens context enterprise developers "
+          "benchmark open-source safety latency cloud chips deployment partnership").split()
+
+
+def _synthetic_raw(count: int, now: datetime, seed: int = 0) -> Iterator[str]:
+    rng = random.Random(seed)
+    yield "# 20251120 Tech News Research Results (Raw Collection)\n\n"
+    per_category = max(1, count // 4)
+    for number in range(1, count + 1):
+        if number % per_category == 1:
+            yield f"## {rng.choice(['AI Models', 'AI Products', 'AI Infrastructure', 'Funding'])}\n\n"
+        if number % 5 == 1:
+            yield f"### {rng.choice(_COMPANIES)}\n\n"
+        name, host = rng.choice(_SOURCES)
+        age = rng.uniform(0, 47.5)
+        published = datetime.fromtimestamp(now.timestamp() - age * 3600, SHANGHAI)
+        words = " ".join(rng.choice(_WORDS) for _ in range(45))
+        yield (f"**{number}. {rng.choice(_COMPANIES)} launches {rng.choice(_WORDS)} {rng.choice(_WORDS)} "
+               f"update {number}**\n"
+               f"- Source: {name}\n"
+               f"- URL: https://{host}/2025/11/20/story-{number}\n"
+               f"- Date: {published:%Y-%m-%d %H:%M} CST | Layer {int(age >= 24)} ({age:.0f}h ago)\n"
+               f"- Summary: {words}.\n"
+               f"- Key Data: ${rng.randint(1, 900)}M, {rng.randint(1, 99)}%\n\n")
+
+
+def run_benchmark(count: int):
+    """Memory and per-round iteration: nested dicts vs. ItemStore."""
+    import copy
+    import tracemalloc
+
+    now = datetime(2025, 11, 20, 15, 30, tzinfo=SHANGHAI)
+    lines = "".join(_synthetic_raw(count, now)).splitlines(keepends=True)
+
+    start = time.perf_counter()
+    store = parse_raw_markdown(lines, now)
+    parse_time = time.perf_counter() - start
+    for row in range(len(store)):
+        store.credibility[row] = 9.5 if row % 3 else 7.5
+        store.tier[row] = 1 if row % 3 else 2
+        store.completeness[row] = 6.0 + (row % 40) / 10
+        store.has_essential[row] = store.has_key_data[row] = 1
+    text = json.dumps(list(store.iter_dicts()), ensure_ascii=False)
+    del store
+
+    # Both representations are measured as freshly loaded from disk
+    tracemalloc.start()
+    dicts = json.loads(text)
+    dict_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    tracemalloc.start()
+    store = ItemStore.from_dicts(json.loads(text))
+    store_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    text_memory = sum(sys.getsizeof(item.id) + sys.getsizeof(item.title) + sys.getsizeof(item.summary)
+                      + sys.getsizeof(item.url) for item in store)
+
+    def timed(fn, runs: int = 5) -> float:
+        best = float("inf")
+        for _ in range(runs):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    rounds = [
+        ("Round 1 credibility ≥ 8",
+         lambda: [d for d in dicts if d["source"]["credibility"] >= 8],
+         lambda: [r for r, c in enumerate(store.credibility) if c >= 8]),
+        ("Round 2 age ≤ 24h, layer",
+         lambda: [d for d in dicts if d["timestamp"]["age_hours"] <= 24 and d["timestamp"]["layer"] == 0],
+         lambda: [r for r, (a, l) in enumerate(zip(store.age_hours, store.layer)) if a <= 24 and l == 0]),
+        ("Round 5 completeness ≥ 7",
+         lambda: [d for d in dicts if d["completeness"]["score"] >= 7 and d["completeness"]["has_key_data"]],
+         lambda: [r for r, (s, k) in enumerate(zip(store.completeness, store.has_key_data)) if s >= 7 and k]),
+        ("Copy survivors",
+         lambda: copy.deepcopy(dicts[: len(dicts) // 2]),
+         lambda: store.take(range(len(store) // 2))),
+    ]
+
+    print(f"📄 {count:,} items: raw.md parsed in {parse_time:.2f}s "
+          f"({parse_time / count * 1e6:.1f} µs/item)")
+    print(f"📊 Memory: dicts {dict_memory / 1e6:6.1f} MB, ItemStore {store_memory / 1e6:6.1f} MB "
+          f"({dict_memory / store_memory:.1f}x less; id/title/summary/url text is {text_memory / 1e6:.1f} MB)")
+    for name, with_dicts, with_store in rounds:
+        t_dicts, t_store = timed(with_dicts), timed(with_store)
+        print(f"⏱️  {name:<26} dicts {t_dicts * 1000:8.2f} ms   ItemStore {t_store * 1000:8.2f} ms "
+              f"({t_dicts / t_store:.1f}x)")
+
+    start = time.perf_counter()
+    restored = list(store.iter_dicts())
+    serialize_time = time.perf_counter() - start
+    same = restored == dicts
+    print(f"⏱️  {'Serialize to schema':<26} {serialize_time * 1000:8.2f} ms")
+    print(f"{'✅' if same else '❌'} Round trip {'matches' if same else 'differs from'} the validated_items JSON")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Parse raw.md / validated.json into the compact item model"
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        help="tech_news_[DATE]_raw.md or tech_news_[DATE]_validated.json"
+    )
+    parser.add_argument(
+        "--output",
+        help="Write the items as {\"validated_items\": [...]} JSON"
+    )
+    parser.add_argument(
+        "--now",
+        help="Reference time for age_hours / layer (ISO8601; default: use the raw.md annotations)"
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Print item, source and layer counts"
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="N",
+        help="Compare memory and round iteration against nested dicts on N items"
+    )
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        return
+
+    if not args.input:
+        parser.error("input file is required unless --benchmark is given")
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"❌ Error: Input file does not exist: {input_path}")
+        sys.exit(1)
+
+    now = None
+    if args.now:
+        parsed = parse_timestamp(args.now)
+        if parsed is None:
+            print(f"❌ Error: Could not parse --now value: {args.now}")
+            sys.exit(1)
+        now = parsed.published.astimezone(UTC)
+
+    try:
+        store = load_items(input_path, now)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Error: Could not read {input_path}: {e}")
+        sys.exit(1)
+
+    if args.output:
+        store.write_json(Path(args.output))
+        print(f"✅ {len(store)} items written to {args.output}")
+    if args.summary or not args.output:
+        print(json.dumps(summarize(store), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+"""
+Cross-day archive of published stories, used as a pre-filter before
+validator Round 4 (Deduplication).
+
+Round 4 only compares items within one day's batch, so a story published
+two days ago can come back through the 48h window or the Layer 1/2
+fallbacks. The archive keeps one fixed-size binary record per published
+item:
+
+    date (YYYYMMDD) | URL hash | fingerprint hash | title MinHash signature
+
+- URL hash: BLAKE2b of the normalized domain + path (dedup_engine url_key)
+- Fingerprint hash: company|product|event without the date part. A
+  follow-up about the same product shares it ("OpenAI launches GPT-5",
+  then "OpenAI cuts GPT-5 API prices"), so it only counts together with a
+  similar title
+- Signature: the same 32 × 16-bit MinHash dedup_engine uses for titles;
+  near-duplicate titles are found through its LSH bands
+
+Records are written to append-only segment files: one d<YYYYMMDD>.seg per
+archived date, compacted into one m<YYYYMM>.seg per month once the date is
+older than --keep-days (duplicate records are dropped on the way).
+Re-adding a date replaces its records wherever they live. A
+lookup memory-maps only the segments overlapping its window and answers a
+whole batch from one in-memory index. Compaction runs in a background
+thread after add(); readers and writers in one process share a lock.
+
+Usage:
+    python story_archive.py --backfill ./output
+    python story_archive.py --check tech_news_20251120_validated.json --days 7 [--output filtered.json]
+    python story_archive.py --add tech_news_20251120_validated.json
+    python story_archive.py --compact
+    python story_archive.py --stats
+    python story_archive.py --benchmark 90
+"""
+
+import argparse
+import json
+import math
+import mmap
+import os
+import re
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date, timedelta
+from hashlib import blake2b
+from operator import eq
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from dedup_engine import BANDS, NUM_PERM, _shingles, generate_fingerprint, item_url, minhash
+from domain_index import normalize_host, split_url
+
+DEFAULT_ARCHIVE_DIR = ".story_archive"
+DEFAULT_LOOKBACK_DAYS = 7
+DEFAULT_KEEP_DAYS = 31
+ARCHIVE_VERSION = 1
+
+# date, reserved (0), URL hash, fingerprint hash, title signature. The 88
+# bytes are 11 little-endian 64-bit words, so a mapped segment cast to "Q"
+# has the date, URL and fingerprint columns at a fixed stride and each LSH
+# band (4 × 16-bit signature values) is exactly one word
+RECORD = struct.Struct(f"<IIQQ{NUM_PERM}H")
+WORDS = RECORD.size // 8
+SIGNATURE_AT = 12  # offset of the signature in 16-bit units
+assert NUM_PERM == BANDS * 4
+
+# Estimated Jaccard over title word + bigram shingles; reworded headlines
+# of one story typically land at 0.7+, unrelated same-company news below 0.4
+TITLE_JACCARD_THRESHOLD = 0.7
+TITLE_MATCHING_SLOTS = math.ceil(TITLE_JACCARD_THRESHOLD * NUM_PERM)
+
+_VALIDATED_RE = re.compile(r"tech_news_(\d{8})_validated\.json$")
+_SEGMENT_RE = re.compile(r"([dm])(\d{6}|\d{8})\.seg$")
+
+
+class Match(NamedTuple):
+    """Why an item counts as already published."""
+    date: int
+    reason: str  # "same_url", "fingerprint" or "similar_title"
+
+
+def _hash(text: str) -> int:
+    """Non-zero 64-bit hash; 0 marks a missing value."""
+    if not text:
+        return 0
+    return int.from_bytes(blake2b(text.encode("utf-8"), digest_size=8).digest(), "little") or 1
+
+
+def _day(value: int) -> date:
+    return date(value // 10000, value // 100 % 100, value % 100)
+
+
+def _int_date(day: date) -> int:
+    return day.year * 10000 + day.month * 100 + day.day
+
+
+def date_from_path(path) -> Optional[int]:
+    """20251120 for .../tech_news_20251120_validated.json."""
+    match = _VALIDATED_RE.search(str(path))
+    return int(match.group(1)) if match else None
+
+
+def record_for(item: dict, day: int) -> bytes:
+    """The packed archive record of one validated_items entry."""
+    title = (item.get("title") or "").strip().lower()
+    raw_host, path = split_url(item_url(item))
+    domain = normalize_host(raw_host)
+    url_key = f"{domain}{path.rstrip('/').lower()}" if domain else ""
+    fingerprint = generate_fingerprint(item)
+    fingerprint = fingerprint.rsplit("|", 1)[0] if fingerprint else ""
+    signature = minhash(_shingles(title, 1) | _shingles(title, 2)) or (0,) * NUM_PERM
+    return RECORD.pack(day, 0, _hash(url_key), _hash(fingerprint), *signature)
+
+
+def _record_date(record: bytes) -> int:
+    return int.from_bytes(record[:4], "little")
+
+
+def _load_items(path: Path) -> List[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    return document if isinstance(document, list) else document.get("validated_items", [])
+
+
+class _Index:
+    """Lookup tables over the records of one window, built column-wise.
+
+    Each band table keeps the most recent record per band value; that is
+    enough to find the latest matching date. The fingerprint table does
+    the same, and its row is only a match if the titles are similar too.
+    """
+
+    def __init__(self, data: bytes):
+        self.data = data
+        words = memoryview(data).cast("Q")
+        self.dates = words[0::WORDS].tolist()
+        rows = range(len(self.dates))
+        self.urls = dict(zip(words[1::WORDS].tolist(), self.dates))
+        self.fingerprints = dict(zip(words[2::WORDS].tolist(), rows))
+        self.bands = [dict(zip(words[3 + band::WORDS].tolist(), rows)) for band in range(BANDS)]
+        # 0 marks a missing hash or an empty signature
+        for table in [self.urls, self.fingerprints] + self.bands:
+            table.pop(0, None)
+        self.signatures = memoryview(data).cast("H")
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def match(self, record: bytes) -> Optional[Match]:
+        words = memoryview(record).cast("Q")
+        if words[1] in self.urls:
+            return Match(self.urls[words[1]], "same_url")
+        signature = memoryview(record).cast("H")[SIGNATURE_AT:]
+        step = RECORD.size // 2
+        row = self.fingerprints.get(words[2])
+        if row is not None:
+            # Same company and product is not enough: follow-ups share both
+            other = self.signatures[row * step + SIGNATURE_AT:(row + 1) * step]
+            if sum(map(eq, signature, other)) >= TITLE_MATCHING_SLOTS:
+                return Match(self.dates[row], "fingerprint")
+        best = 0
+        for band, table in enumerate(self.bands):
+            row = table.get(words[3 + band])
+            if row is None or self.dates[row] <= best:
+                continue
+            other = self.signatures[row * step + SIGNATURE_AT:(row + 1) * step]
+            if sum(map(eq, signature, other)) >= TITLE_MATCHING_SLOTS:
+                best = self.dates[row]
+        return Match(best, "similar_title") if best else None
+
+
+class StoryArchive:
+    """Append-only, memory-mapped archive of published story records.
+
+        archive = StoryArchive(".story_archive")
+        archive.backfill(["./output"])
+        matches = archive.lookup(items, 20251120, days=7)
+    """
+
+    def __init__(self, archive_dir=DEFAULT_ARCHIVE_DIR, keep_days: int = DEFAULT_KEEP_DAYS):
+        self.archive_dir = Path(archive_dir)
+        self.keep_days = keep_days
+        self.manifest_path = self.archive_dir / "manifest.json"
+        self.lock = threading.RLock()
+        self.dates: set = set()
+        self._compactor: Optional[threading.Thread] = None
+        self._index_key = None
+        self._index: Optional[_Index] = None
+        self._load_manifest()
+
+    # -- manifest --------------------------------------------------------
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, "rb") as f:
+                manifest = json.loads(f.read())
+        except (OSError, ValueError):
+            return
+        if manifest.get("version") == ARCHIVE_VERSION:
+            self.dates = set(manifest.get("dates", []))
+
+    def _save_manifest(self):
+        manifest = {"version": ARCHIVE_VERSION, "dates": sorted(self.dates)}
+        tmp_path = self.manifest_path.with_name(f"manifest.json.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, separators=(",", ":"))
+        os.replace(tmp_path, self.manifest_path)
+
+    # -- segments --------------------------------------------------------
+
+    def segments(self, start: int = 0, end: int = 99999999) -> List[Path]:
+        """Segment files that may hold records dated start..end (inclusive)."""
+        found = []
+        if not self.archive_dir.is_dir():
+            return found
+        for path in self.archive_dir.iterdir():
+            match = _SEGMENT_RE.fullmatch(path.name)
+            if not match:
+                continue
+            kind, stamp = match.group(1), int(match.group(2))
+            low, high = (stamp, stamp) if kind == "d" else (stamp * 100 + 1, stamp * 100 + 31)
+            if low <= end and high >= start:
+                found.append((low, kind == "d", path))
+        # Date order, so later records win when tables are built
+        return [path for *_, path in sorted(found)]
+
+    @staticmethod
+    def _read(path: Path, start: int = 0, end: int = 99999999) -> bytes:
+        """Records of one segment dated start..end, sliced out of a memory map."""
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            size -= size % RECORD.size  # ignore a torn trailing record
+            if not size:
+                return b""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view, view[:size].cast("Q") as words:
+                    # Records within a segment are in date order
+                    dates = words[0::WORDS]
+                    low, high = bisect_left(dates, start), bisect_right(dates, end)
+                    dates.release()
+                return mapped[low * RECORD.size:high * RECORD.size]
+
+    def _write_segment(self, path: Path, records: Iterable[bytes]):
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join(records))
+        os.replace(tmp_path, path)
+
+    # -- writing ---------------------------------------------------------
+
+    def add(self, day: int, items: Iterable[dict], compact: bool = True) -> int:
+        """Archive one date's published items, replacing any earlier records of that date."""
+        records = [record_for(item, day) for item in items]
+        with self.lock:
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            month_path = self.archive_dir / f"m{day // 100}.seg"
+            if month_path.exists() and self._read(month_path, day, day):
+                # Already compacted: drop the old records from the month segment
+                data = self._read(month_path)
+                old = (data[at:at + RECORD.size] for at in range(0, len(data), RECORD.size))
+                self._write_segment(month_path, (record for record in old if _record_date(record) != day))
+            self._write_segment(self.archive_dir / f"d{day}.seg", records)
+            self.dates.add(day)
+            self._save_manifest()
+        if compact:
+            self.compact_async()
+        return len(records)
+
+    def backfill(self, directories: Iterable, force: bool = False) -> Dict[int, int]:
+        """Archive every tech_news_[DATE]_validated.json not archived yet."""
+        added: Dict[int, int] = {}
+        for directory in directories:
+            for path in sorted(Path(directory).rglob("tech_news_*_validated.json")):
+                day = date_from_path(path)
+                if day is None or (day in self.dates and not force) or day in added:
+                    continue
+                try:
+                    items = _load_items(path)
+                except (OSError, json.JSONDecodeError) as e:
+                    print(f"⚠️  Skipping {path}: {e}")
+                    continue
+                added[day] = self.add(day, items, compact=False)
+        if added:
+            self.compact_async()
+        return added
+
+    def compact(self) -> int:
+        """Merge day segments older than keep_days into month segments; returns days merged."""
+        with self.lock:
+            if not self.dates:
+                return 0
+            cutoff = _int_date(_day(max(self.dates)) - timedelta(days=self.keep_days))
+            by_month: Dict[int, List[Path]] = defaultdict(list)
+            for path in self.segments(end=cutoff - 1):
+                if path.name.startswith("d"):
+                    by_month[int(path.name[1:7])].append(path)
+
+            merged = 0
+            for month, day_paths in sorted(by_month.items()):
+                month_path = self.archive_dir / f"m{month}.seg"
+                sources = ([month_path] if month_path.exists() else []) + day_paths
+                records = set()
+                for path in sources:
+                    data = self._read(path)
+                    records.update(data[at:at + RECORD.size] for at in range(0, len(data), RECORD.size))
+                self._write_segment(month_path, sorted(records, key=_record_date))
+                for path in day_paths:
+                    path.unlink()
+                merged += len(day_paths)
+            return merged
+
+    def compact_async(self) -> Optional[threading.Thread]:
+        """Run compact() in a background thread unless one is already running."""
+        with self.lock:
+            if self._compactor and self._compactor.is_alive():
+                return None
+            self._compactor = threading.Thread(target=self.compact, name="story-archive-compact")
+            self._compactor.start()
+            return self._compactor
+
+    def wait(self):
+        """Block until background compaction has finished."""
+        compactor = self._compactor
+        if compactor:
+            compactor.join()
+
+    # -- queries ---------------------------------------------------------
+
+    def _window_index(self, start: int, end: int) -> _Index:
+        with self.lock:
+            paths = self.segments(start, end)
+            key = (start, end, tuple((p.name, p.stat().st_size, p.stat().st_mtime_ns) for p in paths))
+            if key != self._index_key:
+                self._index = _Index(b"".join(self._read(path, start, end) for path in paths))
+                self._index_key = key
+            return self._index
+
+    def lookup(self, items: List[dict], day: int, days: int = DEFAULT_LOOKBACK_DAYS) -> List[Optional[Match]]:
+        """For each item: the most recent of the previous `days` dates it was published on, or None."""
+        start = _int_date(_day(day) - timedelta(days=days))
+        end = _int_date(_day(day) - timedelta(days=1))
+        index = self._window_index(start, end)
+        return [index.match(record_for(item, day)) for item in items]
+
+    def filter_published(self, items: List[dict], day: int,
+                         days: int = DEFAULT_LOOKBACK_DAYS) -> Tuple[List[dict], List[Tuple[dict, Match]]]:
+        """Split items into (new, [(already published, match)...])."""
+        kept, dropped = [], []
+        for item, match in zip(items, self.lookup(items, day, days)):
+            if match:
+                dropped.append((item, match))
+            else:
+                kept.append(item)
+        return kept, dropped
+
+    def stats(self) -> dict:
+        with self.lock:
+            paths = self.segments()
+            size = sum(p.stat().st_size for p in paths)
+            return {
+                "dates": len(self.dates),
+                "first_date": min(self.dates) if self.dates else None,
+                "last_date": max(self.dates) if self.dates else None,
+                "day_segments": sum(1 for p in paths if p.name.startswith("d")),
+                "month_segments": sum(1 for p in paths if p.name.startswith("m")),
+                "records": size // RECORD.size,
+                "bytes": size,
+            }
+
+
+def _synthetic_history(days: int, per_day: int, repeat_rate: float = 0.05) -> Iterator[Tuple[int, List[dict]]]:
+    """Daily batches where a share of each day's items re-run earlier stories."""
+    import random
+    from dedup_engine import _synthetic_items
+
+    rng = random.Random(0)
+    pool = _synthetic_items(days * per_day, duplicate_rate=0.0, seed=1)
+    first = date(2025, 8, 1)
+    for offset in range(days):
+        batch = [dict(item) for item in pool[offset * per_day:(offset + 1) * per_day]]
+        if offset:
+            for idx in rng.sample(range(per_day), int(per_day * repeat_rate)):
+                batch[idx] = dict(rng.choice(pool[max(0, offset - 3) * per_day:offset * per_day]))
+        yield _int_date(first + timedelta(days=offset)), batch
+
+
+def run_benchmark(days: int, per_day: int = 300):
+    history = list(_synthetic_history(days + 1, per_day))
+    *past, (today, batch) = history
+    workdir = Path(tempfile.mkdtemp(prefix="story_archive_"))
+    try:
+        archive = StoryArchive(workdir / "archive")
+        start = time.perf_counter()
+        for day, items in past:
+            archive.add(day, items, compact=False)
+        add_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        merged = archive.compact()
+        compact_time = time.perf_counter() - start
+
+        for window in (7, 30):
+            start = time.perf_counter()
+            matches = archive.lookup(batch, today, window)
+            cold = time.perf_counter() - start
+            start = time.perf_counter()
+            archive.lookup(batch, today, window)
+            warm = time.perf_counter() - start
+            found = sum(1 for m in matches if m)
+            print(f"⏱️  Last {window:>2} days: {len(batch)} items checked in {cold * 1000:.1f} ms cold, "
+                  f"{warm * 1000:.1f} ms warm ({found} already published)")
+
+        stats = archive.stats()
+        print(f"⏱️  Archived {len(past)} days × {per_day} items in {add_time:.2f}s; "
+              f"compacted {merged} day segments in {compact_time * 1000:.0f} ms")
+        print(f"📊 {stats['records']:,} records in {stats['bytes'] / 1e6:.1f} MB "
+              f"({stats['day_segments']} day + {stats['month_segments']} month segments)")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Cross-day archive of published stories (pre-filter before Round 4)"
+    )
+    parser.add_argument(
+        "--archive",
+        default=DEFAULT_ARCHIVE_DIR,
+        help=f"Archive directory (default: {DEFAULT_ARCHIVE_DIR})"
+    )
+    parser.add_argument(
+        "--backfill",
+        nargs="+",
+        metavar="DIR",
+        help="Archive every tech_news_[DATE]_validated.json under these directories"
+    )
+    parser.add_argument(
+        "--add",
+        metavar="VALIDATED_JSON",
+        help="Archive the items of one tech_news_[DATE]_validated.json"
+    )
+    parser.add_argument(
+        "--check",
+        metavar="VALIDATED_JSON",
+        help="Report items already published in the previous --days days"
+    )
+    parser.add_argument(
+        "--date",
+        help="Date of --check / --add as YYYYMMDD (default: taken from the file name)"
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=DEFAULT_LOOKBACK_DAYS,
+        help=f"Lookback window for --check (default: {DEFAULT_LOOKBACK_DAYS})"
+    )
+    parser.add_argument(
+        "--output",
+        help="With --check: write the document without the already-published items"
+    )
+    parser.add_argument(
+        "--keep-days",
+        type=int,
+        default=DEFAULT_KEEP_DAYS,
+        help=f"Keep this many recent dates as day segments (default: {DEFAULT_KEEP_DAYS})"
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Merge old day segments into month segments now"
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print archive statistics"
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="DAYS",
+        help="Build a synthetic archive of DAYS days and time batch lookups"
+    )
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        return
+
+    archive = StoryArchive(args.archive, keep_days=args.keep_days)
+
+    def file_date(path: str) -> int:
+        value = args.date or date_from_path(path)
+        if value is None or not str(value).isdigit() or len(str(value)) != 8:
+            print(f"❌ Error: Could not determine the date of {path}; pass --date YYYYMMDD")
+            sys.exit(1)
+        return int(value)
+
+    def read(path: str):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"❌ Error: Could not read {path}: {e}")
+            sys.exit(1)
+
+    if args.backfill:
+        added = archive.backfill(args.backfill)
+        archive.wait()
+        print(f"✅ Archived {len(added)} new dates ({sum(added.values())} items)")
+
+    if args.add:
+        day = file_date(args.add)
+        document = read(args.add)
+        items = document if isinstance(document, list) else document.get("validated_items", [])
+        count = archive.add(day, items)
+        archive.wait()
+        print(f"✅ Archived {count} items for {day}")
+
+    if args.check:
+        day = file_date(args.check)
+        document = read(args.check)
+        items = document if isinstance(document, list) else document.get("validated_items", [])
+        start = time.perf_counter()
+        kept, dropped = archive.filter_published(items, day, args.days)
+        elapsed = time.perf_counter() - start
+        for item, match in dropped:
+            print(f"  🔁 {match.reason} ({match.date}): \"{item.get('title')}\"")
+        print(f"📊 {len(dropped)} of {len(items)} items already published in the last {args.days} days "
+              f"({elapsed * 1000:.1f} ms)")
+        if args.output:
+            if isinstance(document, dict):
+                document = dict(document)
+                document["validated_items"] = kept
+                document.setdefault("quality_metrics", {})["previously_published"] = len(dropped)
+            else:
+                document = kept
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(document, f, ensure_ascii=False, indent=2)
+                f.write("\n")
+
+    if args.compact:
+        merged = archive.compact()
+        print(f"✅ Compacted {merged} day segments")
+
+    if args.stats or not (args.backfill or args.add or args.check or args.compact):
+        print(json.dumps(archive.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,541 @@
+#!/usr/bin/env python3
+"""
+Timestamp extraction and age engine for validator Round 2 (Time Accuracy).
+
+Implements the Timestamp Parsing Rules from references/validation_rules.md:
+
+- Formats: ISO8601 / HTML5, RFC2822, Unix epochs, natural-language relative
+  ("2 hours ago", "yesterday") and absolute ("Nov 20, 2025") dates
+- Extraction priority: <meta> tags → JSON-LD datePublished → <time datetime>
+  → content text patterns
+- Timezones: no zone → UTC, PST/PDT = UTC-8/-7, CST = UTC+8 (China);
+  ages are computed against Asia/Shanghai time
+
+parse_timestamp() dispatches on cheap shape tests (length, digit and
+separator positions) before any regex runs. extract_from_html() scans the
+page as a stream of chunks and stops at the first priority-1 tag instead
+of building a DOM. compute_ages() turns a whole batch of epochs into
+age_hours / layer columns in one step.
+
+Usage:
+    python timestamp_engine.py <page.html> [<page.html> ...] [--now <ISO8601>]
+    python timestamp_engine.py --parse "Wed, 20 Nov 2025 14:30:00 PST"
+    python timestamp_engine.py --benchmark 100000
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from array import array
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional: the pure-Python path gives identical results
+    np = None
+
+UTC = timezone.utc
+# China has no DST, so a fixed offset is exact for Asia/Shanghai
+SHANGHAI = timezone(timedelta(hours=8), "Asia/Shanghai")
+
+# Timezone abbreviations seen in tech news (CST means China, not US Central)
+TZ_OFFSETS = {
+    "Z": 0, "UT": 0, "UTC": 0, "GMT": 0,
+    "PST": -8, "PDT": -7,
+    "MST": -7, "MDT": -6,
+    "EST": -5, "EDT": -4,
+    "CST": 8, "BJT": 8, "HKT": 8, "SGT": 8,
+    "JST": 9, "KST": 9,
+    "BST": 1, "CET": 1, "CEST": 2,
+}
+
+MONTHS = {
+    name: idx
+    for idx, names in enumerate(
+        (("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"),
+         ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"),
+         ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"),
+         ("dec", "december")),
+        start=1)
+    for name in names
+}
+
+# Unix_Timestamp validation range (2023-2027)
+UNIX_MIN = 1_700_000_000
+UNIX_MAX = 1_800_000_000
+
+# Time_Layers boundaries in hours
+LAYER0_MAX_HOURS = 24.0
+LAYER1_MAX_HOURS = 48.0
+CROSS_CHECK_MAX_HOURS = 12.0
+
+PRIORITY_META = 1
+PRIORITY_JSON_LD = 2
+PRIORITY_TIME_TAG = 3
+PRIORITY_CONTENT = 4
+
+_RFC2822_RE = re.compile(
+    r"^(?:[A-Za-z]{3},\s*)?(\d{1,2})\s+([A-Za-z]{3,9})\s+(\d{4})\s+(\d{1,2}):(\d{2})(?::(\d{2}))?"
+    r"\s*([+-]\d{4}|[A-Za-z]{1,5})?$"
+)
+_RELATIVE_RE = re.compile(r"(\d+)\s*(minute|min|hour|hr|day|week)s?\s+ago", re.IGNORECASE)
+_RELATIVE_ZH_RE = re.compile(r"(\d+)\s*(分钟|小时|天|周)前")
+_MONTH_FIRST_RE = re.compile(
+    r"([A-Za-z]{3,9})\.?\s+(\d{1,2}),?\s+(\d{4})(?:[ ,at]+(\d{1,2}):(\d{2})\s*([AaPp][Mm])?)?(?:\s+([A-Za-z]{2,5}))?"
+)
+_DAY_FIRST_RE = re.compile(r"(\d{1,2})\s+([A-Za-z]{3,9})\.?,?\s+(\d{4})")
+_ZH_DATE_RE = re.compile(r"(\d{4})年(\d{1,2})月(\d{1,2})日(?:\s*(\d{1,2})[:：](\d{2}))?")
+
+# HTML extraction patterns, applied to a sliding window over the stream
+_META_RE = re.compile(r"<meta\b[^>]*>", re.IGNORECASE)
+_META_PROP_RE = re.compile(
+    r"""(?:property|name|itemprop)\s*=\s*["'](article:published_time|og:published_time|datePublished)["']""",
+    re.IGNORECASE,
+)
+_META_CONTENT_RE = re.compile(r"""content\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+_JSON_LD_RE = re.compile(r'"datePublished"\s*:\s*"([^"]+)"')
+_TIME_TAG_RE = re.compile(r"""<time\b[^>]*\bdatetime\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+_CONTENT_RE = re.compile(r"(?:Published|Updated|Posted|发布时间|发布于)\s*[:：]?\s*([^<\n]{6,60})")
+_HEAD_END_RE = re.compile(r"</head\s*>", re.IGNORECASE)
+
+# Longest construct we must see whole across a chunk boundary
+_CARRY_CHARS = 2048
+
+
+class ParsedTime(NamedTuple):
+    """A parsed timestamp, always timezone-aware (UTC)."""
+    published: datetime
+    method: str
+
+
+class Extraction(NamedTuple):
+    """Best timestamp found in a page plus where it came from."""
+    published: datetime
+    method: str
+    priority: int
+    raw: str
+    bytes_scanned: int
+
+
+def _tz_offset(token: Optional[str]) -> Optional[timezone]:
+    """Resolve '+0800', 'GMT', 'PST', ... into a fixed offset (None if unknown)."""
+    if not token:
+        return UTC
+    if token[0] in "+-" and len(token) == 5 and token[1:].isascii() and token[1:].isdigit():
+        sign = -1 if token[0] == "-" else 1
+        try:
+            return timezone(sign * timedelta(hours=int(token[1:3]), minutes=int(token[3:5])))
+        except ValueError:  # "+9999": outside the +-24h a zone offset can be
+            return None
+    hours = TZ_OFFSETS.get(token.upper())
+    if hours is None:
+        return None
+    return timezone(timedelta(hours=hours))
+
+
+def _parse_iso(value: str) -> Optional[datetime]:
+    text = value.replace(" ", "T", 1) if len(value) > 10 and value[10] == " " else value
+    if text.endswith(("Z", "z")):
+        text = text[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(text)
+    except (OverflowError, ValueError):
+        # Trailing zone abbreviation: "2025-11-20T14:30:00 PST"
+        head, _, token = value.rpartition(" ")
+        tz = _tz_offset(token) if head else None
+        if tz is None:
+            return None
+        parsed = _parse_iso(head)
+        if parsed is None:
+            return None
+        parsed = parsed.replace(tzinfo=tz)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    try:
+        return parsed.astimezone(UTC)
+    except OverflowError:  # "0001-01-01T00:00:00+08:00" falls before year 1 in UTC
+        return None
+
+
+def _parse_rfc2822(value: str) -> Optional[datetime]:
+    match = _RFC2822_RE.match(value)
+    if not match:
+        return None
+    day, month_name, year, hour, minute, second, zone = match.groups()
+    month = MONTHS.get(month_name.lower())
+    tz = _tz_offset(zone)
+    if month is None or tz is None:
+        return None
+    try:
+        return datetime(int(year), month, int(day), int(hour), int(minute), int(second or 0),
+                        tzinfo=tz).astimezone(UTC)
+    except (OverflowError, ValueError):
+        return None
+
+
+def _parse_relative(value: str, now: datetime) -> Optional[datetime]:
+    try:
+        return _relative_time(value, now)
+    except (OverflowError, ValueError):  # "999999999 days ago" lands before year 1
+        return None
+
+
+def is_relative(value: str) -> bool:
+    """True for values such as "3 hours ago" or "昨天" that only mean something relative to a reference time."""
+    return _parse_relative(value.strip(), datetime.now(UTC)) is not None
+
+
+def _relative_time(value: str, now: datetime) -> Optional[datetime]:
+    lowered = value.lower()
+    if "yesterday" in lowered or "昨天" in value:
+        return now - timedelta(days=1)
+    if "today" in lowered or "just now" in lowered or "今天" in value or "刚刚" in value:
+        return now
+
+    match = _RELATIVE_RE.search(value)
+    if match:
+        amount, unit = int(match.group(1)), match.group(2).lower()
+        if unit.startswith("min"):
+            return now - timedelta(minutes=amount)
+        if unit.startswith("h"):
+            return now - timedelta(hours=amount)
+        if unit == "day":
+            return now - timedelta(days=amount)
+        return now - timedelta(weeks=amount)
+
+    match = _RELATIVE_ZH_RE.search(value)
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        delta = {"分钟": timedelta(minutes=amount), "小时": timedelta(hours=amount),
+                 "天": timedelta(days=amount), "周": timedelta(weeks=amount)}[unit]
+        return now - delta
+    return None
+
+
+def _parse_absolute_natural(value: str) -> Optional[datetime]:
+    match = _MONTH_FIRST_RE.search(value)
+    if match and match.group(1).lower() in MONTHS:
+        month_name, day, year, hour, minute, ampm, zone = match.groups()
+        hour = int(hour or 0)
+        if ampm:
+            hour = hour % 12 + (12 if ampm.lower() == "pm" else 0)
+        tz = _tz_offset(zone) or UTC
+        try:
+            return datetime(int(year), MONTHS[month_name.lower()], int(day), hour, int(minute or 0),
+                            tzinfo=tz).astimezone(UTC)
+        except (OverflowError, ValueError):
+            return None
+
+    match = _DAY_FIRST_RE.search(value)
+    if match and match.group(2).lower() in MONTHS:
+        day, month_name, year = match.groups()
+        try:
+            return datetime(int(year), MONTHS[month_name.lower()], int(day), tzinfo=UTC)
+        except (OverflowError, ValueError):
+            return None
+
+    match = _ZH_DATE_RE.search(value)
+    if match:
+        year, month, day, hour, minute = match.groups()
+        try:
+            # Chinese-language dates are published in China time
+            return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0),
+                            tzinfo=SHANGHAI).astimezone(UTC)
+        except (OverflowError, ValueError):
+            return None
+    return None
+
+
+def parse_timestamp(value, now: Optional[datetime] = None) -> Optional[ParsedTime]:
+    """Parse one timestamp value in any supported format.
+
+    Cheap shape tests pick the parser, so the common ISO and epoch cases
+    never touch a regex.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if UNIX_MIN < value < UNIX_MAX:
+            return ParsedTime(datetime.fromtimestamp(value, UTC), "Unix")
+        return None
+
+    value = value.strip()
+    length = len(value)
+    if length == 0:
+        return None
+
+    # Unix: 10 digits (optionally with a millisecond suffix); isdigit() alone
+    # also accepts "²" and other digits int() rejects
+    if value.isascii() and value.isdigit():
+        epoch = int(value)
+        if length == 13:
+            epoch //= 1000
+        if UNIX_MIN < epoch < UNIX_MAX:
+            return ParsedTime(datetime.fromtimestamp(epoch, UTC), "Unix")
+        return None
+
+    # ISO8601 / HTML5: YYYY-MM-DD...
+    if length >= 10 and value[4] == "-" and value[7] == "-" and value[:4].isdigit():
+        parsed = _parse_iso(value)
+        if parsed is not None:
+            return ParsedTime(parsed, "ISO8601")
+
+    # RFC2822: "Wed, 20 Nov 2025 14:30:00 GMT" (weekday comma at index 3)
+    if (length > 3 and value[3] == ",") or (value[:2].strip().isdigit() and ":" in value):
+        parsed = _parse_rfc2822(value)
+        if parsed is not None:
+            return ParsedTime(parsed, "RFC2822")
+
+    now = now or datetime.now(UTC)
+    parsed = _parse_relative(value, now)
+    if parsed is not None:
+        return ParsedTime(parsed.astimezone(UTC), "Natural")
+
+    parsed = _parse_absolute_natural(value)
+    if parsed is not None:
+        return ParsedTime(parsed, "Natural")
+    return None
+
+
+def _meta_timestamp(tag: str) -> Optional[str]:
+    if not _META_PROP_RE.search(tag):
+        return None
+    content = _META_CONTENT_RE.search(tag)
+    return content.group(1) if content else None
+
+
+def extract_from_html(chunks: Iterable[str], now: Optional[datetime] = None) -> Optional[Extraction]:
+    """Find the highest-priority published time in a stream of HTML chunks.
+
+    Scanning stops as soon as a priority-1 <meta> tag parses, or once the
+    </head> has passed (no more meta tags possible) and a JSON-LD date has
+    been found. Only a bounded carry-over window is kept between chunks.
+    """
+    best: Optional[Extraction] = None
+    carry = ""
+    scanned = 0
+    past_head = False
+
+    def consider(raw: str, priority: int) -> bool:
+        nonlocal best
+        if best is not None and best.priority <= priority:
+            return False
+        parsed = parse_timestamp(raw, now)
+        if parsed is None:
+            return False
+        best = Extraction(parsed.published, parsed.method, priority, raw, scanned)
+        return True
+
+    for chunk in chunks:
+        scanned += len(chunk)
+        window = carry + chunk
+
+        for tag in _META_RE.finditer(window):
+            raw = _meta_timestamp(tag.group(0))
+            if raw and consider(raw, PRIORITY_META):
+                return best
+
+        if not past_head and _HEAD_END_RE.search(window):
+            past_head = True
+
+        if best is None or best.priority > PRIORITY_JSON_LD:
+            for match in _JSON_LD_RE.finditer(window):
+                if consider(match.group(1), PRIORITY_JSON_LD):
+                    break
+        if past_head and best is not None and best.priority == PRIORITY_JSON_LD:
+            return best
+
+        if best is None or best.priority > PRIORITY_TIME_TAG:
+            for match in _TIME_TAG_RE.finditer(window):
+                if consider(match.group(1), PRIORITY_TIME_TAG):
+                    break
+
+        if best is None:
+            for match in _CONTENT_RE.finditer(window):
+                if consider(match.group(1).strip(), PRIORITY_CONTENT):
+                    break
+
+        # Keep an unfinished tag (or the last few KB) for the next chunk
+        cut = window.rfind("<", max(0, len(window) - _CARRY_CHARS))
+        carry = window[cut:] if cut != -1 and ">" not in window[cut:] else window[-256:]
+
+    return best
+
+
+def iter_file_chunks(path: Path, chunk_size: int = 16384) -> Iterable[str]:
+    """Yield decoded chunks of a file without reading it whole."""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def cross_validate(metadata_time: datetime, content_time: datetime) -> bool:
+    """Double_Verification: True if metadata and content ages agree within 12h."""
+    return abs((metadata_time - content_time).total_seconds()) <= CROSS_CHECK_MAX_HOURS * 3600
+
+
+def compute_ages(epochs: Sequence[float], now: Optional[datetime] = None) -> Tuple[array, array]:
+    """Compute age_hours and Time_Layers for a batch of UTC epoch seconds.
+
+    Returns (age_hours, layer) as compact arrays ('d' and 'b'). Uses NumPy
+    when it is installed; the pure-Python path produces the same values.
+    """
+    now_epoch = (now or datetime.now(SHANGHAI)).timestamp()
+
+    if np is not None:
+        ages = (now_epoch - np.asarray(epochs, dtype=np.float64)) / 3600.0
+        layers = (ages > LAYER0_MAX_HOURS).astype(np.int8) + (ages > LAYER1_MAX_HOURS).astype(np.int8)
+        return array("d", ages.tolist()), array("b", layers.tolist())
+
+    ages = array("d", [(now_epoch - epoch) / 3600.0 for epoch in epochs])
+    layers = array("b", [(age > LAYER0_MAX_HOURS) + (age > LAYER1_MAX_HOURS) for age in ages])
+    return ages, layers
+
+
+def round2_metrics(age_hours: Sequence[float], layers: Sequence[int], inconsistent: int = 0) -> dict:
+    """Build the quality_metrics.time_accuracy block for a batch."""
+    total = len(layers)
+    counts = [0, 0, 0]
+    for layer in layers:
+        counts[layer] += 1
+    compliance = (counts[0] + counts[1]) / total if total else 0.0
+    average = sum(age_hours) / total if total else 0.0
+
+    status = "PASS"
+    if compliance < 1.0 or (total and inconsistent / total > 0.2):
+        status = "FAIL"
+    elif average > 36.0:
+        status = "WARNING"
+
+    return {
+        "layer0_count": counts[0],
+        "layer1_count": counts[1],
+        "layer2_count": counts[2],
+        "average_age_hours": round(average, 1),
+        "compliance_rate": round(compliance, 3),
+        "inconsistent_count": inconsistent,
+        "status": status,
+    }
+
+
+def _synthetic_values(count: int, now: datetime, seed: int = 0) -> List[str]:
+    """Timestamps in every supported format, spread over the last 72 hours."""
+    rng = random.Random(seed)
+    values = []
+    for _ in range(count):
+        moment = now - timedelta(minutes=rng.randrange(72 * 60))
+        kind = rng.randrange(6)
+        if kind == 0:
+            values.append(moment.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"))
+        elif kind == 1:
+            values.append(moment.astimezone(SHANGHAI).isoformat())
+        elif kind == 2:
+            values.append(moment.strftime("%a, %d %b %Y %H:%M:%S +0000"))
+        elif kind == 3:
+            values.append(str(int(moment.timestamp())))
+        elif kind == 4:
+            values.append(f"{rng.randint(1, 47)} hours ago")
+        else:
+            values.append(moment.strftime("%b %d, %Y"))
+    return values
+
+
+def run_benchmark(count: int):
+    """Time parsing plus batch age computation for synthetic values."""
+    now = datetime.now(UTC)
+    values = _synthetic_values(count, now)
+
+    start = time.perf_counter()
+    parsed = [parse_timestamp(value, now) for value in values]
+    parse_time = time.perf_counter() - start
+
+    epochs = [p.published.timestamp() for p in parsed if p is not None]
+    start = time.perf_counter()
+    ages, layers = compute_ages(epochs, now)
+    age_time = time.perf_counter() - start
+
+    print(f"⏱️  Parsed {len(values)} timestamps in {parse_time:.3f}s "
+          f"({len(values) / parse_time:,.0f}/s, {len(epochs)} parsed)")
+    print(f"⏱️  Computed ages for {len(epochs)} items in {age_time * 1000:.1f} ms "
+          f"({'numpy' if np is not None else 'pure Python'})")
+    print(json.dumps(round2_metrics(ages, layers), indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Extract published timestamps and compute 48h-layer ages (validator Round 2)"
+    )
+    parser.add_argument(
+        "pages",
+        nargs="*",
+        help="HTML files to scan"
+    )
+    parser.add_argument(
+        "--parse",
+        action="append",
+        default=[],
+        metavar="VALUE",
+        help="Parse a raw timestamp string (repeatable)"
+    )
+    parser.add_argument(
+        "--now",
+        help="Reference time (ISO8601, default: current time)"
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="N",
+        help="Parse N synthetic timestamps and report throughput"
+    )
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        return
+
+    now = datetime.now(UTC)
+    if args.now:
+        parsed_now = parse_timestamp(args.now)
+        if parsed_now is None:
+            print(f"❌ Error: Could not parse --now value: {args.now}")
+            sys.exit(1)
+        now = parsed_now.published
+
+    results = []
+    for value in args.parse:
+        parsed = parse_timestamp(value, now)
+        results.append({"input": value, "published": parsed.published.isoformat() if parsed else None,
+                        "parsed_method": parsed.method if parsed else None})
+
+    for page in args.pages:
+        found = extract_from_html(iter_file_chunks(Path(page)), now)
+        results.append({"input": page, "published": found.published.isoformat() if found else None,
+                        "parsed_method": found.method if found else None,
+                        "priority": found.priority if found else None,
+                        "bytes_scanned": found.bytes_scanned if found else None})
+
+    if not results:
+        parser.error("give HTML files, --parse values or --benchmark")
+
+    epochs = [datetime.fromisoformat(r["published"]).timestamp() for r in results if r["published"]]
+    ages, layers = compute_ages(epochs, now)
+    age_iter = iter(zip(ages, layers))
+    for result in results:
+        if result["published"]:
+            age, layer = next(age_iter)
+            published = datetime.fromisoformat(result["published"])
+            result["published"] = published.astimezone(SHANGHAI).isoformat()
+            result["age_hours"] = round(age, 1)
+            result["layer"] = layer
+        print(json.dumps(result, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
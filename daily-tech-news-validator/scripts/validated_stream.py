@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Streaming JSONL hand-off between Validation and Writing.
+
+tech_news_[DATE]_validated.jsonl carries the same data as
+tech_news_[DATE]_validated.json, one JSON record per line, written as
+soon as it is known:
+
+    {"record": "metadata", "metadata": {...}}          first line
+    {"record": "item", "item": {...}}                  item cleared Rounds 1-3 and 5
+    {"record": "rejected", "item": {...}}              rejected_items entry
+    {"record": "retract", "id": "item_007", "reason": "duplicate of item_003"}
+    {"record": "trailer", "metadata": {...}, "quality_metrics": {...}}
+
+Round 4 (Deduplication) needs the whole batch, so its outcome arrives
+late: dropped duplicates as "retract" records and the surviving merged
+item as a second "item" record with the same id, which replaces the
+first. The trailer is always the last line; a stream without one is still
+being written (or the validator died). An aborted run ends with
+{"record": "abort", "error": ...} so followers stop waiting.
+
+The writer skill can start drafting from ValidatedStream(path,
+follow=True) while validation is still running, but must apply retracts
+and wait for the trailer's PASS before finalizing. to_document() rebuilds
+the validated.json schema for everything that expects it.
+
+Usage:
+    python validated_stream.py tech_news_20251120_validated.jsonl --output tech_news_20251120_validated.json
+    python validated_stream.py tech_news_20251120_validated.json --output tech_news_20251120_validated.jsonl
+    python validated_stream.py tech_news_20251120_validated.jsonl --follow
+    python validated_stream.py --benchmark 50000
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+STREAM_VERSION = 1
+
+
+def _dumps(record: dict) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+class ValidatedStreamWriter:
+    """Append records to a validated.jsonl stream, flushing each line.
+
+        with ValidatedStreamWriter(path, {"input_file": "tech_news_20251120_raw.md"}) as stream:
+            for item in items_passing_rounds_1_to_3:
+                stream.item(item)
+            stream.retract("item_007", "duplicate of item_003")
+            stream.finish(quality_metrics, {"workflow_status": "PASS"})
+
+    Leaving the block with an exception before finish() writes an abort
+    record instead of a trailer.
+    """
+
+    def __init__(self, path, metadata: Optional[dict] = None):
+        self.path = Path(path)
+        self.metadata = dict(metadata or {})
+        self.metadata.setdefault("stream_version", STREAM_VERSION)
+        self.items_written = 0
+        self.finished = False
+        self._file = None
+
+    def __enter__(self) -> "ValidatedStreamWriter":
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._write({"record": "metadata", "metadata": self.metadata})
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.finished:
+            error = f"{exc_type.__name__}: {exc}" if exc_type else "stream closed without trailer"
+            self._write({"record": "abort", "error": error})
+        self._file.close()
+        return False
+
+    def _write(self, record: dict):
+        self._file.write(_dumps(record))
+        self._file.flush()
+
+    def item(self, item: dict):
+        """Emit a validated item; re-emitting an id replaces the earlier record."""
+        if "id" not in item:
+            item = dict(item, id=f"item_{self.items_written + 1:03d}")
+        self.items_written += 1
+        self._write({"record": "item", "item": item})
+
+    def reject(self, item: dict):
+        self._write({"record": "rejected", "item": item})
+
+    def retract(self, item_id: str, reason: str = ""):
+        self._write({"record": "retract", "id": item_id, "reason": reason})
+
+    def retract_duplicates(self, items: List[dict], result):
+        """Emit Round 4's outcome from a dedup_engine.DedupResult for `items`.
+
+        Every cluster member other than the kept one is retracted, and the
+        kept item is re-emitted with its merged sources.
+        """
+        for cluster, merged in zip(result.clusters, result.items):
+            if len(cluster) < 2:
+                continue
+            kept = merged.get("id")
+            for idx in cluster:
+                if items[idx].get("id") != kept:
+                    self.retract(items[idx].get("id"), f"duplicate of {kept}")
+            self._write({"record": "item", "item": merged})
+
+    def finish(self, quality_metrics: dict, metadata: Optional[dict] = None):
+        """Write the trailer; metadata updates the header's (e.g. workflow_status)."""
+        final = dict(self.metadata, **(metadata or {}))
+        self._write({"record": "trailer", "metadata": final, "quality_metrics": quality_metrics})
+        self.finished = True
+
+
+class StreamAborted(RuntimeError):
+    """The validator wrote an abort record instead of a trailer."""
+
+
+class ValidatedStream:
+    """Lazy reader over a validated.jsonl stream.
+
+    Iterating yields each "item" record's item as it is read, including
+    Round 4 replacements; retracted ids collect in .retracted, rejected
+    items in .rejected, and .metadata / .quality_metrics are filled from
+    the header and trailer. With follow=True the reader waits for lines
+    still being written until the trailer arrives (or `timeout` seconds
+    pass without new data).
+    """
+
+    def __init__(self, path, follow: bool = False, poll_interval: float = 0.2,
+                 timeout: Optional[float] = None):
+        self.path = Path(path)
+        self.follow = follow
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.metadata: dict = {}
+        self.quality_metrics: Optional[dict] = None
+        self.rejected: List[dict] = []
+        self.retracted: Dict[str, str] = {}
+        self.complete = False
+
+    def _lines(self) -> Iterator[str]:
+        with open(self.path, "r", encoding="utf-8") as f:
+            pending = ""
+            idle_since = time.monotonic()
+            while True:
+                line = f.readline()
+                if line.endswith("\n"):
+                    yield pending + line
+                    pending = ""
+                    idle_since = time.monotonic()
+                    continue
+                # EOF, possibly in the middle of a line still being written
+                pending += line
+                if self.complete or not self.follow:
+                    if pending.strip():
+                        yield pending
+                    return
+                if self.timeout is not None and time.monotonic() - idle_since > self.timeout:
+                    raise TimeoutError(f"No trailer in {self.path} after {self.timeout}s without new data")
+                time.sleep(self.poll_interval)
+
+    def __iter__(self) -> Iterator[dict]:
+        for line_no, line in enumerate(self._lines(), 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{self.path}:{line_no}: {e}") from None
+
+            kind = record.get("record")
+            if kind == "item":
+                yield record["item"]
+            elif kind == "retract":
+                self.retracted[record["id"]] = record.get("reason", "")
+            elif kind == "rejected":
+                self.rejected.append(record["item"])
+            elif kind == "metadata":
+                self.metadata = record.get("metadata", {})
+            elif kind == "trailer":
+                self.metadata = record.get("metadata", self.metadata)
+                self.quality_metrics = record.get("quality_metrics", {})
+                self.complete = True
+                return
+            elif kind == "abort":
+                raise StreamAborted(f"{self.path}: validation aborted: {record.get('error')}")
+
+
+def to_document(path, follow: bool = False, timeout: Optional[float] = None) -> dict:
+    """Rebuild the tech_news_[DATE]_validated.json document from a stream."""
+    stream = ValidatedStream(path, follow=follow, timeout=timeout)
+    items: Dict[str, dict] = {}
+    for item in stream:
+        items[item.get("id")] = item
+    if not stream.complete:
+        raise ValueError(f"{path} has no trailer record (validation still running or interrupted)")
+    for item_id in stream.retracted:
+        items.pop(item_id, None)
+
+    metadata = {k: v for k, v in stream.metadata.items() if k != "stream_version"}
+    return {
+        "metadata": metadata,
+        "quality_metrics": stream.quality_metrics,
+        "validated_items": list(items.values()),
+        "rejected_items": stream.rejected,
+    }
+
+
+def from_document(document: dict, path) -> int:
+    """Write an existing validated.json document as a stream; returns the item count."""
+    items = document.get("validated_items", [])
+    with ValidatedStreamWriter(path, document.get("metadata", {})) as stream:
+        for item in items:
+            stream.item(item)
+        for item in document.get("rejected_items", []):
+            stream.reject(item)
+        stream.finish(document.get("quality_metrics", {}))
+    return len(items)
+
+
+def run_benchmark(count: int):
+    """Compare peak memory of loading validated.json with streaming the JSONL."""
+    sys.path.insert(0, str(Path(__file__).parent))
+    from dedup_engine import _synthetic_items
+
+    document = {"metadata": {"validator_version": "4.0.0"}, "quality_metrics": {},
+                "validated_items": _synthetic_items(count), "rejected_items": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "validated.json"
+        jsonl_path = Path(tmp) / "validated.jsonl"
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False, indent=2)
+        from_document(document, jsonl_path)
+        del document
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        with open(json_path, "r", encoding="utf-8") as f:
+            loaded = len(json.load(f)["validated_items"])
+        json_seconds = time.perf_counter() - start
+        json_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+
+        start = time.perf_counter()
+        first_item = None
+        streamed = 0
+        for _ in ValidatedStream(jsonl_path):
+            if first_item is None:
+                first_item = time.perf_counter() - start
+            streamed += 1
+        stream_seconds = time.perf_counter() - start
+        stream_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    print(f"⏱️  json.load:       {loaded} items in {json_seconds:.3f}s, peak {json_peak / 1e6:.1f} MB, "
+          f"first item after {json_seconds * 1000:.1f} ms")
+    print(f"⏱️  ValidatedStream: {streamed} items in {stream_seconds:.3f}s, peak {stream_peak / 1e6:.1f} MB, "
+          f"first item after {first_item * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert between validated.json and the streaming validated.jsonl hand-off"
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        help="validated.jsonl (converted to JSON) or validated.json (converted to JSONL)"
+    )
+    parser.add_argument(
+        "--output",
+        help="Output path (default: input with the other extension)"
+    )
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="Print items from a stream as they are written and wait for the trailer"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="With --follow: give up after this many seconds without new data"
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="N",
+        help="Compare json.load with streaming for N synthetic items"
+    )
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        return
+
+    if not args.input:
+        parser.error("input file is required unless --benchmark is given")
+
+    input_path = Path(args.input)
+    try:
+        if args.follow:
+            stream = ValidatedStream(input_path, follow=True, timeout=args.timeout)
+            for item in stream:
+                print(f"  📰 {item.get('id')}: {item.get('title')}")
+            for item_id, reason in stream.retracted.items():
+                print(f"  🔁 {item_id} retracted ({reason})")
+            status = stream.metadata.get("workflow_status", "UNKNOWN")
+            print(f"✅ Stream complete: workflow_status {status}")
+        elif input_path.suffix == ".jsonl":
+            output = Path(args.output) if args.output else input_path.with_suffix(".json")
+            document = to_document(input_path)
+            tmp_path = output.with_name(output.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(document, f, ensure_ascii=False, indent=2)
+                f.write("\n")
+            os.replace(tmp_path, output)
+            print(f"✅ Wrote {len(document['validated_items'])} items to {output}")
+        else:
+            output = Path(args.output) if args.output else input_path.with_suffix(".jsonl")
+            with open(input_path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+            count = from_document(document, output)
+            print(f"✅ Wrote {count} items to {output}")
+    except (OSError, ValueError, TimeoutError, StreamAborted) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+"""
+Parallel validation executor for the five core rounds.
+
+Rounds 1 (credibility), 2 (time accuracy), 3 (AI relevance) and 5
+(completeness) only look at one item at a time, so items are sharded
+across a process pool and each worker runs all four rounds on its shard
+in one pass; an item stops at the first round that rejects it. Round 4
+(deduplication) needs the whole set, so the shards are merged back in
+input order at a barrier and Round 4 runs once on the survivors
+(optionally after the story archive pre-filter).
+
+quality_metrics are recomputed in the parent from the per-item verdicts,
+in input order, with the same round*_metrics() helpers the single-round
+scripts use. The document is therefore identical for any worker count.
+
+Round 2 rejects timestamps more than FUTURE_SKEW_HOURS in the future and
+clamps smaller clock skew to age 0 (flagged "future_clamped"). A timestamp
+that cannot be parsed is not rejected: the item keeps its raw value, is
+flagged for manual review and counted in time_accuracy.unparsed_count.
+
+Round 5 scoring follows score_completeness() in
+references/validation_rules.md.
+
+--stream writes the validated.jsonl hand-off (validated_stream.py) while
+this runs: shards come back in input order, and each item is written as
+soon as its shard clears the per-item rounds, so Writing can start before
+the barrier; the archive pre-filter and Round 4 follow as retracts.
+
+Usage:
+    python validation_executor.py tech_news_20251120_raw.md --output tech_news_20251120_validated.json
+    python validation_executor.py items.json --workers 8 --now 2025-11-20T15:30:00+08:00
+    python validation_executor.py tech_news_20251120_raw.md --archive .story_archive --days 7
+    python validation_executor.py tech_news_20251120_raw.md --stream tech_news_20251120_validated.jsonl
+    python validation_executor.py --benchmark 10000 [--workers 8]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from ai_relevance import Relevance, default_matcher, round3_metrics
+from dedup_engine import _get, deduplicate, item_url, priority_key
+from domain_index import LLM_EVAL, REJECT, Classification, default_index, round1_metrics
+from timestamp_engine import (LAYER0_MAX_HOURS, LAYER1_MAX_HOURS, SHANGHAI, UTC, ParsedTime, parse_timestamp,
+                              round2_metrics)
+
+VALIDATOR_VERSION = "4.0.0"
+
+# Round 5 (references/validation_rules.md, Content Quality Scoring)
+# Round 2: publishers' clocks and feed time zones can be slightly off
+FUTURE_SKEW_HOURS = 1.0
+
+COMPLETENESS_THRESHOLD = 7.0
+COMPLETE_SCORE = 8.0
+IMPORTANT_MISSING_WARNING = 0.2
+IMPACT_INDICATORS = ("significant", "major", "breakthrough", "first", "largest",
+                     "will enable", "represents", "marks", "could", "expected to")
+QUOTE_MARKS = ('"', "“", "”", "「", "」")
+CATEGORY_KEY_DATA = {
+    "Funding": ("amount", "currency", "round_type"),
+    "Product Launch": ("product_name", "key_feature", "release_date"),
+    "Financial Results": ("metric", "value", "change_percentage"),
+}
+
+
+class Completeness(NamedTuple):
+    score: float
+    has_essential_fields: bool
+    has_key_data: bool
+    summary_length: int
+    important_missing: int
+
+
+class ItemVerdict(NamedTuple):
+    """Everything the per-item rounds found for one item (small enough to pickle cheaply)."""
+    rejected_round: int  # 0 when the item survives Rounds 1, 2, 3 and 5
+    reason: str
+    classification: Classification
+    published: Optional[str]
+    parsed_method: Optional[str]
+    age_hours: Optional[float]
+    layer: Optional[int]
+    relevance: Optional[Relevance]
+    completeness: Optional[Completeness]
+    time_flag: str = ""  # "unparsed", "future_clamped" or ""
+
+
+def score_completeness(item: dict) -> Completeness:
+    """Round 5 score (0-10) for an item in the validated_items schema."""
+    summary = item.get("summary") or ""
+    key_data = item.get("key_data") if isinstance(item.get("key_data"), dict) else {}
+    company = (_get(item, "ai_validation", "company") or item.get("company_name")
+               or key_data.get("company"))
+    essential = (item.get("title"), item_url(item), _get(item, "source", "name") or item.get("source_name"),
+                 _get(item, "timestamp", "published") or item.get("published_date"), summary)
+    has_essential = all(essential) and len(summary) >= 50
+    important_missing = sum(1 for value in (company, item.get("category"), key_data) if not value)
+    if not has_essential:
+        return Completeness(0.0, False, bool(key_data), len(summary), important_missing)
+
+    score = 10.0
+    if len(summary) < 150:
+        score -= 2.0
+    elif len(summary) > 300:
+        score -= 1.0
+    score -= 2.0 * important_missing
+    required = CATEGORY_KEY_DATA.get(item.get("category"))
+    if required and not all(key_data.get(key) for key in required):
+        score -= 1.5
+    lowered = summary.lower()
+    if not any(indicator in lowered for indicator in IMPACT_INDICATORS):
+        score -= 1.0
+    if not any(mark in summary for mark in QUOTE_MARKS):
+        score -= 0.5
+    score += 0.3 * sum(1 for field in ("author", "tags", "image_url") if item.get(field))
+    return Completeness(round(max(0.0, min(10.0, score)), 1), True, bool(key_data), len(summary),
+                        important_missing)
+
+
+def round5_metrics(results: Sequence[Completeness]) -> dict:
+    """Build the quality_metrics.completeness block; the average is over accepted items."""
+    kept = [r for r in results if r.score >= COMPLETENESS_THRESHOLD]
+    average = round(sum(r.score for r in kept) / len(kept), 2) if kept else 0.0
+    missing_rate = sum(1 for r in kept if r.important_missing) / len(kept) if kept else 0.0
+
+    status = "PASS"
+    if average < COMPLETENESS_THRESHOLD:
+        status = "FAIL"
+    elif missing_rate > IMPORTANT_MISSING_WARNING:
+        status = "WARNING"
+
+    return {
+        "average": average,
+        "complete_count": sum(1 for r in kept if r.score >= COMPLETE_SCORE),
+        "acceptable_count": sum(1 for r in kept if r.score < COMPLETE_SCORE),
+        "incomplete_rejected": len(results) - len(kept),
+        "important_missing_rate": round(missing_rate, 3),
+        "status": status,
+    }
+
+
+def _upvotes(item: dict) -> Optional[int]:
+    """Upvote count if the item carries one (search results usually don't)."""
+    value = item.get("upvotes")
+    if value is None:
+        value = _get(item, "engagement", "upvotes")
+    return value if type(value) is int else None
+
+
+def _raw_timestamp(item: dict):
+    return _get(item, "timestamp", "published") or item.get("published_date")
+
+
+def _parse_raw(value, now: datetime) -> Optional[ParsedTime]:
+    """parse_timestamp() for a scraped value; anything it cannot handle counts as unparsed."""
+    if not isinstance(value, (str, int, float)):
+        return None
+    try:
+        return parse_timestamp(value, now)
+    except (OverflowError, ValueError):
+        return None
+
+
+def validate_item(item: dict, now: datetime) -> ItemVerdict:
+    """Rounds 1, 2, 3 and 5 for one item; stops at the first rejection."""
+    classification = default_index().classify(item_url(item), _upvotes(item))
+    if classification.status == REJECT:
+        return ItemVerdict(1, classification.reason, classification, None, None, None, None, None, None)
+
+    value = _raw_timestamp(item)
+    parsed = _parse_raw(value, now)
+    published = method = age = layer = None
+    time_flag = "unparsed" if value and parsed is None else ""
+    if parsed is not None:
+        published = parsed.published.strftime("%Y-%m-%dT%H:%M:%SZ")
+        method = parsed.method
+        age = round((now.timestamp() - parsed.published.timestamp()) / 3600.0, 1)
+        if age < -FUTURE_SKEW_HOURS:
+            return ItemVerdict(2, f"Timestamp in the future ({-age}h ahead)", classification,
+                               published, method, age, None, None, None)
+        if age < 0:
+            age = 0.0
+            time_flag = "future_clamped"
+        layer = (age > LAYER0_MAX_HOURS) + (age > LAYER1_MAX_HOURS)
+        if layer == 2:
+            return ItemVerdict(2, f"Older than {LAYER1_MAX_HOURS:.0f}h ({age}h)", classification,
+                               published, method, age, layer, None, None)
+
+    relevance = default_matcher().classify(item)
+    if relevance.status == REJECT:
+        return ItemVerdict(3, f"Non-AI content - {relevance.reason}", classification,
+                           published, method, age, layer, relevance, None, time_flag)
+
+    # Round 5 sees the blocks the earlier rounds produced; an unparsed
+    # timestamp is still present (Round 2 sent it to manual review)
+    probe = dict(item)
+    present = published or (value if time_flag == "unparsed" else None)
+    probe["timestamp"] = {"published": present} if present else {}
+    probe["ai_validation"] = {"company": relevance.company or _get(item, "ai_validation", "company")}
+    completeness = score_completeness(probe)
+    if completeness.score < COMPLETENESS_THRESHOLD:
+        reason = ("Missing essential fields" if not completeness.has_essential_fields
+                  else f"Incomplete ({completeness.score}/10)")
+        return ItemVerdict(5, reason, classification, published, method, age, layer, relevance, completeness,
+                           time_flag)
+    return ItemVerdict(0, "", classification, published, method, age, layer, relevance, completeness, time_flag)
+
+
+def _validate_shard(job: Tuple[List[dict], float]) -> List[ItemVerdict]:
+    """Process-pool entry point: one shard, all per-item rounds."""
+    items, now_epoch = job
+    now = datetime.fromtimestamp(now_epoch, SHANGHAI)
+    return [validate_item(item, now) for item in items]
+
+
+def run_item_rounds(items: List[dict], now: datetime, workers: Optional[int] = None,
+                    on_verdict: Optional[Callable[[int, ItemVerdict], None]] = None) -> List[ItemVerdict]:
+    """Per-item rounds on a process pool; verdicts come back in input order.
+
+    on_verdict(index, verdict) is called for each item as soon as its shard
+    (and every shard before it) is done, while later shards still run.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(items) < 2 * workers:
+        jobs = [(items, now.timestamp())]
+        shards = map(_validate_shard, jobs)
+        pool = None
+    else:
+        # A few shards per worker keeps the pool busy when shards finish unevenly
+        size = max(1, -(-len(items) // (workers * 4)))
+        jobs = [(items[start:start + size], now.timestamp()) for start in range(0, len(items), size)]
+        pool = ProcessPoolExecutor(max_workers=workers)
+        shards = pool.map(_validate_shard, jobs)
+    verdicts: List[ItemVerdict] = []
+    try:
+        for shard in shards:
+            for verdict in shard:
+                if on_verdict is not None:
+                    on_verdict(len(verdicts), verdict)
+                verdicts.append(verdict)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return verdicts
+
+
+def _with_verdict(item: dict, verdict: ItemVerdict) -> dict:
+    """The item with the source / timestamp / ai_validation / completeness blocks filled in."""
+    out = dict(item)
+    c = verdict.classification
+    source = dict(item.get("source") or {})
+    source.setdefault("url", item_url(item))
+    if c.credibility is not None:
+        source["credibility"] = c.credibility
+    source["tier"] = c.tier
+    if c.status == LLM_EVAL:
+        source["manual_review"] = True
+    out["source"] = source
+    if verdict.published:
+        out["timestamp"] = {"published": verdict.published, "parsed_method": verdict.parsed_method,
+                            "age_hours": verdict.age_hours, "layer": verdict.layer}
+        if verdict.time_flag == "future_clamped":
+            out["timestamp"]["future_clamped"] = True
+    elif verdict.time_flag == "unparsed":
+        out["timestamp"] = {"published": _raw_timestamp(item), "parsed_method": None, "manual_review": True}
+    r = verdict.relevance
+    block = r.ai_validation()
+    block["company"] = block["company"] or _get(item, "ai_validation", "company")
+    if r.status == LLM_EVAL:
+        block["manual_review"] = True
+    out["ai_validation"] = block
+    m = verdict.completeness
+    out["completeness"] = {"score": m.score, "has_essential_fields": m.has_essential_fields,
+                           "has_key_data": m.has_key_data, "summary_length": m.summary_length}
+    return out
+
+
+def _rejected(item: dict, round_number: int, reason: str, details: str = "") -> dict:
+    return {"original_title": item.get("title"), "rejection_reason": reason,
+            "rejection_round": round_number, "details": details}
+
+
+def validate(items: List[dict], now: Optional[datetime] = None, workers: Optional[int] = None,
+             archive=None, day: Optional[int] = None, days: int = 7, input_file: str = "",
+             timings: Optional[dict] = None, stream=None) -> dict:
+    """Validate a batch and return the validated.json document.
+
+    With a validated_stream.ValidatedStreamWriter as `stream`, each item is
+    written as soon as it clears Rounds 1, 2, 3 and 5, and the archive
+    pre-filter and Round 4 follow as retracts before the trailer. Stream
+    items without an id get item_[N] (their 1-based input position), in the
+    returned document too.
+    """
+    now = now or datetime.now(SHANGHAI)
+    timings = timings if timings is not None else {}
+    survivors: List[dict] = []
+    rejected: List[dict] = []
+
+    def collect(index: int, verdict: ItemVerdict):
+        item = items[index]
+        if verdict.rejected_round:
+            record = _rejected(item, verdict.rejected_round, verdict.reason)
+            rejected.append(record)
+            if stream is not None:
+                stream.reject(record)
+            return
+        out = _with_verdict(item, verdict)
+        if stream is not None:
+            out.setdefault("id", f"item_{index + 1:03d}")
+            stream.item(out)
+        survivors.append(out)
+
+    start = time.perf_counter()
+    verdicts = run_item_rounds(items, now, workers, on_verdict=collect)
+    timings["item_rounds"] = time.perf_counter() - start
+
+    # -- barrier: everything below sees the whole batch, in input order --
+    start = time.perf_counter()
+
+    reached2 = [v for v in verdicts if v.rejected_round != 1]
+    timed = [v for v in reached2 if v.layer is not None and v.rejected_round != 2]
+    time_accuracy = round2_metrics([v.age_hours for v in timed], [v.layer for v in timed])
+    time_accuracy["stale_rejected"] = sum(1 for v in reached2 if v.rejected_round == 2 and v.layer == 2)
+    time_accuracy["future_rejected"] = sum(1 for v in reached2 if v.rejected_round == 2 and v.layer is None)
+    time_accuracy["future_clamped"] = sum(1 for v in reached2 if v.time_flag == "future_clamped")
+    # Kept for manual time estimation (SKILL.md Round 2 report)
+    time_accuracy["unparsed_count"] = sum(1 for v in reached2 if v.time_flag == "unparsed")
+    time_accuracy["missing_count"] = sum(1 for v in reached2 if v.published is None and not v.time_flag)
+
+    previously_published = None
+    if archive is not None and day is not None:
+        survivors, dropped = archive.filter_published(survivors, day, days)
+        previously_published = len(dropped)
+        for item, match in dropped:
+            record = _rejected(item, 4, f"Already published on {match.date}", match.reason)
+            rejected.append(record)
+            if stream is not None:
+                stream.retract(item["id"], f"already published on {match.date}")
+                stream.reject(record)
+
+    dedup = deduplicate(survivors)
+    for cluster in dedup.clusters:
+        if len(cluster) > 1:
+            ordered = sorted(cluster, key=lambda idx: priority_key(survivors[idx]))
+            kept = survivors[ordered[0]].get("title")
+            for idx in ordered[1:]:
+                record = _rejected(survivors[idx], 4, "Duplicate", f"Merged into \"{kept}\"")
+                rejected.append(record)
+                if stream is not None:
+                    stream.reject(record)
+    if stream is not None:
+        stream.retract_duplicates(survivors, dedup)
+    if previously_published is not None:
+        dedup.metrics["previously_published"] = previously_published
+
+    metrics = {
+        "source_credibility": round1_metrics([v.classification for v in verdicts]),
+        "time_accuracy": time_accuracy,
+        "ai_relevance": round3_metrics([v.relevance for v in verdicts if v.relevance is not None]),
+        "deduplication": dedup.metrics,
+        "completeness": round5_metrics([v.completeness for v in verdicts if v.completeness is not None]),
+    }
+    timings["round4"] = time.perf_counter() - start
+    status = "FAIL" if any(block["status"] == "FAIL" for block in metrics.values()) else "PASS"
+
+    metadata = {
+        "validation_date": now.astimezone(SHANGHAI).isoformat(timespec="seconds"),
+        "validator_version": VALIDATOR_VERSION,
+        "input_file": input_file,
+        "workflow_status": status,
+    }
+    if stream is not None:
+        stream.finish(metrics, metadata)
+    return {
+        "metadata": metadata,
+        "quality_metrics": metrics,
+        "validated_items": dedup.items,
+        "rejected_items": rejected,
+    }
+
+
+def load_input(path: Path) -> List[dict]:
+    """raw.md (via item_model) or a validated.json / JSON list of items."""
+    if path.suffix == ".md":
+        from item_model import load_items
+        return list(load_items(path).iter_dicts())
+    with open(path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    return document if isinstance(document, list) else document.get("validated_items", [])
+
+
+def _synthetic_items(count: int, now: datetime, seed: int = 0) -> List[dict]:
+    """Raw-looking items: a few blacklisted, stale, off-topic and thin ones among AI stories."""
+    from dedup_engine import _synthetic_items as dedup_items
+
+    rng = random.Random(seed)
+    hosts = ["techcrunch.com", "reuters.com", "theverge.com", "36kr.com", "venturebeat.com", "example-spam.biz"]
+    items = []
+    for item in dedup_items(count, duplicate_rate=0.05, seed=seed):
+        host = rng.choice(hosts)
+        published = now - timedelta(hours=rng.uniform(0, 52))
+        lead = rng.choice(["The launch represents a major step for AI model developers.",
+                           "The company detailed the AI model in a developer post."])
+        summary = f"{lead} {item['summary']}" if rng.random() > 0.03 else item["summary"][:40]
+        items.append({
+            "id": item["id"],
+            "title": item["title"] if rng.random() > 0.04 else f"Rare earth prices surge ({item['id']})",
+            "source": {"name": host, "url": item["source"]["url"].replace(item["source"]["name"], host)},
+            "timestamp": {"published": published.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")},
+            "summary": summary,
+            "key_data": {"company": item["title"].split()[0], "details": f"${rng.randint(1, 900)}M"},
+            "category": "AI Models",
+        })
+    return items
+
+
+def run_benchmark(count: int, workers: Optional[int] = None):
+    now = datetime(2025, 11, 20, 15, 30, tzinfo=SHANGHAI)
+    items = _synthetic_items(count, now)
+    pooled = workers or os.cpu_count() or 1
+    print(f"📊 {count:,} items, {os.cpu_count()} CPU cores")
+
+    documents = []
+    for worker_count in sorted({1, pooled}):
+        timings: dict = {}
+        start = time.perf_counter()
+        documents.append(json.dumps(validate(items, now, worker_count, timings=timings), sort_keys=True))
+        total = time.perf_counter() - start
+        print(f"⏱️  {worker_count:>2} worker(s): Rounds 1/2/3/5 {timings['item_rounds']:.2f}s "
+              f"({count / timings['item_rounds']:,.0f} items/s), barrier + Round 4 {timings['round4']:.2f}s, "
+              f"total {total:.2f}s")
+    same = all(doc == documents[0] for doc in documents)
+    print(f"{'✅' if same else '❌'} Output {'identical' if same else 'differs'} across worker counts")
+    print(json.dumps(json.loads(documents[0])["quality_metrics"], indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run validator Rounds 1-5 with per-item rounds on a process pool"
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        help="tech_news_[DATE]_raw.md, validated.json or a JSON list of items"
+    )
+    parser.add_argument(
+        "--output",
+        help="Write the validated.json document to this path"
+    )
+    parser.add_argument(
+        "--stream",
+        metavar="PATH",
+        help="Also write tech_news_[DATE]_validated.jsonl to PATH, item by item, while validation runs"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for Rounds 1, 2, 3 and 5 (default: CPU count)"
+    )
+    parser.add_argument(
+        "--now",
+        help="Reference time for age_hours / layers (ISO8601; default: now)"
+    )
+    parser.add_argument(
+        "--archive",
+        help="Story archive directory; items published in the last --days days are dropped before Round 4"
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=7,
+        help="Lookback window for --archive (default: 7)"
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="N",
+        help="Validate N synthetic items with 1 and --workers processes"
+    )
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark, args.workers)
+        return
+
+    if not args.input:
+        parser.error("input file is required unless --benchmark is given")
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"❌ Error: Input file does not exist: {input_path}")
+        sys.exit(1)
+
+    now = None
+    if args.now:
+        parsed = parse_timestamp(args.now)
+        if parsed is None:
+            print(f"❌ Error: Could not parse --now value: {args.now}")
+            sys.exit(1)
+        now = parsed.published.astimezone(SHANGHAI)
+    now = now or datetime.now(SHANGHAI)
+
+    try:
+        items = load_input(input_path)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Error: Could not read {input_path}: {e}")
+        sys.exit(1)
+
+    archive = None
+    if args.archive:
+        from story_archive import StoryArchive
+        archive = StoryArchive(args.archive)
+
+    timings: dict = {}
+    start = time.perf_counter()
+    options = dict(archive=archive, day=int(now.strftime("%Y%m%d")), days=args.days,
+                   input_file=input_path.name, timings=timings)
+    if args.stream:
+        # Writing can start drafting from the stream before Round 4 is done
+        from validated_stream import ValidatedStreamWriter
+        header = {"validation_date": now.isoformat(timespec="seconds"), "validator_version": VALIDATOR_VERSION,
+                  "input_file": input_path.name}
+        with ValidatedStreamWriter(args.stream, header) as stream:
+            document = validate(items, now, args.workers, stream=stream, **options)
+    else:
+        document = validate(items, now, args.workers, **options)
+    elapsed = time.perf_counter() - start
+
+    for name, block in document["quality_metrics"].items():
+        icon = {"PASS": "✅", "WARNING": "⚠️ ", "FAIL": "❌"}.get(block["status"], "❓")
+        print(f"{icon} {name}: {block['status']}")
+    print(f"📊 {len(document['validated_items'])} validated, {len(document['rejected_items'])} rejected "
+          f"of {len(items)} items")
+    print(f"⏱️  Rounds 1/2/3/5 {timings['item_rounds']:.2f}s, Round 4 {timings['round4']:.2f}s, "
+          f"total {elapsed:.2f}s")
+
+    if args.output:
+        output_path = Path(args.output)
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        os.replace(tmp_path, output_path)
+        print(f"✅ Validated data written to {output_path}")
+    if args.stream:
+        print(f"✅ Validated stream written to {args.stream}")
+
+    if document["metadata"]["workflow_status"] == "FAIL":
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
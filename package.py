@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+WeChat Tech News Plugin Packaging Script
+
+Creates the distribution ZIP for marketplace installation. The skill list
+comes from .claude-plugin/marketplace.json; files are streamed straight
+into the archive (no staging copy), compressed on a thread pool, and
+written in sorted order with fixed timestamps and permissions, so the same
+input always produces a byte-identical ZIP.
+
+Compressed members are reused from the previous archive when the file's
+SHA-256 is unchanged (tracked in dist/.package_index.json), so repacking
+after a small edit only recompresses the edited files.
+
+Usage:
+    python package.py
+    python package.py --output-dir dist --jobs 8
+    python package.py --version 4.1.0 --no-reuse
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+OUTPUT_DIR = "dist"
+INDEX_NAME = ".package_index.json"
+INDEX_VERSION = 1
+
+# Top-level files shipped next to the skills
+EXTRA_FILES = ["README.md", "LICENSE", "CONTRIBUTING.md"]
+EXCLUDE_DIRS = {"__pycache__", ".git", ".pytest_cache", ".mypy_cache"}
+EXCLUDE_NAMES = {".DS_Store", ".validate_cache.json"}
+EXCLUDE_SUFFIXES = (".pyc", ".pyo", ".tmp")
+
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+_CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+_END_RECORD = struct.Struct("<IHHHHIIH")
+_ZIP_LIMIT = 0xFFFFFFFF
+
+
+class Member(NamedTuple):
+    """One archive entry: compressed payload plus what the central directory needs."""
+    arcname: str
+    sha256: str
+    method: int  # 0 = stored, 8 = deflated
+    crc: int
+    size: int
+    compress_size: int
+    data: bytes
+    mode: int
+    reused: bool
+
+
+def dos_timestamp() -> Tuple[int, int]:
+    """(time, date) in DOS format: SOURCE_DATE_EPOCH if set, else 1980-01-01 00:00."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        t = time.gmtime(max(int(epoch), 315532800))
+        return ((t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2),
+                ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday)
+    return 0, (1 << 5) | 1
+
+
+def excluded(path: Path) -> bool:
+    return (path.name in EXCLUDE_NAMES or path.name.endswith(EXCLUDE_SUFFIXES)
+            or any(part in EXCLUDE_DIRS for part in path.parts))
+
+
+def collect_files(marketplace_dir: Path) -> Tuple[dict, Dict[str, Path]]:
+    """marketplace.json plus {arcname (relative to the plugin root): source file}."""
+    with open(marketplace_dir / ".claude-plugin" / "marketplace.json", "r", encoding="utf-8") as f:
+        marketplace = json.load(f)
+
+    files: Dict[str, Path] = {}
+
+    def add(path: Path, base: Path):
+        if path.is_file() and not excluded(path.relative_to(base)):
+            files[path.relative_to(marketplace_dir).as_posix()] = path
+
+    for path in (marketplace_dir / ".claude-plugin").iterdir():
+        add(path, marketplace_dir)
+    for name in EXTRA_FILES:
+        add(marketplace_dir / name, marketplace_dir)
+
+    for plugin in marketplace.get("plugins", []):
+        source = (marketplace_dir / plugin.get("source", "./")).resolve()
+        plugin_json = source / ".claude-plugin" / "plugin.json"
+        if plugin_json.is_file():
+            add(plugin_json, marketplace_dir)
+        for skill in plugin.get("skills", []):
+            skill_dir = (source / skill).resolve()
+            if not (skill_dir / "SKILL.md").is_file():
+                raise ValueError(f"Skill '{skill}' of plugin '{plugin.get('name')}' has no SKILL.md")
+            for root, dirs, names in os.walk(skill_dir):
+                dirs[:] = sorted(d for d in dirs if d not in EXCLUDE_DIRS)
+                for name in names:
+                    add(Path(root) / name, marketplace_dir)
+    return marketplace, files
+
+
+def load_index(index_path: Path, output_dir: Path) -> Tuple[Optional[Path], Dict[str, list]]:
+    """Previous archive and its {arcname: [sha256, method, crc, size, compress_size, level]}."""
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None, {}
+    if index.get("version") != INDEX_VERSION:
+        return None, {}
+    archive = output_dir / index.get("archive", "")
+    if not archive.is_file():
+        return None, {}
+    return archive, index.get("members", {})
+
+
+def read_raw_members(archive: Path) -> Dict[str, Tuple[int, int]]:
+    """{arcname: (offset of compressed data, compress_size)} from a ZIP's central directory."""
+    with open(archive, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - _END_RECORD.size - 0xFFFF))
+        tail = f.read()
+        pos = tail.rfind(b"PK\x05\x06")
+        if pos < 0:
+            raise ValueError(f"{archive} is not a ZIP file")
+        _, _, _, _, count, cd_size, cd_offset, _ = _END_RECORD.unpack_from(tail, pos)
+        f.seek(cd_offset)
+        central = f.read(cd_size)
+
+        members = {}
+        pos = 0
+        for _ in range(count):
+            fields = _CENTRAL_HEADER.unpack_from(central, pos)
+            compress_size, name_len, extra_len, comment_len, header_offset = (
+                fields[8], fields[10], fields[11], fields[12], fields[16])
+            start = pos + _CENTRAL_HEADER.size
+            name = central[start:start + name_len].decode("utf-8")
+            pos = start + name_len + extra_len + comment_len
+
+            f.seek(header_offset)
+            local = _LOCAL_HEADER.unpack(f.read(_LOCAL_HEADER.size))
+            data_offset = header_offset + _LOCAL_HEADER.size + local[9] + local[10]
+            members[name] = (data_offset, compress_size)
+    return members
+
+
+def build_member(arcname: str, path: Path, level: int, previous: Dict[str, list],
+                 previous_archive: Optional[Path], raw: Dict[str, Tuple[int, int]]) -> Member:
+    """Hash the file and either reuse its compressed bytes or compress it (thread-safe)."""
+    data = path.read_bytes()
+    sha = hashlib.sha256(data).hexdigest()
+    mode = 0o755 if os.stat(path).st_mode & 0o111 else 0o644
+
+    entry = previous.get(arcname)
+    if entry and entry[0] == sha and entry[5] == level and arcname in raw:
+        offset, compress_size = raw[arcname]
+        if compress_size == entry[4]:
+            with open(previous_archive, "rb") as f:
+                f.seek(offset)
+                payload = f.read(compress_size)
+            return Member(arcname, sha, entry[1], entry[2], entry[3], compress_size, payload, mode, True)
+
+    crc = zlib.crc32(data)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    deflated = compressor.compress(data) + compressor.flush()
+    if len(deflated) < len(data):
+        return Member(arcname, sha, 8, crc, len(data), len(deflated), deflated, mode, False)
+    return Member(arcname, sha, 0, crc, len(data), len(data), data, mode, False)
+
+
+def write_archive(output: Path, members, prefix: str, timestamp: Tuple[int, int]) -> List[Member]:
+    """Write members (an iterable, in archive order) as a ZIP via a temp file."""
+    dos_time, dos_date = timestamp
+    central = []
+    written = []
+    tmp_path = output.with_name(output.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        for member in members:
+            name = (prefix + member.arcname).encode("utf-8")
+            flags = 0 if name.isascii() else 0x800
+            offset = f.tell()
+            if max(offset, member.size, member.compress_size) >= _ZIP_LIMIT:
+                raise ValueError(f"{member.arcname}: archive exceeds 4 GB (ZIP64 is not supported)")
+            f.write(_LOCAL_HEADER.pack(0x04034B50, 20, flags, member.method, dos_time, dos_date,
+                                       member.crc, member.compress_size, member.size, len(name), 0))
+            f.write(name)
+            f.write(member.data)
+            central.append(_CENTRAL_HEADER.pack(
+                0x02014B50, (3 << 8) | 20, 20, flags, member.method, dos_time, dos_date,
+                member.crc, member.compress_size, member.size, len(name), 0, 0, 0, 0,
+                (0o100000 | member.mode) << 16, offset) + name)
+            written.append(member._replace(data=b""))
+
+        cd_offset = f.tell()
+        for record in central:
+            f.write(record)
+        cd_size = f.tell() - cd_offset
+        f.write(_END_RECORD.pack(0x06054B50, 0, 0, len(central), len(central), cd_size, cd_offset, 0))
+    os.replace(tmp_path, output)
+    return written
+
+
+def package(marketplace_dir: Path, output_dir: Path, version: Optional[str] = None,
+            jobs: int = 8, level: int = 9, reuse: bool = True) -> dict:
+    """Build the plugin ZIP; returns a summary dict."""
+    marketplace, files = collect_files(marketplace_dir)
+    plugin_name = marketplace.get("name", marketplace_dir.name)
+    version = version or marketplace.get("metadata", {}).get("version", "0.0.0")
+    archive_name = f"{plugin_name}-{version}.zip"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output = output_dir / archive_name
+    index_path = output_dir / INDEX_NAME
+
+    previous_archive, previous, raw = None, {}, {}
+    if reuse:
+        previous_archive, previous = load_index(index_path, output_dir)
+        if previous_archive:
+            try:
+                raw = read_raw_members(previous_archive)
+            except (OSError, ValueError, struct.error):
+                previous_archive, previous = None, {}
+        prefix_len = len(plugin_name) + 1
+        raw = {name[prefix_len:]: value for name, value in raw.items()
+               if name.startswith(plugin_name + "/")}
+
+    # The previous archive is read while the new one is written, so reusing
+    # compressed bytes from the archive being replaced is safe (temp file)
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        members = pool.map(
+            lambda arcname: build_member(arcname, files[arcname], level, previous, previous_archive, raw),
+            sorted(files),
+        )
+        written = write_archive(output, members, plugin_name + "/", dos_timestamp())
+
+    index = {
+        "version": INDEX_VERSION,
+        "archive": archive_name,
+        "members": {m.arcname: [m.sha256, m.method, m.crc, m.size, m.compress_size, level]
+                    for m in written},
+    }
+    tmp_index = index_path.with_name(index_path.name + ".tmp")
+    with open(tmp_index, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_index, index_path)
+
+    return {
+        "archive": output,
+        "files": len(written),
+        "reused": sum(1 for m in written if m.reused),
+        "bytes": output.stat().st_size,
+        "skills": [s for p in marketplace.get("plugins", []) for s in p.get("skills", [])],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Package the plugin into a deterministic distribution ZIP"
+    )
+    parser.add_argument(
+        "--marketplace-dir",
+        default=".",
+        help="Marketplace root containing .claude-plugin/marketplace.json (default: .)"
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=OUTPUT_DIR,
+        help=f"Directory for the ZIP (default: {OUTPUT_DIR})"
+    )
+    parser.add_argument(
+        "--version",
+        help="Version in the archive name (default: metadata.version from marketplace.json)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count() or 4,
+        help="Number of compression threads (default: CPU count)"
+    )
+    parser.add_argument(
+        "--level",
+        type=int,
+        choices=range(0, 10),
+        default=9,
+        metavar="0-9",
+        help="Deflate compression level (default: 9)"
+    )
+    parser.add_argument(
+        "--no-reuse",
+        action="store_true",
+        help="Recompress every file instead of reusing members from the previous archive"
+    )
+
+    args = parser.parse_args()
+
+    marketplace_dir = Path(args.marketplace_dir).resolve()
+    output_dir = Path(args.output_dir)
+    if not output_dir.is_absolute():
+        output_dir = marketplace_dir / output_dir
+
+    print(f"📦 Packaging plugin from {marketplace_dir}...")
+    start = time.perf_counter()
+    try:
+        summary = package(marketplace_dir, output_dir, version=args.version, jobs=args.jobs,
+                          level=args.level, reuse=not args.no_reuse)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    archive = summary["archive"]
+    for skill in summary["skills"]:
+        print(f"  - {skill}")
+    print("✅ Package created successfully!")
+    print()
+    print("📊 Package Details:")
+    print(f"   Name: {archive.name}")
+    print(f"   Size: {summary['bytes'] / 1024:.1f} KB")
+    print(f"   Location: {archive}")
+    print(f"   Files: {summary['files']} ({summary['reused']} reused from the previous archive)")
+    print(f"⏱️  Packed in {elapsed * 1000:.0f} ms")
+    print()
+    print("📤 Installation Instructions:")
+    print("   1. Share the ZIP file with users")
+    print("   2. Users extract to: ~/.claude/plugins/marketplaces/")
+    print("   3. Restart Claude Code")
+    print("   4. Enable plugin in Settings → Plugins")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,18 @@ Add a new plugin to an existing marketplace.
 
 Usage:
     python add_plugin.py <marketplace-dir> --name <plugin-name> --description <desc> --skills <skill-paths>
+    python add_plugin.py <marketplace-dir> --manifest plugins.jsonl [--report report.json] [--jobs N]
 """
 
 import argparse
+import contextlib
 import json
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
 
 def validate_name(name: str) -> bool:
@@ -38,12 +43,38 @@ def load_marketplace_json(marketplace_dir: Path) -> dict:
 
 
 def save_marketplace_json(marketplace_dir: Path, data: dict):
-    """Save marketplace.json with proper formatting."""
+    """Save marketplace.json with proper formatting.
+
+    Written to a temp file and renamed into place, so readers never see a
+    half-written file.
+    """
     marketplace_json_path = marketplace_dir / ".claude-plugin" / "marketplace.json"
+    tmp_path = marketplace_json_path.with_name(marketplace_json_path.name + ".tmp")
 
-    with open(marketplace_json_path, 'w') as f:
+    with open(tmp_path, 'w') as f:
         json.dump(data, f, indent=2)
         f.write('\n')  # Add trailing newline
+    os.replace(tmp_path, marketplace_json_path)
+
+
+def normalize_skill_paths(skill_paths: List[str]) -> List[str]:
+    """Ensure skill paths start with ./"""
+    return [path if path.startswith('./') else f'./{path}' for path in skill_paths]
+
+
+def skill_path_issue(marketplace_dir: Path, skill_path: str) -> Optional[str]:
+    """Return a description of what is wrong with a skill path, or None."""
+    # Remove leading ./ if present
+    clean_path = skill_path[2:] if skill_path.startswith('./') else skill_path
+    skill_dir = marketplace_dir / clean_path
+
+    if not skill_dir.exists():
+        return f"Skill directory does not exist: {skill_path}"
+    if not skill_dir.is_dir():
+        return f"Skill path is not a directory: {skill_path}"
+    if not (skill_dir / "SKILL.md").exists():
+        return f"SKILL.md not found in: {skill_path}"
+    return None
 
 
 def verify_skill_paths(marketplace_dir: Path, skill_paths: List[str]) -> bool:
@@ -51,23 +82,9 @@ def verify_skill_paths(marketplace_dir: Path, skill_paths: List[str]) -> bool:
     all_valid = True
 
     for skill_path in skill_paths:
-        # Remove leading ./ if present
-        clean_path = skill_path[2:] if skill_path.startswith('./') else skill_path
-        skill_dir = marketplace_dir / clean_path
-
-        if not skill_dir.exists():
-            print(f"⚠️  Warning: Skill directory does not exist: {skill_path}")
-            all_valid = False
-            continue
-
-        if not skill_dir.is_dir():
-            print(f"⚠️  Warning: Skill path is not a directory: {skill_path}")
-            all_valid = False
-            continue
-
-        skill_md = skill_dir / "SKILL.md"
-        if not skill_md.exists():
-            print(f"⚠️  Warning: SKILL.md not found in: {skill_path}")
+        issue = skill_path_issue(marketplace_dir, skill_path)
+        if issue:
+            print(f"⚠️  Warning: {issue}")
             all_valid = False
 
     return all_valid
@@ -105,12 +122,7 @@ def add_plugin(
         sys.exit(1)
 
     # Normalize skill paths (ensure they start with ./)
-    normalized_paths = []
-    for path in skill_paths:
-        if not path.startswith('./'):
-            normalized_paths.append(f'./{path}')
-        else:
-            normalized_paths.append(path)
+    normalized_paths = normalize_skill_paths(skill_paths)
 
     # Verify skill paths
     print("Verifying skill paths...")
@@ -153,6 +165,190 @@ def add_plugin(
     print("3. Test the plugin in Claude Code")
 
 
+def read_manifest(manifest_path: Path) -> List[dict]:
+    """Read plugin specs from a JSONL file (one object per line) or a JSON
+    file holding a list or a {"plugins": [...]} object."""
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        if manifest_path.suffix in ('.jsonl', '.ndjson'):
+            specs = []
+            for line_no, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        specs.append(json.loads(line))
+                    except json.JSONDecodeError as e:
+                        raise ValueError(f"line {line_no}: {e}") from None
+            return specs
+        data = json.load(f)
+
+    if isinstance(data, dict):
+        data = data.get('plugins', [])
+    if not isinstance(data, list):
+        raise ValueError("manifest must be a list of plugin specs or {\"plugins\": [...]}")
+    return data
+
+
+def check_plugin_spec(spec, existing_names: Dict[str, int], batch_names: Dict[str, int], index: int) -> dict:
+    """Check one manifest entry without touching the filesystem."""
+    entry = {"index": index, "name": None, "status": "pending", "errors": [], "warnings": []}
+    if not isinstance(spec, dict):
+        entry["errors"].append("Plugin spec must be a JSON object")
+        return entry
+
+    name = spec.get('name')
+    description = spec.get('description')
+    skills = spec.get('skills')
+    entry["name"] = name
+
+    if not isinstance(name, str) or not validate_name(name):
+        entry["errors"].append("Invalid plugin name (must be kebab-case)")
+    elif name in existing_names:
+        entry["errors"].append(f"Plugin '{name}' already exists in marketplace.json")
+    elif name in batch_names:
+        entry["errors"].append(f"Plugin '{name}' is repeated in the manifest (first at entry {batch_names[name]})")
+    else:
+        batch_names[name] = index
+
+    if not isinstance(description, str) or not description:
+        entry["errors"].append("Missing 'description'")
+    elif len(description) < 20:
+        entry["warnings"].append("Description is very short (< 20 characters)")
+    elif len(description) > 200:
+        entry["warnings"].append("Description is quite long (> 200 characters)")
+
+    if isinstance(skills, str):
+        skills = [skills]
+    if not isinstance(skills, list) or not skills or not all(isinstance(s, str) for s in skills):
+        entry["errors"].append("'skills' must be a non-empty list of paths")
+    else:
+        entry["skills"] = normalize_skill_paths(skills)
+    return entry
+
+
+def add_plugins(
+    marketplace_dir: Path,
+    specs: List[dict],
+    jobs: int = 8,
+    allow_missing_skills: bool = False
+) -> dict:
+    """Add many plugins in one all-or-nothing transaction.
+
+    marketplace.json is loaded once, names are checked against an index of
+    existing and batch names, every distinct skill path is verified on a
+    thread pool, and the file is written once. If any spec fails, nothing
+    is written. Returns a report dict; never prompts.
+    """
+    started = time.perf_counter()
+    report = {
+        "marketplace": str(marketplace_dir),
+        "status": "failed",
+        "requested": len(specs),
+        "added": [],
+        "errors": [],
+        "plugins": [],
+    }
+
+    marketplace_json_path = marketplace_dir / ".claude-plugin" / "marketplace.json"
+    try:
+        with open(marketplace_json_path, 'r') as f:
+            marketplace_data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        report["errors"].append(f"Could not load {marketplace_json_path}: {e}")
+        return report
+
+    plugins = marketplace_data.get('plugins', []) if isinstance(marketplace_data, dict) else None
+    if not isinstance(plugins, list):
+        report["errors"].append(f"{marketplace_json_path}: 'plugins' must be a list")
+        return report
+    malformed = [i for i, p in enumerate(plugins) if not isinstance(p, dict)]
+    if malformed:
+        report["errors"].extend(f"{marketplace_json_path}: plugins[{i}] must be a JSON object" for i in malformed)
+        return report
+
+    existing_names = {p.get('name'): i for i, p in enumerate(plugins)}
+    batch_names: Dict[str, int] = {}
+    entries = [check_plugin_spec(spec, existing_names, batch_names, i) for i, spec in enumerate(specs)]
+
+    # Verify each distinct skill path once, concurrently
+    unique_paths = sorted({path for entry in entries for path in entry.get("skills", [])})
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        issues = dict(zip(unique_paths, executor.map(lambda p: skill_path_issue(marketplace_dir, p), unique_paths)))
+
+    for entry in entries:
+        for path in entry.get("skills", []):
+            if issues[path]:
+                (entry["warnings"] if allow_missing_skills else entry["errors"]).append(issues[path])
+        entry["status"] = "rejected" if entry["errors"] else "valid"
+
+    report["plugins"] = entries
+    failed = [entry for entry in entries if entry["errors"]]
+    if failed:
+        report["errors"].append(f"{len(failed)} of {len(entries)} plugin spec(s) failed; nothing was written")
+    elif not entries:
+        report["errors"].append("Manifest contains no plugin specs")
+    else:
+        plugins = marketplace_data.setdefault('plugins', [])
+        for entry, spec in zip(entries, specs):
+            plugins.append({
+                "name": entry["name"],
+                "description": spec['description'],
+                "source": spec.get('source', './'),
+                "strict": bool(spec.get('strict', False)),
+                "skills": entry["skills"]
+            })
+            entry["status"] = "added"
+            report["added"].append(entry["name"])
+        save_marketplace_json(marketplace_dir, marketplace_data)
+        report["status"] = "committed"
+
+    report["elapsed_seconds"] = round(time.perf_counter() - started, 4)
+    return report
+
+
+def run_manifest(marketplace_dir: Path, manifest_path: Path, report_path: Optional[str],
+                 jobs: int, allow_missing_skills: bool) -> bool:
+    """Batch mode for --manifest: add every plugin, print a summary, write the report.
+
+    With report_path '-' the JSON report goes to stdout and the summary to
+    stderr, so the output can be piped straight into another tool.
+    """
+    with contextlib.redirect_stdout(sys.stderr if report_path == '-' else sys.stdout):
+        print(f"➕ Adding plugins from {manifest_path}")
+        print()
+
+        try:
+            specs = read_manifest(manifest_path)
+        except (OSError, ValueError) as e:
+            report = {"marketplace": str(marketplace_dir), "status": "failed", "requested": 0,
+                      "added": [], "errors": [f"Could not read manifest {manifest_path}: {e}"], "plugins": []}
+        else:
+            report = add_plugins(marketplace_dir, specs, jobs, allow_missing_skills)
+        report["manifest"] = str(manifest_path)
+
+        for entry in report["plugins"]:
+            for message in entry["errors"]:
+                print(f"❌ [{entry['index']}] {entry['name']}: {message}")
+            for message in entry["warnings"]:
+                print(f"⚠️  [{entry['index']}] {entry['name']}: {message}")
+
+        if report_path and report_path != '-':
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+                f.write('\n')
+
+        print()
+        if report["status"] == "committed":
+            print(f"✅ Added {len(report['added'])} plugin(s) in {report['elapsed_seconds']}s")
+        else:
+            for message in report["errors"]:
+                print(f"❌ Error: {message}")
+        if report_path and report_path != '-':
+            print(f"📄 Report written to {report_path}")
+
+    if report_path == '-':
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    return report["status"] == "committed"
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Add a plugin to a Claude Code marketplace"
@@ -163,17 +359,14 @@ def main():
     )
     parser.add_argument(
         "--name",
-        required=True,
         help="Plugin name (kebab-case, e.g., 'my-plugin')"
     )
     parser.add_argument(
         "--description",
-        required=True,
         help="Plugin description (50-200 characters recommended)"
     )
     parser.add_argument(
         "--skills",
-        required=True,
         nargs='+',
         help="Skill paths relative to marketplace root (e.g., './skill-name' or 'category/skill-name')"
     )
@@ -187,6 +380,26 @@ def main():
         action="store_true",
         help="Enable strict mode for plugin validation"
     )
+    parser.add_argument(
+        "--manifest",
+        help="Add every plugin from a JSONL or JSON manifest in one all-or-nothing write "
+             "(replaces --name/--description/--skills)"
+    )
+    parser.add_argument(
+        "--report",
+        help="With --manifest: write a JSON report to this path ('-' for stdout)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=8,
+        help="With --manifest: threads used to verify skill paths (default: 8)"
+    )
+    parser.add_argument(
+        "--allow-missing-skills",
+        action="store_true",
+        help="With --manifest: report skill path issues as warnings instead of failing the batch"
+    )
 
     args = parser.parse_args()
 
@@ -195,6 +408,13 @@ def main():
         print(f"❌ Error: Marketplace directory does not exist: {marketplace_dir}")
         sys.exit(1)
 
+    if args.manifest:
+        ok = run_manifest(marketplace_dir, Path(args.manifest), args.report, args.jobs, args.allow_missing_skills)
+        sys.exit(0 if ok else 1)
+
+    if not (args.name and args.description and args.skills):
+        parser.error("--name, --description and --skills are required (or use --manifest)")
+
     # Check description length
     if len(args.description) < 20:
         print("⚠️  Warning: Description is very short (< 20 characters)")
@@ -137,6 +137,7 @@ __pycache__/
 .pytest_cache/
 
 # Temporary files
+.validate_cache.json
 *.tmp
 *.swp
 ~*
@@ -0,0 +1,568 @@
+#!/usr/bin/env python3
+"""
+Search skills across many marketplaces through a local SQLite FTS5 index.
+
+The index holds marketplace, plugin and skill metadata plus each SKILL.md's
+frontmatter and headings. Updates are incremental: marketplace.json is only
+re-parsed when its mtime or size changed, and a SKILL.md is only re-read
+when its own mtime or size changed, so re-indexing after a few edits costs
+one stat() per skill.
+
+A root may be a marketplace directory or a directory of mirrored
+marketplaces (every child with .claude-plugin/marketplace.json is indexed).
+
+    with SkillIndex("skill_index.db") as index:
+        index.update(["~/mirrors"])
+        for hit in index.search("pdf extraction", limit=5):
+            print(hit.marketplace, hit.plugin, hit.skill_path)
+
+Usage:
+    python skill_index.py update ~/mirrors ./my-marketplace [--index skill_index.db]
+    python skill_index.py update                      # refresh everything already indexed
+    python skill_index.py query "pdf form" [--limit 20] [--marketplace NAME] [--json]
+    python skill_index.py stats
+    python skill_index.py --benchmark 100000
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import re
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+from validate_marketplace import parse_frontmatter  # noqa: E402
+
+DEFAULT_INDEX = "skill_index.db"
+SCHEMA_VERSION = 1
+MAX_HEADINGS_CHARS = 4000
+
+# bm25 column weights: name, description, headings, plugin, marketplace, plugin description
+RANK_WEIGHTS = (10.0, 4.0, 1.0, 6.0, 2.0, 2.0)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS marketplaces (
+    id INTEGER PRIMARY KEY,
+    root TEXT UNIQUE NOT NULL,
+    name TEXT,
+    mtime_ns INTEGER,
+    size INTEGER
+);
+CREATE TABLE IF NOT EXISTS plugins (
+    id INTEGER PRIMARY KEY,
+    marketplace_id INTEGER NOT NULL,
+    name TEXT,
+    description TEXT,
+    version TEXT,
+    source TEXT
+);
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY,
+    marketplace_id INTEGER NOT NULL,
+    plugin_id INTEGER NOT NULL,
+    path TEXT,
+    skill_dir TEXT,
+    name TEXT,
+    description TEXT,
+    headings TEXT,
+    mtime_ns INTEGER,
+    size INTEGER
+);
+CREATE INDEX IF NOT EXISTS skills_marketplace ON skills(marketplace_id);
+CREATE INDEX IF NOT EXISTS plugins_marketplace ON plugins(marketplace_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS skills_fts USING fts5(
+    name, description, headings, plugin, marketplace, plugin_description,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+"""
+
+_HEADING_RE = re.compile(r'^#{1,6}[ \t]+(.+?)[ \t#]*$')
+# unicode61 treats a run of CJK characters as one token, so CJK text is
+# indexed one character per token and queried as a phrase
+_CJK = '\u3040-\u30ff\u3400-\u9fff\uac00-\ud7af\uf900-\ufaff'
+_CJK_CHAR_RE = re.compile(f'([{_CJK}])')
+_TOKEN_RE = re.compile(f'[{_CJK}]+|[^\\W{_CJK}]+')
+
+
+class SkillHit(NamedTuple):
+    """One ranked search result (lower score = better match, as bm25)."""
+    marketplace: str
+    plugin: str
+    skill_path: str
+    name: str
+    description: str
+    skill_dir: str
+    score: float
+
+
+class SkillDoc(NamedTuple):
+    """What the index keeps from one SKILL.md."""
+    name: str
+    description: str
+    headings: str
+    mtime_ns: int
+    size: int
+
+
+def read_skill_md(path: Path, st: os.stat_result) -> SkillDoc:
+    """Frontmatter name/description and the headings (outside code fences) of a SKILL.md."""
+    text = path.read_text(encoding='utf-8', errors='replace')
+    frontmatter: Dict[str, object] = {}
+    body = text
+    lines = text.splitlines()
+    if lines and lines[0].strip() == '---':
+        for end, line in enumerate(lines[1:], 1):
+            if line.strip() in ('---', '...'):
+                frontmatter = parse_frontmatter('\n'.join(lines[1:end]))
+                body = '\n'.join(lines[end + 1:])
+                break
+
+    headings = []
+    in_fence = False
+    for line in body.splitlines():
+        if line.lstrip().startswith(('```', '~~~')):
+            in_fence = not in_fence
+            continue
+        if not in_fence:
+            match = _HEADING_RE.match(line)
+            if match:
+                headings.append(match.group(1))
+
+    def text_of(key: str) -> str:
+        value = frontmatter.get(key, '')
+        return ' '.join(value) if isinstance(value, list) else str(value)
+
+    return SkillDoc(text_of('name'), text_of('description'),
+                    ' | '.join(headings)[:MAX_HEADINGS_CHARS], st.st_mtime_ns, st.st_size)
+
+
+def clean_skill_path(path: str) -> str:
+    return path[2:] if path.startswith('./') else path
+
+
+def discover_marketplaces(root: Path) -> List[Path]:
+    """root itself if it is a marketplace, else its immediate children that are."""
+    if (root / '.claude-plugin' / 'marketplace.json').is_file():
+        return [root]
+    found = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir() and os.path.isfile(os.path.join(entry.path, '.claude-plugin', 'marketplace.json')):
+                    found.append(Path(entry.path))
+    except OSError:
+        pass
+    return sorted(found)
+
+
+def segment(text: str) -> str:
+    """Space out CJK characters so each is its own FTS token."""
+    return _CJK_CHAR_RE.sub(r' \1 ', text) if text else text
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, as a prefix
+    (CJK runs as an exact phrase)."""
+    terms = []
+    for token in _TOKEN_RE.findall(text):
+        if _CJK_CHAR_RE.match(token):
+            terms.append('"' + ' '.join(token) + '"')
+        else:
+            terms.append(f'"{token}"*')
+    return ' '.join(terms)
+
+
+class SkillIndex:
+    """On-disk SQLite FTS5 index of skills across marketplaces."""
+
+    def __init__(self, path=DEFAULT_INDEX):
+        self.path = Path(path)
+        self.db = sqlite3.connect(str(self.path))
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        version = None
+        if self.db.execute("SELECT 1 FROM sqlite_master WHERE name = 'meta'").fetchone():
+            row = self.db.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            version = int(row[0]) if row else None
+            if version != SCHEMA_VERSION:
+                for table in ("skills_fts", "skills", "plugins", "marketplaces", "meta"):
+                    self.db.execute(f"DROP TABLE IF EXISTS {table}")
+        self.db.executescript(_SCHEMA)
+        self.db.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        self.db.execute("INSERT INTO skills_fts(skills_fts, rank) VALUES ('rank', ?)",
+                        (f"bm25({', '.join(str(w) for w in RANK_WEIGHTS)})",))
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self) -> "SkillIndex":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    # -- updating -----------------------------------------------------------
+
+    def update(self, roots: Iterable = ()) -> Dict[str, int]:
+        """Index new or changed marketplaces under roots and refresh everything already indexed.
+
+        Returns counts: marketplaces, skills, reparsed (marketplace.json
+        files parsed), reread (SKILL.md files read) and removed (marketplaces
+        whose marketplace.json disappeared).
+        """
+        stats = {'marketplaces': 0, 'skills': 0, 'reparsed': 0, 'reread': 0, 'removed': 0}
+        known = {row[0]: row for row in self.db.execute(
+            "SELECT root, id, name, mtime_ns, size FROM marketplaces")}
+        targets = dict.fromkeys(known)
+        for root in roots:
+            for marketplace_dir in discover_marketplaces(Path(root).expanduser().resolve()):
+                targets[str(marketplace_dir)] = None
+
+        with self.db:
+            for root in targets:
+                json_path = Path(root) / '.claude-plugin' / 'marketplace.json'
+                try:
+                    st = json_path.stat()
+                except OSError:
+                    if root in known:
+                        self._delete_marketplace(known[root][1])
+                        stats['removed'] += 1
+                    continue
+                stats['marketplaces'] += 1
+                row = known.get(root)
+                if row and row[3] == st.st_mtime_ns and row[4] == st.st_size:
+                    skills, reread = self._refresh_skills(row[1], row[2])
+                else:
+                    try:
+                        with open(json_path, 'r', encoding='utf-8') as f:
+                            document = json.load(f)
+                    except (OSError, ValueError) as e:
+                        print(f"⚠️  Skipping {json_path}: {e}", file=sys.stderr)
+                        continue
+                    stats['reparsed'] += 1
+                    skills, reread = self._index_marketplace(root, row[1] if row else None, document, st)
+                stats['skills'] += skills
+                stats['reread'] += reread
+        return stats
+
+    def _delete_marketplace(self, marketplace_id: int):
+        self.db.execute("DELETE FROM skills_fts WHERE rowid IN (SELECT id FROM skills WHERE marketplace_id = ?)",
+                        (marketplace_id,))
+        self.db.execute("DELETE FROM skills WHERE marketplace_id = ?", (marketplace_id,))
+        self.db.execute("DELETE FROM plugins WHERE marketplace_id = ?", (marketplace_id,))
+        self.db.execute("DELETE FROM marketplaces WHERE id = ?", (marketplace_id,))
+
+    def _refresh_skills(self, marketplace_id: int, marketplace_name: str) -> Tuple[int, int]:
+        """marketplace.json unchanged: stat every SKILL.md, re-read only the changed ones."""
+        rows = self.db.execute("SELECT id, skill_dir, mtime_ns, size, plugin_id FROM skills "
+                               "WHERE marketplace_id = ?", (marketplace_id,)).fetchall()
+        changed = []
+        for skill_id, skill_dir, mtime_ns, size, plugin_id in rows:
+            try:
+                st = os.stat(os.path.join(skill_dir, 'SKILL.md'))
+            except OSError:
+                if mtime_ns is not None:
+                    changed.append((skill_id, plugin_id, SkillDoc('', '', '', None, None)))
+                continue
+            if st.st_mtime_ns != mtime_ns or st.st_size != size:
+                try:
+                    changed.append((skill_id, plugin_id, read_skill_md(Path(skill_dir) / 'SKILL.md', st)))
+                except OSError:
+                    continue
+
+        for skill_id, plugin_id, doc in changed:
+            plugin_name, plugin_description = self.db.execute(
+                "SELECT name, description FROM plugins WHERE id = ?", (plugin_id,)).fetchone()
+            self._store_skill(skill_id, doc, plugin_name, marketplace_name, plugin_description)
+        return len(rows), len(changed)
+
+    def _store_skill(self, skill_id: int, doc: SkillDoc, plugin_name: str, marketplace_name: str,
+                     plugin_description: str):
+        self.db.execute("UPDATE skills SET name = ?, description = ?, headings = ?, mtime_ns = ?, size = ? "
+                        "WHERE id = ?", (doc.name, doc.description, doc.headings, doc.mtime_ns, doc.size, skill_id))
+        self.db.execute("DELETE FROM skills_fts WHERE rowid = ?", (skill_id,))
+        self.db.execute("INSERT INTO skills_fts(rowid, name, description, headings, plugin, marketplace, "
+                        "plugin_description) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (skill_id, segment(doc.name), segment(doc.description), segment(doc.headings),
+                         segment(plugin_name), segment(marketplace_name), segment(plugin_description)))
+
+    def _index_marketplace(self, root: str, marketplace_id: Optional[int], document: dict,
+                           st: os.stat_result) -> Tuple[int, int]:
+        """(Re)build one marketplace's rows, reusing SKILL.md data whose mtime and size still match."""
+        previous: Dict[str, SkillDoc] = {}
+        if marketplace_id is not None:
+            for skill_dir, name, description, headings, mtime_ns, size in self.db.execute(
+                    "SELECT skill_dir, name, description, headings, mtime_ns, size FROM skills "
+                    "WHERE marketplace_id = ?", (marketplace_id,)):
+                previous[skill_dir] = SkillDoc(name, description, headings, mtime_ns, size)
+            self._delete_marketplace(marketplace_id)
+
+        marketplace_name = str(document.get('name', Path(root).name))
+        marketplace_id = self.db.execute(
+            "INSERT INTO marketplaces(root, name, mtime_ns, size) VALUES (?, ?, ?, ?)",
+            (root, marketplace_name, st.st_mtime_ns, st.st_size)).lastrowid
+
+        skills = reread = 0
+        for plugin in document.get('plugins', []):
+            if not isinstance(plugin, dict):
+                continue
+            plugin_name = str(plugin.get('name', ''))
+            plugin_description = str(plugin.get('description', ''))
+            plugin_id = self.db.execute(
+                "INSERT INTO plugins(marketplace_id, name, description, version, source) VALUES (?, ?, ?, ?, ?)",
+                (marketplace_id, plugin_name, plugin_description, str(plugin.get('version', '')),
+                 str(plugin.get('source', '')))).lastrowid
+            for skill_path in plugin.get('skills', []):
+                if not isinstance(skill_path, str):
+                    continue
+                skill_dir = str(Path(root) / clean_skill_path(skill_path))
+                skill_md = Path(skill_dir) / 'SKILL.md'
+                doc = SkillDoc('', '', '', None, None)
+                try:
+                    md_stat = skill_md.stat()
+                    cached = previous.get(skill_dir)
+                    if cached and cached.mtime_ns == md_stat.st_mtime_ns and cached.size == md_stat.st_size:
+                        doc = cached
+                    else:
+                        doc = read_skill_md(skill_md, md_stat)
+                        reread += 1
+                except OSError:
+                    pass
+                skill_id = self.db.execute(
+                    "INSERT INTO skills(marketplace_id, plugin_id, path, skill_dir) VALUES (?, ?, ?, ?)",
+                    (marketplace_id, plugin_id, skill_path, skill_dir)).lastrowid
+                self._store_skill(skill_id, doc, plugin_name, marketplace_name, plugin_description)
+                skills += 1
+        return skills, reread
+
+    # -- querying -----------------------------------------------------------
+
+    def search(self, query: str, limit: int = 20, marketplace: Optional[str] = None,
+               raw: bool = False) -> List[SkillHit]:
+        """Ranked skills matching query (free text, or FTS5 syntax with raw=True)."""
+        match = query if raw else fts_query(query)
+        if not match:
+            return []
+        if marketplace:
+            # Phrase-match the marketplace column inside FTS so ranking stays in one pass
+            match = f'({match}) AND marketplace : "{segment(marketplace).replace(chr(34), "")}"'
+        # Rank and cut inside FTS first, then join only the top rows
+        sql = ("SELECT m.name, p.name, s.path, s.name, s.description, s.skill_dir, top.rank "
+               "FROM (SELECT rowid, rank FROM skills_fts WHERE skills_fts MATCH ? ORDER BY rank LIMIT ?) top "
+               "JOIN skills s ON s.id = top.rowid "
+               "JOIN plugins p ON p.id = s.plugin_id JOIN marketplaces m ON m.id = s.marketplace_id "
+               "ORDER BY top.rank")
+        hits = [SkillHit(*row) for row in self.db.execute(sql, (match, limit))]
+        if marketplace:
+            hits = [hit for hit in hits if hit.marketplace == marketplace]
+        return hits
+
+    def counts(self) -> Dict[str, int]:
+        return {table: self.db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("marketplaces", "plugins", "skills")}
+
+
+def _write_synthetic(root: Path, skills: int, per_marketplace: int = 1000, seed: int = 7) -> List[Path]:
+    """Synthetic mirrors: marketplaces of one-skill plugins with varied SKILL.md text.
+
+    Words are drawn Zipf-like from 30 common terms plus a long tail of
+    rarer ones, so queries range from very broad to selective.
+    """
+    rng = random.Random(seed)
+    common = ("pdf docx spreadsheet chart translate summarize wechat news search validate format "
+              "deploy kubernetes terraform sql postgres redis cache image video audio transcribe "
+              "compliance review security audit test refactor python rust typescript api").split()
+    tail = [f"{word}{n}" for n in range(1, 101) for word in ("tool", "lib", "flow")]
+    population = common + tail
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(population))))
+
+    def words(k: int) -> List[str]:
+        picked: List[str] = []
+        while len(picked) < k:
+            word = rng.choices(population, cum_weights=cum_weights)[0]
+            if word not in picked:
+                picked.append(word)
+        return picked
+    marketplaces = []
+    for m in range(0, skills, per_marketplace):
+        marketplace_dir = root / f"mirror-{m // per_marketplace:04d}"
+        (marketplace_dir / '.claude-plugin').mkdir(parents=True)
+        plugins = []
+        for i in range(m, min(m + per_marketplace, skills)):
+            title = words(4)
+            name = f"{title[0]}-{title[1]}-{i}"
+            skill_dir = marketplace_dir / name
+            skill_dir.mkdir()
+            (skill_dir / 'SKILL.md').write_text(
+                f"---\nname: {name}\ndescription: {' '.join(words(8))}\n---\n\n"
+                f"# {title[2].title()} toolkit\n\n## {title[3].title()} workflow\n\nBody text.\n",
+                encoding='utf-8')
+            plugins.append({"name": name, "description": f"{title[0]} {title[1]} plugin",
+                            "source": "./", "skills": [f"./{name}"]})
+        with open(marketplace_dir / '.claude-plugin' / 'marketplace.json', 'w', encoding='utf-8') as f:
+            json.dump({"name": marketplace_dir.name, "plugins": plugins}, f)
+        marketplaces.append(marketplace_dir)
+    return marketplaces
+
+
+def run_benchmark(count: int):
+    """Time full indexing, no-op and small incremental updates, and queries over count skills."""
+    with tempfile.TemporaryDirectory() as tmp:
+        mirrors = Path(tmp) / "mirrors"
+        start = time.perf_counter()
+        marketplaces = _write_synthetic(mirrors, count)
+        print(f"📁 Generated {count} skills in {len(marketplaces)} marketplace(s) "
+              f"in {time.perf_counter() - start:.1f}s")
+
+        with SkillIndex(Path(tmp) / "index.db") as index:
+            start = time.perf_counter()
+            stats = index.update([mirrors])
+            print(f"⏱️  Full index:          {time.perf_counter() - start:.2f}s "
+                  f"({stats['skills']} skills, {stats['reread']} SKILL.md read)")
+
+            start = time.perf_counter()
+            stats = index.update()
+            print(f"⏱️  No-change update:    {time.perf_counter() - start:.2f}s "
+                  f"({stats['reread']} SKILL.md read)")
+
+            edited = sorted(p for p in marketplaces[0].iterdir() if (p / 'SKILL.md').is_file())[:10]
+            for skill_dir in edited:
+                with open(skill_dir / 'SKILL.md', 'a', encoding='utf-8') as f:
+                    f.write("\n## Zebrafish appendix\n")
+            start = time.perf_counter()
+            stats = index.update()
+            print(f"⏱️  10 edited skills:    {time.perf_counter() - start:.2f}s "
+                  f"({stats['reread']} SKILL.md read)")
+
+            # bm25 scores every matching row, so cost follows how many skills a query matches
+            groups = {
+                "selective": ["flow42 tool7", "zebrafish", "lib88", "tool15 deploy", "flow3 lib9"],
+                "broad": ["pdf", "translate wechat", "kubernetes deploy", "sql cache"],
+            }
+            for label, queries in groups.items():
+                for query in queries:
+                    index.search(query, limit=20)
+                timings = []
+                matched = []
+                for _ in range(5):
+                    for query in queries:
+                        start = time.perf_counter()
+                        index.search(query, limit=20)
+                        timings.append(time.perf_counter() - start)
+                for query in queries:
+                    matched.append(index.db.execute("SELECT COUNT(*) FROM skills_fts WHERE skills_fts MATCH ?",
+                                                    (fts_query(query),)).fetchone()[0])
+                print(f"⏱️  Query, {label + ':':<11} median {statistics.median(timings) * 1000:.2f} ms, "
+                      f"max {max(timings) * 1000:.2f} ms (top 20 of {min(matched)}-{max(matched)} matches)")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Index and search skills across many marketplaces"
+    )
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["update", "query", "stats"],
+        help="update: (re)index roots; query: search the index; stats: show index size"
+    )
+    parser.add_argument(
+        "args",
+        nargs="*",
+        help="update: marketplace directories or directories of marketplaces; query: search text"
+    )
+    parser.add_argument(
+        "--index",
+        default=DEFAULT_INDEX,
+        help=f"Index database path (default: {DEFAULT_INDEX})"
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="query: maximum results (default: 20)"
+    )
+    parser.add_argument(
+        "--marketplace",
+        help="query: only results from this marketplace name"
+    )
+    parser.add_argument(
+        "--raw",
+        action="store_true",
+        help="query: pass the text to FTS5 as-is (e.g. 'name:pdf OR headings:forms')"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="query: print results as JSON"
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="N",
+        help="Index N synthetic skills and time updates and queries"
+    )
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+        return
+    if not args.command:
+        parser.error("a command (update, query or stats) is required unless --benchmark is given")
+
+    try:
+        index = SkillIndex(args.index)
+    except sqlite3.Error as e:
+        print(f"❌ Error: Cannot open index {args.index}: {e}")
+        sys.exit(1)
+
+    with index:
+        if args.command == "update":
+            start = time.perf_counter()
+            stats = index.update(args.args)
+            elapsed = time.perf_counter() - start
+            print(f"✅ Indexed {stats['skills']} skill(s) in {stats['marketplaces']} marketplace(s) "
+                  f"in {elapsed:.2f}s")
+            print(f"   {stats['reparsed']} marketplace.json parsed, {stats['reread']} SKILL.md read, "
+                  f"{stats['removed']} marketplace(s) removed")
+        elif args.command == "query":
+            if not args.args:
+                parser.error("query text is required")
+            start = time.perf_counter()
+            try:
+                hits = index.search(" ".join(args.args), limit=args.limit,
+                                    marketplace=args.marketplace, raw=args.raw)
+            except sqlite3.OperationalError as e:
+                print(f"❌ Error: Invalid query: {e}")
+                sys.exit(1)
+            elapsed = time.perf_counter() - start
+            if args.json:
+                print(json.dumps([hit._asdict() for hit in hits], ensure_ascii=False, indent=2))
+                return
+            for rank, hit in enumerate(hits, 1):
+                print(f"{rank:>3}. {hit.name or hit.skill_path}  [{hit.marketplace} / {hit.plugin}]")
+                if hit.description:
+                    print(f"     {hit.description[:120]}")
+                print(f"     {hit.skill_dir}")
+            print(f"⏱️  {len(hits)} result(s) in {elapsed * 1000:.1f} ms")
+        else:
+            counts = index.counts()
+            print(f"📊 {counts['skills']} skill(s), {counts['plugins']} plugin(s), "
+                  f"{counts['marketplaces']} marketplace(s) in {index.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,23 +3,130 @@
 Validate a Claude Code marketplace structure and configuration.
 
 Usage:
-    python validate_marketplace.py <marketplace-directory>
+    python validate_marketplace.py <marketplace-directory> [--jobs N] [--cache [PATH]]
+    python validate_marketplace.py <marketplace-directory> --watch [--poll]
 """
 
 import argparse
+import contextlib
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import io
 import json
+import os
 import re
+import select
+import stat
+import struct
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+# Bump when the per-skill checks change so stale cache entries are discarded
+CACHE_VERSION = 2
+DEFAULT_CACHE_NAME = ".validate_cache.json"
+
+# SKILL.md is only read up to the closing '---' of its frontmatter, and never
+# past this many bytes
+FRONTMATTER_LIMIT = 64 * 1024
+_READ_CHUNK = 1024
+_FRONTMATTER_END_RE = re.compile(rb'\r?\n(?:---|\.\.\.)[ \t]*(?:\r?\n|$)')
+_FRONTMATTER_KEY_RE = re.compile(r'^([A-Za-z_][\w.-]*)[ \t]*:(?:[ \t]+(.*))?$')
+
+
+def read_frontmatter_block(path: Path, limit: int = FRONTMATTER_LIMIT) -> Tuple[Optional[bytes], int, bool]:
+    """Read a Markdown file only as far as its YAML frontmatter.
+
+    Returns (frontmatter bytes or None, bytes read, has opening '---').
+    The block is None when the file does not start with a '---' line or
+    no closing '---' / '...' line appears within `limit` bytes.
+    """
+    with open(path, 'rb') as f:
+        buf = f.read(min(_READ_CHUNK, limit))
+        if buf.startswith(b'\xef\xbb\xbf'):
+            buf = buf[3:]
+        first_line_end = buf.find(b'\n')
+        opening = buf[:first_line_end if first_line_end != -1 else len(buf)].rstrip()
+        if opening != b'---':
+            return None, len(buf), buf.startswith(b'---')
+
+        eof = False
+        while True:
+            match = _FRONTMATTER_END_RE.search(buf, first_line_end)
+            # A match at the very end of the buffer may continue ('----') in the next chunk
+            if match and (eof or match.end() < len(buf) or buf.endswith(b'\n')):
+                return buf[first_line_end + 1:match.start() + 1], len(buf), True
+            if eof or len(buf) >= limit:
+                return None, len(buf), True
+            chunk = f.read(min(_READ_CHUNK, limit - len(buf)))
+            eof = not chunk
+            buf += chunk
+
+
+def _frontmatter_scalar(value: str):
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+        return value[1:-1]
+    return value
+
+
+def parse_frontmatter(text: str) -> Dict[str, object]:
+    """Parse the top-level key/value structure of a YAML frontmatter block.
+
+    Handles plain and quoted scalars, block scalars (| and >), indented
+    continuation lines and '- item' lists; nested mappings are kept as
+    their raw text.
+    """
+    data: Dict[str, object] = {}
+    key = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        if line[0] not in ' \t-':
+            match = _FRONTMATTER_KEY_RE.match(line)
+            if match:
+                key = match.group(1)
+                value = (match.group(2) or '').strip()
+                data[key] = '' if value in ('|', '|-', '|+', '>', '>-', '>+') else _frontmatter_scalar(value)
+                continue
+        if key is None:
+            continue
+        if stripped.startswith('- ') or stripped == '-':
+            current = data[key]
+            if not isinstance(current, list):
+                current = data[key] = [] if current == '' else [current]
+            current.append(_frontmatter_scalar(stripped[1:]))
+        elif isinstance(data[key], str):
+            data[key] = f"{data[key]} {stripped}".strip()
+    return data
 
 
 class MarketplaceValidator:
-    def __init__(self, marketplace_dir: Path):
+    def __init__(self, marketplace_dir: Path, jobs: int = 1, cache_path: Optional[Path] = None,
+                 verbose: bool = False):
         self.marketplace_dir = marketplace_dir
+        self.verbose = verbose
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.marketplace_json = None
+        self.jobs = max(1, jobs)
+        self.cache_path = cache_path
+        self.cache_hits = 0
+        self._cache: Dict[str, dict] = {}
+        self._next_cache: Dict[str, dict] = {}
+        self._pending: Dict[str, Future] = {}
+        # Watch mode: results known to be current (no filesystem event since
+        # they were computed) and the already-parsed marketplace.json
+        self.trusted: Dict[str, Tuple[List[str], Optional[dict]]] = {}
+        self.results: Dict[str, Tuple[List[str], Optional[dict]]] = {}
+        self.preloaded_json: Optional[dict] = None
+        # skill path -> (bytes read, SKILL.md size) for checks run this time
+        self.io_stats: Dict[str, Tuple[int, int]] = {}
 
     def error(self, message: str):
         """Add an error message."""
@@ -44,6 +151,7 @@ class MarketplaceValidator:
             return False
 
         # Run validation checks
+        self.load_cache()
         self.check_marketplace_json()
 
         if self.marketplace_json:
@@ -51,6 +159,12 @@ class MarketplaceValidator:
             self.check_metadata()
             self.check_plugins()
 
+        if self.cache_path:
+            print(f"✓ Reused cached results for {self.cache_hits}/{len(self._next_cache)} skill(s)")
+        if self.verbose:
+            self.report_io()
+        self.save_cache()
+
         # Print results
         print()
         if self.warnings:
@@ -76,19 +190,23 @@ class MarketplaceValidator:
         """Validate marketplace.json exists and is valid JSON."""
         marketplace_json_path = self.marketplace_dir / ".claude-plugin" / "marketplace.json"
 
-        if not marketplace_json_path.exists():
-            self.error("marketplace.json not found at .claude-plugin/marketplace.json")
-            return
+        if self.preloaded_json is not None:
+            # Watch mode: marketplace.json has not changed since it was parsed
+            self.marketplace_json = self.preloaded_json
+        else:
+            if not marketplace_json_path.exists():
+                self.error("marketplace.json not found at .claude-plugin/marketplace.json")
+                return
 
-        print("✓ marketplace.json exists")
+            print("✓ marketplace.json exists")
 
-        try:
-            with open(marketplace_json_path, 'r') as f:
-                self.marketplace_json = json.load(f)
-            print("✓ marketplace.json is valid JSON")
-        except json.JSONDecodeError as e:
-            self.error(f"marketplace.json is invalid JSON: {e}")
-            return
+            try:
+                with open(marketplace_json_path, 'r') as f:
+                    self.marketplace_json = json.load(f)
+                print("✓ marketplace.json is valid JSON")
+            except json.JSONDecodeError as e:
+                self.error(f"marketplace.json is invalid JSON: {e}")
+                return
 
         # Check required top-level fields
         required_fields = ['name', 'owner', 'metadata', 'plugins']
@@ -169,12 +287,13 @@ class MarketplaceValidator:
         print(f"✓ Found {len(plugins)} plugin(s)")
 
         plugin_names = set()
-        for idx, plugin in enumerate(plugins):
-            if not isinstance(plugin, dict):
-                self.error(f"Plugin at index {idx} is not an object")
-                continue
+        with self.skill_check_pool(plugins):
+            for idx, plugin in enumerate(plugins):
+                if not isinstance(plugin, dict):
+                    self.error(f"Plugin at index {idx} is not an object")
+                    continue
 
-            self.check_plugin(plugin, idx, plugin_names)
+                self.check_plugin(plugin, idx, plugin_names)
 
     def check_plugin(self, plugin: dict, idx: int, plugin_names: set):
         """Validate individual plugin configuration."""
@@ -227,56 +346,158 @@ class MarketplaceValidator:
                 self.error(f"Plugin '{plugin_name}' has non-string skill path")
                 continue
 
-            # Resolve skill directory
-            # Remove leading ./ if present
-            clean_path = skill_path[2:] if skill_path.startswith('./') else skill_path
-            skill_dir = self.marketplace_dir / clean_path
+            # Results are collected per skill and reported in declaration order,
+            # whether they were computed here, on the pool, or taken from cache
+            for issue in self.skill_issues(skill_path):
+                self.error(f"Plugin '{plugin_name}' {issue}")
+
+    def skill_check_pool(self, plugins: list) -> "_SkillCheckPool":
+        """Start per-skill checks for every plugin on a thread pool when --jobs > 1."""
+        return _SkillCheckPool(self, plugins)
+
+    def skill_issues(self, skill_path: str) -> List[str]:
+        """Return the issues for one skill path, using prefetched results when available."""
+        future = self._pending.get(skill_path)
+        if skill_path in self.trusted:
+            issues, entry = self.trusted[skill_path]
+        elif future is not None:
+            issues, entry = future.result()
+        else:
+            issues, entry = self.check_skill(skill_path)
+        self.results[skill_path] = (issues, entry)
+
+        if entry is not None:
+            cached = self._cache.get(skill_path)
+            if cached and cached.get('sha256') == entry['sha256']:
+                self.cache_hits += 1
+            self._next_cache[skill_path] = entry
+        return issues
+
+    def check_skill(self, skill_path: str) -> Tuple[List[str], Optional[dict]]:
+        """Run the filesystem checks for one skill path.
+
+        Returns the issues found plus a cache entry for SKILL.md (None when
+        the skill has no readable SKILL.md). Safe to call from worker threads.
+        """
+        # Resolve skill directory
+        # Remove leading ./ if present
+        clean_path = skill_path[2:] if skill_path.startswith('./') else skill_path
+        skill_dir = self.marketplace_dir / clean_path
 
-            if not skill_dir.exists():
-                self.error(f"Plugin '{plugin_name}' skill path does not exist: {skill_path}")
-                continue
+        try:
+            dir_stat = skill_dir.stat()
+        except OSError:
+            return [f"skill path does not exist: {skill_path}"], None
 
-            if not skill_dir.is_dir():
-                self.error(f"Plugin '{plugin_name}' skill path is not a directory: {skill_path}")
-                continue
+        if not stat.S_ISDIR(dir_stat.st_mode):
+            return [f"skill path is not a directory: {skill_path}"], None
 
-            # Check for SKILL.md
-            skill_md = skill_dir / "SKILL.md"
-            if not skill_md.exists():
-                self.error(f"Plugin '{plugin_name}' skill missing SKILL.md: {skill_path}")
-                continue
+        # Check for SKILL.md
+        skill_md = skill_dir / "SKILL.md"
+        try:
+            md_stat = skill_md.stat()
+        except OSError:
+            return [f"skill missing SKILL.md: {skill_path}"], None
 
-            # Validate SKILL.md has YAML frontmatter
-            self.check_skill_md(plugin_name, skill_path, skill_md)
+        # Unchanged mtime and size: trust the cached result without reading the file
+        cached = self._cache.get(skill_path)
+        if (cached and cached.get('mtime_ns') == md_stat.st_mtime_ns
+                and cached.get('size') == md_stat.st_size):
+            self.io_stats[skill_path] = (0, md_stat.st_size)
+            return list(cached['issues']), cached
 
-    def check_skill_md(self, plugin_name: str, skill_path: str, skill_md: Path):
-        """Validate SKILL.md file has proper YAML frontmatter."""
         try:
-            with open(skill_md, 'r') as f:
-                content = f.read()
+            block, bytes_read, opened = read_frontmatter_block(skill_md)
+        except Exception as e:
+            return [f"skill '{skill_path}' SKILL.md could not be read: {e}"], None
+        self.io_stats[skill_path] = (bytes_read, md_stat.st_size)
+
+        # Only the frontmatter is checked, so only the bytes read are hashed
+        digest = hashlib.sha256(block if block is not None else b'\0' + bytes([opened])).hexdigest()
+        if cached and cached.get('sha256') == digest:
+            # Touched but frontmatter not modified
+            issues = list(cached['issues'])
+        else:
+            issues = self.check_skill_md(skill_path, block, opened)
+
+        entry = {
+            'mtime_ns': md_stat.st_mtime_ns,
+            'size': md_stat.st_size,
+            'sha256': digest,
+            'issues': issues,
+        }
+        return issues, entry
+
+    def check_skill_md(self, skill_path: str, block: Optional[bytes], opened: bool = True) -> List[str]:
+        """Validate SKILL.md frontmatter (as returned by read_frontmatter_block)."""
+        # Check for YAML frontmatter
+        if block is None and not opened:
+            return [f"skill '{skill_path}' SKILL.md missing YAML frontmatter"]
+        if block is None:
+            return [f"skill '{skill_path}' SKILL.md has malformed YAML frontmatter "
+                    f"(no closing '---' within {FRONTMATTER_LIMIT // 1024} KB)"]
 
-            # Check for YAML frontmatter
-            if not content.startswith('---'):
-                self.error(f"Plugin '{plugin_name}' skill '{skill_path}' SKILL.md missing YAML frontmatter")
-                return
+        try:
+            frontmatter = parse_frontmatter(block.decode('utf-8'))
+        except UnicodeDecodeError as e:
+            return [f"skill '{skill_path}' SKILL.md could not be read: {e}"]
 
-            # Extract frontmatter
-            parts = content.split('---', 2)
-            if len(parts) < 3:
-                self.error(f"Plugin '{plugin_name}' skill '{skill_path}' SKILL.md has malformed YAML frontmatter")
-                return
+        issues = []
+        if 'name' not in frontmatter:
+            issues.append(f"skill '{skill_path}' SKILL.md frontmatter missing 'name' field")
 
-            frontmatter = parts[1].strip()
+        if 'description' not in frontmatter:
+            issues.append(f"skill '{skill_path}' SKILL.md frontmatter missing 'description' field")
 
-            # Basic check for required fields (simple regex, not full YAML parsing)
-            if not re.search(r'name\s*:', frontmatter):
-                self.error(f"Plugin '{plugin_name}' skill '{skill_path}' SKILL.md frontmatter missing 'name' field")
+        return issues
 
-            if not re.search(r'description\s*:', frontmatter):
-                self.error(f"Plugin '{plugin_name}' skill '{skill_path}' SKILL.md frontmatter missing 'description' field")
+    def report_io(self):
+        """Print bytes of SKILL.md read per skill against the file sizes."""
+        if not self.io_stats:
+            return
+        print()
+        print("📄 SKILL.md bytes read (frontmatter only):")
+        for skill_path in sorted(self.io_stats):
+            bytes_read, size = self.io_stats[skill_path]
+            print(f"  {skill_path}: {bytes_read:,} of {size:,} bytes")
+        total_read = sum(read for read, _ in self.io_stats.values())
+        total_size = sum(size for _, size in self.io_stats.values())
+        share = total_read / total_size * 100 if total_size else 0.0
+        print(f"  Total: {total_read:,} of {total_size:,} bytes ({share:.1f}%) "
+              f"across {len(self.io_stats)} skill(s)")
+
+    def load_cache(self):
+        """Load per-skill results from a previous run, if caching is enabled."""
+        if not self.cache_path or not self.cache_path.exists():
+            return
 
-        except Exception as e:
-            self.error(f"Plugin '{plugin_name}' skill '{skill_path}' SKILL.md could not be read: {e}")
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            # A corrupt cache only costs a full re-check
+            return
+
+        if data.get('version') == CACHE_VERSION and data.get('root') == str(self.marketplace_dir):
+            self._cache = data.get('skills', {})
+
+    def save_cache(self):
+        """Persist per-skill results for the skills seen in this run."""
+        if not self.cache_path:
+            return
+
+        data = {
+            'version': CACHE_VERSION,
+            'root': str(self.marketplace_dir),
+            'skills': self._next_cache,
+        }
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            self.warning(f"Could not write validation cache {self.cache_path}: {e}")
 
     @staticmethod
     def validate_name(name: str) -> bool:
@@ -299,6 +520,339 @@ class MarketplaceValidator:
         return bool(re.match(pattern, version))
 
 
+class _SkillCheckPool:
+    """Context manager that prefetches per-skill checks on a thread pool.
+
+    Checks are submitted for every skill path up front so that plugins with
+    few skills still keep all workers busy; results are consumed later in
+    declaration order by MarketplaceValidator.check_skills.
+    """
+
+    def __init__(self, validator: MarketplaceValidator, plugins: list):
+        self.validator = validator
+        self.plugins = plugins
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self):
+        if self.validator.jobs <= 1:
+            return self
+
+        self.executor = ThreadPoolExecutor(max_workers=self.validator.jobs)
+        pending = self.validator._pending
+        for plugin in self.plugins:
+            if not isinstance(plugin, dict) or not isinstance(plugin.get('skills'), list):
+                continue
+            for skill_path in plugin['skills']:
+                if (isinstance(skill_path, str) and skill_path not in pending
+                        and skill_path not in self.validator.trusted):
+                    pending[skill_path] = self.executor.submit(self.validator.check_skill, skill_path)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+        self.validator._pending.clear()
+        return False
+
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (_IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+               | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR)
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Directories never holding skills; hidden ones except .claude-plugin are skipped too
+_SKIP_DIRS = {"__pycache__", "node_modules"}
+
+# A changed path: (absolute path, may be a directory)
+Change = Tuple[str, bool]
+
+
+def _skip_dir(name: str) -> bool:
+    return name in _SKIP_DIRS or (name.startswith('.') and name != '.claude-plugin')
+
+
+class _InotifySource:
+    """Recursive inotify watch over the marketplace tree (Linux only).
+
+    Raises OSError when inotify is unavailable or the tree needs more
+    watches than fs.inotify.max_user_watches allows.
+    """
+
+    def __init__(self, root: str):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.paths: Dict[int, str] = {}
+        try:
+            self.add_tree(root)
+        except OSError:
+            self.close()
+            raise
+
+    def add_tree(self, top: str):
+        stack = [top]
+        while stack:
+            path = stack.pop()
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), _WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err in (errno.ENOENT, errno.ENOTDIR):
+                    continue  # removed again before we got to it
+                raise OSError(err, f"inotify_add_watch failed for {path}: {os.strerror(err)}")
+            self.paths[wd] = path
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False) and not _skip_dir(entry.name):
+                            stack.append(entry.path)
+            except OSError:
+                pass
+
+    def wait(self, timeout: Optional[float]) -> Optional[List[Change]]:
+        """Block up to timeout seconds; returns changes, [] on timeout, None on overflow."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        changes: List[Change] = []
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return changes
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if mask & _IN_Q_OVERFLOW:
+                    return None
+                if mask & _IN_IGNORED:
+                    self.paths.pop(wd, None)
+                    continue
+                base = self.paths.get(wd)
+                if base is None:
+                    continue
+                path = os.path.join(base, os.fsdecode(name)) if name else base
+                is_dir = bool(mask & _IN_ISDIR) or not name
+                if is_dir and mask & (_IN_CREATE | _IN_MOVED_TO) and not _skip_dir(os.path.basename(path)):
+                    self.add_tree(path)
+                changes.append((path, is_dir))
+
+    def close(self):
+        os.close(self.fd)
+
+
+class _PollingSource:
+    """Fallback change source: stat marketplace.json and every skill on an interval."""
+
+    def __init__(self, watcher: "MarketplaceWatcher", interval: float):
+        self.watcher = watcher
+        self.interval = interval
+        self.snapshot = self.take()
+
+    def take(self) -> Dict[str, Optional[Tuple[int, int, int]]]:
+        snapshot = {}
+        targets = [self.watcher.marketplace_json_path]
+        for skill_dir in self.watcher.skill_dirs:
+            targets.append(skill_dir)
+            targets.append(os.path.join(skill_dir, "SKILL.md"))
+        for path in targets:
+            try:
+                st = os.stat(path)
+                snapshot[path] = (st.st_mtime_ns, st.st_size, st.st_ino)
+            except OSError:
+                snapshot[path] = None
+        return snapshot
+
+    def wait(self, timeout: Optional[float]) -> Optional[List[Change]]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            if remaining > 0:
+                time.sleep(remaining)
+            current = self.take()
+            changes = [(path, False) for path in current.keys() | self.snapshot.keys()
+                       if current.get(path) != self.snapshot.get(path)]
+            self.snapshot = current
+            if changes or (deadline is not None and time.monotonic() >= deadline):
+                return changes
+
+    def close(self):
+        pass
+
+
+class MarketplaceWatcher:
+    """Long-running --watch mode.
+
+    Validates once, then keeps the parsed marketplace.json and per-skill
+    results in memory. Filesystem events (inotify, or polling where that is
+    unavailable) are debounced and mapped to the skills they touch; only
+    those skills are re-checked, everything else is reused as-is, and
+    marketplace.json is only re-parsed when it changed.
+    """
+
+    def __init__(self, marketplace_dir: Path, jobs: int = 1, cache_path: Optional[Path] = None,
+                 strict: bool = False, debounce: float = 0.02, poll_interval: float = 0.5,
+                 force_polling: bool = False):
+        self.marketplace_dir = marketplace_dir
+        self.jobs = jobs
+        self.cache_path = cache_path
+        self.strict = strict
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.force_polling = force_polling
+        self.marketplace_json_path = os.path.join(str(marketplace_dir), ".claude-plugin", "marketplace.json")
+        self.marketplace_json: Optional[dict] = None
+        self.results: Dict[str, Tuple[List[str], Optional[dict]]] = {}
+        self.skill_dirs: Dict[str, List[str]] = {}
+        self.ignored = set()
+        if cache_path:
+            self.ignored = {str(cache_path), str(cache_path) + '.tmp'}
+
+    def _index_skills(self):
+        """Map each declared skill's directory to the skill paths naming it."""
+        self.skill_dirs = {}
+        plugins = (self.marketplace_json or {}).get('plugins', [])
+        for plugin in plugins if isinstance(plugins, list) else []:
+            skills = plugin.get('skills') if isinstance(plugin, dict) else None
+            for skill_path in skills if isinstance(skills, list) else []:
+                if isinstance(skill_path, str):
+                    clean_path = skill_path[2:] if skill_path.startswith('./') else skill_path
+                    skill_dir = os.path.normpath(os.path.join(str(self.marketplace_dir), clean_path))
+                    self.skill_dirs.setdefault(skill_dir, []).append(skill_path)
+
+    def affected(self, changes: Optional[List[Change]]) -> Tuple[bool, set]:
+        """(marketplace.json changed, skill paths to re-check) for a batch of changes.
+
+        None means events were lost (queue overflow): re-check everything.
+        """
+        if changes is None:
+            return True, set(self.results)
+        json_changed = False
+        skills = set()
+        plugin_dir = os.path.dirname(self.marketplace_json_path)
+        for path, is_dir in changes:
+            path = os.path.normpath(path)
+            if path in self.ignored:
+                continue
+            if path in (self.marketplace_json_path, plugin_dir) or (is_dir and plugin_dir.startswith(path + os.sep)):
+                json_changed = True
+            # The skill directory itself, or any file or directory inside it
+            probe = path
+            while probe.startswith(str(self.marketplace_dir)):
+                skills.update(self.skill_dirs.get(probe, ()))
+                parent = os.path.dirname(probe)
+                if parent == probe:
+                    break
+                probe = parent
+            # A renamed or deleted ancestor of skill directories
+            if is_dir:
+                prefix = path + os.sep
+                for skill_dir, skill_paths in self.skill_dirs.items():
+                    if skill_dir.startswith(prefix):
+                        skills.update(skill_paths)
+        return json_changed, skills
+
+    def run_cycle(self, changes: Optional[List[Change]] = None, first: bool = False) -> bool:
+        """Validate, reusing everything the changes did not touch; prints a summary."""
+        start = time.perf_counter()
+        validator = MarketplaceValidator(self.marketplace_dir, jobs=self.jobs,
+                                         cache_path=self.cache_path if first else None)
+        rechecked = None
+        if not first:
+            json_changed, skills = self.affected(changes)
+            if not json_changed and not skills:
+                return True
+            validator.trusted = {k: v for k, v in self.results.items() if k not in skills}
+            if not json_changed:
+                validator.preloaded_json = self.marketplace_json
+            rechecked = skills
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            is_valid = validator.validate()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        self.marketplace_json = validator.marketplace_json
+        self.results = validator.results
+        self._index_skills()
+        if rechecked is not None:
+            rechecked = {k for k in self.results if k not in validator.trusted}
+
+        if self.strict and validator.warnings:
+            is_valid = False
+
+        stamp = time.strftime("%H:%M:%S")
+        if first:
+            print(f"[{stamp}] 🔍 Validated {len(self.results)} skill(s) in {elapsed_ms:.1f} ms")
+        else:
+            print(f"[{stamp}] 🔄 Re-validated in {elapsed_ms:.1f} ms "
+                  f"({len(rechecked)} skill(s) re-checked, {len(changes or [])} change(s))")
+        for message in validator.errors:
+            print(f"  {message}")
+        if self.strict:
+            for message in validator.warnings:
+                print(f"  {message}")
+        status = "✅ Validation passed" if is_valid else "❌ Validation failed"
+        print(f"[{stamp}] {status} ({len(validator.errors)} error(s), {len(validator.warnings)} warning(s))")
+        sys.stdout.flush()
+        return is_valid
+
+    def watch(self):
+        """Validate, then re-validate on every debounced batch of changes until interrupted."""
+        self.run_cycle(first=True)
+        source = None
+        if not self.force_polling and sys.platform.startswith('linux'):
+            try:
+                source = _InotifySource(str(self.marketplace_dir))
+                print(f"👀 Watching {self.marketplace_dir} (inotify, {len(source.paths)} directories)")
+            except OSError as e:
+                print(f"⚠️  inotify unavailable ({e}); falling back to polling")
+        if source is None:
+            source = _PollingSource(self, self.poll_interval)
+            print(f"👀 Watching {self.marketplace_dir} (polling every {self.poll_interval}s)")
+        print("   Press Ctrl+C to stop")
+        sys.stdout.flush()
+
+        try:
+            while True:
+                changes = source.wait(None)
+                # Debounce: keep collecting until the burst of writes goes quiet
+                while changes:
+                    more = source.wait(self.debounce)
+                    if more is None:
+                        changes = None
+                    elif not more:
+                        break
+                    else:
+                        changes.extend(more)
+                if changes == []:
+                    continue
+                self.run_cycle(changes)
+                if isinstance(source, _PollingSource):
+                    source.snapshot = source.take()
+        except KeyboardInterrupt:
+            print()
+            print("👋 Stopped watching")
+        finally:
+            source.close()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate a Claude Code marketplace structure"
@@ -312,11 +866,68 @@ def main():
         action="store_true",
         help="Treat warnings as errors"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of threads for per-skill filesystem checks (default: 1)"
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PATH",
+        help=f"Reuse results for unchanged skills across runs "
+             f"(default location: <marketplace-dir>/{DEFAULT_CACHE_NAME})"
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Report bytes of SKILL.md read per skill"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-validate only what changed on every save"
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch: poll for changes instead of using inotify"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=0.5,
+        help="With --watch --poll: seconds between polls (default: 0.5)"
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=20,
+        help="With --watch: milliseconds of quiet before re-validating a burst of writes (default: 20)"
+    )
 
     args = parser.parse_args()
 
     marketplace_dir = Path(args.marketplace_dir).resolve()
-    validator = MarketplaceValidator(marketplace_dir)
+    cache_path = None
+    if args.cache is not None:
+        cache_path = Path(args.cache).resolve() if args.cache else marketplace_dir / DEFAULT_CACHE_NAME
+
+    if args.watch:
+        if not marketplace_dir.is_dir():
+            print(f"❌ Error: Marketplace directory does not exist: {marketplace_dir}")
+            sys.exit(1)
+        watcher = MarketplaceWatcher(marketplace_dir, jobs=args.jobs, cache_path=cache_path,
+                                     strict=args.strict, debounce=args.debounce / 1000,
+                                     poll_interval=args.poll_interval, force_polling=args.poll)
+        watcher.watch()
+        return
+
+    validator = MarketplaceValidator(marketplace_dir, jobs=args.jobs, cache_path=cache_path,
+                                     verbose=args.verbose)
 
     is_valid = validator.validate()
 
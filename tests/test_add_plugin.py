@@ -0,0 +1,63 @@
+"""Bulk manifest mode of marketplace-creator's add_plugin.py."""
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skills" / "marketplace-creator" / "scripts"))
+
+from add_plugin import add_plugins  # noqa: E402
+
+DESCRIPTION = "Plugin added by the bulk manifest test"
+
+
+class AddPluginsTest(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp(prefix="add_plugin_test_"))
+        (self.root / ".claude-plugin").mkdir()
+        self.marketplace = self.root / ".claude-plugin" / "marketplace.json"
+        self.write({"name": "test-marketplace", "plugins": [
+            {"name": "existing", "description": DESCRIPTION, "source": "./", "skills": ["./skills/one"]}]})
+        for skill in ("one", "two"):
+            (self.root / "skills" / skill).mkdir(parents=True)
+            (self.root / "skills" / skill / "SKILL.md").write_text("---\nname: x\n---\n", encoding="utf-8")
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def write(self, document):
+        self.marketplace.write_text(json.dumps(document), encoding="utf-8")
+
+    def test_valid_batch_is_written_once(self):
+        report = add_plugins(self.root, [
+            {"name": "alpha", "description": DESCRIPTION, "skills": ["skills/one"]},
+            {"name": "beta", "description": DESCRIPTION, "skills": ["skills/two"]},
+        ])
+        self.assertEqual(report["status"], "committed")
+        names = [p["name"] for p in json.loads(self.marketplace.read_text(encoding="utf-8"))["plugins"]]
+        self.assertEqual(names, ["existing", "alpha", "beta"])
+
+    def test_one_bad_spec_writes_nothing(self):
+        before = self.marketplace.read_bytes()
+        report = add_plugins(self.root, [
+            {"name": "alpha", "description": DESCRIPTION, "skills": ["skills/one"]},
+            {"name": "existing", "description": DESCRIPTION, "skills": ["skills/two"]},
+            {"name": "gamma", "description": DESCRIPTION, "skills": ["skills/missing"]},
+        ])
+        self.assertEqual(report["status"], "failed")
+        self.assertEqual([p["status"] for p in report["plugins"]], ["valid", "rejected", "rejected"])
+        self.assertEqual(self.marketplace.read_bytes(), before)
+
+    def test_malformed_marketplace_entry_writes_nothing(self):
+        self.write({"name": "test-marketplace", "plugins": ["not an object"]})
+        before = self.marketplace.read_bytes()
+        report = add_plugins(self.root, [{"name": "alpha", "description": DESCRIPTION, "skills": ["skills/one"]}])
+        self.assertEqual(report["status"], "failed")
+        self.assertEqual(self.marketplace.read_bytes(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Round-trips of validated_items entries through item_model.ItemStore."""
+
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "daily-tech-news-validator" / "scripts"))
+
+from item_model import ItemStore  # noqa: E402
+from timestamp_engine import SHANGHAI  # noqa: E402
+
+
+def entry(**overrides) -> dict:
+    item = {
+        "id": "item_001",
+        "title": "OpenAI launches GPT-5",
+        "source": {"name": "Reuters", "url": "https://www.reuters.com/technology/gpt-5", "credibility": 9,
+                   "tier": 1},
+        "timestamp": {"published": "2025-11-20T08:00:00Z", "parsed_method": "ISO8601", "age_hours": 4.5,
+                      "layer": 0},
+        "completeness": {"score": 8.5, "has_essential_fields": True, "has_key_data": False,
+                         "summary_length": 120},
+        "summary": "OpenAI released GPT-5 to developers.",
+        "category": "AI Models",
+    }
+    item.update(overrides)
+    return item
+
+
+class RoundTripTest(unittest.TestCase):
+    def round_trip(self, items: list) -> list:
+        return list(ItemStore.from_dicts(items).iter_dicts())
+
+    def test_entries_come_back_unchanged(self):
+        items = [entry(), entry(id="item_002", source={"name": "Blog", "credibility": "high", "tier": 3},
+                                unknown_field={"kept": True})]
+        self.assertEqual(self.round_trip(items), items)
+        self.assertIs(type(self.round_trip(items)[0]["source"]["credibility"]), int)
+
+    def test_explicit_nulls_are_kept(self):
+        items = [entry(timestamp={"published": "2025-11-20T08:00:00Z", "parsed_method": None, "age_hours": None,
+                                  "layer": None},
+                       completeness={"score": None, "has_essential_fields": None, "summary_length": None},
+                       summary=None, key_data=None, ai_validation=None, note=None)]
+        self.assertEqual(self.round_trip(items), items)
+
+    def test_values_set_after_loading_replace_nulls(self):
+        store = ItemStore.from_dicts([entry(timestamp={"published": "2025-11-20T08:00:00Z", "age_hours": None})])
+        store.update_ages(datetime(2025, 11, 20, 20, 0, tzinfo=SHANGHAI))
+        self.assertEqual(store[0].to_dict()["timestamp"]["age_hours"], 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
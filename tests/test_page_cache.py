@@ -0,0 +1,75 @@
+"""page_cache.PageCache: shared-directory index merge and memoized published times."""
+
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "daily-tech-news-search" / "scripts"))
+
+from page_cache import PageCache, normalize_url, published_time  # noqa: E402
+
+RELATIVE_PAGE = b'<html><head><meta property="article:published_time" content="3 hours ago"></head></html>'
+ABSOLUTE_PAGE = b'<html><head><meta property="article:published_time" content="2025-11-20T08:00:00Z"></head></html>'
+
+
+class PageCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp(prefix="page_cache_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def objects_on_disk(self) -> set:
+        return {path.parent.name + path.stem for path in (Path(self.cache_dir) / "objects").rglob("*.z")}
+
+    def test_saves_from_two_caches_merge(self):
+        first, second = PageCache(self.cache_dir), PageCache(self.cache_dir)
+        first.put("https://a.example/1", b"one")
+        second.put("https://b.example/2", b"two")
+        first.save()
+        second.save()
+
+        merged = PageCache(self.cache_dir)
+        self.assertEqual(set(merged.entries), {normalize_url("https://a.example/1"),
+                                               normalize_url("https://b.example/2")})
+        self.assertEqual(self.objects_on_disk(), {entry[0] for entry in merged.entries.values()})
+
+    def test_eviction_elsewhere_leaves_no_orphans(self):
+        first, second = PageCache(self.cache_dir), PageCache(self.cache_dir)
+        first.put("https://a.example/1", b"one")
+        first.save()
+        second.put("https://a.example/1", b"one, updated")
+        second.save()
+        first.save()
+
+        merged = PageCache(self.cache_dir)
+        self.assertEqual(merged.get("https://a.example/1").body, b"one, updated")
+        self.assertEqual(self.objects_on_disk(), {entry[0] for entry in merged.entries.values()})
+
+    def test_relative_published_time_follows_the_fetch_time(self):
+        cache = PageCache(self.cache_dir, ttl=86400)
+        cache.put("https://a.example/old", RELATIVE_PAGE)
+        cache.entries[normalize_url("https://a.example/old")][1] = time.time() - 5 * 3600
+        cache.put("https://b.example/new", RELATIVE_PAGE)
+
+        now = datetime.now(timezone.utc)
+        old = datetime.fromisoformat(published_time(cache, "https://a.example/old")["published"])
+        new = datetime.fromisoformat(published_time(cache, "https://b.example/new")["published"])
+        self.assertAlmostEqual((now - old) / timedelta(hours=1), 8, delta=0.1)
+        self.assertAlmostEqual((now - new) / timedelta(hours=1), 3, delta=0.1)
+        self.assertEqual(cache.stats["memo_hits"], 1)
+
+    def test_absolute_published_time_is_memoized(self):
+        cache = PageCache(self.cache_dir)
+        cache.put("https://a.example/story", ABSOLUTE_PAGE)
+        self.assertEqual(published_time(cache, "https://a.example/story")["published"], "2025-11-20T08:00:00+00:00")
+        self.assertEqual(published_time(cache, "https://a.example/story")["published"], "2025-11-20T08:00:00+00:00")
+        self.assertEqual(cache.stats["memo_hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Cross-day matching of story_archive.StoryArchive."""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "daily-tech-news-validator" / "scripts"))
+
+from story_archive import StoryArchive  # noqa: E402
+
+
+def news_item(title: str, url: str, day: int, product: str = "GPT-5") -> dict:
+    published = f"{str(day)[:4]}-{str(day)[4:6]}-{str(day)[6:]}T08:00:00Z"
+    return {
+        "title": title,
+        "source": {"url": url},
+        "timestamp": {"published": published},
+        "ai_validation": {"company": "OpenAI"},
+        "key_data": {"product": product},
+        "category": "AI Models",
+    }
+
+
+class StoryArchiveTest(unittest.TestCase):
+    def setUp(self):
+        self.archive_dir = tempfile.mkdtemp(prefix="story_archive_test_")
+        self.archive = StoryArchive(self.archive_dir, keep_days=1)
+        self.archive.add(20251118, [news_item("OpenAI launches GPT-5",
+                                              "https://techcrunch.com/2025/11/18/openai-launches-gpt-5", 20251118)],
+                         compact=False)
+
+    def tearDown(self):
+        self.archive.wait()
+        shutil.rmtree(self.archive_dir, ignore_errors=True)
+
+    def test_same_product_follow_up_is_not_published(self):
+        follow_up = news_item("OpenAI cuts GPT-5 API prices",
+                              "https://www.reuters.com/technology/openai-cuts-gpt-5-api-prices", 20251120)
+        kept, dropped = self.archive.filter_published([follow_up], 20251120)
+        self.assertEqual(kept, [follow_up])
+        self.assertEqual(dropped, [])
+
+    def test_reworded_same_story_is_published(self):
+        repost = news_item("OpenAI launches GPT-5 model",
+                           "https://www.theverge.com/2025/11/20/openai-gpt-5", 20251120)
+        match, = self.archive.lookup([repost], 20251120)
+        self.assertIsNotNone(match)
+        self.assertEqual(match.date, 20251118)
+
+    def test_same_url_is_published(self):
+        repost = news_item("GPT-5 is here",
+                           "https://techcrunch.com/2025/11/18/openai-launches-gpt-5/", 20251120)
+        match, = self.archive.lookup([repost], 20251120)
+        self.assertEqual(match.reason, "same_url")
+
+    def test_re_adding_a_compacted_date_replaces_its_records(self):
+        old = news_item("Anthropic ships Claude update", "https://example.com/2025/11/01/update", 20251101,
+                        product="Claude")
+        self.archive.add(20251101, [old], compact=False)
+        self.assertEqual(self.archive.compact(), 1)
+        self.assertIsNotNone(self.archive.lookup([old], 20251102, days=1)[0])
+
+        self.archive.add(20251101, [], compact=False)
+        self.assertEqual(self.archive.lookup([old], 20251102, days=1), [None])
+
+
+if __name__ == "__main__":
+    unittest.main()
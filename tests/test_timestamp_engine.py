@@ -0,0 +1,36 @@
+"""Round 2 timestamp parsing in timestamp_engine."""
+
+import sys
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "daily-tech-news-validator" / "scripts"))
+
+from timestamp_engine import parse_timestamp  # noqa: E402
+
+NOW = datetime(2025, 11, 20, 12, 0, tzinfo=timezone.utc)
+
+
+class ParseTimestampTest(unittest.TestCase):
+    def test_non_ascii_digits_are_unparsed(self):
+        self.assertIsNone(parse_timestamp("²", NOW))
+        self.assertIsNone(parse_timestamp("١٧٣٢١١٢٤٠٠", NOW))
+
+    def test_out_of_range_relative_time_is_unparsed(self):
+        self.assertIsNone(parse_timestamp("999999999 days ago", NOW))
+        self.assertIsNone(parse_timestamp("999999999 weeks ago", NOW))
+        self.assertIsNone(parse_timestamp("99999999999999999999 小时前", NOW))
+
+    def test_out_of_range_absolute_time_is_unparsed(self):
+        self.assertIsNone(parse_timestamp("0001-01-01T00:00:00+08:00", NOW))
+        self.assertNotEqual(parse_timestamp("Wed, 20 Nov 2025 14:30:00 +9999", NOW).method, "RFC2822")
+
+    def test_supported_formats_still_parse(self):
+        self.assertEqual(parse_timestamp("3 hours ago", NOW).published, datetime(2025, 11, 20, 9, tzinfo=timezone.utc))
+        self.assertEqual(parse_timestamp("1763640000", NOW).published, NOW)
+        self.assertEqual(parse_timestamp("2025-11-20T14:30:00 PST", NOW).method, "ISO8601")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Per-item rounds and the Round 4 barrier in validation_executor."""
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "daily-tech-news-validator" / "scripts"))
+
+import validation_executor  # noqa: E402
+from validated_stream import ValidatedStreamWriter, to_document  # noqa: E402
+from validation_executor import SHANGHAI, _synthetic_items, validate  # noqa: E402
+
+NOW = datetime(2025, 11, 20, 15, 30, tzinfo=SHANGHAI)
+
+
+class ValidateTest(unittest.TestCase):
+    def test_output_is_identical_for_any_worker_count(self):
+        items = _synthetic_items(80, NOW)
+        single = json.dumps(validate(items, NOW, workers=1), sort_keys=True)
+        pooled = json.dumps(validate(items, NOW, workers=3), sort_keys=True)
+        self.assertEqual(single, pooled)
+
+    def test_unparseable_timestamps_go_to_manual_review(self):
+        items = _synthetic_items(20, NOW)
+        items[0]["timestamp"] = {"published": "²"}
+        items[1]["timestamp"] = {"published": "999999999 days ago"}
+        document = validate(items, NOW, workers=1)
+        self.assertEqual(document["quality_metrics"]["time_accuracy"]["unparsed_count"], 2)
+
+    def test_parser_error_does_not_stop_the_batch(self):
+        items = _synthetic_items(20, NOW)
+        target = items[0]["timestamp"]["published"]
+        real = validation_executor.parse_timestamp
+
+        def parse(value, now=None):
+            if value == target:
+                raise OverflowError("date value out of range")
+            return real(value, now)
+
+        with mock.patch.object(validation_executor, "parse_timestamp", parse):
+            document = validate(items, NOW, workers=1)
+        self.assertEqual(document["quality_metrics"]["time_accuracy"]["unparsed_count"], 1)
+        flagged, = [item for item in document["validated_items"] if item["id"] == items[0]["id"]]
+        self.assertEqual(flagged["timestamp"], {"published": target, "parsed_method": None, "manual_review": True})
+
+
+class StreamTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="validated_stream_test_")
+        self.path = Path(self.tmp) / "validated.jsonl"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_stream_rebuilds_the_document(self):
+        items = _synthetic_items(300, NOW)
+        for item in items:
+            del item["id"]
+        with ValidatedStreamWriter(self.path, {"input_file": "raw.md"}) as stream:
+            document = validate(items, NOW, workers=3, input_file="raw.md", stream=stream)
+        rebuilt = to_document(self.path)
+
+        by_id = lambda doc: {item["id"]: item for item in doc["validated_items"]}  # noqa: E731
+        self.assertEqual(by_id(rebuilt), by_id(document))
+        for key in ("metadata", "quality_metrics", "rejected_items"):
+            self.assertEqual(rebuilt[key], document[key])
+
+    def test_items_precede_round4_retracts(self):
+        items = _synthetic_items(300, NOW)
+        with ValidatedStreamWriter(self.path) as stream:
+            validate(items, NOW, workers=3, stream=stream)
+        with open(self.path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        # One item or rejected record per input item, all before Round 4's output
+        round4 = next(n for n, r in enumerate(records)
+                      if r["record"] == "retract" or r.get("item", {}).get("rejection_round") == 4)
+        self.assertEqual(records[0]["record"], "metadata")
+        self.assertEqual(len(records[1:round4]), len(items))
+        self.assertEqual(records[-1]["record"], "trailer")
+
+
+if __name__ == "__main__":
+    unittest.main()
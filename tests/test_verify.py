@@ -0,0 +1,44 @@
+"""verify.py reports malformed metadata as failed checks."""
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from verify import RootVerifier  # noqa: E402
+
+
+class MetadataTypeTest(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp(prefix="verify_test_"))
+        (self.root / ".claude-plugin").mkdir()
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def errors_for(self, name: str, document) -> list:
+        (self.root / ".claude-plugin" / name).write_text(json.dumps(document), encoding="utf-8")
+        result = RootVerifier(self.root).verify()
+        return [c for _, checks in result.sections for c in checks if c["status"] == "error"]
+
+    def test_non_object_marketplace_is_an_error(self):
+        errors = self.errors_for("marketplace.json", [1, 2])
+        self.assertIn("marketplace.json syntax", [c["label"] for c in errors])
+
+    def test_non_object_plugin_json_is_an_error(self):
+        errors = self.errors_for("plugin.json", "x")
+        self.assertIn("plugin.json syntax", [c["label"] for c in errors])
+
+    def test_malformed_plugin_entries_are_errors(self):
+        errors = self.errors_for("marketplace.json", {"metadata": [], "plugins": [1, {"skills": "ab"}]})
+        labels = [c["label"] for c in errors]
+        self.assertIn("marketplace.json plugins[0]", labels)
+        self.assertIn("marketplace.json plugins[1].skills", labels)
+
+
+if __name__ == "__main__":
+    unittest.main()
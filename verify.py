@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+WeChat Tech News Plugin Verification Script
+
+Checks plugin structure and dependencies for one or more plugin roots in a
+single process: plugin.json and marketplace.json are parsed once, each
+root is scanned once, and every declared skill, required resource and
+file linked from a SKILL.md is checked against that scan.
+
+Usage:
+    python verify.py
+    python verify.py . ../other-checkout
+    python verify.py checkouts/* --report verify.json --no-color
+    python verify.py . --report -          # JSON on stdout, text on stderr
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+DEFAULT_PLUGIN_DIR = Path.home() / ".claude" / "plugins" / "marketplaces" / "wechat-tech-news"
+
+RED = "\033[0;31m"
+GREEN = "\033[0;32m"
+YELLOW = "\033[1;33m"
+NC = "\033[0m"
+RULE = "━" * 30
+
+DOC_FILES = ["README.md", "LICENSE", "CONTRIBUTING.md", "INSTALL_GUIDE.md"]
+
+# Resources the skills cannot work without: (path, label)
+REQUIRED_RESOURCES = [
+    ("daily-tech-news-search/references/search_queries.md", "Search queries reference"),
+    ("daily-tech-news-search/references/verification_process.md", "Verification process reference"),
+    ("wechat-tech-news-writer/references/compliance_guidelines.md", "Compliance guidelines"),
+    ("wechat-tech-news-writer/references/sensitive_keywords.md", "Sensitive keywords database"),
+    ("wechat-tech-news-writer/references/engagement_tactics.md", "Engagement tactics"),
+    ("wechat-tech-news-writer/assets", "Writer assets"),
+]
+
+DEPENDENCIES = [
+    (re.compile(r"tavily", re.IGNORECASE), "Tavily MCP dependency"),
+    (re.compile(re.escape("/sc:research")), "/sc:research command dependency"),
+]
+
+SKIP_DIRS = {".git", "__pycache__", "node_modules", ".venv", "venv", "dist"}
+LINK_RE = re.compile(r"\]\(((?:references|scripts|assets)/[^)\s#]+)\)")
+
+
+def scan_tree(root: Path) -> Tuple[Set[str], Set[str]]:
+    """One walk of root: (files, directories) as POSIX paths relative to root."""
+    files: Set[str] = set()
+    dirs: Set[str] = set()
+    for current, subdirs, names in os.walk(root):
+        subdirs[:] = [d for d in subdirs if d not in SKIP_DIRS]
+        rel = os.path.relpath(current, root)
+        prefix = "" if rel == "." else rel.replace(os.sep, "/") + "/"
+        for d in subdirs:
+            dirs.add(prefix + d)
+        for name in names:
+            files.add(prefix + name)
+    return files, dirs
+
+
+def load_json(path: Path) -> Tuple[Optional[dict], Optional[str], str]:
+    """(parsed document, error, raw text); the document is None if missing, invalid or not an object."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None, "missing", ""
+    except OSError as e:
+        return None, str(e), ""
+    try:
+        document = json.loads(text)
+    except json.JSONDecodeError as e:
+        return None, f"invalid JSON: {e}", text
+    if not isinstance(document, dict):
+        return None, f"top level must be a JSON object, not {type(document).__name__}", text
+    return document, None, text
+
+
+def clean_skill_path(path: str) -> str:
+    path = path.strip()
+    while path.startswith("./"):
+        path = path[2:]
+    return path.rstrip("/")
+
+
+class RootVerifier:
+    """Runs every check for one plugin root and keeps the results per section."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.sections: List[Tuple[str, List[dict]]] = []
+        self.info: Dict[str, object] = {}
+        self._current: List[dict] = []
+
+    def section(self, title: str):
+        self._current = []
+        self.sections.append((title, self._current))
+
+    def record(self, status: str, label: str, detail: str = ""):
+        self._current.append({"status": status, "label": label, "detail": detail})
+
+    def exists(self, ok: bool, label: str, path: str, warn_only: bool = False):
+        if ok:
+            self.record("ok", label)
+        else:
+            self.record("warn" if warn_only else "error", label, f"missing: {path}")
+
+    def _strings(self, document: dict, key: str, label: str) -> List[str]:
+        """document[key] as a list of strings, reporting any other type as an error."""
+        value = document.get(key, [])
+        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+            self.record("error", label, "must be a JSON array of strings")
+            return []
+        return value
+
+    @property
+    def errors(self) -> int:
+        return sum(1 for _, checks in self.sections for c in checks if c["status"] == "error")
+
+    @property
+    def warnings(self) -> int:
+        return sum(1 for _, checks in self.sections for c in checks if c["status"] == "warn")
+
+    def verify(self) -> "RootVerifier":
+        root = self.root
+        self.section("📁 Plugin Directory Structure")
+        if not root.is_dir():
+            self.record("error", "Plugin root directory", f"missing: {root}")
+            return self
+        files, dirs = scan_tree(root)
+        self.record("ok", "Plugin root directory")
+        self.exists(".claude-plugin" in dirs, "Metadata directory", ".claude-plugin")
+
+        self.section("📋 Metadata Files")
+        plugin, plugin_error, plugin_text = load_json(root / ".claude-plugin" / "plugin.json")
+        marketplace, marketplace_error, marketplace_text = load_json(root / ".claude-plugin" / "marketplace.json")
+        declares_plugins = bool(marketplace and marketplace.get("plugins"))
+        for name, document, error in (("plugin.json", plugin, plugin_error),
+                                      ("marketplace.json", marketplace, marketplace_error)):
+            if error == "missing":
+                # A marketplace that declares its plugins does not need a plugin.json
+                optional = name == "plugin.json" and declares_plugins
+                self.exists(False, name, f".claude-plugin/{name}", warn_only=optional)
+            elif error:
+                self.record("error", f"{name} syntax", error)
+            else:
+                self.record("ok", f"{name} syntax", "valid JSON")
+
+        # Declared skills: plugin.json first, else every plugin in marketplace.json;
+        # wrongly typed entries are reported here rather than crashing later
+        if plugin is not None:
+            name = plugin.get("name", "unknown")
+            version = plugin.get("version", "unknown")
+            declared = [(".", s) for s in self._strings(plugin, "skills", "plugin.json skills")]
+        else:
+            name = (marketplace or {}).get("name", "unknown")
+            metadata = (marketplace or {}).get("metadata")
+            version = metadata.get("version", "unknown") if isinstance(metadata, dict) else "unknown"
+            declared = []
+            entries = (marketplace or {}).get("plugins", [])
+            if not isinstance(entries, list):
+                self.record("error", "marketplace.json plugins", "must be a JSON array")
+                entries = []
+            for i, entry in enumerate(entries):
+                if not isinstance(entry, dict):
+                    self.record("error", f"marketplace.json plugins[{i}]", "must be a JSON object")
+                    continue
+                source = entry.get("source", "./")
+                source = clean_skill_path(source if isinstance(source, str) else "./") or "."
+                declared.extend((source, s) for s in
+                                self._strings(entry, "skills", f"marketplace.json plugins[{i}].skills"))
+
+        self.section("📚 Documentation Files")
+        for doc in DOC_FILES:
+            self.exists(doc in files, doc, doc)
+
+        skills = []
+        for source, skill in declared:
+            path = clean_skill_path(skill)
+            if source != ".":
+                path = f"{source}/{path}"
+            skills.append(path)
+
+        self.section("🎯 Skills")
+        skill_texts = []
+        for skill in skills:
+            self.exists(skill in dirs, f"{skill} directory", skill)
+            self.exists(f"{skill}/SKILL.md" in files, f"{skill}/SKILL.md", f"{skill}/SKILL.md")
+            if f"{skill}/SKILL.md" in files:
+                try:
+                    skill_texts.append((skill, (root / skill / "SKILL.md").read_text(encoding="utf-8")))
+                except (OSError, UnicodeDecodeError) as e:
+                    self.record("error", f"{skill}/SKILL.md readable", str(e))
+
+        self.section("📎 Skill Resources")
+        for path, label in REQUIRED_RESOURCES:
+            if path.split("/", 1)[0] in skills:
+                self.exists(path in files or path in dirs, label, path)
+        for skill, text in skill_texts:
+            for link in sorted(set(LINK_RE.findall(text))):
+                path = f"{skill}/{link}"
+                if path in files or path in dirs:
+                    self.record("ok", f"{skill} → {link}")
+                else:
+                    self.record("warn", f"{skill} → {link}", f"linked from SKILL.md, missing: {path}")
+
+        self.section("🔧 Plugin Configuration")
+        self.info = {"name": name, "version": version, "skills": len(skills)}
+        if not skills:
+            self.record("error", "Skills declared", "no skills in plugin.json or marketplace.json")
+        elif all(s in dirs for s in skills):
+            self.record("ok", f"All {len(skills)} skills registered")
+
+        self.section("🔗 Dependencies")
+        searched = [plugin_text, marketplace_text] + [text for _, text in skill_texts]
+        for pattern, label in DEPENDENCIES:
+            if any(pattern.search(text) for text in searched):
+                self.record("ok", f"{label} declared")
+            else:
+                self.record("warn", label, "not found in plugin.json, marketplace.json or any SKILL.md")
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            "root": str(self.root),
+            "ok": self.errors == 0,
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "plugin": self.info,
+            "sections": {title: checks for title, checks in self.sections},
+        }
+
+    def render(self, color: bool) -> str:
+        green, red, yellow, nc = (GREEN, RED, YELLOW, NC) if color else ("", "", "", "")
+        marks = {"ok": f"{green}✓{nc}", "error": f"{red}✗{nc}", "warn": f"{yellow}⚠{nc}"}
+        lines = []
+        for title, checks in self.sections:
+            lines.append(title)
+            lines.append(RULE)
+            if title.startswith("🔧") and self.info:
+                lines.append(f"Plugin Name: {green}{self.info['name']}{nc}")
+                lines.append(f"Version: {green}{self.info['version']}{nc}")
+                lines.append(f"Skills defined: {green}{self.info['skills']}{nc}")
+            for check in checks:
+                detail = f" ({check['detail']})" if check["detail"] else ""
+                lines.append(f"{marks[check['status']]} {check['label']}{detail}")
+            lines.append("")
+        return "\n".join(lines)
+
+
+def verify_roots(roots: List[Path]) -> List[RootVerifier]:
+    return [RootVerifier(root).verify() for root in roots]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Verify plugin structure and dependencies for one or more plugin roots"
+    )
+    parser.add_argument(
+        "roots",
+        nargs="*",
+        help=f"Plugin root directories (default: {DEFAULT_PLUGIN_DIR})"
+    )
+    parser.add_argument(
+        "--report",
+        metavar="PATH",
+        help="Write a JSON report to PATH ('-' for stdout; the text output then goes to stderr)"
+    )
+    parser.add_argument(
+        "--no-color",
+        action="store_true",
+        help="Plain output without ANSI colours (default when not writing to a terminal)"
+    )
+
+    args = parser.parse_args()
+
+    roots = [Path(r).expanduser().resolve() for r in args.roots] or [DEFAULT_PLUGIN_DIR]
+    out = sys.stderr if args.report == "-" else sys.stdout
+    color = not args.no_color and out.isatty() and "NO_COLOR" not in os.environ
+    green, red, nc = (GREEN, RED, NC) if color else ("", "", "")
+
+    results = verify_roots(roots)
+
+    for result in results:
+        header = "🔍 Verifying WeChat Tech News Plugin..."
+        if len(roots) > 1:
+            header += f" ({result.root})"
+        print(header, file=out)
+        print(file=out)
+        print(result.render(color), file=out)
+        print(RULE, file=out)
+        if result.errors == 0:
+            print(f"{green}✅ Verification passed!{nc}", file=out)
+        else:
+            print(f"{red}❌ Verification failed with {result.errors} error(s){nc}", file=out)
+        print(file=out)
+
+    failed = [r for r in results if r.errors]
+    if len(results) > 1:
+        print(f"📊 {len(results) - len(failed)}/{len(results)} plugin root(s) passed", file=out)
+    elif not failed:
+        print("Next steps:", file=out)
+        print("  - Run: ./package.sh to create distribution ZIP", file=out)
+        print("  - Restart Claude Code to load the plugin", file=out)
+        print("  - Enable in Settings → Plugins", file=out)
+    else:
+        print("Please fix the errors above before proceeding.", file=out)
+
+    if args.report:
+        report = json.dumps({"roots": [r.to_dict() for r in results], "ok": not failed},
+                            ensure_ascii=False, indent=2)
+        if args.report == "-":
+            print(report)
+        else:
+            with open(args.report, "w", encoding="utf-8") as f:
+                f.write(report + "\n")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
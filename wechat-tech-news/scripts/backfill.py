@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+Concurrent multi-date backfill for the wechat-tech-news workflow.
+
+Runs the per-date pipeline of workflow_runner.py for every date in a
+range, several dates at a time, instead of one run per date:
+
+- A global budget (--concurrency) caps how many phase commands run at
+  once across all dates; --phase-limit caps single phases further (e.g.
+  Collection=2 for the search APIs)
+- The dates share one phase cache, one set of rule-file digests (each
+  skill's SKILL.md / references / scripts are hashed once per backfill,
+  not once per date), one page cache directory and one story archive;
+  commands reach the shared directories through the {page_cache} and
+  {archive} placeholders, and {now} is the end of the date in
+  Asia/Shanghai. PageCache merges its index under a file lock on save,
+  so the collection commands of concurrent dates can share the directory
+- Every date still gets its own workflow_[DATE].json and reports
+- Validation of a date waits for the Validation of the previous
+  --archive-days dates in the range, whose items are added to the story
+  archive as soon as they pass, so the "already published" pre-filter
+  sees the same history as a day-by-day run
+- A date whose workflow_[DATE].json already says SUCCESS is skipped, so
+  an interrupted backfill resumes where it stopped; progress is written
+  to backfill_[FROM]_[TO].json after every date
+
+Usage:
+    python backfill.py --from 20250801 --to 20251031 --config workflow.json [--concurrency 6]
+    python backfill.py --from 20250801 --to 20251031 --config workflow.json --phase-limit Collection=2
+    python backfill.py --from 20250801 --to 20250807 --dry-run
+    python backfill.py --benchmark 30
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from workflow_runner import (DEFAULT_CACHE_DIR, DONE, FAILED, SHANGHAI, SKILLS_ROOT, SUCCESS, PhaseCache,
+                             WorkflowRunner, write_metadata, PHASES)
+
+VALIDATOR_SCRIPTS = SKILLS_ROOT / "daily-tech-news-validator" / "scripts"
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_ARCHIVE_DAYS = 7
+DEFAULT_ARCHIVE_DIR = ".story_archive"
+DEFAULT_PAGE_CACHE_DIR = ".page_cache"
+STATE_VERSION = 1
+
+
+def date_range(start: str, end: str) -> List[str]:
+    """Inclusive list of YYYYMMDD dates."""
+    first = datetime.strptime(start, "%Y%m%d").date()
+    last = datetime.strptime(end, "%Y%m%d").date()
+    return [(first + timedelta(days=n)).strftime("%Y%m%d") for n in range((last - first).days + 1)]
+
+
+def is_complete(output_dir: Path, day: str) -> bool:
+    """True when workflow_[DATE].json records a successful run."""
+    try:
+        with open(output_dir / f"workflow_{day}.json", "r", encoding="utf-8") as f:
+            return json.load(f).get("status") == SUCCESS
+    except (OSError, json.JSONDecodeError, AttributeError):
+        return False
+
+
+def _story_archive(path: Path):
+    if str(VALIDATOR_SCRIPTS) not in sys.path:
+        sys.path.insert(0, str(VALIDATOR_SCRIPTS))
+    from story_archive import StoryArchive
+    return StoryArchive(path)
+
+
+class BackfillRunner:
+    def __init__(self, dates: List[str], output_dir: Path, commands: Optional[Dict[str, str]] = None,
+                 concurrency: int = DEFAULT_CONCURRENCY, phase_limits: Optional[Dict[str, int]] = None,
+                 archive_dir: Optional[Path] = None, archive_days: int = DEFAULT_ARCHIVE_DAYS,
+                 page_cache_dir: Optional[Path] = None, force: Tuple[str, ...] = (),
+                 skip: Tuple[str, ...] = (), dry_run: bool = False, restart: bool = False):
+        self.dates = dates
+        self.output_dir = output_dir
+        self.commands = commands or {}
+        self.concurrency = concurrency
+        self.force = force
+        self.skip = skip
+        self.dry_run = dry_run
+        self.restart = restart
+        self.archive_dir = archive_dir or output_dir / DEFAULT_ARCHIVE_DIR
+        self.archive_days = archive_days
+        self.page_cache_dir = page_cache_dir or output_dir / DEFAULT_PAGE_CACHE_DIR
+
+        # Shared by every date
+        self.cache = PhaseCache(output_dir / DEFAULT_CACHE_DIR)
+        self.rule_digests: Dict[Path, str] = {}
+        self.archive = None
+        self.budget = threading.BoundedSemaphore(concurrency)
+        self.phase_budgets = {name: threading.BoundedSemaphore(limit)
+                              for name, limit in (phase_limits or {}).items()}
+
+        self.validated = {day: threading.Event() for day in dates}
+        self.lock = threading.Lock()
+        self.state_path = output_dir / f"backfill_{dates[0]}_{dates[-1]}.json"
+        self.state: Dict[str, dict] = {}
+
+    # -- shared resources -------------------------------------------------
+
+    @contextmanager
+    def slot(self, phase):
+        """Hold the phase's own budget (if any), then one unit of the global budget."""
+        with self.phase_budgets.get(phase.name) or nullcontext(), self.budget:
+            yield
+
+    def placeholders(self, day: str) -> Dict[str, str]:
+        return {
+            "archive": str(self.archive_dir),
+            "page_cache": str(self.page_cache_dir),
+            "now": f"{day[:4]}-{day[4:6]}-{day[6:]}T23:59:59+08:00",
+        }
+
+    def _before_phase(self, day: str, name: str):
+        if name != "Validation":
+            return
+        current = datetime.strptime(day, "%Y%m%d").date()
+        for back in range(1, self.archive_days + 1):
+            event = self.validated.get((current - timedelta(days=back)).strftime("%Y%m%d"))
+            if event is not None:
+                event.wait()
+
+    def _after_phase(self, day: str, name: str, result: dict):
+        if name != "Validation":
+            return
+        try:
+            path = self.output_dir / f"tech_news_{day}_validated.json"
+            if self.archive is not None and result["status"] in DONE and path.exists():
+                with open(path, "r", encoding="utf-8") as f:
+                    document = json.load(f)
+                items = document if isinstance(document, list) else document.get("validated_items", [])
+                self.archive.add(int(day), items, compact=False)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️  [{day}] Could not archive validated items: {e}")
+        finally:
+            self.validated[day].set()
+
+    # -- state -------------------------------------------------------------
+
+    def _record(self, day: str, entry: dict):
+        with self.lock:
+            self.state[day] = entry
+            if self.dry_run:
+                return
+            document = {
+                "version": STATE_VERSION,
+                "from": self.dates[0],
+                "to": self.dates[-1],
+                "concurrency": self.concurrency,
+                "updated": datetime.now(SHANGHAI).isoformat(timespec="seconds"),
+                "completed": sum(1 for e in self.state.values() if e["status"] == SUCCESS),
+                "dates": dict(sorted(self.state.items())),
+            }
+            tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(document, f, ensure_ascii=False, indent=2)
+                f.write("\n")
+            os.replace(tmp_path, self.state_path)
+
+    # -- running -----------------------------------------------------------
+
+    def run_date(self, day: str) -> dict:
+        runner = WorkflowRunner(
+            day, self.output_dir, commands=self.commands, force=self.force, skip=self.skip,
+            dry_run=self.dry_run, cache=self.cache, rule_digests=self.rule_digests,
+            placeholders=self.placeholders(day), slot=self.slot,
+            on_phase_start=lambda name: self._before_phase(day, name),
+            on_phase_done=lambda name, result: self._after_phase(day, name, result),
+            log_prefix=f"[{day}] ",
+        )
+        try:
+            metadata = runner.run()
+        finally:
+            # A date that stopped before Validation must not block later dates
+            self.validated[day].set()
+        if not self.dry_run:
+            write_metadata(self.output_dir, day, metadata)
+        return metadata
+
+    def run(self) -> Dict[str, dict]:
+        pending = [day for day in self.dates if self.restart or not is_complete(self.output_dir, day)]
+        for day in self.dates:
+            if day not in pending:
+                self.validated[day].set()
+                self.state[day] = {"status": SUCCESS, "resumed": True}
+        if len(pending) < len(self.dates):
+            print(f"♻️  Resuming: {len(self.dates) - len(pending)} of {len(self.dates)} dates already complete")
+
+        if self.commands.get("Validation") and "{archive}" in self.commands["Validation"]:
+            self.archive = _story_archive(self.archive_dir)
+            # History from before the range (and from an interrupted run)
+            if not self.dry_run:
+                self.archive.backfill([self.output_dir])
+                self.archive.wait()
+
+        pool = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            futures = {pool.submit(self.run_date, day): day for day in pending}
+            for future in as_completed(futures):
+                day = futures[future]
+                try:
+                    metadata = future.result()
+                    entry = {"status": metadata["status"],
+                             "duration_seconds": metadata["total_duration_seconds"],
+                             "cache_hits": metadata["cache"]["hits"]}
+                except Exception as e:  # One broken date must not stop the others
+                    entry = {"status": FAILED, "error": f"{type(e).__name__}: {e}"}
+                self._record(day, entry)
+                done = sum(1 for day in pending if day in self.state)
+                print(f"📅 {day}: {entry['status']} ({done}/{len(pending)})")
+        except KeyboardInterrupt:
+            pool.shutdown(wait=False, cancel_futures=True)
+            print("\n⏸️  Interrupted; completed dates are kept, re-run the same command to resume")
+            raise
+        pool.shutdown()
+        if not self.dry_run:
+            self.cache.save()
+        if self.archive is not None:
+            self.archive.compact_async()
+            self.archive.wait()
+        return self.state
+
+
+_FAKE_PHASE = '''
+import json, sys, time
+phase, day, delay = sys.argv[1], sys.argv[2], float(sys.argv[3])
+time.sleep(delay)
+outputs = {
+    "Collection": ["tech_news_{d}_raw.md"],
+    "Validation": ["tech_news_{d}_validated.json", "validation_report_{d}.md"],
+    "Writing": ["tech_news_{d}_wechat_draft.md"],
+    "Formatting": ["tech_news_{d}_wechat_final.md", "format_report_{d}.md"],
+}[phase]
+for name in outputs:
+    body = json.dumps({"metadata": {"workflow_status": "PASS"}, "validated_items": []}) if name.endswith(".json") else phase
+    open(name.format(d=day), "w").write(body)
+'''
+
+
+def run_benchmark(days: int, concurrency: int = DEFAULT_CONCURRENCY, delay: float = 0.2):
+    """Sequential vs. concurrent backfill with simulated phase commands."""
+    workdir = Path(tempfile.mkdtemp(prefix="backfill_"))
+    try:
+        script = workdir / "fake_phase.py"
+        script.write_text(_FAKE_PHASE, encoding="utf-8")
+        commands = {phase.name: f"{sys.executable} {script} {phase.name} {{date}} {delay}"
+                    for phase in PHASES if phase.name != "Export"}
+        dates = date_range("20250801", (date(2025, 8, 1) + timedelta(days=days - 1)).strftime("%Y%m%d"))
+
+        timings = []
+        for workers in (1, concurrency):
+            output_dir = workdir / f"c{workers}"
+            output_dir.mkdir()
+            runner = BackfillRunner(dates, output_dir, commands, concurrency=workers, skip=("Export",))
+            start = time.perf_counter()
+            with open(os.devnull, "w") as quiet, _redirect_stdout(quiet):
+                state = runner.run()
+            timings.append(time.perf_counter() - start)
+            ok = sum(1 for entry in state.values() if entry["status"] == SUCCESS)
+            print(f"⏱️  concurrency {workers:>2}: {len(dates)} dates in {timings[-1]:.2f}s ({ok} succeeded)")
+
+        start = time.perf_counter()
+        with open(os.devnull, "w") as quiet, _redirect_stdout(quiet):
+            BackfillRunner(dates, workdir / f"c{concurrency}", commands, concurrency=concurrency,
+                           skip=("Export",)).run()
+        resume = time.perf_counter() - start
+        print(f"📊 Speedup {timings[0] / timings[1]:.1f}x; re-running the finished range took "
+              f"{resume * 1000:.0f} ms (every date resumed)")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+@contextmanager
+def _redirect_stdout(stream):
+    saved, sys.stdout = sys.stdout, stream
+    try:
+        yield
+    finally:
+        sys.stdout = saved
+
+
+def _phase_limit(value: str) -> Tuple[str, int]:
+    name, _, limit = value.partition("=")
+    names = {phase.name for phase in PHASES}
+    if name not in names or not limit.isdigit() or int(limit) < 1:
+        raise argparse.ArgumentTypeError(f"expected PHASE=N with PHASE one of {', '.join(sorted(names))}")
+    return name, int(limit)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Backfill a date range of the tech news workflow with shared caches"
+    )
+    parser.add_argument(
+        "--from",
+        dest="start",
+        help="First date as YYYYMMDD"
+    )
+    parser.add_argument(
+        "--to",
+        dest="end",
+        help="Last date as YYYYMMDD (inclusive)"
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=".",
+        help="Directory holding the phase artifacts of every date (default: current directory)"
+    )
+    parser.add_argument(
+        "--config",
+        help='JSON file mapping phase names to shell commands, e.g. {"commands": {"Export": "..."}}'
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Phase commands running at once across all dates (default: {DEFAULT_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--phase-limit",
+        type=_phase_limit,
+        action="append",
+        default=[],
+        metavar="PHASE=N",
+        help="Run at most N commands of PHASE at once (repeatable)"
+    )
+    parser.add_argument(
+        "--archive-days",
+        type=int,
+        default=DEFAULT_ARCHIVE_DAYS,
+        help=f"Story archive lookback the Validation command uses (default: {DEFAULT_ARCHIVE_DAYS})"
+    )
+    parser.add_argument(
+        "--force",
+        nargs="+",
+        default=[],
+        metavar="PHASE",
+        help="Re-run these phases even if their inputs are unchanged"
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Run every date again instead of resuming after the completed ones"
+    )
+    parser.add_argument(
+        "--skip-export",
+        action="store_true",
+        help="Skip Phase 5 (Word export)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show which phases would run for each date without running them"
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="DAYS",
+        help="Backfill DAYS dates of simulated phases sequentially and with --concurrency"
+    )
+
+    args = parser.parse_args()
+
+    if args.concurrency < 1:
+        print(f"❌ Error: --concurrency must be at least 1, got {args.concurrency}")
+        sys.exit(1)
+
+    if args.benchmark:
+        run_benchmark(args.benchmark, args.concurrency)
+        return
+
+    for flag, value in (("--from", args.start), ("--to", args.end)):
+        if not value or len(value) != 8 or not value.isdigit():
+            print(f"❌ Error: {flag} must be YYYYMMDD, got {value}")
+            sys.exit(1)
+    try:
+        dates = date_range(args.start, args.end)
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    if not dates:
+        print(f"❌ Error: --from {args.start} is after --to {args.end}")
+        sys.exit(1)
+
+    names = {phase.name for phase in PHASES}
+    unknown = [name for name in args.force if name not in names]
+    if unknown:
+        print(f"❌ Error: Unknown phase(s): {', '.join(unknown)} (expected one of {', '.join(sorted(names))})")
+        sys.exit(1)
+
+    output_dir = Path(args.output_dir)
+    if not output_dir.is_dir():
+        print(f"❌ Error: Output directory does not exist: {output_dir}")
+        sys.exit(1)
+
+    commands = {}
+    if args.config:
+        try:
+            with open(args.config, "r", encoding="utf-8") as f:
+                commands = json.load(f).get("commands", {})
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"❌ Error: Could not read {args.config}: {e}")
+            sys.exit(1)
+
+    runner = BackfillRunner(
+        dates,
+        output_dir,
+        commands=commands,
+        concurrency=args.concurrency,
+        phase_limits=dict(args.phase_limit),
+        archive_days=args.archive_days,
+        force=tuple(args.force),
+        skip=("Export",) if args.skip_export else (),
+        dry_run=args.dry_run,
+        restart=args.restart,
+    )
+    start = time.perf_counter()
+    try:
+        state = runner.run()
+    except KeyboardInterrupt:
+        sys.exit(130)
+    elapsed = time.perf_counter() - start
+
+    succeeded = sum(1 for entry in state.values() if entry["status"] == SUCCESS)
+    failed = sorted(day for day, entry in state.items() if entry["status"] == FAILED)
+    print()
+    print(f"📊 {succeeded}/{len(dates)} dates complete in {elapsed:.1f}s")
+    if failed:
+        print(f"❌ Failed: {', '.join(failed)}")
+    if not args.dry_run:
+        print(f"📄 Progress: {runner.state_path}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
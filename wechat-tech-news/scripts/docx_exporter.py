@@ -0,0 +1,869 @@
+#!/usr/bin/env python3
+"""
+Built-in streaming Markdown → Word exporter for Phase 5.
+
+The Markdown is parsed line by line and WordprocessingML is written
+straight into the .docx zip container as it is produced; no document
+tree is built, so memory stays flat however long the article is. Parts
+that depend on the whole document are generated from what was collected
+on the way:
+
+    word/document.xml            streamed; headings get bookmarks
+    table of contents            streamed from a second, heading-only pass of the
+                                 same parser (a TOC field Word can refresh for page numbers)
+    word/_rels/document.xml.rels hyperlink targets seen while streaming
+    docProps/core.xml            title (first H1), date, author, version
+    docProps/app.xml             word / character / paragraph counts
+
+Emoji are kept as text and given an emoji font, so they survive Word,
+WPS and LibreOffice. Output is written to a temporary file and renamed,
+and is byte-for-byte reproducible for the same input.
+
+A month of archived articles can be exported on a process pool; a
+failed article is reported but does not stop the batch (Quality Gate 5).
+
+Usage:
+    python docx_exporter.py tech_news_[DATE]_wechat_final.md [--output tech_news_[DATE]_wechat_final.docx]
+    python docx_exporter.py --batch archive/ --month 202511 [--workers 8] [--output-dir exports/]
+    python docx_exporter.py a.md b.md c.md --workers 4
+    python docx_exporter.py --benchmark
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+WORKFLOW_VERSION = "4.0.0"
+DEFAULT_AUTHOR = "wechat-tech-news"
+TOC_LEVELS = (2, 3)
+TOC_TITLE = "目录"
+FLUSH_BYTES = 1 << 16
+
+LATIN_FONT = "Calibri"
+EAST_ASIA_FONT = "Microsoft YaHei"
+EMOJI_FONT = "Segoe UI Emoji"
+CODE_FONT = "Consolas"
+# A4 with 2.54 cm margins, in twentieths of a point
+PAGE_WIDTH, PAGE_HEIGHT, MARGIN = 11906, 16838, 1440
+TEXT_WIDTH = PAGE_WIDTH - 2 * MARGIN
+INDENT = 420
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_FENCE_RE = re.compile(r"[ \t]*(```|~~~)")
+_HEADING_RE = re.compile(r"(#{1,6})[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$")
+_BULLET_RE = re.compile(r"([ \t]*)[-*+][ \t]+(.*)")
+_NUMBER_RE = re.compile(r"([ \t]*)(\d+[.)])[ \t]+(.*)")
+_QUOTE_RE = re.compile(r"[ \t]*>[ \t]?(.*)")
+_RULE_RE = re.compile(r"[ \t]*([-*_])(?:[ \t]*\1){2,}[ \t]*$")
+_TABLE_SEP_RE = re.compile(r"[ \t]*\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*$")
+_INLINE_RE = re.compile(
+    r"`(?P<code>[^`]+)`"
+    r"|!\[(?P<alt>[^\]]*)\]\([^)]*\)"
+    r"|\[(?P<label>[^\]]+)\]\((?P<url>[^)\s]+)(?:[ \t]+\"[^\"]*\")?\)"
+    r"|\*\*(?P<bold>.+?)\*\*|__(?P<bold2>.+?)__"
+    r"|~~(?P<strike>.+?)~~"
+    r"|\*(?P<italic>[^*\s](?:[^*]*[^*\s])?)\*"
+)
+_EMOJI_RE = re.compile(
+    "([\U0001F000-\U0001FAFF\u2600-\u27bf\u2b00-\u2bff\u2300-\u23ff"
+    "\u200d\ufe0f\u20e3\U000E0020-\U000E007F]+)"
+)
+_INVALID_XML_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+_CJK_RE = re.compile(r"[\u3000-\u30ff\u3400-\u9fff\uff00-\uffef]")
+_WORD_RE = re.compile(r"[\u3400-\u9fff]|[A-Za-z0-9]+")
+_DATE_RE = re.compile(r"(\d{8})")
+
+
+class Block(NamedTuple):
+    """One Markdown block: kind, heading/list level, text (or cells for table rows)."""
+    kind: str
+    level: int
+    text: str
+    cells: Tuple[str, ...] = ()
+
+
+class ExportStats(NamedTuple):
+    source: str
+    output: str
+    paragraphs: int
+    headings: int
+    tables: int
+    links: int
+    words: int
+    seconds: float
+    error: Optional[str] = None
+
+
+def _join(previous: str, line: str) -> str:
+    """Join wrapped Markdown lines; no space is inserted between CJK characters."""
+    if not previous:
+        return line
+    if _CJK_RE.match(previous[-1:]) or _CJK_RE.match(line[:1]):
+        return previous + line
+    return previous + " " + line
+
+
+def _split_row(line: str) -> Tuple[str, ...]:
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    return tuple(cell.strip().replace("\\|", "|") for cell in re.split(r"(?<!\\)\|", line))
+
+
+def iter_blocks(lines: Iterable[str]) -> Iterator[Block]:
+    """Parse Markdown lines into blocks, holding at most one paragraph at a time.
+
+    Kinds: heading, para, bullet, number, item (continuation of a list
+    item), quote, code (one per line), rule, row (table row; level 1 for
+    the first row of a table).
+    """
+    pending: Optional[Block] = None
+    fence: Optional[str] = None
+    in_list = False
+    hard_break = False
+    table_row = 0
+
+    for raw in lines:
+        line = raw.rstrip("\r\n").expandtabs(4)
+        previous_break, hard_break = hard_break, line.endswith("  ")
+
+        if fence is not None:
+            match = _FENCE_RE.match(line)
+            if match and match.group(1) == fence and not line.strip()[3:].strip("`~"):
+                fence = None
+            else:
+                yield Block("code", 0, line)
+            continue
+
+        match = _FENCE_RE.match(line)
+        if match:
+            if pending:
+                yield pending
+                pending = None
+            fence = match.group(1)
+            in_list = False
+            table_row = 0
+            continue
+
+        stripped = line.strip()
+        if not stripped:
+            if pending:
+                yield pending
+                pending = None
+            table_row = 0
+            continue
+
+        if stripped.startswith("|") or (table_row and "|" in stripped):
+            if pending:
+                yield pending
+                pending = None
+            if _TABLE_SEP_RE.match(line) and table_row:
+                continue
+            table_row += 1
+            yield Block("row", 1 if table_row == 1 else 0, "", _split_row(line))
+            in_list = False
+            continue
+        table_row = 0
+
+        heading = _HEADING_RE.match(line) if stripped.startswith("#") else None
+        rule = _RULE_RE.match(line)
+        bullet = None if rule else _BULLET_RE.match(line)
+        number = _NUMBER_RE.match(line)
+        quote = _QUOTE_RE.match(line) if stripped.startswith(">") else None
+        starts_block = heading or rule or bullet or number or quote
+
+        if pending and not starts_block:
+            # Continuation of the open paragraph, list item or quote; a hard
+            # break, or an indented line under a list item, keeps its line
+            if previous_break or (pending.kind in ("bullet", "number") and line[:1] == " "):
+                pending = pending._replace(text=pending.text + "\n" + stripped)
+            else:
+                pending = pending._replace(text=_join(pending.text, stripped))
+            continue
+        if pending:
+            yield pending
+            pending = None
+
+        if heading:
+            yield Block("heading", len(heading.group(1)), heading.group(2))
+            in_list = False
+        elif rule:
+            yield Block("rule", 0, "")
+            in_list = False
+        elif bullet:
+            pending = Block("bullet", len(bullet.group(1)) // 2, bullet.group(2).strip())
+            in_list = True
+        elif number:
+            pending = Block("number", len(number.group(1)) // 2, f"{number.group(2)} {number.group(3).strip()}")
+            in_list = True
+        elif quote:
+            pending = Block("quote", 0, quote.group(1).strip())
+            in_list = False
+        elif in_list and line[:1] in " \t":
+            # Indented text under a list item after a blank line
+            pending = Block("item", (len(line) - len(line.lstrip())) // 2, stripped)
+        else:
+            pending = Block("para", 0, stripped)
+            in_list = False
+    if pending:
+        yield pending
+
+
+def iter_headings(path: Path) -> Iterator[Tuple[int, str]]:
+    """(level, text) of every heading, in document order."""
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for block in iter_blocks(f):
+            if block.kind == "heading":
+                yield block.level, block.text
+
+
+def xml_escape(text: str, quote: bool = False) -> str:
+    text = _INVALID_XML_RE.sub("", text)
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    if quote:
+        text = text.replace('"', "&quot;")
+    return text
+
+
+def plain_text(text: str) -> str:
+    """Inline Markdown reduced to its visible text (TOC entries, metadata)."""
+    return "".join(piece for piece, _, _ in inline_runs(text))
+
+
+def inline_runs(text: str, fmt: frozenset = frozenset(), link: Optional[str] = None
+                ) -> Iterator[Tuple[str, frozenset, Optional[str]]]:
+    """Yield (text, formatting, link target) runs for inline Markdown."""
+    pos = 0
+    for match in _INLINE_RE.finditer(text):
+        if match.start() > pos:
+            yield text[pos:match.start()], fmt, link
+        # lastgroup would name the URL of a link, so take the first group that matched
+        group = next(name for name, value in match.groupdict().items() if value is not None)
+        value = match.group(group)
+        if group == "code":
+            yield value, fmt | {"code"}, link
+        elif group == "alt":
+            if value:
+                yield value, fmt | {"italic"}, link
+        elif group == "label":
+            yield from inline_runs(value, fmt, match.group("url"))
+        elif group in ("bold", "bold2"):
+            yield from inline_runs(value, fmt | {"bold"}, link)
+        else:
+            yield from inline_runs(value, fmt | {group}, link)
+        pos = match.end()
+    if pos < len(text):
+        yield text[pos:], fmt, link
+
+
+def _rpr(fmt: frozenset, emoji: bool = False) -> str:
+    parts = []
+    if "link" in fmt:
+        parts.append('<w:rStyle w:val="Hyperlink"/>')
+    if emoji:
+        parts.append(f'<w:rFonts w:ascii="{EMOJI_FONT}" w:hAnsi="{EMOJI_FONT}" '
+                     f'w:eastAsia="{EMOJI_FONT}" w:cs="{EMOJI_FONT}"/>')
+    elif "code" in fmt:
+        parts.append(f'<w:rFonts w:ascii="{CODE_FONT}" w:hAnsi="{CODE_FONT}" w:cs="{CODE_FONT}"/>')
+    if "bold" in fmt:
+        parts.append("<w:b/><w:bCs/>")
+    if "italic" in fmt:
+        parts.append("<w:i/><w:iCs/>")
+    if "strike" in fmt:
+        parts.append("<w:strike/>")
+    if "code" in fmt:
+        parts.append('<w:shd w:val="clear" w:color="auto" w:fill="F2F2F2"/>')
+    return f"<w:rPr>{''.join(parts)}</w:rPr>" if parts else ""
+
+
+def run_xml(text: str, fmt: frozenset = frozenset()) -> str:
+    """One or more <w:r> elements; emoji get their own runs with the emoji font."""
+    out = []
+    for number, line in enumerate(text.split("\n")):
+        if number:
+            out.append("<w:r><w:br/></w:r>")
+        for idx, piece in enumerate(_EMOJI_RE.split(line)):
+            if piece:
+                out.append(f'<w:r>{_rpr(fmt, emoji=idx % 2 == 1)}'
+                           f'<w:t xml:space="preserve">{xml_escape(piece)}</w:t></w:r>')
+    return "".join(out)
+
+
+class DocxWriter:
+    """Streams one .docx: body XML goes straight into the zip as it is written."""
+
+    def __init__(self, path: Path, title: str = "", author: str = DEFAULT_AUTHOR,
+                 version: str = WORKFLOW_VERSION, created: Optional[datetime] = None,
+                 headings: Optional[Callable[[], Iterable[Tuple[int, str]]]] = None):
+        self.path = path
+        self.title = title
+        self.author = author
+        self.version = version
+        self.created = created or datetime(1980, 1, 1, tzinfo=timezone.utc)
+        # Called when the TOC is due; yields (level, text) for every heading
+        self.headings = headings
+        self.links: Dict[str, str] = {}
+        self.paragraphs = 0
+        self.heading_count = 0
+        self.tables = 0
+        self.words = 0
+        self.characters = 0
+        self._columns = 0
+        self._toc_written = headings is None
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._zip = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+        self._stream = None
+
+    # -- zip plumbing --------------------------------------------------------
+
+    def _info(self, name: str) -> zipfile.ZipInfo:
+        info = zipfile.ZipInfo(name, date_time=self.created.timetuple()[:6]
+                               if self.created.year >= 1980 else (1980, 1, 1, 0, 0, 0))
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o644 << 16
+        return info
+
+    def _part(self, name: str, xml: str):
+        self._zip.writestr(self._info(name), XML_HEADER + xml)
+
+    def _write(self, xml: str):
+        self._buffer.append(xml)
+        self._buffered += len(xml)
+        if self._buffered >= FLUSH_BYTES:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            self._stream.write("".join(self._buffer).encode("utf-8"))
+            self._buffer.clear()
+            self._buffered = 0
+
+    def __enter__(self) -> "DocxWriter":
+        self._part("[Content_Types].xml", CONTENT_TYPES)
+        self._part("_rels/.rels", PACKAGE_RELS)
+        self._part("word/styles.xml", STYLES)
+        self._part("word/settings.xml", SETTINGS)
+        # Sizes are unknown up front, so the entry may need ZIP64
+        self._stream = self._zip.open(self._info("word/document.xml"), "w", force_zip64=True)
+        self._write(XML_HEADER + f'<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}"><w:body>')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._finish()
+        finally:
+            if self._stream is not None and not self._stream.closed:
+                self._stream.close()
+            self._zip.close()
+
+    def _finish(self):
+        self._end_table()
+        if not self._toc_written:
+            self._write_toc()
+        self._write(f'<w:sectPr><w:pgSz w:w="{PAGE_WIDTH}" w:h="{PAGE_HEIGHT}"/>'
+                    f'<w:pgMar w:top="{MARGIN}" w:right="{MARGIN}" w:bottom="{MARGIN}" w:left="{MARGIN}" '
+                    f'w:header="851" w:footer="992" w:gutter="0"/></w:sectPr></w:body></w:document>')
+        self._flush()
+        self._stream.close()
+
+        rels = ['<Relationship Id="rId1" Type="' + REL_TYPE + 'styles" Target="styles.xml"/>',
+                '<Relationship Id="rId2" Type="' + REL_TYPE + 'settings" Target="settings.xml"/>']
+        for url, rid in self.links.items():
+            rels.append(f'<Relationship Id="{rid}" Type="{REL_TYPE}hyperlink" '
+                        f'Target="{xml_escape(url, quote=True)}" TargetMode="External"/>')
+        self._part("word/_rels/document.xml.rels",
+                   f'<Relationships xmlns="{REL_NS}">{"".join(rels)}</Relationships>')
+
+        title = self.title or self.path.name.split(".")[0]
+        stamp = self.created.strftime("%Y-%m-%dT%H:%M:%SZ")
+        self._part("docProps/core.xml", (
+            '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+            'xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:dcterms="http://purl.org/dc/terms/" '
+            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+            f"<dc:title>{xml_escape(title)}</dc:title>"
+            f"<dc:creator>{xml_escape(self.author)}</dc:creator>"
+            f"<cp:lastModifiedBy>{xml_escape(self.author)}</cp:lastModifiedBy>"
+            "<cp:keywords>tech-news; wechat</cp:keywords>"
+            f"<cp:version>{xml_escape(self.version)}</cp:version>"
+            f'<dcterms:created xsi:type="dcterms:W3CDTF">{stamp}</dcterms:created>'
+            f'<dcterms:modified xsi:type="dcterms:W3CDTF">{stamp}</dcterms:modified>'
+            "</cp:coreProperties>"
+        ))
+        self._part("docProps/app.xml", (
+            '<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties">'
+            "<Application>wechat-tech-news docx_exporter</Application>"
+            f"<Words>{self.words}</Words><Characters>{self.characters}</Characters>"
+            f"<Paragraphs>{self.paragraphs}</Paragraphs>"
+            "</Properties>"
+        ))
+
+    # -- content -------------------------------------------------------------
+
+    def _count(self, text: str):
+        self.words += len(_WORD_RE.findall(text))
+        self.characters += len(text)
+
+    def _link_id(self, url: str) -> str:
+        rid = self.links.get(url)
+        if rid is None:
+            rid = self.links[url] = f"rId{len(self.links) + 3}"
+        return rid
+
+    def _inline(self, text: str) -> str:
+        out = []
+        for piece, fmt, link in inline_runs(text):
+            self._count(piece)
+            if link:
+                target = (f'w:anchor="{xml_escape(link[1:], quote=True)}"' if link.startswith("#")
+                          else f'r:id="{self._link_id(link)}"')
+                out.append(f'<w:hyperlink {target} w:history="1">{run_xml(piece, fmt | {"link"})}</w:hyperlink>')
+            else:
+                out.append(run_xml(piece, fmt))
+        return "".join(out)
+
+    def paragraph(self, text: str, style: Optional[str] = None, ppr: str = "", runs: Optional[str] = None):
+        self._end_table()
+        style_xml = f'<w:pStyle w:val="{style}"/>' if style else ""
+        props = f"<w:pPr>{style_xml}{ppr}</w:pPr>" if style_xml or ppr else ""
+        body = runs if runs is not None else self._inline(text)
+        self._write(f"<w:p>{props}{body}</w:p>")
+        self.paragraphs += 1
+
+    def heading(self, level: int, text: str):
+        self._end_table()
+        if level == 1 and not self.heading_count and not self.title:
+            self.title = plain_text(text)
+        index = self.heading_count
+        self.heading_count += 1
+        runs = self._inline(text)
+        if level in TOC_LEVELS:
+            runs = (f'<w:bookmarkStart w:id="{index}" w:name="_Toc{index}"/>{runs}'
+                    f'<w:bookmarkEnd w:id="{index}"/>')
+        self.paragraph(text, f"Heading{level}", runs=runs)
+        # The TOC goes right after the title heading (or first, if there is none)
+        if not self._toc_written and (level == 1 or index == 0):
+            self._write_toc()
+
+    def _write_toc(self):
+        """Stream the TOC from a fresh pass over the headings; one entry is held back
+        so the field can be closed in the last entry's paragraph."""
+        self._toc_written = True
+        lo, hi = TOC_LEVELS[0], TOC_LEVELS[-1]
+        held = None
+        for idx, (level, text) in enumerate(self.headings()):
+            if level not in TOC_LEVELS:
+                continue
+            if held is None:
+                self.paragraph(TOC_TITLE, "TOCHeading")
+                prefix = ('<w:r><w:fldChar w:fldCharType="begin"/></w:r>'
+                          f'<w:r><w:instrText xml:space="preserve"> TOC \\o "{lo}-{hi}" \\h \\z \\u </w:instrText></w:r>'
+                          '<w:r><w:fldChar w:fldCharType="separate"/></w:r>')
+            else:
+                self._toc_entry(*held)
+                prefix = ""
+            held = (idx, level, text, prefix)
+        if held is not None:
+            self._toc_entry(*held, suffix='<w:r><w:fldChar w:fldCharType="end"/></w:r>')
+
+    def _toc_entry(self, idx: int, level: int, text: str, prefix: str = "", suffix: str = ""):
+        link = f'<w:hyperlink w:anchor="_Toc{idx}" w:history="1">{run_xml(plain_text(text))}</w:hyperlink>'
+        self._write(f'<w:p><w:pPr><w:pStyle w:val="TOC{level - TOC_LEVELS[0] + 1}"/></w:pPr>'
+                    f"{prefix}{link}{suffix}</w:p>")
+        self.paragraphs += 1
+
+    def list_item(self, marker: str, level: int, text: str):
+        left = INDENT * (level + 1)
+        runs = run_xml(marker + "\t") if marker else ""
+        ind = f'<w:ind w:left="{left}" w:hanging="{INDENT}"/>' if marker else f'<w:ind w:left="{left}"/>'
+        self.paragraph(text, "ListParagraph", ppr=ind, runs=runs + self._inline(text))
+
+    def code_line(self, text: str):
+        self._count(text)
+        self.paragraph(text, "Code", runs=run_xml(text))
+
+    def rule(self):
+        self.paragraph("", ppr='<w:pBdr><w:bottom w:val="single" w:sz="6" w:space="1" w:color="auto"/></w:pBdr>',
+                       runs="")
+
+    def table_row(self, cells: Tuple[str, ...], first: bool):
+        if first:
+            self._end_table()
+            self._columns = max(1, len(cells))
+            width = TEXT_WIDTH // self._columns
+            grid = "".join(f'<w:gridCol w:w="{width}"/>' for _ in range(self._columns))
+            self._write('<w:tbl><w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:w="5000" w:type="pct"/>'
+                        f'<w:tblLook w:val="04A0"/></w:tblPr><w:tblGrid>{grid}</w:tblGrid>')
+            self.tables += 1
+        elif not self._columns:
+            return self.table_row(cells, True)
+        width = TEXT_WIDTH // self._columns
+        cells = (tuple(cells) + ("",) * self._columns)[:self._columns]
+        xml = ["<w:tr>"]
+        for cell in cells:
+            runs = self._inline(f"**{cell}**" if first and cell else cell)
+            xml.append(f'<w:tc><w:tcPr><w:tcW w:w="{width}" w:type="dxa"/></w:tcPr><w:p>{runs}</w:p></w:tc>')
+        xml.append("</w:tr>")
+        self._write("".join(xml))
+
+    def _end_table(self):
+        if self._columns:
+            self._write("</w:tbl>")
+            self._columns = 0
+            # Word expects a paragraph between a table and whatever follows
+            self._write("<w:p/>")
+
+    def block(self, block: Block):
+        kind = block.kind
+        if kind == "heading":
+            self.heading(block.level, block.text)
+        elif kind == "para":
+            self.paragraph(block.text)
+        elif kind == "bullet":
+            self.list_item("•", block.level, block.text)
+        elif kind == "number":
+            marker, _, text = block.text.partition(" ")
+            self.list_item(marker, block.level, text)
+        elif kind == "item":
+            self.list_item("", max(0, block.level - 1), block.text)
+        elif kind == "quote":
+            self.paragraph(block.text, "Quote")
+        elif kind == "code":
+            self.code_line(block.text)
+        elif kind == "rule":
+            self.rule()
+        elif kind == "row":
+            self.table_row(block.cells, block.level == 1)
+
+
+def _created(source: Path) -> datetime:
+    """Article date from tech_news_[DATE]_..., else SOURCE_DATE_EPOCH, else the file's mtime."""
+    match = _DATE_RE.search(source.name)
+    if match:
+        try:
+            return datetime.strptime(match.group(1), "%Y%m%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    stamp = int(epoch) if epoch else int(source.stat().st_mtime)
+    return datetime.fromtimestamp(stamp, timezone.utc)
+
+
+def export_docx(source: Path, output: Path, author: str = DEFAULT_AUTHOR,
+                version: str = WORKFLOW_VERSION, toc: bool = True) -> ExportStats:
+    """Export one Markdown file; the .docx appears atomically at output."""
+    start = time.perf_counter()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_name(output.name + ".tmp")
+    try:
+        with open(source, "r", encoding="utf-8-sig") as f, \
+                DocxWriter(tmp_path, author=author, version=version,
+                           created=_created(source),
+                           headings=(lambda: iter_headings(source)) if toc else None) as writer:
+            for block in iter_blocks(f):
+                writer.block(block)
+        os.replace(tmp_path, output)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return ExportStats(str(source), str(output), writer.paragraphs, writer.heading_count, writer.tables,
+                       len(writer.links), writer.words, time.perf_counter() - start)
+
+
+def _export_job(job: Tuple[str, str, str, str, bool]) -> ExportStats:
+    """Process-pool entry point: errors are returned, never raised."""
+    source, output, author, version, toc = job
+    start = time.perf_counter()
+    try:
+        return export_docx(Path(source), Path(output), author, version, toc)
+    except (OSError, UnicodeDecodeError, ValueError, zipfile.BadZipFile) as e:
+        return ExportStats(source, output, 0, 0, 0, 0, 0, time.perf_counter() - start, str(e))
+
+
+def export_batch(sources: List[Path], output_dir: Optional[Path] = None, workers: Optional[int] = None,
+                 author: str = DEFAULT_AUTHOR, version: str = WORKFLOW_VERSION,
+                 toc: bool = True) -> List[ExportStats]:
+    """Export many articles on a process pool; results come back in input order."""
+    jobs = [(str(src), str((output_dir or src.parent) / (src.stem + ".docx")), author, version, toc)
+            for src in sources]
+    if workers == 1 or len(jobs) <= 1:
+        return [_export_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_export_job, jobs, chunksize=max(1, len(jobs) // (4 * (workers or os.cpu_count() or 1)))))
+
+
+def find_archive(directory: Path, month: Optional[str]) -> List[Path]:
+    """tech_news_[DATE]_wechat_final.md files under directory, optionally for one YYYYMM."""
+    pattern = f"tech_news_{month or ''}*_wechat_final.md"
+    return sorted(directory.rglob(pattern))
+
+
+# -- static parts ----------------------------------------------------------
+
+CONTENT_TYPES = (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '<Override PartName="/word/settings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>'
+    '<Override PartName="/docProps/core.xml" '
+    'ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>'
+    '<Override PartName="/docProps/app.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.extended-properties+xml"/>'
+    "</Types>"
+)
+
+PACKAGE_RELS = (
+    f'<Relationships xmlns="{REL_NS}">'
+    f'<Relationship Id="rId1" Type="{REL_TYPE}officeDocument" Target="word/document.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" '
+    'Target="docProps/core.xml"/>'
+    f'<Relationship Id="rId3" Type="{REL_TYPE}extended-properties" Target="docProps/app.xml"/>'
+    "</Relationships>"
+)
+
+SETTINGS = (
+    f'<w:settings xmlns:w="{W_NS}">'
+    f'<w:defaultTabStop w:val="{INDENT}"/>'
+    '<w:characterSpacingControl w:val="compressPunctuation"/>'
+    '<w:compat><w:compatSetting w:name="compatibilityMode" w:uri="http://schemas.microsoft.com/office/word" '
+    'w:val="15"/></w:compat>'
+    "</w:settings>"
+)
+
+
+def _style(style_id: str, name: str, ppr: str = "", rpr: str = "", kind: str = "paragraph",
+           based_on: Optional[str] = "Normal", extra: str = "") -> str:
+    based = f'<w:basedOn w:val="{based_on}"/>' if based_on else ""
+    nxt = '<w:next w:val="Normal"/>' if kind == "paragraph" and style_id != "Normal" else ""
+    return (f'<w:style w:type="{kind}" w:styleId="{style_id}"><w:name w:val="{name}"/>{based}{nxt}'
+            f'<w:qFormat/>{f"<w:pPr>{ppr}</w:pPr>" if ppr else ""}{f"<w:rPr>{rpr}</w:rPr>" if rpr else ""}'
+            f"{extra}</w:style>")
+
+
+_HEADING_SIZES = {1: 36, 2: 30, 3: 26, 4: 24, 5: 22, 6: 22}
+
+STYLES = (
+    f'<w:styles xmlns:w="{W_NS}">'
+    "<w:docDefaults><w:rPrDefault><w:rPr>"
+    f'<w:rFonts w:ascii="{LATIN_FONT}" w:hAnsi="{LATIN_FONT}" w:eastAsia="{EAST_ASIA_FONT}" w:cs="{LATIN_FONT}"/>'
+    '<w:sz w:val="22"/><w:szCs w:val="22"/><w:lang w:val="en-US" w:eastAsia="zh-CN"/>'
+    "</w:rPr></w:rPrDefault><w:pPrDefault><w:pPr>"
+    '<w:spacing w:after="120" w:line="300" w:lineRule="auto"/>'
+    "</w:pPr></w:pPrDefault></w:docDefaults>"
+    + '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:qFormat/></w:style>'
+    + "".join(
+        _style(f"Heading{level}", f"heading {level}",
+               ppr=f'<w:keepNext/><w:keepLines/><w:spacing w:before="{360 if level <= 2 else 240}" w:after="120"/>'
+                   f'<w:outlineLvl w:val="{level - 1}"/>',
+               rpr=f'<w:b/><w:bCs/><w:sz w:val="{size}"/><w:szCs w:val="{size}"/>')
+        for level, size in _HEADING_SIZES.items()
+    )
+    + _style("TOCHeading", "TOC Heading", ppr='<w:keepNext/><w:spacing w:before="240" w:after="120"/>',
+             rpr='<w:b/><w:bCs/><w:sz w:val="28"/><w:szCs w:val="28"/>')
+    + "".join(_style(f"TOC{n}", f"toc {n}", ppr=f'<w:spacing w:after="60"/><w:ind w:left="{INDENT * (n - 1)}"/>')
+              for n in range(1, len(TOC_LEVELS) + 1))
+    + _style("ListParagraph", "List Paragraph", ppr=f'<w:ind w:left="{INDENT}"/>')
+    + _style("Quote", "Quote",
+             ppr='<w:pBdr><w:left w:val="single" w:sz="18" w:space="8" w:color="BFBFBF"/></w:pBdr>'
+                 f'<w:ind w:left="{INDENT}"/>',
+             rpr='<w:i/><w:iCs/><w:color w:val="595959"/>')
+    + _style("Code", "Code",
+             ppr='<w:shd w:val="clear" w:color="auto" w:fill="F2F2F2"/><w:spacing w:after="0" w:line="240" '
+                 'w:lineRule="auto"/>',
+             rpr=f'<w:rFonts w:ascii="{CODE_FONT}" w:hAnsi="{CODE_FONT}" w:cs="{CODE_FONT}"/>'
+                 '<w:sz w:val="19"/><w:szCs w:val="19"/>')
+    + _style("Hyperlink", "Hyperlink", kind="character", based_on=None,
+             rpr='<w:color w:val="0563C1"/><w:u w:val="single"/>')
+    + _style("TableGrid", "Table Grid", kind="table", based_on=None,
+             extra='<w:tblPr><w:tblBorders>'
+                   + "".join(f'<w:{side} w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+                             for side in ("top", "left", "bottom", "right", "insideH", "insideV"))
+                   + "</w:tblBorders></w:tblPr>")
+    + "</w:styles>"
+)
+
+
+# -- benchmark -------------------------------------------------------------
+
+def _synthetic_article(paragraphs: int, seed: int = 0) -> Iterator[str]:
+    import random
+
+    rng = random.Random(seed)
+    words = ("人工智能", "大模型", "OpenAI", "推理", "芯片", "开源", "发布", "融资", "算力", "Agent")
+    yield "# 48小时科技新闻汇总 | 2025年11月20日 AI焦点\n\n## 🌟 48小时焦点\n\n"
+    for idx in range(1, 6):
+        yield f"{idx}. **🇺🇸 OpenAI发布新模型{idx}**\n   一句话摘要,见[原文](https://example.com/{idx})。\n\n"
+    for idx in range(paragraphs):
+        if idx % 20 == 0:
+            yield f"## 🤖 AI动态 {idx // 20}\n\n"
+        if idx % 5 == 0:
+            yield f"### 公司新闻 {idx}\n\n"
+        text = "".join(rng.choice(words) for _ in range(rng.randint(30, 80)))
+        yield f"{text}，**重点**在于`code`与 *强调* 🚀。\n\n"
+        if idx % 50 == 7:
+            yield "| 公司 | 金额 |\n|---|---|\n| A | $1B |\n| B | $2B |\n\n"
+        if idx % 50 == 21:
+            yield "```python\nprint('hello')\n```\n\n- 要点一\n- 要点二\n\n> 引用内容\n\n"
+    yield "---\n\n## 📋 免责声明\n\n本文内容仅供参考。\n"
+
+
+def run_benchmark():
+    """Peak Python memory and time for growing articles, then a pooled batch."""
+    import tracemalloc
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        print("📊 Single export (peak memory should stay flat as the article grows)")
+        for paragraphs in (2_000, 10_000, 40_000):
+            source = tmp_dir / f"tech_news_20251120_{paragraphs}_wechat_final.md"
+            with open(source, "w", encoding="utf-8") as f:
+                f.writelines(_synthetic_article(paragraphs))
+            stats = export_docx(source, source.with_suffix(".docx"))
+            tracemalloc.start()
+            export_docx(source, source.with_suffix(".docx"))
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"   {source.stat().st_size / 1e6:7.1f} MB markdown → "
+                  f"{Path(stats.output).stat().st_size / 1e6:6.1f} MB docx, "
+                  f"{stats.paragraphs:7d} paragraphs, peak {peak / 1e6:5.1f} MB, {stats.seconds:6.2f} s")
+
+        archive = tmp_dir / "archive"
+        archive.mkdir()
+        for day in range(1, 31):
+            with open(archive / f"tech_news_202511{day:02d}_wechat_final.md", "w", encoding="utf-8") as f:
+                f.writelines(_synthetic_article(120, seed=day))
+        sources = find_archive(archive, "202511")
+        pooled = max(2, os.cpu_count() or 1)
+        for workers in (1, pooled):
+            start = time.perf_counter()
+            results = export_batch(sources, tmp_dir / f"out{workers}", workers=workers)
+            elapsed = time.perf_counter() - start
+            failed = sum(1 for r in results if r.error)
+            print(f"⏱️  Batch of {len(sources)} articles, {workers:2d} worker(s): {elapsed:6.2f} s"
+                  f"{f' ({failed} failed)' if failed else ''}")
+        same = all((tmp_dir / "out1" / name).read_bytes() == (tmp_dir / f"out{pooled}" / name).read_bytes()
+                   for name in (p.stem + ".docx" for p in sources))
+        print(f"{'✅' if same else '❌'} Pooled output identical to serial output")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export tech news Markdown to Word (.docx) with a streaming writer"
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="Markdown file(s) to export (tech_news_[DATE]_wechat_final.md)"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        help="Output .docx path (single input only; default: input name with .docx)"
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        help="Export every tech_news_*_wechat_final.md under DIR"
+    )
+    parser.add_argument(
+        "--month",
+        help="With --batch, only articles dated YYYYMM"
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="Directory for exported files (default: next to each input)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for batch export (default: CPU count)"
+    )
+    parser.add_argument(
+        "--author",
+        default=DEFAULT_AUTHOR,
+        help=f"Author recorded in the document metadata (default: {DEFAULT_AUTHOR})"
+    )
+    parser.add_argument(
+        "--no-toc",
+        action="store_true",
+        help="Do not generate a table of contents"
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Measure peak memory on growing articles and pooled batch throughput"
+    )
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark()
+        return
+
+    sources = [Path(p) for p in args.inputs]
+    if args.batch:
+        batch_dir = Path(args.batch)
+        if not batch_dir.is_dir():
+            print(f"❌ Error: Batch directory does not exist: {batch_dir}")
+            sys.exit(1)
+        if args.month and not re.fullmatch(r"\d{6}", args.month):
+            print(f"❌ Error: --month must be YYYYMM, got {args.month}")
+            sys.exit(1)
+        sources.extend(find_archive(batch_dir, args.month))
+    if not sources:
+        parser.error("no input files (give Markdown files, --batch DIR or --benchmark)")
+    if args.output and len(sources) > 1:
+        parser.error("--output works with a single input; use --output-dir for several")
+
+    missing = [str(p) for p in sources if not p.is_file()]
+    if missing:
+        print(f"❌ Error: Input file does not exist: {', '.join(missing)}")
+        sys.exit(1)
+
+    output_dir = Path(args.output_dir) if args.output_dir else None
+    start = time.perf_counter()
+    if args.output:
+        results = [_export_job((str(sources[0]), args.output, args.author, WORKFLOW_VERSION, not args.no_toc))]
+    else:
+        results = export_batch(sources, output_dir, args.workers, args.author, WORKFLOW_VERSION, not args.no_toc)
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        if result.error:
+            # Quality Gate 5: report and carry on, the Markdown is still usable
+            print(f"⚠️  {result.source}: export failed: {result.error}")
+        else:
+            print(f"✅ {result.output} ({result.paragraphs} paragraphs, {result.headings} headings, "
+                  f"{result.tables} tables, {result.words} words)")
+    failed = sum(1 for r in results if r.error)
+    if len(results) > 1:
+        print(f"📊 {len(results) - failed}/{len(results)} exported in {elapsed:.2f}s")
+    else:
+        print(f"⏱️  {elapsed:.2f}s")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
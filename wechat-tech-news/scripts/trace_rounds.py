@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Trace the scripted validator and formatter rounds.
+
+Loads the round scripts from daily-tech-news-validator/scripts and
+daily-tech-news-formatter/scripts, wraps their batch entry points with
+tracing spans, runs them over a batch of items and an article, and writes
+a Chrome trace plus per-round totals (wall time, CPU time, items, items/s,
+peak memory) into the "trace" block of workflow_[DATE].json. Validator
+Rounds 1-5 are compared with the validator's Performance Expectations;
+formatter Rounds 1-5 share the Formatting phase budget.
+
+Usage:
+    python trace_rounds.py --items tech_news_20251120_validated.json \\
+        --article tech_news_20251120_wechat_draft.md --date 20251120
+    python trace_rounds.py --synthetic 5000 --trace rounds_trace.json
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+import tracing
+
+SKILLS_ROOT = Path(__file__).resolve().parents[2]
+VALIDATOR_SCRIPTS = SKILLS_ROOT / "daily-tech-news-validator" / "scripts"
+FORMATTER_SCRIPTS = SKILLS_ROOT / "daily-tech-news-formatter" / "scripts"
+
+# Upper bounds from the validator's Performance Expectations table
+ROUND_BUDGETS = {
+    "Round 1: Credibility": 45,
+    "Round 2: Time Accuracy": 60,
+    "Round 3: AI Relevance": 90,
+    "Round 4: Deduplication": 45,
+    "Round 5: Completeness": 60,
+}
+# The formatter lists no per-round times; its five rounds split the 6 min
+# upper bound of the Formatting phase (wechat-tech-news Performance Benchmarks)
+FORMATTER_ROUND_BUDGET = 6 * 60 // 5
+FORMATTER_ROUNDS = (
+    "Round 1: Compliance Optimization",
+    "Round 2: Punctuation Normalization",
+    "Round 3: Grammar and Semantic Optimization",
+    "Round 4: Title and Headline Enhancement",
+    "Round 5: Final Quality Assurance",
+)
+FORMATTER_BUDGETS = {name: FORMATTER_ROUND_BUDGET for name in FORMATTER_ROUNDS}
+
+for _path in (VALIDATOR_SCRIPTS, FORMATTER_SCRIPTS):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+import ai_relevance  # noqa: E402
+import dedup_engine  # noqa: E402
+import domain_index  # noqa: E402
+import format_pipeline  # noqa: E402
+import keyword_scanner  # noqa: E402
+import punctuation_normalizer  # noqa: E402
+import timestamp_engine  # noqa: E402
+import validation_executor  # noqa: E402
+
+
+def instrument_rounds():
+    """Wrap each round's batch entry point with a span."""
+    tracing.instrument(domain_index.DomainIndex, "classify_batch", "Round 1: Credibility", "validator",
+                       items=lambda self, urls, *rest: len(urls))
+    tracing.instrument(ai_relevance.RelevanceMatcher, "classify_batch", "Round 3: AI Relevance", "validator",
+                       items=lambda self, items: len(items))
+    tracing.instrument(dedup_engine, "deduplicate", "Round 4: Deduplication", "validator",
+                       items=lambda items, *rest, **kw: len(items))
+    tracing.instrument(keyword_scanner.KeywordScanner, "rewrite", "Round 1: Compliance Optimization", "formatter",
+                       items=lambda self, text: len(text))
+    tracing.instrument(punctuation_normalizer, "normalize_text", "Round 2: Punctuation Normalization", "formatter",
+                       items=lambda text: len(text))
+    tracing.instrument(format_pipeline, "round_grammar", "Round 3: Grammar and Semantic Optimization", "formatter",
+                       items=lambda text: len(text))
+    tracing.instrument(format_pipeline, "round_titles", "Round 4: Title and Headline Enhancement", "formatter",
+                       items=lambda text: len(text))
+    tracing.instrument(format_pipeline, "round_qa", "Round 5: Final Quality Assurance", "formatter",
+                       items=lambda text, scanner: len(text))
+
+
+def time_round(items: List[dict], now: Optional[datetime] = None):
+    """Round 2 has no single batch function: parse every timestamp, then age the batch."""
+    with tracing.span("Round 2: Time Accuracy", "validator", items=len(items)):
+        epochs = []
+        for item in items:
+            value = dedup_engine._get(item, "timestamp", "published") or item.get("published")
+            parsed = timestamp_engine.parse_timestamp(value, now) if value else None
+            if parsed is not None:
+                epochs.append(parsed.published.timestamp())
+        return timestamp_engine.compute_ages(epochs, now)
+
+
+def completeness_round(items: List[dict]) -> dict:
+    """Round 5 scores items one at a time; the span covers the whole batch."""
+    with tracing.span("Round 5: Completeness", "validator", items=len(items)):
+        results = [validation_executor.score_completeness(item) for item in items]
+        return validation_executor.round5_metrics(results)
+
+
+def run_rounds(items: List[dict], article: Optional[str], now: Optional[datetime] = None):
+    urls = [dedup_engine.item_url(item) for item in items]
+    domain_index.default_index().classify_batch(urls)
+    time_round(items, now)
+    ai_relevance.default_matcher().classify_batch(items)
+    dedup_engine.deduplicate(items)
+    completeness_round(items)
+
+    if article is not None:
+        scanner = keyword_scanner.KeywordScanner.from_table()
+        text = scanner.rewrite(article).text
+        text, _ = punctuation_normalizer.normalize_text(text)
+        text = format_pipeline.round_grammar(text).text
+        text = format_pipeline.round_titles(text).text
+        format_pipeline.round_qa(text, scanner)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Trace validator and formatter rounds and record per-round timings"
+    )
+    parser.add_argument(
+        "--items",
+        help="validated.json (or a JSON list of items) to run the validator rounds on"
+    )
+    parser.add_argument(
+        "--article",
+        help="Markdown draft to run the formatter rounds on"
+    )
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        metavar="N",
+        help="Use N synthetic items and a synthetic article instead of --items/--article"
+    )
+    parser.add_argument(
+        "--date",
+        help="Merge per-round totals into workflow_[DATE].json in --output-dir"
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=".",
+        help="Directory holding workflow_[DATE].json (default: current directory)"
+    )
+    parser.add_argument(
+        "--trace",
+        default="rounds_trace.json",
+        help="Chrome trace output path (default: rounds_trace.json)"
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Record peak Python memory per round (slower)"
+    )
+
+    args = parser.parse_args()
+
+    if args.synthetic:
+        items = dedup_engine._synthetic_items(args.synthetic)
+        article = keyword_scanner._synthetic_article(keyword_scanner.parse_keyword_table(), 7_000)
+    elif args.items:
+        try:
+            with open(args.items, "r", encoding="utf-8") as f:
+                document = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"❌ Error: Could not read {args.items}: {e}")
+            sys.exit(1)
+        items = document if isinstance(document, list) else document.get("validated_items", [])
+        article = Path(args.article).read_text(encoding="utf-8") if args.article else None
+    else:
+        parser.error("--items or --synthetic is required")
+
+    instrument_rounds()
+    tracing.enable(memory=args.memory)
+    run_rounds(items, article)
+    tracer = tracing.disable()
+
+    summary = tracer.summary()
+    for entry in summary:
+        budgets = FORMATTER_BUDGETS if entry["category"] == "formatter" else ROUND_BUDGETS
+        budget = budgets.get(entry["name"])
+        verdict = ""
+        if budget is not None:
+            verdict = "✅ within" if entry["wall_seconds"] <= budget else "❌ over"
+            verdict = f"  {verdict} {budget}s budget"
+        rate = f"{entry['items_per_second']:>12,.0f}/s" if "items_per_second" in entry else " " * 14
+        print(f"  {entry['category']:<9} {entry['name']:<44} {entry['wall_seconds'] * 1000:9.1f} ms {rate}{verdict}")
+
+    tracer.write_chrome_trace(args.trace)
+    print(f"🔥 Chrome trace: {args.trace}")
+
+    if args.date:
+        metadata_path = Path(args.output_dir) / f"workflow_{args.date}.json"
+        tracing.merge_summary(str(metadata_path), summary)
+        print(f"📄 Round timings merged into {metadata_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,573 @@
+#!/usr/bin/env python3
+"""
+Incremental runner for the five-phase wechat-tech-news workflow.
+
+Collection → Validation → Writing → Formatting → Export are modelled as a
+DAG. Each phase is keyed on a hash of its input artifacts, the rule files
+of the skill that runs it (SKILL.md, references/, scripts/, plus the
+built-in docx_exporter.py for Export) and its command. Outputs are
+stored in a content-addressed cache, so a re-run skips every phase whose
+key is unchanged (restoring its outputs if they were deleted) and only
+the changed phase and its downstream phases execute. Hand-edited outputs
+are never overwritten; their new content simply changes the keys of the
+phases downstream. Durations, cache hits and statuses are written to
+workflow_[DATE].json.
+
+A phase runs either a shell command from --config, or is produced by the
+agent: when no command is configured, existing outputs newer than the
+phase inputs are recorded into the cache; otherwise the runner stops and
+reports which skill to run next.
+
+Usage:
+    python workflow_runner.py [--date YYYYMMDD] [--output-dir DIR] [--config workflow.json]
+    python workflow_runner.py --dry-run
+    python workflow_runner.py --force Formatting
+    python workflow_runner.py --trace workflow_trace.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from graphlib import TopologicalSorter
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, List, NamedTuple, Optional, Tuple
+
+import tracing
+
+SKILLS_ROOT = Path(__file__).resolve().parents[2]
+SHANGHAI = timezone(timedelta(hours=8), "Asia/Shanghai")
+
+WORKFLOW_VERSION = "4.0.0"
+# Bump when the key derivation changes so old cache entries are ignored
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = ".workflow_cache"
+
+SUCCESS = "SUCCESS"
+CACHED = "CACHED"
+RECORDED = "RECORDED"
+FAILED = "FAILED"
+PENDING = "PENDING"
+BLOCKED = "BLOCKED"
+SKIPPED = "SKIPPED"
+WOULD_RUN = "WOULD_RUN"
+
+DONE = (SUCCESS, CACHED, RECORDED, SKIPPED)
+
+
+def _validation_gate(paths: List[Path]) -> Optional[str]:
+    """Quality Gate 2: validated.json must report workflow_status PASS."""
+    try:
+        with open(paths[0], "r", encoding="utf-8") as f:
+            status = json.load(f).get("metadata", {}).get("workflow_status")
+    except (OSError, json.JSONDecodeError, AttributeError) as e:
+        return f"could not read {paths[0].name}: {e}"
+    if status != "PASS":
+        return f"validation workflow_status is {status!r}"
+    return None
+
+
+class Phase(NamedTuple):
+    name: str
+    skill: str
+    inputs: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+    deps: Tuple[str, ...]
+    max_retries: int = 0
+    optional: bool = False
+    gate: Optional[Callable[[List[Path]], Optional[str]]] = None
+    rules: Tuple[str, ...] = ()  # extra rule files, relative to SKILLS_ROOT
+
+
+PHASES = [
+    Phase("Collection", "daily-tech-news-search",
+          (), ("tech_news_{date}_raw.md",), (), max_retries=2),
+    Phase("Validation", "daily-tech-news-validator",
+          ("tech_news_{date}_raw.md",),
+          ("tech_news_{date}_validated.json", "validation_report_{date}.md"),
+          ("Collection",), gate=_validation_gate),
+    Phase("Writing", "wechat-tech-news-writer",
+          ("tech_news_{date}_validated.json",), ("tech_news_{date}_wechat_draft.md",),
+          ("Validation",), max_retries=1),
+    Phase("Formatting", "daily-tech-news-formatter",
+          ("tech_news_{date}_wechat_draft.md",),
+          ("tech_news_{date}_wechat_final.md", "format_report_{date}.md"),
+          ("Writing",), max_retries=1),
+    Phase("Export", "document-exporter",
+          ("tech_news_{date}_wechat_final.md",), ("tech_news_{date}_wechat_final.docx",),
+          ("Formatting",), optional=True,
+          # document-exporter is not in this repo; the built-in exporter is
+          rules=("wechat-tech-news/scripts/docx_exporter.py",)),
+]
+
+OUTPUT_NAMES = {
+    "tech_news_{date}_raw.md": "raw_markdown",
+    "tech_news_{date}_validated.json": "validated_json",
+    "tech_news_{date}_wechat_draft.md": "draft_markdown",
+    "tech_news_{date}_wechat_final.md": "final_markdown",
+    "tech_news_{date}_wechat_final.docx": "final_docx",
+    "validation_report_{date}.md": "validation_report",
+    "format_report_{date}.md": "format_report",
+}
+
+
+def file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def rule_files(skill: str) -> List[Path]:
+    """Files whose content defines a skill's behaviour."""
+    skill_dir = SKILLS_ROOT / skill
+    if not skill_dir.is_dir():
+        return []
+    files = [skill_dir / "SKILL.md"] if (skill_dir / "SKILL.md").exists() else []
+    for sub, pattern in (("references", "*.md"), ("scripts", "*.py")):
+        files.extend(sorted((skill_dir / sub).glob(pattern)))
+    return files
+
+
+def phase_key(phase: Phase, inputs: Dict[str, str], outputs: List[str], rules: Dict[str, str],
+              command: Optional[str]) -> str:
+    # Output names carry the date, so a cache shared by several dates never
+    # hands one date's Collection result to another
+    payload = json.dumps({
+        "version": CACHE_VERSION,
+        "phase": phase.name,
+        "command": command,
+        "inputs": inputs,
+        "outputs": outputs,
+        "rules": rules,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PhaseCache:
+    """Content-addressed store of phase outputs, indexed by phase key.
+
+    Safe to share between runners on several threads (see backfill.py).
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.objects = root / "objects"
+        self.index_path = root / "index.json"
+        self.index: Dict[str, dict] = {}
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            # A corrupt index only costs a full re-run
+            return
+        if data.get("version") == CACHE_VERSION:
+            self.index = data.get("entries", {})
+
+    def save(self):
+        with self.lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "entries": self.index}, f, indent=2)
+            os.replace(tmp_path, self.index_path)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / digest[2:]
+
+    def store(self, key: str, phase: str, paths: List[Path], duration: float):
+        outputs = {}
+        for path in paths:
+            digest = file_digest(path)
+            target = self._object_path(digest)
+            if not target.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = target.with_name(f"{target.name}.{threading.get_ident()}.tmp")
+                shutil.copyfile(path, tmp_path)
+                os.replace(tmp_path, target)
+            outputs[path.name] = digest
+        with self.lock:
+            self.index[key] = {
+                "phase": phase,
+                "outputs": outputs,
+                "duration_seconds": round(duration, 3),
+                "created": datetime.now(SHANGHAI).isoformat(timespec="seconds"),
+            }
+
+    def restore(self, key: str, output_dir: Path) -> Optional[List[str]]:
+        """Bring back missing outputs for key; None on a miss.
+
+        Outputs that exist but differ from the cached copy were edited by
+        hand and are kept; their names are returned so the caller can
+        report them (downstream keys already see the edited content).
+        """
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        if not all(self._object_path(d).exists() for d in entry["outputs"].values()):
+            return None
+        edited = []
+        for name, digest in entry["outputs"].items():
+            path = output_dir / name
+            if not path.exists():
+                shutil.copyfile(self._object_path(digest), path)
+            elif file_digest(path) != digest:
+                edited.append(name)
+        return edited
+
+
+class WorkflowRunner:
+    """Runs the phases of one date.
+
+    A backfill shares one PhaseCache and one rule-digest dict between the
+    runners of many dates, passes extra command placeholders, wraps
+    command execution in `slot` (its concurrency budget) and observes
+    phases through on_phase_start / on_phase_done.
+    """
+
+    def __init__(self, date: str, output_dir: Path, commands: Optional[Dict[str, str]] = None,
+                 force: Tuple[str, ...] = (), skip: Tuple[str, ...] = (), dry_run: bool = False,
+                 cache_dir: Optional[Path] = None, cache: Optional[PhaseCache] = None,
+                 rule_digests: Optional[Dict[Path, str]] = None,
+                 placeholders: Optional[Dict[str, str]] = None,
+                 slot: Optional[Callable[[Phase], ContextManager]] = None,
+                 on_phase_start: Optional[Callable[[str], None]] = None,
+                 on_phase_done: Optional[Callable[[str, dict], None]] = None,
+                 log_prefix: str = ""):
+        self.date = date
+        self.output_dir = output_dir
+        self.commands = commands or {}
+        self.force = set(force)
+        self.skip = set(skip)
+        self.dry_run = dry_run
+        self.cache = cache or PhaseCache(cache_dir or output_dir / DEFAULT_CACHE_DIR)
+        self.phases = {phase.name: phase for phase in PHASES}
+        self.results: Dict[str, dict] = {}
+        self._rule_digests: Dict[Path, str] = rule_digests if rule_digests is not None else {}
+        self.placeholders = placeholders or {}
+        self.slot = slot or (lambda phase: nullcontext())
+        self.on_phase_start = on_phase_start
+        self.on_phase_done = on_phase_done
+        self.log_prefix = log_prefix
+
+    def _paths(self, templates: Tuple[str, ...]) -> List[Path]:
+        return [self.output_dir / t.format(date=self.date) for t in templates]
+
+    def _rules(self, phase: Phase) -> Dict[str, str]:
+        digests = {}
+        extra = [SKILLS_ROOT / name for name in phase.rules if (SKILLS_ROOT / name).exists()]
+        for path in rule_files(phase.skill) + extra:
+            if path not in self._rule_digests:
+                self._rule_digests[path] = file_digest(path)
+            digests[str(path.relative_to(SKILLS_ROOT))] = self._rule_digests[path]
+        return digests
+
+    def order(self) -> List[str]:
+        graph = TopologicalSorter({phase.name: phase.deps for phase in PHASES})
+        return list(graph.static_order())
+
+    def run(self) -> dict:
+        start = datetime.now(SHANGHAI)
+        order = self.order()
+        for idx, name in enumerate(order, 1):
+            if self.on_phase_start:
+                self.on_phase_start(name)
+            with tracing.span(name, "phase") as s:
+                result = self.run_phase(self.phases[name])
+                s.args["status"] = result["status"]
+            self.results[name] = result
+            if self.on_phase_done:
+                self.on_phase_done(name, result)
+            detail = f" - {result['reason']}" if result.get("reason") else ""
+            print(f"{self.log_prefix}Phase {idx}/{len(order)}: {name:<11} {_STATUS_ICONS[result['status']]} "
+                  f"{result['status']} ({result['duration_seconds']:.1f}s){detail}")
+
+        if not self.dry_run:
+            self.cache.save()
+        end = datetime.now(SHANGHAI)
+        return self.metadata(start, end)
+
+    def run_phase(self, phase: Phase) -> dict:
+        result = {"name": phase.name, "status": PENDING, "duration_seconds": 0.0, "cache_hit": False}
+        outputs = self._paths(phase.outputs)
+        result["output"] = outputs[0].name
+        if len(outputs) > 1:
+            result["report"] = outputs[1].name
+
+        if phase.name in self.skip:
+            result["status"] = SKIPPED
+            return result
+
+        for dep in phase.deps:
+            dep_result = self.results.get(dep, {})
+            if dep_result.get("status") == WOULD_RUN:
+                result["status"] = WOULD_RUN
+                result["reason"] = f"after {dep}"
+                return result
+            if dep_result.get("status") not in DONE and not self.phases[dep].optional:
+                result["status"] = BLOCKED
+                result["reason"] = f"waiting for {dep}"
+                return result
+
+        inputs = self._paths(phase.inputs)
+        missing = [p.name for p in inputs if not p.exists()]
+        if missing:
+            result["status"] = BLOCKED
+            result["reason"] = f"missing input {', '.join(missing)}"
+            return result
+
+        command = self.commands.get(phase.name)
+        key = phase_key(phase, {p.name: file_digest(p) for p in inputs}, [p.name for p in outputs],
+                        self._rules(phase), command)
+        result["cache_key"] = key[:16]
+
+        edited = None if phase.name in self.force else self.cache.restore(key, self.output_dir)
+        if edited is not None:
+            if edited:
+                result["reason"] = f"kept hand-edited {', '.join(edited)}"
+            result["status"] = CACHED
+            result["cache_hit"] = True
+            result["cached_duration_seconds"] = self.cache.index[key]["duration_seconds"]
+            return result
+
+        if self.dry_run:
+            result["status"] = WOULD_RUN
+            return result
+
+        if command is None:
+            return self._record_external(phase, key, inputs, outputs, result)
+
+        with self.slot(phase):
+            started = time.perf_counter()
+            for attempt in range(phase.max_retries + 1):
+                result["retry_count"] = attempt
+                reason = self._execute(phase, command, outputs)
+                if reason is None:
+                    break
+                result["reason"] = reason
+            result["duration_seconds"] = round(time.perf_counter() - started, 3)
+
+        if reason is not None:
+            result["status"] = FAILED
+            return result
+        result.pop("reason", None)
+        self.cache.store(key, phase.name, outputs, result["duration_seconds"])
+        result["status"] = SUCCESS
+        return result
+
+    def _execute(self, phase: Phase, command: str, outputs: List[Path]) -> Optional[str]:
+        """Run a phase command once; return a failure reason or None."""
+        # Plain replacement rather than str.format: commands often contain JSON braces
+        cmd = (command.replace("{date}", self.date)
+               .replace("{output_dir}", str(self.output_dir))
+               .replace("{skills_dir}", str(SKILLS_ROOT)))
+        for name, value in self.placeholders.items():
+            cmd = cmd.replace("{" + name + "}", value)
+        completed = subprocess.run(cmd, shell=True, cwd=self.output_dir)
+        if completed.returncode != 0:
+            return f"command exited with status {completed.returncode}"
+        missing = [p.name for p in outputs if not p.exists()]
+        if missing:
+            return f"command did not produce {', '.join(missing)}"
+        if phase.gate:
+            return phase.gate(outputs)
+        return None
+
+    def _record_external(self, phase: Phase, key: str, inputs: List[Path],
+                         outputs: List[Path], result: dict) -> dict:
+        """Adopt outputs written by the agent if they are newer than the inputs."""
+        if all(p.exists() for p in outputs):
+            newest_input = max((p.stat().st_mtime for p in inputs), default=0.0)
+            if all(p.stat().st_mtime >= newest_input for p in outputs):
+                reason = phase.gate(outputs) if phase.gate else None
+                if reason is not None:
+                    result["status"] = FAILED
+                    result["reason"] = reason
+                    return result
+                self.cache.store(key, phase.name, outputs, 0.0)
+                result["status"] = RECORDED
+                return result
+        result["reason"] = f"run the {phase.skill} skill to produce {outputs[0].name}"
+        return result
+
+    def metadata(self, start: datetime, end: datetime) -> dict:
+        phases = [self.results[name] for name in self.order()]
+        required = [r for r in phases if not self.phases[r["name"]].optional]
+        if any(r["status"] == FAILED for r in required):
+            status = FAILED
+        elif all(r["status"] in DONE for r in required):
+            status = SUCCESS
+        else:
+            status = PENDING
+
+        outputs = {}
+        for phase in PHASES:
+            for template in phase.outputs:
+                path = self.output_dir / template.format(date=self.date)
+                if path.exists():
+                    outputs[OUTPUT_NAMES[template]] = path.name
+        outputs["workflow_metadata"] = f"workflow_{self.date}.json"
+
+        hits = sum(1 for r in phases if r["cache_hit"])
+        return {
+            "date": f"{self.date[:4]}-{self.date[4:6]}-{self.date[6:]}",
+            "version": WORKFLOW_VERSION,
+            "status": status,
+            "start_time": start.isoformat(timespec="seconds"),
+            "end_time": end.isoformat(timespec="seconds"),
+            "total_duration_seconds": round((end - start).total_seconds(), 3),
+            "phases": phases,
+            "outputs": outputs,
+            "cache": {
+                "hits": hits,
+                "misses": sum(1 for r in phases if r["status"] in (SUCCESS, RECORDED, WOULD_RUN)),
+                "saved_seconds": round(sum(r.get("cached_duration_seconds", 0.0) for r in phases), 3),
+            },
+        }
+
+
+_STATUS_ICONS = {
+    SUCCESS: "✅",
+    CACHED: "♻️ ",
+    RECORDED: "📝",
+    FAILED: "❌",
+    PENDING: "⏸️ ",
+    BLOCKED: "⛔",
+    SKIPPED: "⏭️ ",
+    WOULD_RUN: "▶️ ",
+}
+
+
+def write_metadata(output_dir: Path, date: str, metadata: dict) -> Path:
+    """Write workflow_[DATE].json atomically."""
+    metadata_path = output_dir / f"workflow_{date}.json"
+    tmp_path = metadata_path.with_name(metadata_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(metadata, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, metadata_path)
+    return metadata_path
+
+
+def calculate_china_date() -> str:
+    return datetime.now(SHANGHAI).strftime("%Y%m%d")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the five-phase tech news workflow, skipping phases whose inputs are unchanged"
+    )
+    parser.add_argument(
+        "--date",
+        default=calculate_china_date(),
+        help="Workflow date as YYYYMMDD (default: today in Asia/Shanghai)"
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=".",
+        help="Directory holding the phase artifacts (default: current directory)"
+    )
+    parser.add_argument(
+        "--config",
+        help='JSON file mapping phase names to shell commands, e.g. {"commands": {"Export": "..."}}'
+    )
+    parser.add_argument(
+        "--force",
+        nargs="+",
+        default=[],
+        metavar="PHASE",
+        help="Re-run these phases even if their inputs are unchanged"
+    )
+    parser.add_argument(
+        "--skip-export",
+        action="store_true",
+        help="Skip Phase 5 (Word export)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show which phases would run without running them"
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Record phase spans; write a Chrome trace to PATH and totals to workflow_[DATE].json"
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Also record peak Python memory per span (slower)"
+    )
+
+    args = parser.parse_args()
+
+    if len(args.date) != 8 or not args.date.isdigit():
+        print(f"❌ Error: --date must be YYYYMMDD, got {args.date}")
+        sys.exit(1)
+
+    names = {phase.name for phase in PHASES}
+    unknown = [name for name in args.force if name not in names]
+    if unknown:
+        print(f"❌ Error: Unknown phase(s): {', '.join(unknown)} (expected one of {', '.join(sorted(names))})")
+        sys.exit(1)
+
+    output_dir = Path(args.output_dir)
+    if not output_dir.is_dir():
+        print(f"❌ Error: Output directory does not exist: {output_dir}")
+        sys.exit(1)
+
+    commands = {}
+    if args.config:
+        try:
+            with open(args.config, "r", encoding="utf-8") as f:
+                commands = json.load(f).get("commands", {})
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"❌ Error: Could not read {args.config}: {e}")
+            sys.exit(1)
+
+    runner = WorkflowRunner(
+        args.date,
+        output_dir,
+        commands=commands,
+        force=tuple(args.force),
+        skip=("Export",) if args.skip_export else (),
+        dry_run=args.dry_run,
+    )
+    if args.trace:
+        tracing.enable(memory=args.trace_memory)
+    metadata = runner.run()
+    tracer = tracing.disable()
+
+    print()
+    print(f"Cache: {metadata['cache']['hits']} hit(s), {metadata['cache']['misses']} miss(es), "
+          f"~{metadata['cache']['saved_seconds']:.0f}s saved")
+    if args.dry_run:
+        return
+
+    if tracer is not None:
+        metadata["trace"] = tracer.summary()
+        tracer.write_chrome_trace(args.trace)
+        print(f"🔥 Chrome trace: {args.trace}")
+    metadata_path = write_metadata(output_dir, args.date, metadata)
+    print(f"📄 Workflow metadata: {metadata_path}")
+
+    if metadata["status"] == FAILED:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()